@@ -2,7 +2,8 @@ import numpy as np
 import pandas.util.testing as tm
 from pandas import (DataFrame, Series, rolling_median, rolling_mean,
                     rolling_min, rolling_max, rolling_var, rolling_skew,
-                    rolling_kurt, rolling_std, read_csv, factorize, date_range)
+                    rolling_kurt, rolling_std, read_csv, factorize, date_range,
+                    option_context)
 from pandas.core.algorithms import take_1d
 try:
     from pandas._libs import algos
@@ -54,6 +55,24 @@ class ParallelGroupbyMethods(object):
             self.loop()
 
 
+class ParallelGroupbyColumns(object):
+
+    goal_time = 0.2
+    params = ([1, 2, 4, 8], ['mean', 'sum', 'var'])
+    param_names = ['threads', 'method']
+
+    def setup(self, threads, method):
+        N = 10**5
+        ncols = 200
+        ngroups = 10**3
+        self.df = DataFrame(np.random.randn(N, ncols))
+        self.df['key'] = np.random.randint(0, ngroups, size=N)
+
+    def time_groupby_columns(self, threads, method):
+        with option_context('compute.threads', threads):
+            getattr(self.df.groupby('key'), method)()
+
+
 class ParallelGroups(object):
 
     goal_time = 0.2
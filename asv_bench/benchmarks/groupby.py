@@ -268,6 +268,14 @@ class AggFunctions(object):
     def time_different_python_functions_singlecol(self, df):
         df.groupby('key1').agg([sum, min, max])
 
+    def time_str_functions_list(self, df):
+        df.groupby(['key1', 'key2']).agg(['sum', 'mean', 'std', 'count',
+                                          'min', 'max'])
+
+    def time_str_functions_list_singlecol(self, df):
+        df.groupby('key1')['value1'].agg(['sum', 'mean', 'std', 'count',
+                                          'min', 'max'])
+
 
 class GroupStrings(object):
 
@@ -1,5 +1,7 @@
 import numpy as np
 from pandas import DataFrame, date_range, read_pickle
+from pandas.compat import cPickle as pkl
+from pandas.io.pickle import to_pickle_buffers, read_pickle_buffers
 import pandas.util.testing as tm
 
 from ..pandas_vb_common import BaseIO, setup  # noqa
@@ -24,3 +26,29 @@ class Pickle(BaseIO):
 
     def time_write_pickle(self):
         self.df.to_pickle(self.fname)
+
+
+class PickleBuffers(object):
+
+    goal_time = 0.2
+
+    def setup(self):
+        N = 1000000
+        C = 10
+        self.df = DataFrame(np.random.randn(N, C),
+                            columns=['float{}'.format(i) for i in range(C)],
+                            index=date_range('20000101', periods=N, freq='s'))
+        self.pickled = pkl.dumps(self.df, protocol=pkl.HIGHEST_PROTOCOL)
+        self.header, self.buffers = to_pickle_buffers(self.df)
+
+    def time_dumps(self):
+        pkl.dumps(self.df, protocol=pkl.HIGHEST_PROTOCOL)
+
+    def time_loads(self):
+        pkl.loads(self.pickled)
+
+    def time_to_pickle_buffers(self):
+        to_pickle_buffers(self.df)
+
+    def time_read_pickle_buffers(self):
+        read_pickle_buffers(self.header, self.buffers)
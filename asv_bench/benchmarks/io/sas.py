@@ -19,3 +19,32 @@ class SAS(object):
 
     def time_read_msgpack(self, format):
         read_sas(self.f, format=format)
+
+
+class SASColumns(object):
+
+    goal_time = 0.2
+
+    def setup(self):
+        paths = [os.path.dirname(__file__), '..', '..', '..', 'pandas',
+                 'tests', 'io', 'sas', 'data', 'test1.sas7bdat']
+        self.f = os.path.join(*paths)
+
+    def time_read_sas_columns(self):
+        read_sas(self.f, columns=['Column1', 'Column3'])
+
+
+class SASThreads(object):
+
+    goal_time = 0.2
+    params = [1, 2]
+    param_names = ['nthreads']
+
+    def setup(self, nthreads):
+        # an RDC compressed file
+        paths = [os.path.dirname(__file__), '..', '..', '..', 'pandas',
+                 'tests', 'io', 'sas', 'data', 'test3.sas7bdat']
+        self.f = os.path.join(*paths)
+
+    def time_read_sas_nthreads(self, nthreads):
+        read_sas(self.f, nthreads=nthreads)
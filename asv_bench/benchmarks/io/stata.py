@@ -35,3 +35,20 @@ class Stata(BaseIO):
 
     def time_write_stata(self, convert_dates):
         self.df.to_stata(self.fname, self.convert_dates)
+
+
+class StataColumns(BaseIO):
+
+    goal_time = 0.2
+
+    def setup(self):
+        self.fname = '__test_columns__.dta'
+        N = 10000
+        C = 500
+        self.df = DataFrame(np.random.randn(N, C),
+                            columns=['float{}'.format(i) for i in range(C)])
+        self.df.to_stata(self.fname, write_index=False)
+        self.columns = list(self.df.columns[::50])
+
+    def time_read_stata_columns(self):
+        read_stata(self.fname, columns=self.columns)
@@ -14,8 +14,12 @@ from numpy cimport (ndarray,
                     uint32_t, uint64_t, float32_t, float64_t)
 
 from libc.stdlib cimport malloc, free
+from libc.math cimport sqrt
 
 from util cimport numeric, get_nat
+from missing cimport checknull
+from khash cimport (kh_int64_t, kh_init_int64, kh_resize_int64,
+                    kh_put_int64, kh_destroy_int64)
 from algos cimport swap
 from algos import take_2d_axis1_float64_float64, groupsort_indexer
 
@@ -24,6 +28,22 @@ cdef int64_t iNaT = get_nat()
 cdef double NaN = <double> np.NaN
 cdef double nan = NaN
 
+_SIZE_HINT_LIMIT = (1 << 20) + 7
+
+# codes of the interpolations of group_quantile
+cdef enum QuantileInterpolation:
+    INTERPOLATION_LINEAR = 0
+    INTERPOLATION_LOWER = 1
+    INTERPOLATION_HIGHER = 2
+    INTERPOLATION_NEAREST = 3
+    INTERPOLATION_MIDPOINT = 4
+
+_quantile_interpolations = {'linear': INTERPOLATION_LINEAR,
+                            'lower': INTERPOLATION_LOWER,
+                            'higher': INTERPOLATION_HIGHER,
+                            'nearest': INTERPOLATION_NEAREST,
+                            'midpoint': INTERPOLATION_MIDPOINT}
+
 
 # TODO: aggregate multiple columns in single pass
 # ----------------------------------------------------------------------
@@ -36,7 +56,8 @@ def group_nth_object(ndarray[object, ndim=2] out,
                      ndarray[int64_t] counts,
                      ndarray[object, ndim=2] values,
                      ndarray[int64_t] labels,
-                     int64_t rank):
+                     int64_t rank,
+                     Py_ssize_t min_count=-1):
     """
     Only aggregates on axis=0
     """
@@ -47,6 +68,8 @@ def group_nth_object(ndarray[object, ndim=2] out,
         ndarray[int64_t, ndim=2] nobs
         ndarray[object, ndim=2] resx
 
+    assert min_count == -1, "'min_count' only used in add and prod"
+
     nobs = np.zeros((<object> out).shape, dtype=np.int64)
     resx = np.empty((<object> out).shape, dtype=object)
 
@@ -62,7 +85,7 @@ def group_nth_object(ndarray[object, ndim=2] out,
             val = values[i, j]
 
             # not nan
-            if val == val:
+            if not checknull(val):
                 nobs[lab, j] += 1
                 if nobs[lab, j] == rank:
                     resx[lab, j] = val
@@ -80,7 +103,8 @@ def group_nth_object(ndarray[object, ndim=2] out,
 def group_last_object(ndarray[object, ndim=2] out,
                       ndarray[int64_t] counts,
                       ndarray[object, ndim=2] values,
-                      ndarray[int64_t] labels):
+                      ndarray[int64_t] labels,
+                      Py_ssize_t min_count=-1):
     """
     Only aggregates on axis=0
     """
@@ -91,6 +115,8 @@ def group_last_object(ndarray[object, ndim=2] out,
         ndarray[object, ndim=2] resx
         ndarray[int64_t, ndim=2] nobs
 
+    assert min_count == -1, "'min_count' only used in add and prod"
+
     nobs = np.zeros((<object> out).shape, dtype=np.int64)
     resx = np.empty((<object> out).shape, dtype=object)
 
@@ -106,7 +132,7 @@ def group_last_object(ndarray[object, ndim=2] out,
             val = values[i, j]
 
             # not nan
-            if val == val:
+            if not checknull(val):
                 nobs[lab, j] += 1
                 resx[lab, j] = val
 
@@ -118,6 +144,193 @@ def group_last_object(ndarray[object, ndim=2] out,
                 out[i, j] = resx[i, j]
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_object(ndarray[object, ndim=2] out,
+                     ndarray[int64_t] counts,
+                     ndarray[object, ndim=2] values,
+                     ndarray[int64_t] labels,
+                     Py_ssize_t min_count=-1):
+    """
+    Only aggregates on axis=0
+    """
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        object val
+        ndarray[object, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    assert min_count == -1, "'min_count' only used in add and prod"
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    maxx = np.empty((<object> out).shape, dtype=object)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            # not nan
+            if not checknull(val):
+                nobs[lab, j] += 1
+                if nobs[lab, j] == 1 or val > maxx[lab, j]:
+                    maxx[lab, j] = val
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = nan
+            else:
+                out[i, j] = maxx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_object(ndarray[object, ndim=2] out,
+                     ndarray[int64_t] counts,
+                     ndarray[object, ndim=2] values,
+                     ndarray[int64_t] labels,
+                     Py_ssize_t min_count=-1):
+    """
+    Only aggregates on axis=0
+    """
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        object val
+        ndarray[object, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    assert min_count == -1, "'min_count' only used in add and prod"
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    minx = np.empty((<object> out).shape, dtype=object)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            # not nan
+            if not checknull(val):
+                nobs[lab, j] += 1
+                if nobs[lab, j] == 1 or val < minx[lab, j]:
+                    minx[lab, j] = val
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = nan
+            else:
+                out[i, j] = minx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nunique(ndarray[int64_t] out,
+                  ndarray[int64_t] labels,
+                  ndarray[int64_t] codes,
+                  bint dropna=True):
+    """
+    Count the distinct values of each group in a single hashed pass
+
+    Parameters
+    ----------
+    out : array of int64, the number of distinct values of each group
+    labels : array of int64, the group of each value, -1 for none
+    codes : array of int64, the factorized values, -1 for missing values
+    dropna : boolean, default True
+        don't count the missing values
+    """
+    cdef:
+        Py_ssize_t i, N = len(labels)
+        int64_t lab, code, ncodes
+        kh_int64_t *table
+        int ret = 0
+
+    if not len(codes) == len(labels):
+        raise AssertionError("len(codes) != len(labels)")
+
+    # the codes are shifted by one so that missing values get their own key
+    ncodes = codes.max() + 2 if N else 1
+
+    table = kh_init_int64()
+    kh_resize_int64(table, min(N, _SIZE_HINT_LIMIT))
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            code = codes[i]
+            if lab < 0 or (dropna and code < 0):
+                continue
+
+            kh_put_int64(table, lab * ncodes + code + 1, &ret)
+            if ret != 0:
+                # the pair was not seen yet
+                out[lab] += 1
+
+    kh_destroy_int64(table)
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_add_masked_int64(ndarray[int64_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[int64_t, ndim=2] values,
+                           ndarray[int64_t] labels,
+                           Py_ssize_t min_count=0):
+    """
+    Only aggregates on axis=0
+
+    The sums are computed exactly in int64, skipping the values equal to
+    iNaT, which mark the missing values of nullable integers; the sums of
+    less than min_count values are set to iNaT.
+    """
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts = len(counts)
+        int64_t val
+        ndarray[int64_t, ndim=2] sumx, nobs
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    nobs = np.zeros_like(out)
+    sumx = np.zeros_like(out)
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+                if val != iNaT:
+                    nobs[lab, j] += 1
+                    sumx[lab, j] += val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] < min_count:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = sumx[i, j]
+
+
 cdef inline float64_t _median_linear(float64_t* a, int n) nogil:
     cdef int i, j, na_count = 0
     cdef float64_t result
@@ -158,6 +371,65 @@ cdef inline float64_t _median_linear(float64_t* a, int n) nogil:
     return result
 
 
+cdef inline float64_t _quantile_linear(float64_t* a, int n, float64_t q,
+                                       int interpolation) nogil:
+    # the q-th quantile of the non-NA values of a, partially sorting a
+    # in place; the interpolations are those of numpy.percentile
+    cdef int i, j, na_count = 0
+    cdef Py_ssize_t lower
+    cdef float64_t idx, frac, lo, hi, result
+    cdef float64_t* tmp
+
+    if n == 0:
+        return NaN
+
+    # count NAs
+    for i in range(n):
+        if a[i] != a[i]:
+            na_count += 1
+
+    if na_count:
+        if na_count == n:
+            return NaN
+
+        tmp = <float64_t*> malloc((n - na_count) * sizeof(float64_t))
+
+        j = 0
+        for i in range(n):
+            if a[i] == a[i]:
+                tmp[j] = a[i]
+                j += 1
+
+        a = tmp
+        n -= na_count
+
+    idx = q * (n - 1)
+    lower = <Py_ssize_t> idx
+    frac = idx - lower
+
+    lo = kth_smallest_c(a, lower, n)
+    if frac == 0 or interpolation == INTERPOLATION_LOWER:
+        result = lo
+    else:
+        hi = kth_smallest_c(a, lower + 1, n)
+        if interpolation == INTERPOLATION_LINEAR:
+            result = lo + (hi - lo) * frac
+        elif interpolation == INTERPOLATION_HIGHER:
+            result = hi
+        elif interpolation == INTERPOLATION_MIDPOINT:
+            result = (lo + hi) / 2
+        elif frac > 0.5 or (frac == 0.5 and lower % 2):
+            # nearest, rounding half to even as numpy
+            result = hi
+        else:
+            result = lo
+
+    if na_count:
+        free(a)
+
+    return result
+
+
 cdef inline float64_t kth_smallest_c(float64_t* a,
                                      Py_ssize_t k,
                                      Py_ssize_t n) nogil:
@@ -5,7 +5,7 @@
 import cython
 cimport numpy as cnp
 import numpy as np
-from numpy cimport ndarray, uint8_t, uint32_t, uint64_t
+from numpy cimport ndarray, int64_t, uint8_t, uint32_t, uint64_t
 
 from util cimport _checknull
 from cpython cimport (PyString_Check,
@@ -95,6 +95,51 @@ def hash_object_array(ndarray[object] arr, object key, object encoding='utf8'):
     return result
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def hash_utf8_array(ndarray[uint8_t] data, ndarray[int64_t] offsets,
+                    ndarray[uint8_t, cast=True] mask, object key,
+                    object encoding='utf8'):
+    """
+    Parameters
+    ----------
+    data : 1-d uint8 ndarray of the utf8 encoded strings
+    offsets : 1-d int64 ndarray, the string i is data[offsets[i]:offsets[i+1]]
+    mask : 1-d boolean ndarray, True where the string is missing
+    key : hash key, must be 16 byte len encoded
+    encoding : encoding for key, default to 'utf8'
+
+    Returns
+    -------
+    1-d uint64 ndarray of hashes, the same as those of hash_object_array
+    for the strings, with the missing values hashed as 'nan'
+    """
+    cdef:
+        Py_ssize_t i, n = len(offsets) - 1
+        ndarray[uint64_t] result
+        bytes k, na = b'nan'
+        uint8_t *kb
+        uint8_t *nab = <uint8_t *>na
+        uint8_t *buf = <uint8_t *>data.data
+
+    k = <bytes>key.encode(encoding)
+    kb = <uint8_t *>k
+    if len(k) != 16:
+        raise ValueError(
+            'key should be a 16-byte string encoded, got {!r} (len {})'.format(
+                k, len(k)))
+
+    result = np.empty(n, dtype=np.uint64)
+    with nogil:
+        for i in range(n):
+            if mask[i]:
+                result[i] = low_level_siphash(nab, 3, kb)
+            else:
+                result[i] = low_level_siphash(buf + offsets[i],
+                                              offsets[i + 1] - offsets[i], kb)
+    return result
+
+
 cdef inline uint64_t _rotl(uint64_t x, uint64_t b) nogil:
     return (x << b) | (x >> (64 - b))
 
@@ -26,6 +26,7 @@ from khash cimport (
 from numpy cimport ndarray, uint8_t, uint32_t
 
 from libc.stdlib cimport malloc, free
+from libc.string cimport memcmp
 from cpython cimport (PyMem_Malloc, PyMem_Realloc, PyMem_Free,
                       PyString_Check, PyBytes_Check,
                       PyUnicode_Check)
@@ -176,3 +177,163 @@ def unique_label_indices(ndarray[int64_t, ndim=1] labels):
     arr = arr[labels[arr].argsort()]
 
     return arr[1:] if arr.size != 0 and labels[arr[0]] == -1 else arr
+
+
+# ----------------------------------------------------------------------
+# utf8 buffers: strings held as a single buffer of bytes and the offsets
+# of each string in it, which are hashed without creating python objects
+
+
+cdef inline uint64_t _utf8_hash(const uint8_t *buf, int64_t start,
+                                int64_t stop) nogil:
+    """ FNV-1a hash of the bytes buf[start:stop] """
+    cdef:
+        int64_t j
+        uint64_t h = 14695981039346656037ULL
+
+    for j in range(start, stop):
+        h ^= buf[j]
+        h *= 1099511628211ULL
+    return h
+
+
+cdef inline bint _utf8_equal(const uint8_t *a, int64_t astart, int64_t astop,
+                             const uint8_t *b, int64_t bstart,
+                             int64_t bstop) nogil:
+    if astop - astart != bstop - bstart:
+        return 0
+    return memcmp(a + astart, b + bstart, astop - astart) == 0
+
+
+cdef inline uint64_t _utf8_table_size(Py_ssize_t n):
+    """ the power of 2 size of an open addressing table for n keys """
+    cdef uint64_t size = 8
+    while size < 2 * <uint64_t>n:
+        size <<= 1
+    return size
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def factorize_utf8(ndarray[uint8_t] data, ndarray[int64_t] offsets,
+                   ndarray[uint8_t, cast=True] mask,
+                   int64_t na_sentinel=-1):
+    """
+    Factorize the strings of a utf8 buffer, in order of first appearance
+
+    Parameters
+    ----------
+    data : ndarray[uint8]
+        the utf8 encoded strings
+    offsets : ndarray[int64]
+        the string i is data[offsets[i]:offsets[i + 1]]
+    mask : ndarray[bool]
+        True where the string is missing
+    na_sentinel : int64, default -1
+        the label of the missing strings
+
+    Returns
+    -------
+    labels : ndarray[int64]
+    first : ndarray[int64]
+        the position of the first appearance of each unique string
+    """
+    cdef:
+        Py_ssize_t i, n = len(offsets) - 1
+        int64_t k, count = 0
+        uint64_t h, slot, m
+        const uint8_t *buf = <const uint8_t *>data.data
+        ndarray[int64_t] labels = np.empty(n, dtype=np.int64)
+        ndarray[int64_t] first = np.empty(n, dtype=np.int64)
+        ndarray[uint64_t] hashes = np.empty(n, dtype=np.uint64)
+        ndarray[int64_t] table
+
+    m = _utf8_table_size(n) - 1
+    table = np.full(m + 1, -1, dtype=np.int64)
+
+    with nogil:
+        for i in range(n):
+            if mask[i]:
+                labels[i] = na_sentinel
+                continue
+
+            h = _utf8_hash(buf, offsets[i], offsets[i + 1])
+            slot = h & m
+            while True:
+                k = table[slot]
+                if k == -1:
+                    # a new unique string
+                    table[slot] = count
+                    hashes[count] = h
+                    first[count] = i
+                    labels[i] = count
+                    count += 1
+                    break
+                if hashes[k] == h and _utf8_equal(
+                        buf, offsets[first[k]], offsets[first[k] + 1],
+                        buf, offsets[i], offsets[i + 1]):
+                    labels[i] = k
+                    break
+                slot = (slot + 1) & m
+
+    return labels, first[:count]
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def isin_utf8(ndarray[uint8_t] data, ndarray[int64_t] offsets,
+              ndarray[uint8_t, cast=True] mask,
+              ndarray[uint8_t] values_data, ndarray[int64_t] values_offsets,
+              ndarray[uint8_t, cast=True] values_mask):
+    """
+    Return a boolean array, True where the string of a utf8 buffer is one of
+    the strings of a second utf8 buffer, the missing strings match if there
+    are missing values
+    """
+    cdef:
+        Py_ssize_t i, n = len(offsets) - 1, nvalues = len(values_offsets) - 1
+        int64_t k
+        uint64_t h, slot, m
+        bint has_na = 0
+        const uint8_t *buf = <const uint8_t *>data.data
+        const uint8_t *vbuf = <const uint8_t *>values_data.data
+        ndarray[uint8_t, cast=True] result = np.zeros(n, dtype=np.bool_)
+        ndarray[uint64_t] hashes = np.empty(nvalues, dtype=np.uint64)
+        ndarray[int64_t] table
+
+    m = _utf8_table_size(nvalues) - 1
+    table = np.full(m + 1, -1, dtype=np.int64)
+
+    with nogil:
+        # the table of the values, duplicates are inserted again which is
+        # harmless for a lookup
+        for i in range(nvalues):
+            if values_mask[i]:
+                has_na = 1
+                continue
+            h = _utf8_hash(vbuf, values_offsets[i], values_offsets[i + 1])
+            hashes[i] = h
+            slot = h & m
+            while table[slot] != -1:
+                slot = (slot + 1) & m
+            table[slot] = i
+
+        for i in range(n):
+            if mask[i]:
+                result[i] = has_na
+                continue
+
+            h = _utf8_hash(buf, offsets[i], offsets[i + 1])
+            slot = h & m
+            while True:
+                k = table[slot]
+                if k == -1:
+                    break
+                if hashes[k] == h and _utf8_equal(
+                        vbuf, values_offsets[k], values_offsets[k + 1],
+                        buf, offsets[i], offsets[i + 1]):
+                    result[i] = 1
+                    break
+                slot = (slot + 1) & m
+
+    return result
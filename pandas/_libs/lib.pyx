@@ -18,6 +18,7 @@ np.import_array()
 np.import_ufunc()
 
 from libc.stdlib cimport malloc, free
+from libc.string cimport memcmp
 
 from cpython cimport (Py_INCREF, PyTuple_SET_ITEM,
                       PyList_Check, PyFloat_Check,
@@ -29,6 +30,7 @@ from cpython cimport (Py_INCREF, PyTuple_SET_ITEM,
                       PyBytes_GET_SIZE,
                       PyUnicode_GET_SIZE,
                       PyObject)
+from cpython.unicode cimport PyUnicode_DecodeUTF8
 
 try:
     from cpython cimport PyString_GET_SIZE
@@ -85,13 +87,26 @@ def values_from_object(object o):
 @cython.boundscheck(False)
 def memory_usage_of_objects(ndarray[object, ndim=1] arr):
     """ return the memory usage of an object array in bytes,
-    does not include the actual bytes of the pointers """
-    cdef Py_ssize_t i, n
-    cdef int64_t s = 0
+    does not include the actual bytes of the pointers; an object
+    referenced more than once is only counted once """
+    cdef:
+        Py_ssize_t i, n
+        int64_t s = 0
+        object val, last = None
+        set seen = set()
 
     n = len(arr)
     for i from 0 <= i < n:
-        s += arr[i].__sizeof__()
+        val = arr[i]
+        # runs of the same object are common, skip them without hashing
+        if val is last:
+            continue
+        last = val
+        key = <Py_ssize_t><void*>val
+        if key in seen:
+            continue
+        seen.add(key)
+        s += val.__sizeof__()
     return s
 
 
@@ -804,6 +819,157 @@ def string_array_replace_from_nan_rep(
     return arr
 
 
+# ----------------------------------------------------------------------
+# utf8 buffers: strings held as a single buffer of bytes and the offsets
+# of each string in it, string i is data[offsets[i]:offsets[i + 1]]
+
+_utf8_ops = {'eq': 0, 'ne': 1, 'lt': 2, 'le': 3, 'gt': 4, 'ge': 5}
+
+
+cdef inline int _utf8_cmp(const uint8_t *a, int64_t alen,
+                          const uint8_t *b, int64_t blen) nogil:
+    """ compare two utf8 strings, the byte order is the code point order """
+    cdef int c = memcmp(a, b, alen if alen < blen else blen)
+    if c != 0:
+        return c
+    return (alen > blen) - (alen < blen)
+
+
+cdef inline bint _utf8_op(int c, int op) nogil:
+    if op == 0:
+        return c == 0
+    elif op == 1:
+        return c != 0
+    elif op == 2:
+        return c < 0
+    elif op == 3:
+        return c <= 0
+    elif op == 4:
+        return c > 0
+    return c >= 0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def utf8_to_object(ndarray[uint8_t] data, ndarray[int64_t] offsets,
+                   ndarray[uint8_t, cast=True] mask):
+    """ decode the strings of a utf8 buffer to an object array, with NaN
+    for the missing strings """
+    cdef:
+        Py_ssize_t i, n = len(offsets) - 1
+        const char *buf = <const char *>data.data
+        object na = np.nan
+        ndarray[object] result = np.empty(n, dtype=object)
+
+    for i in range(n):
+        if mask[i]:
+            result[i] = na
+        else:
+            result[i] = PyUnicode_DecodeUTF8(buf + offsets[i],
+                                             offsets[i + 1] - offsets[i],
+                                             NULL)
+    return result
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def utf8_compare_scalar(ndarray[uint8_t] data, ndarray[int64_t] offsets,
+                        ndarray[uint8_t, cast=True] mask, bytes other,
+                        object op):
+    """
+    Compare the strings of a utf8 buffer to a utf8 encoded string with the
+    comparison op ('eq', 'ne', 'lt', 'le', 'gt' or 'ge'), the missing
+    strings compare False, or True for 'ne'
+    """
+    cdef:
+        Py_ssize_t i, n = len(offsets) - 1
+        int iop = _utf8_ops[op]
+        const uint8_t *buf = <const uint8_t *>data.data
+        const uint8_t *obuf = <const uint8_t *>other
+        int64_t olen = len(other)
+        ndarray[uint8_t, cast=True] result = np.empty(n, dtype=np.bool_)
+
+    with nogil:
+        for i in range(n):
+            if mask[i]:
+                result[i] = iop == 1
+            else:
+                result[i] = _utf8_op(
+                    _utf8_cmp(buf + offsets[i], offsets[i + 1] - offsets[i],
+                              obuf, olen), iop)
+    return result
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def utf8_compare(ndarray[uint8_t] data, ndarray[int64_t] offsets,
+                 ndarray[uint8_t, cast=True] mask,
+                 ndarray[uint8_t] other_data, ndarray[int64_t] other_offsets,
+                 ndarray[uint8_t, cast=True] other_mask, object op):
+    """
+    Compare the strings of two utf8 buffers of the same length elementwise
+    with the comparison op, a missing string on either side compares False,
+    or True for 'ne'
+    """
+    cdef:
+        Py_ssize_t i, n = len(offsets) - 1
+        int iop = _utf8_ops[op]
+        const uint8_t *buf = <const uint8_t *>data.data
+        const uint8_t *obuf = <const uint8_t *>other_data.data
+        ndarray[uint8_t, cast=True] result = np.empty(n, dtype=np.bool_)
+
+    if len(other_offsets) != n + 1:
+        raise ValueError('Lengths must match to compare')
+
+    with nogil:
+        for i in range(n):
+            if mask[i] or other_mask[i]:
+                result[i] = iop == 1
+            else:
+                result[i] = _utf8_op(
+                    _utf8_cmp(buf + offsets[i], offsets[i + 1] - offsets[i],
+                              obuf + other_offsets[i],
+                              other_offsets[i + 1] - other_offsets[i]), iop)
+    return result
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def utf8_find(ndarray[uint8_t] data, ndarray[int64_t] offsets,
+              ndarray[uint8_t, cast=True] mask, bytes pat, object how):
+    """
+    Return a boolean array, True where the string of a utf8 buffer contains
+    ('contains'), starts with ('startswith') or ends with ('endswith') the
+    utf8 encoded pat, the missing strings are False
+    """
+    cdef:
+        Py_ssize_t i, n = len(offsets) - 1
+        int64_t j, start, stop, plen = len(pat)
+        int ihow
+        const uint8_t *buf = <const uint8_t *>data.data
+        const uint8_t *pbuf = <const uint8_t *>pat
+        ndarray[uint8_t, cast=True] result = np.zeros(n, dtype=np.bool_)
+
+    ihow = {'contains': 0, 'startswith': 1, 'endswith': 2}[how]
+
+    with nogil:
+        for i in range(n):
+            start = offsets[i]
+            stop = offsets[i + 1]
+            if mask[i] or stop - start < plen:
+                continue
+            if ihow == 1:
+                result[i] = memcmp(buf + start, pbuf, plen) == 0
+            elif ihow == 2:
+                result[i] = memcmp(buf + stop - plen, pbuf, plen) == 0
+            else:
+                for j in range(start, stop - plen + 1):
+                    if memcmp(buf + j, pbuf, plen) == 0:
+                        result[i] = 1
+                        break
+    return result
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def convert_json_to_lines(object arr):
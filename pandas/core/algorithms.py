@@ -10,13 +10,13 @@ from pandas.core.dtypes.cast import (
     maybe_promote, construct_1d_object_array_from_listlike)
 from pandas.core.dtypes.generic import (
     ABCSeries, ABCIndex,
-    ABCIndexClass, ABCCategorical)
+    ABCIndexClass, ABCCategorical, ABCMaskedArray, ABCStringArray)
 from pandas.core.dtypes.common import (
     is_unsigned_integer_dtype, is_signed_integer_dtype,
     is_integer_dtype, is_complex_dtype,
     is_object_dtype,
     is_categorical_dtype, is_sparse,
-    is_period_dtype,
+    is_period_dtype, is_masked_dtype, is_utf8_dtype,
     is_numeric_dtype, is_float_dtype,
     is_bool_dtype, needs_i8_conversion,
     is_categorical, is_datetimetz,
@@ -166,8 +166,8 @@ def _ensure_arraylike(values):
     """
     ensure that we are arraylike if not already
     """
-    if not isinstance(values, (np.ndarray, ABCCategorical,
-                               ABCIndexClass, ABCSeries)):
+    if not isinstance(values, (np.ndarray, ABCCategorical, ABCMaskedArray,
+                               ABCStringArray, ABCIndexClass, ABCSeries)):
         inferred = lib.infer_dtype(values)
         if inferred in ['mixed', 'string', 'unicode']:
             if isinstance(values, tuple):
@@ -401,6 +401,10 @@ def isin(comps, values):
                         " to isin(), you passed a [{values_type}]"
                         .format(values_type=type(values).__name__))
 
+    if is_utf8_dtype(comps):
+        # hash the bytes of the strings, without decoding them
+        return getattr(comps, '_values', comps).isin(values)
+
     if not isinstance(values, (ABCIndex, ABCSeries, np.ndarray)):
         values = construct_1d_object_array_from_listlike(list(values))
 
@@ -463,16 +467,25 @@ def factorize(values, sort=False, order=None, na_sentinel=-1, size_hint=None):
 
     values = _ensure_arraylike(values)
     original = values
-    values, dtype, _ = _ensure_data(values)
-    (hash_klass, vec_klass), values = _get_data_algo(values, _hashtables)
+    if is_utf8_dtype(values):
+        # hash the bytes of the strings, without decoding them
+        labels, uniques = getattr(values, '_values', values).factorize(
+            na_sentinel=na_sentinel)
+        dtype = None
+        uniques = uniques.to_dense()
+    else:
+        values, dtype, _ = _ensure_data(values)
+        (hash_klass, vec_klass), values = _get_data_algo(values,
+                                                         _hashtables)
 
-    table = hash_klass(size_hint or len(values))
-    uniques = vec_klass()
-    check_nulls = not is_integer_dtype(original)
-    labels = table.get_labels(values, uniques, 0, na_sentinel, check_nulls)
+        table = hash_klass(size_hint or len(values))
+        uniques = vec_klass()
+        check_nulls = not is_integer_dtype(original)
+        labels = table.get_labels(values, uniques, 0, na_sentinel,
+                                  check_nulls)
+        uniques = uniques.to_array()
 
     labels = _ensure_platform_int(labels)
-    uniques = uniques.to_array()
 
     if sort and len(uniques) > 0:
         from pandas.core.sorting import safe_sort
@@ -549,6 +562,11 @@ def value_counts(values, sort=True, ascending=False, normalize=False,
             result.name = name
             counts = result.values
 
+        elif is_masked_dtype(values) or is_utf8_dtype(values):
+            result = Series(values)._values.value_counts(dropna=dropna)
+            result.name = name
+            counts = result.values
+
         else:
             keys, counts = _value_counts_arraylike(values, dropna)
 
@@ -1323,6 +1341,11 @@ def take_nd(arr, indexer, axis=0, out=None, fill_value=np.nan, mask_info=None,
         return arr.take(indexer, fill_value=fill_value, allow_fill=allow_fill)
     elif is_interval_dtype(arr):
         return arr.take(indexer, fill_value=fill_value, allow_fill=allow_fill)
+    elif is_masked_dtype(arr) or is_utf8_dtype(arr):
+        if indexer is None:
+            indexer = np.arange(len(arr), dtype=np.int64)
+        return arr.take_nd(indexer, fill_value=fill_value,
+                           allow_fill=allow_fill)
 
     if indexer is None:
         indexer = np.arange(arr.shape[axis], dtype=np.int64)
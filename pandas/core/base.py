@@ -33,6 +33,30 @@ _indexops_doc_kwargs = dict(klass='IndexOpsMixin', inplace='',
                             unique='IndexOpsMixin', duplicated='IndexOpsMixin')
 
 
+def _memory_usage_of_objects(values, deep=True):
+    """
+    Return the memory usage in bytes of the objects referenced by a 1-d
+    object array, and the variance of this usage when it is estimated from a
+    sample of the objects with ``deep='sample'``
+    """
+    if PYPY:
+        return 0, 0.
+
+    from pandas.core.config import get_option
+    size = max(get_option('compute.memory_usage_sample_size'), 2)
+
+    n = len(values)
+    if deep != 'sample' or n <= size:
+        return lib.memory_usage_of_objects(values), 0.
+
+    # the same sample is drawn each time, so that the estimates of the
+    # same values are stable
+    indexer = np.random.RandomState(0).randint(0, n, size)
+    sizes = np.array([values[i].__sizeof__() for i in indexer],
+                     dtype=np.float64)
+    return int(n * sizes.mean()), n ** 2 * sizes.var(ddof=1) / size
+
+
 class StringMixin(object):
     """implements string methods so long as object defines a `__unicode__`
     method.
@@ -1049,9 +1073,12 @@ class IndexOpsMixin(object):
 
         Parameters
         ----------
-        deep : bool
+        deep : bool or 'sample'
             Introspect the data deeply, interrogate
-            `object` dtypes for system-level memory consumption
+            `object` dtypes for system-level memory consumption.
+            With 'sample', the consumption of `object` dtypes is
+            estimated from a sample of
+            ``compute.memory_usage_sample_size`` elements
 
         Returns
         -------
@@ -1066,12 +1093,12 @@ class IndexOpsMixin(object):
         --------
         numpy.ndarray.nbytes
         """
-        if hasattr(self.values, 'memory_usage'):
-            return self.values.memory_usage(deep=deep)
+        if hasattr(self._values, 'memory_usage'):
+            return self._values.memory_usage(deep=deep)
 
         v = self.values.nbytes
-        if deep and is_object_dtype(self) and not PYPY:
-            v += lib.memory_usage_of_objects(self.values)
+        if deep and is_object_dtype(self):
+            v += _memory_usage_of_objects(self.values, deep)[0]
         return v
 
     def factorize(self, sort=False, na_sentinel=-1):
@@ -43,11 +43,28 @@ def use_numexpr_cb(key):
     expressions.set_use_numexpr(cf.get_option(key))
 
 
+memory_usage_sample_size_doc = """
+: int
+    The number of elements of an object array whose size is measured to
+    estimate its memory usage with memory_usage(deep='sample'),
+    the default is 1000
+"""
+
+threads_doc = """
+: int
+    The number of threads used by the cython groupby aggregations of
+    frames with several numeric columns. The columns are split in slices
+    aggregated in parallel, the default is 1
+"""
+
 with cf.config_prefix('compute'):
     cf.register_option('use_bottleneck', True, use_bottleneck_doc,
                        validator=is_bool, cb=use_bottleneck_cb)
     cf.register_option('use_numexpr', True, use_numexpr_doc,
                        validator=is_bool, cb=use_numexpr_cb)
+    cf.register_option('memory_usage_sample_size', 1000,
+                       memory_usage_sample_size_doc, validator=is_int)
+    cf.register_option('threads', 1, threads_doc, validator=is_int)
 #
 # options from the "display" namespace
 
@@ -261,7 +278,7 @@ pc_large_repr_doc = """
 pc_memory_usage_doc = """
 : bool, string or None
     This specifies if the memory usage of a DataFrame should be displayed when
-    df.info() is called. Valid values True,False,'deep'
+    df.info() is called. Valid values True,False,'deep','sample'
 """
 
 pc_latex_escape = """
@@ -352,8 +369,8 @@ with cf.config_prefix('display'):
     cf.register_option('line_width', get_default_val('display.width'),
                        pc_line_width_doc)
     cf.register_option('memory_usage', True, pc_memory_usage_doc,
-                       validator=is_one_of_factory([None, True,
-                                                    False, 'deep']))
+                       validator=is_one_of_factory([None, True, False,
+                                                    'deep', 'sample']))
     cf.register_option('unicode.east_asian_width', False,
                        pc_east_asian_width_doc, validator=is_bool)
     cf.register_option('unicode.ambiguous_as_wide', False,
@@ -434,6 +451,52 @@ with cf.config_prefix('mode'):
     cf.register_option('chained_assignment', 'warn', chained_assignment,
                        validator=is_one_of_factory([None, 'warn', 'raise']))
 
+copy_on_write_doc = """
+: boolean
+    If True, deep copies of a Series or DataFrame (including those made by
+    rename, reindex, set_axis, reset_index and astype to the same dtype)
+    share their data with the original until either object is modified,
+    at which point the modified object makes a private copy.
+    The default is False
+"""
+
+with cf.config_prefix('mode'):
+    cf.register_option('copy_on_write', False, copy_on_write_doc,
+                       validator=is_bool)
+
+consolidation_doc = """
+: string
+    When the blocks of a DataFrame holding the same dtype are merged into a
+    single block. With 'eager', whenever an operation asks for it. With
+    'lazy', only once the frame holds more than mode.consolidation_max_blocks
+    blocks, and never merging blocks holding more than
+    mode.consolidation_max_bytes bytes together. With 'never', blocks are not
+    merged. The default is eager
+"""
+
+consolidation_max_blocks_doc = """
+: int
+    The number of blocks a DataFrame may hold before inserting a column, or
+    any operation when mode.consolidation is 'lazy', merges them.
+    The default is 100
+"""
+
+consolidation_max_bytes_doc = """
+: int or None
+    When mode.consolidation is 'lazy', blocks of the same dtype holding more
+    than this many bytes together are not merged, to avoid copying them.
+    None means no limit. The default is None
+"""
+
+with cf.config_prefix('mode'):
+    cf.register_option('consolidation', 'eager', consolidation_doc,
+                       validator=is_one_of_factory(['eager', 'lazy', 'never']))
+    cf.register_option('consolidation_max_blocks', 100,
+                       consolidation_max_blocks_doc, validator=is_int)
+    cf.register_option('consolidation_max_bytes', None,
+                       consolidation_max_bytes_doc,
+                       validator=is_instance_factory([type(None), int]))
+
 # Set up the io.excel specific configuration.
 writer_engine_doc = """
 : string
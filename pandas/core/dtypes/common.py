@@ -8,6 +8,8 @@ from .dtypes import (CategoricalDtype, CategoricalDtypeType,
                      DatetimeTZDtype, DatetimeTZDtypeType,
                      PeriodDtype, PeriodDtypeType,
                      IntervalDtype, IntervalDtypeType,
+                     MaskedDtype, MaskedDtypeType,
+                     StringDtype, StringDtypeType,
                      ExtensionDtype)
 from .generic import (ABCCategorical, ABCPeriodIndex,
                       ABCDatetimeIndex, ABCSeries,
@@ -539,6 +541,65 @@ def is_categorical_dtype(arr_or_dtype):
     return CategoricalDtype.is_dtype(arr_or_dtype)
 
 
+def is_masked_dtype(arr_or_dtype):
+    """
+    Check whether an array-like or dtype is of a nullable integer or
+    boolean dtype, whose missing values are held in a separate mask.
+
+    Parameters
+    ----------
+    arr_or_dtype : array-like
+        The array-like or dtype to check.
+
+    Returns
+    -------
+    boolean : Whether or not the array-like or dtype is of a
+              nullable integer or boolean dtype.
+
+    Examples
+    --------
+    >>> is_masked_dtype(np.int8)
+    False
+    >>> is_masked_dtype('Int8')
+    True
+    >>> is_masked_dtype(pd.Series([1, None], dtype='Int8'))
+    True
+    """
+
+    if arr_or_dtype is None:
+        return False
+    return MaskedDtype.is_dtype(arr_or_dtype)
+
+
+def is_utf8_dtype(arr_or_dtype):
+    """
+    Check whether an array-like or dtype is of the utf8 string dtype, whose
+    strings are held in a single buffer of utf8 bytes.
+
+    Parameters
+    ----------
+    arr_or_dtype : array-like
+        The array-like or dtype to check.
+
+    Returns
+    -------
+    boolean : Whether or not the array-like or dtype is of the utf8 dtype.
+
+    Examples
+    --------
+    >>> is_utf8_dtype(object)
+    False
+    >>> is_utf8_dtype('utf8')
+    True
+    >>> is_utf8_dtype(pd.Series(['a', None], dtype='utf8'))
+    True
+    """
+
+    if arr_or_dtype is None:
+        return False
+    return StringDtype.is_dtype(arr_or_dtype)
+
+
 def is_string_dtype(arr_or_dtype):
     """
     Check whether the provided array or dtype is of the string dtype.
@@ -1680,6 +1741,10 @@ def is_extension_type(arr):
         return True
     elif is_datetimetz(arr):
         return True
+    elif is_masked_dtype(arr):
+        return True
+    elif is_utf8_dtype(arr):
+        return True
     return False
 
 
@@ -1784,9 +1849,17 @@ def _get_dtype(arr_or_dtype):
         return arr_or_dtype
     elif isinstance(arr_or_dtype, IntervalDtype):
         return arr_or_dtype
+    elif isinstance(arr_or_dtype, MaskedDtype):
+        return arr_or_dtype
+    elif isinstance(arr_or_dtype, StringDtype):
+        return arr_or_dtype
     elif isinstance(arr_or_dtype, string_types):
         if is_categorical_dtype(arr_or_dtype):
             return CategoricalDtype.construct_from_string(arr_or_dtype)
+        elif is_masked_dtype(arr_or_dtype):
+            return MaskedDtype.construct_from_string(arr_or_dtype)
+        elif is_utf8_dtype(arr_or_dtype):
+            return StringDtype.construct_from_string(arr_or_dtype)
         elif is_datetime64tz_dtype(arr_or_dtype):
             return DatetimeTZDtype.construct_from_string(arr_or_dtype)
         elif is_period_dtype(arr_or_dtype):
@@ -1829,9 +1902,17 @@ def _get_dtype_type(arr_or_dtype):
         return IntervalDtypeType
     elif isinstance(arr_or_dtype, PeriodDtype):
         return PeriodDtypeType
+    elif isinstance(arr_or_dtype, MaskedDtype):
+        return MaskedDtypeType
+    elif isinstance(arr_or_dtype, StringDtype):
+        return StringDtypeType
     elif isinstance(arr_or_dtype, string_types):
         if is_categorical_dtype(arr_or_dtype):
             return CategoricalDtypeType
+        elif is_masked_dtype(arr_or_dtype):
+            return MaskedDtypeType
+        elif is_utf8_dtype(arr_or_dtype):
+            return StringDtypeType
         elif is_datetime64tz_dtype(arr_or_dtype):
             return DatetimeTZDtypeType
         elif is_period_dtype(arr_or_dtype):
@@ -1952,12 +2033,22 @@ def pandas_dtype(dtype):
         return dtype
     elif isinstance(dtype, IntervalDtype):
         return dtype
+    elif isinstance(dtype, MaskedDtype):
+        return dtype
+    elif isinstance(dtype, StringDtype):
+        return dtype
     elif isinstance(dtype, string_types):
         try:
             return DatetimeTZDtype.construct_from_string(dtype)
         except TypeError:
             pass
 
+        if is_masked_dtype(dtype):
+            return MaskedDtype.construct_from_string(dtype)
+
+        if is_utf8_dtype(dtype):
+            return StringDtype.construct_from_string(dtype)
+
         if dtype.startswith('period[') or dtype.startswith('Period['):
             # do not parse string like U as period[U]
             try:
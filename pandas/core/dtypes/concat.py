@@ -7,6 +7,8 @@ import pandas._libs.tslib as tslib
 from pandas import compat
 from pandas.core.dtypes.common import (
     is_categorical_dtype,
+    is_masked_dtype,
+    is_utf8_dtype,
     is_sparse,
     is_datetimetz,
     is_datetime64_dtype,
@@ -39,6 +41,10 @@ def get_dtype_kinds(l):
         dtype = arr.dtype
         if is_categorical_dtype(dtype):
             typ = 'category'
+        elif is_masked_dtype(dtype):
+            typ = 'masked'
+        elif is_utf8_dtype(dtype):
+            typ = 'utf8'
         elif is_sparse(arr):
             typ = 'sparse'
         elif isinstance(arr, ABCRangeIndex):
@@ -143,6 +149,12 @@ def _concat_compat(to_concat, axis=0):
         # to support Categorical + datetime-like
         return _concat_categorical(to_concat, axis=axis)
 
+    elif 'masked' in typs:
+        return _concat_masked(to_concat, axis=axis)
+
+    elif 'utf8' in typs:
+        return _concat_utf8(to_concat, axis=axis)
+
     elif _contains_datetime or 'timedelta' in typs or _contains_period:
         return _concat_datetime(to_concat, axis=axis, typs=typs)
 
@@ -211,6 +223,67 @@ def _concat_categorical(to_concat, axis=0):
     return _concat_asobject(to_concat)
 
 
+def _concat_masked(to_concat, axis=0):
+    """Concatenate an array of arrays, some of which are MaskedArrays
+
+    Parameters
+    ----------
+    to_concat : array of arrays
+    axis : int
+        Axis to provide concatenation, MaskedArrays are always 1D
+
+    Returns
+    -------
+    MaskedArray if all of the arrays are MaskedArrays of integers, or all of
+    booleans, else an ndarray of the upcast dense values
+    """
+    from pandas.core.dtypes.dtypes import MaskedDtype
+    from pandas.core.masked import _concat_same_type
+
+    masked = [x for x in to_concat if is_masked_dtype(x.dtype)]
+    if len(masked) == len(to_concat):
+        is_bool = [x.dtype.numpy_dtype == np.bool_ for x in masked]
+        if all(is_bool) or not any(is_bool):
+            dtype = np.result_type(*[x.dtype.numpy_dtype for x in masked])
+            if dtype in MaskedDtype._names:
+                return _concat_same_type(masked)
+
+    to_concat = [x.to_dense() if is_masked_dtype(x.dtype)
+                 else x.ravel() for x in to_concat]
+    res = _concat_compat(to_concat)
+    if axis == 1:
+        return res.reshape(1, len(res))
+    return res
+
+
+def _concat_utf8(to_concat, axis=0):
+    """Concatenate an array of arrays, some of which are StringArrays
+
+    Parameters
+    ----------
+    to_concat : array of arrays
+    axis : int
+        Axis to provide concatenation, StringArrays are always 1D
+
+    Returns
+    -------
+    StringArray if all of the arrays are StringArrays, else an object
+    ndarray of the decoded strings
+    """
+    from pandas.core.utf8 import _concat_same_type
+
+    utf8 = [x for x in to_concat if is_utf8_dtype(x.dtype)]
+    if len(utf8) == len(to_concat):
+        return _concat_same_type(utf8)
+
+    to_concat = [x.to_dense() if is_utf8_dtype(x.dtype)
+                 else x.ravel() for x in to_concat]
+    res = _concat_compat(to_concat)
+    if axis == 1:
+        return res.reshape(1, len(res))
+    return res
+
+
 def union_categoricals(to_union, sort_categories=False, ignore_order=False):
     """
     Combine list-like of Categorical-like, unioning categories. All
@@ -737,3 +737,164 @@ class IntervalDtype(ExtensionDtype):
             else:
                 return False
         return super(IntervalDtype, cls).is_dtype(dtype)
+
+
+class MaskedDtypeType(type):
+    """
+    the type of MaskedDtype, this metaclass determines subclass ability
+    """
+    pass
+
+
+class MaskedDtype(ExtensionDtype):
+    __metaclass__ = MaskedDtypeType
+    """
+    A nullable integer or boolean duck-typed class: values of a numpy
+    integer or boolean dtype held together with a mask of missing values
+
+    THIS IS NOT A REAL NUMPY DTYPE
+    """
+    type = MaskedDtypeType
+    kind = 'O'
+    str = '|O08'
+    base = np.dtype('O')
+    num = 104
+    _metadata = ['numpy_dtype']
+    _names = {np.dtype(t): t.title().replace('Uint', 'UInt')
+              for t in ['int8', 'int16', 'int32', 'int64',
+                        'uint8', 'uint16', 'uint32', 'uint64', 'bool']}
+    _cache = {}
+
+    def __new__(cls, numpy_dtype=None):
+        """
+        Parameters
+        ----------
+        numpy_dtype : numpy integer or boolean dtype of the values, or the
+            name of a nullable dtype, e.g. ``'Int8'``
+        """
+
+        if isinstance(numpy_dtype, MaskedDtype):
+            return numpy_dtype
+        elif numpy_dtype is None:
+            # empty constructor for pickle compat
+            u = object.__new__(cls)
+            u.numpy_dtype = None
+            return u
+
+        if isinstance(numpy_dtype, compat.string_types):
+            for dtype, name in compat.iteritems(cls._names):
+                if numpy_dtype == name:
+                    numpy_dtype = dtype
+                    break
+        try:
+            numpy_dtype = np.dtype(numpy_dtype)
+        except TypeError:
+            raise ValueError("could not construct MaskedDtype")
+        if numpy_dtype not in cls._names:
+            raise ValueError("MaskedDtype requires an integer or boolean "
+                             "dtype, got {dtype}".format(dtype=numpy_dtype))
+
+        try:
+            return cls._cache[numpy_dtype]
+        except KeyError:
+            u = object.__new__(cls)
+            u.numpy_dtype = numpy_dtype
+            cls._cache[numpy_dtype] = u
+            return u
+
+    @classmethod
+    def construct_from_string(cls, string):
+        """
+        attempt to construct this type from a string, raise a TypeError
+        if its not possible
+        """
+        if (isinstance(string, compat.string_types) and
+                string in cls._names.values()):
+            return cls(string)
+        raise TypeError("could not construct MaskedDtype")
+
+    @property
+    def itemsize(self):
+        return self.numpy_dtype.itemsize
+
+    def __unicode__(self):
+        return self._names[self.numpy_dtype]
+
+    @property
+    def name(self):
+        return str(self)
+
+    def __hash__(self):
+        # make myself hashable
+        return hash(str(self))
+
+    def __eq__(self, other):
+        if isinstance(other, compat.string_types):
+            return other == self.name
+
+        return (isinstance(other, MaskedDtype) and
+                self.numpy_dtype == other.numpy_dtype)
+
+    @classmethod
+    def is_dtype(cls, dtype):
+        """
+        Return a boolean if we if the passed type is an actual dtype that we
+        can match (via string or type)
+        """
+        if isinstance(dtype, compat.string_types):
+            return dtype in cls._names.values()
+        return super(MaskedDtype, cls).is_dtype(dtype)
+
+
+class StringDtypeType(type):
+    """
+    the type of StringDtype, this metaclass determines subclass ability
+    """
+    pass
+
+
+class StringDtype(ExtensionDtype):
+    __metaclass__ = StringDtypeType
+    """
+    A utf8 string duck-typed class: strings held in a single buffer of utf8
+    bytes, the offsets of each string in it and a mask of missing values
+
+    THIS IS NOT A REAL NUMPY DTYPE
+    """
+    name = 'utf8'
+    type = StringDtypeType
+    kind = 'O'
+    str = '|O08'
+    base = np.dtype('O')
+    num = 105
+    _metadata = []
+
+    @classmethod
+    def construct_from_string(cls, string):
+        """
+        attempt to construct this type from a string, raise a TypeError
+        if its not possible
+        """
+        if string == cls.name:
+            return cls()
+        raise TypeError("could not construct StringDtype")
+
+    def __hash__(self):
+        # make myself hashable
+        return hash(str(self))
+
+    def __eq__(self, other):
+        if isinstance(other, compat.string_types):
+            return other == self.name
+
+        return isinstance(other, StringDtype)
+
+    @classmethod
+    def is_dtype(cls, dtype):
+        """
+        Return a boolean if we if the passed type is an actual dtype that we
+        can match (via string or type)
+        """
+        if isinstance(dtype, compat.string_types):
+            return dtype == cls.name
+        return super(StringDtype, cls).is_dtype(dtype)
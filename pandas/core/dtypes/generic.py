@@ -51,6 +51,10 @@ ABCSparseArray = create_pandas_abc_type("ABCSparseArray", "_subtyp",
                                         ('sparse_array', 'sparse_series'))
 ABCCategorical = create_pandas_abc_type("ABCCategorical", "_typ",
                                         ("categorical"))
+ABCMaskedArray = create_pandas_abc_type("ABCMaskedArray", "_typ",
+                                        ("maskedarray", ))
+ABCStringArray = create_pandas_abc_type("ABCStringArray", "_typ",
+                                        ("stringarray", ))
 ABCPeriod = create_pandas_abc_type("ABCPeriod", "_typ", ("period", ))
 ABCDateOffset = create_pandas_abc_type("ABCDateOffset", "_typ",
                                        ("dateoffset",))
@@ -5,7 +5,8 @@ import numpy as np
 from pandas._libs import lib, missing as libmissing
 from pandas._libs.tslib import NaT, iNaT
 from .generic import (ABCMultiIndex, ABCSeries,
-                      ABCIndexClass, ABCGeneric)
+                      ABCIndexClass, ABCGeneric,
+                      ABCMaskedArray, ABCStringArray)
 from .common import (is_string_dtype, is_datetimelike,
                      is_datetimelike_v_numeric, is_float_dtype,
                      is_datetime64_dtype, is_datetime64tz_dtype,
@@ -57,6 +58,8 @@ def _isna_new(obj):
     # hack (for now) because MI registers as ndarray
     elif isinstance(obj, ABCMultiIndex):
         raise NotImplementedError("isna is not defined for MultiIndex")
+    elif isinstance(obj, (ABCMaskedArray, ABCStringArray)):
+        return obj.isna()
     elif isinstance(obj, (ABCSeries, np.ndarray, ABCIndexClass)):
         return _isna_ndarraylike(obj)
     elif isinstance(obj, ABCGeneric):
@@ -83,6 +86,8 @@ def _isna_old(obj):
     # hack (for now) because MI registers as ndarray
     elif isinstance(obj, ABCMultiIndex):
         raise NotImplementedError("isna is not defined for MultiIndex")
+    elif isinstance(obj, (ABCMaskedArray, ABCStringArray)):
+        return obj.isna()
     elif isinstance(obj, (ABCSeries, np.ndarray, ABCIndexClass)):
         return _isna_ndarraylike_old(obj)
     elif isinstance(obj, ABCGeneric):
@@ -125,10 +130,16 @@ def _use_inf_as_na(key):
 
 def _isna_ndarraylike(obj):
 
-    values = getattr(obj, 'values', obj)
+    if isinstance(getattr(obj, '_values', None), ABCStringArray):
+        # the mask of the utf8 strings, without decoding them
+        values = obj._values
+    else:
+        values = getattr(obj, 'values', obj)
     dtype = values.dtype
 
-    if is_string_dtype(dtype):
+    if isinstance(values, ABCStringArray):
+        result = values.isna()
+    elif is_string_dtype(dtype):
         if is_categorical_dtype(values):
             from pandas import Categorical
             if not isinstance(values, Categorical):
@@ -36,6 +36,8 @@ from pandas.core.dtypes.cast import (
     find_common_type)
 from pandas.core.dtypes.common import (
     is_categorical_dtype,
+    is_masked_dtype,
+    is_utf8_dtype,
     is_object_dtype,
     is_extension_type,
     is_datetimetz,
@@ -264,8 +266,11 @@ class DataFrame(NDFrame):
         np.arange(n) if no column labels are provided
     dtype : dtype, default None
         Data type to force. Only a single dtype is allowed. If None, infer
-    copy : boolean, default False
-        Copy data from inputs. Only affects DataFrame / 2d ndarray input
+    copy : boolean, default None
+        Copy data from inputs. For DataFrame / 2d ndarray input, None means
+        False. For dict input, None means True; with ``copy=False`` each
+        array is kept in its own block without being copied, and the blocks
+        are only consolidated once an operation requires it
 
     Examples
     --------
@@ -327,7 +332,7 @@ class DataFrame(NDFrame):
         return Panel
 
     def __init__(self, data=None, index=None, columns=None, dtype=None,
-                 copy=False):
+                 copy=None):
         if data is None:
             data = {}
         if dtype is not None:
@@ -340,7 +345,8 @@ class DataFrame(NDFrame):
             mgr = self._init_mgr(data, axes=dict(index=index, columns=columns),
                                  dtype=dtype, copy=copy)
         elif isinstance(data, dict):
-            mgr = self._init_dict(data, index, columns, dtype=dtype)
+            mgr = self._init_dict(data, index, columns, dtype=dtype,
+                                  copy=copy is not False)
         elif isinstance(data, ma.MaskedArray):
             import numpy.ma.mrecords as mrecords
             # masked recarray
@@ -418,7 +424,7 @@ class DataFrame(NDFrame):
 
         NDFrame.__init__(self, mgr, fastpath=True)
 
-    def _init_dict(self, data, index, columns, dtype=None):
+    def _init_dict(self, data, index, columns, dtype=None, copy=True):
         """
         Segregate Series based on type and coerce into matrices.
         Needs to handle a lot of exceptional cases.
@@ -470,7 +476,8 @@ class DataFrame(NDFrame):
             columns = data_names = Index(keys)
             arrays = [data[k] for k in keys]
 
-        return _arrays_to_mgr(arrays, data_names, index, columns, dtype=dtype)
+        return _arrays_to_mgr(arrays, data_names, index, columns, dtype=dtype,
+                              copy=copy)
 
     def _init_ndarray(self, values, index, columns, dtype=None, copy=False):
         # input must be a ndarray, list, Series, index
@@ -506,7 +513,9 @@ class DataFrame(NDFrame):
         # we could have a categorical type passed or coerced to 'category'
         # recast this to an _arrays_to_mgr
         if (is_categorical_dtype(getattr(values, 'dtype', None)) or
-                is_categorical_dtype(dtype)):
+                is_categorical_dtype(dtype) or is_masked_dtype(values) or
+                is_masked_dtype(dtype) or is_utf8_dtype(values) or
+                is_utf8_dtype(dtype)):
 
             if not hasattr(values, 'dtype'):
                 values = _prep_ndarray(values, copy=copy)
@@ -1787,8 +1796,10 @@ class DataFrame(NDFrame):
             elements (including index) should be displayed. None follows
             the `display.memory_usage` setting. True or False overrides
             the `display.memory_usage` setting. A value of 'deep' is equivalent
-            of True, with deep introspection. Memory usage is shown in
-            human-readable units (base-2 representation).
+            of True, with deep introspection, and a value of 'sample' estimates
+            the deep introspection from a sample of the elements, shown with
+            the 95% confidence interval of the estimate. Memory usage is shown
+            in human-readable units (base-2 representation).
         null_counts : boolean, default None
             Whether to show the non-null counts
 
@@ -1886,6 +1897,8 @@ class DataFrame(NDFrame):
             size_qualifier = ''
             if memory_usage == 'deep':
                 deep = True
+            elif memory_usage == 'sample':
+                deep = 'sample'
             else:
                 # size_qualifier is just a best effort; not guaranteed to catch
                 # all cases (e.g., it misses categorical data even with object
@@ -1895,8 +1908,13 @@ class DataFrame(NDFrame):
                         self.index._is_memory_usage_qualified()):
                     size_qualifier = '+'
             mem_usage = self.memory_usage(index=True, deep=deep).sum()
-            lines.append("memory usage: %s\n" %
-                         _sizeof_fmt(mem_usage, size_qualifier))
+            mem_usage = _sizeof_fmt(mem_usage, size_qualifier)
+            if deep == 'sample':
+                # the usages of the objects are cached by the blocks
+                variance = self._data.memory_usage(deep=deep)[1].sum()
+                mem_usage += ' +/- %s' % _sizeof_fmt(1.96 * np.sqrt(variance),
+                                                     '')
+            lines.append("memory usage: %s\n" % mem_usage)
         _put_lines(buf, lines)
 
     def memory_usage(self, index=True, deep=False):
@@ -1908,9 +1926,15 @@ class DataFrame(NDFrame):
             Specifies whether to include memory usage of DataFrame's
             index in returned Series. If `index=True` (default is False)
             the first index of the Series is `Index`.
-        deep : bool
+        deep : bool or 'sample'
             Introspect the data deeply, interrogate
-            `object` dtypes for system-level memory consumption
+            `object` dtypes for system-level memory consumption.
+            With 'sample', the consumption of `object` dtypes is
+            estimated from a sample of
+            ``compute.memory_usage_sample_size`` elements of each
+            column. The consumption of the `object` columns is cached
+            until they are modified. An object referenced several times
+            is only counted once, except by the estimates
 
         Returns
         -------
@@ -1927,8 +1951,8 @@ class DataFrame(NDFrame):
         --------
         numpy.ndarray.nbytes
         """
-        result = Series([c.memory_usage(index=False, deep=deep)
-                         for col, c in self.iteritems()], index=self.columns)
+        result = Series(self._data.memory_usage(deep=deep)[0],
+                        index=self.columns)
         if index:
             result = Series(self.index.memory_usage(deep=deep),
                             index=['Index']).append(result)
@@ -2051,6 +2075,9 @@ class DataFrame(NDFrame):
         return self._set_value(index, col, value, takeable=takeable)
 
     def _set_value(self, index, col, value, takeable=False):
+        if self._data.copy_if_shared():
+            # cached columns are views on the shared values
+            self._clear_item_cache()
         try:
             if takeable is True:
                 series = self._iget_item_cache(col)
@@ -2728,11 +2755,42 @@ class DataFrame(NDFrame):
             results = results.items()
         else:
             results = sorted(results.items())
-        # ... and then assign
+        # ... and then assign, the new columns all at once
+        new_keys, new_values = [], []
         for k, v in results:
-            data[k] = v
+            if (k in data.columns or isinstance(v, DataFrame) or
+                    isinstance(data.columns, MultiIndex)):
+                data[k] = v
+            else:
+                new_keys.append(k)
+                new_values.append(v)
+
+        if new_keys:
+            data._append_items(new_keys, new_values)
         return data
 
+    def _append_items(self, keys, values):
+        """
+        Add new columns at the end of the DataFrame in a single update of the
+        BlockManager, instead of inserting them one at a time.
+        """
+        for value in values:
+            self._ensure_valid_index(value)
+        arrays = []
+        for key, value in zip(keys, values):
+            value = self._sanitize_column(key, value)
+            if isinstance(value, np.ndarray) and value.ndim == 2:
+                # a single column is sanitized to shape (1, n), as in
+                # __setitem__ anything wider cannot be one item
+                if value.shape[0] != 1:
+                    raise ValueError('Wrong number of items passed {val}, '
+                                     'placement implies 1'.format(
+                                         val=value.shape[0]))
+                value = value[0]
+            arrays.append(value)
+        self._data.append_items(keys, arrays)
+        self._clear_item_cache()
+
     def _sanitize_column(self, key, value, broadcast=True):
         """
         Ensures new columns (which go into the BlockManager as new blocks) are
@@ -6019,7 +6077,7 @@ ops.add_flex_arithmetic_methods(DataFrame, **ops.frame_flex_funcs)
 ops.add_special_arithmetic_methods(DataFrame, **ops.frame_special_funcs)
 
 
-def _arrays_to_mgr(arrays, arr_names, index, columns, dtype=None):
+def _arrays_to_mgr(arrays, arr_names, index, columns, dtype=None, copy=True):
     """
     Segregate Series based on type and coerce into matrices.
     Needs to handle a lot of exceptional cases.
@@ -6036,7 +6094,8 @@ def _arrays_to_mgr(arrays, arr_names, index, columns, dtype=None):
     # from BlockManager perspective
     axes = [_ensure_index(columns), _ensure_index(index)]
 
-    return create_block_manager_from_arrays(arrays, arr_names, axes)
+    return create_block_manager_from_arrays(arrays, arr_names, axes,
+                                            consolidate=copy)
 
 
 def extract_index(data):
@@ -4448,6 +4448,45 @@ class NDFrame(PandasObject, SelectionMixin):
             memo = {}
         return self.copy(deep=True)
 
+    def to_mmap(self, path=None):
+        """
+        Make a copy of this object whose data is stored in memory-mapped
+        files, so that the operating system can page it out to disk rather
+        than keeping it in memory.
+
+        .. versionadded:: 0.23.0
+
+        Parameters
+        ----------
+        path : string, default None
+            Directory in which to create the files. If None, the default
+            temporary directory is used.
+
+        Returns
+        -------
+        copy : type of caller
+
+        Notes
+        -----
+        Only data of a numeric, boolean, datetime or timedelta dtype is
+        memory-mapped, data holding Python objects or of an extension dtype
+        is copied in memory. The results of operations on the copy are held
+        in memory as usual.
+
+        The files are removed once created, their disk space is given back
+        when the copy is freed. On Windows, where files in use cannot be
+        removed, they are left in ``path``.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame({'a': [1, 2], 'b': [0.5, 1.5]})
+        >>> mapped = df.to_mmap()
+        >>> mapped.equals(df)
+        True
+        """
+        data = self._data.to_mmap(path=path)
+        return self._constructor(data).__finalize__(self)
+
     def _convert(self, datetime=False, numeric=False, timedelta=False,
                  coerce=False, copy=True):
         """
@@ -5533,6 +5572,8 @@ class NDFrame(PandasObject, SelectionMixin):
             values are used as-is determine the groups. A label or list of
             labels may be passed to group by the columns in ``self``. Notice
             that a tuple is interpreted a (single) key.
+            The ``grouper`` of an existing GroupBy object on the same or an
+            aligned object may be passed to reuse its group labels.
         axis : int, default 0
         level : int, level name, or sequence of such, default None
             If the axis is a MultiIndex (hierarchical), group by a particular
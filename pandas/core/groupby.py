@@ -20,10 +20,12 @@ from pandas.core.dtypes.common import (
     is_numeric_dtype,
     is_timedelta64_dtype, is_datetime64_dtype,
     is_categorical_dtype,
+    is_masked_dtype,
+    is_utf8_dtype,
     is_interval_dtype,
     is_datetimelike,
     is_datetime64_any_dtype,
-    is_bool, is_integer_dtype,
+    is_bool, is_integer_dtype, is_float_dtype,
     is_complex_dtype,
     is_bool_dtype,
     is_scalar,
@@ -48,6 +50,8 @@ from pandas.core.base import (PandasObject, SelectionMixin, GroupByError,
 from pandas.core.index import (Index, MultiIndex,
                                CategoricalIndex, _ensure_index)
 from pandas.core.categorical import Categorical
+from pandas.core.masked import MaskedArray
+from pandas.core.utf8 import StringArray
 from pandas.core.frame import DataFrame
 from pandas.core.generic import NDFrame, _shared_docs
 from pandas.core.internals import BlockManager, make_block
@@ -62,7 +66,7 @@ from pandas.io.formats.printing import pprint_thing
 from pandas.util._validators import validate_kwargs
 
 import pandas.core.algorithms as algorithms
-from pandas.core.config import option_context
+from pandas.core.config import option_context, get_option
 
 from pandas.plotting._core import boxplot_frame_groupby
 
@@ -910,7 +914,7 @@ b  2""")
         (though the default is sort=True) for groupby in general
         """
         ids, _, ngroups = self.grouper.group_info
-        sorter = get_group_index_sorter(ids, ngroups)
+        sorter = self.grouper._sort_idx
         ids, count = ids[sorter], len(ids)
 
         if count == 0:
@@ -960,7 +964,7 @@ b  2""")
         else:
             dtype = obj.dtype
 
-        if not is_scalar(result):
+        if not is_scalar(result) and not is_masked_dtype(dtype):
             if numeric_only and is_numeric_dtype(dtype) or not numeric_only:
                 result = maybe_downcast_to_dtype(result, dtype)
 
@@ -969,12 +973,13 @@ b  2""")
     def _cython_transform(self, how, numeric_only=True):
         output = collections.OrderedDict()
         for name, obj in self._iterate_slices():
-            is_numeric = is_numeric_dtype(obj.dtype)
+            is_numeric = is_numeric_dtype(obj.dtype) or is_masked_dtype(obj)
             if numeric_only and not is_numeric:
                 continue
 
+            values = obj._values if is_masked_dtype(obj) else obj.values
             try:
-                result, names = self.grouper.transform(obj.values, how)
+                result, names = self.grouper.transform(values, how)
             except NotImplementedError:
                 continue
             except AssertionError as e:
@@ -987,16 +992,18 @@ b  2""")
         return self._wrap_transformed_output(output, names)
 
     def _cython_agg_general(self, how, alt=None, numeric_only=True,
-                            min_count=-1):
+                            min_count=-1, **kwargs):
         output = {}
         for name, obj in self._iterate_slices():
-            is_numeric = is_numeric_dtype(obj.dtype)
+            is_numeric = is_numeric_dtype(obj.dtype) or is_masked_dtype(obj)
             if numeric_only and not is_numeric:
                 continue
 
+            values = obj._values if is_masked_dtype(obj) else obj.values
             try:
-                result, names = self.grouper.aggregate(obj.values, how,
-                                                       min_count=min_count)
+                result, names = self.grouper.aggregate(values, how,
+                                                       min_count=min_count,
+                                                       **kwargs)
             except AssertionError as e:
                 raise GroupByError(str(e))
             output[name] = self._try_cast(result, obj)
@@ -1006,6 +1013,47 @@ b  2""")
 
         return self._wrap_aggregated_output(output, names)
 
+    # the functions computed in a single pass when agg is passed several of
+    # them, and their cython aggregation
+    _fused_funcs = {'count': 'count', 'sum': 'add', 'mean': 'mean',
+                    'var': 'var', 'std': 'std', 'min': 'min', 'max': 'max',
+                    'first': 'first', 'last': 'last'}
+
+    def _get_fused_hows(self, arg, obj):
+        """
+        return the cython aggregations computing the list of function names
+        arg over obj in a single pass, or None if they cannot be fused
+        """
+        if (isinstance(self.grouper, BinGrouper) or self.axis != 0 or
+                len(arg) < 2 or
+                not all(isinstance(f, compat.string_types) and
+                        f in self._fused_funcs for f in arg) or
+                len(set(arg)) != len(arg)):
+            return None
+
+        hows = [self._fused_funcs[f] for f in arg]
+        dtypes = [obj.dtype] if obj.ndim == 1 else obj.dtypes
+        for dtype in dtypes:
+            if not isinstance(dtype, np.dtype):
+                return None
+            elif is_integer_dtype(dtype):
+                # the single aggregations compute the min, max, first and
+                # last of integers without going through float64
+                if set(hows) - set(['count', 'add', 'mean', 'var', 'std']):
+                    return None
+            elif not is_float_dtype(dtype):
+                return None
+        return hows
+
+    def _wrap_fused_result(self, result, how, dtype):
+        # cast the result of a fused aggregation as the single aggregation
+        # does
+        if how == 'count':
+            return result.astype('int64')
+        elif dtype == np.float64 or how == 'std' and is_integer_dtype(dtype):
+            return result
+        return maybe_downcast_to_dtype(result, dtype)
+
     def _python_agg_general(self, func, *args, **kwargs):
         func = self._is_builtin_func(func)
         f = lambda x: func(x, *args, **kwargs)
@@ -1233,6 +1281,69 @@ class GroupBy(_GroupBy):
                 return x.median(axis=self.axis, **kwargs)
             return self._python_agg_general(f)
 
+    @Substitution(name='groupby')
+    @Appender(_doc_template)
+    def quantile(self, q=0.5, interpolation='linear'):
+        """
+        Return values at the given quantile of groups, excluding missing
+        values
+
+        Parameters
+        ----------
+        q : float or array-like, default 0.5
+            0 <= q <= 1, the quantile(s) to compute
+        interpolation : {'linear', 'lower', 'higher', 'midpoint', 'nearest'}
+            The interpolation between the two values surrounding the
+            quantile, as in ``numpy.percentile``
+
+        Notes
+        -----
+        A single quantile of numeric data is computed in cython, other
+        quantiles are computed by calling ``quantile`` on each group.
+        """
+        valid = ['linear', 'lower', 'higher', 'midpoint', 'nearest']
+        if interpolation not in valid:
+            raise ValueError("interpolation must be one of {valid}, got "
+                             "{interpolation}".format(
+                                 valid=valid, interpolation=interpolation))
+
+        if is_scalar(q) and self.axis == 0 and self._holds_exact_floats():
+            try:
+                result = self._cython_agg_general(
+                    'quantile', q=q, interpolation=interpolation)
+            except (DataError, NotImplementedError):
+                pass
+            else:
+                # as with Series.quantile, the interpolated quantiles of
+                # integers and booleans are floats, while the others are
+                # values of the groups and keep their dtype
+                if interpolation in ('linear', 'midpoint'):
+                    result = result.astype(np.float64)
+                if isinstance(result, DataFrame):
+                    result.columns.name = q
+                return result
+
+        return self._make_wrapper('quantile')(q, interpolation=interpolation)
+
+    def _holds_exact_floats(self):
+        """
+        whether the integers of the object are exactly held by float64, as
+        by the cython kernels working on float64
+        """
+        obj = self._obj_with_exclusions
+        if isinstance(obj, Series):
+            columns = [obj]
+        else:
+            columns = [obj.iloc[:, i] for i in range(obj.shape[1])]
+
+        limit = 2 ** 53
+        for col in columns:
+            if is_integer_dtype(col):
+                values = col.values
+                if ((values > limit) | (values < -limit)).any():
+                    return False
+        return True
+
     @Substitution(name='groupby')
     @Appender(_doc_template)
     def std(self, ddof=1, *args, **kwargs):
@@ -1877,6 +1988,259 @@ def groupby(obj, by, **kwds):
     return klass(obj, by, **kwds)
 
 
+# the partial states kept by groupby_chunks for each aggregation, and how the
+# states of several chunks are merged
+_chunk_states = {
+    'count': ['count'],
+    'sum': ['sum'],
+    'mean': ['count', 'sum'],
+    'var': ['count', 'sum', 'm2'],
+    'std': ['count', 'sum', 'm2'],
+    'min': ['min'],
+    'max': ['max'],
+    'first': ['first'],
+    'last': ['last'],
+    'nunique': [],
+}
+_chunk_merges = {'count': 'sum', 'sum': 'sum', 'min': 'min', 'max': 'max',
+                 'first': 'first', 'last': 'last'}
+# the aggregations that only apply to numeric columns
+_chunk_numeric = ['sum', 'mean', 'var', 'std']
+
+
+def groupby_chunks(chunks, by, agg, sort=True):
+    """
+    Group and aggregate an iterable of DataFrames, such as the reader
+    returned by ``read_csv(..., chunksize=...)``, one chunk at a time
+
+    Each chunk is aggregated with the cython groupby kernels into partial
+    states (counts, sums, sums of squared deviations, minima, ...) that
+    are merged with the states of the previous chunks, so that the memory
+    used depends on the number of groups rather than on the number of rows.
+
+    .. versionadded:: 0.23.0
+
+    Parameters
+    ----------
+    chunks : iterable of DataFrame
+        the chunks, all with the same columns
+    by : label or list of labels
+        the columns to group by
+    agg : string, list of strings or dict of column -> string or list
+        the aggregations, among ``'count'``, ``'sum'``, ``'mean'``,
+        ``'var'``, ``'std'``, ``'min'``, ``'max'``, ``'first'``, ``'last'``
+        and ``'nunique'``. A string or a list is applied to all the columns
+        that are not grouped by, except those that some of the aggregations
+        do not apply to, as with ``groupby``.
+    sort : boolean, default True
+        Sort the group keys
+
+    Returns
+    -------
+    aggregated : DataFrame
+        the result of ``concat(chunks).groupby(by).agg(agg)``, up to
+        floating point rounding
+
+    Notes
+    -----
+    ``'nunique'`` keeps the distinct (group, value) pairs seen so far, so
+    its memory depends on the number of such pairs.
+
+    ``'mean'``, ``'var'`` and ``'std'`` are always floats, whereas
+    ``groupby`` may cast them back to the dtype of integer columns when all
+    of them are integral.
+
+    Examples
+    --------
+    >>> reader = pd.read_csv('data.csv', chunksize=10 ** 6)
+    >>> pd.groupby_chunks(reader, by='key',
+    ...                   agg={'value': ['sum', 'mean', 'std']})
+    """
+    from pandas.core.reshape.concat import concat
+
+    keys = list(by) if is_list_like(by) else [by]
+    levels = list(range(len(keys))) if len(keys) > 1 else 0
+
+    funcs = None
+    states = {}
+    distinct = {}
+    for chunk in chunks:
+        if funcs is None:
+            funcs = _get_chunk_funcs(chunk, keys, agg)
+            first = chunk
+        if not len(chunk):
+            continue
+
+        grouped = chunk.groupby(keys, sort=False)
+        for col, col_funcs in list(compat.iteritems(funcs)):
+            if 'nunique' in col_funcs:
+                pairs = chunk[keys + [col]].dropna(subset=keys)
+                if col in distinct:
+                    pairs = concat([distinct[col], pairs], ignore_index=True)
+                distinct[col] = pairs.drop_duplicates()
+
+            needed = set()
+            for func in col_funcs:
+                needed.update(_chunk_states[func])
+            if not needed:
+                continue
+
+            hows = [how for how in ['count', 'sum', 'min', 'max', 'first',
+                                    'last'] if how in needed]
+            if 'm2' in needed:
+                hows.append('var')
+            try:
+                partial = grouped[col].agg(hows)
+                if 'm2' in needed:
+                    partial['m2'] = (partial.pop('var') *
+                                     (partial['count'] - 1)).fillna(0)
+
+                if col in states:
+                    partial = _merge_chunk_states(
+                        concat([states[col], partial]), levels)
+            except TypeError:
+                if isinstance(agg, dict):
+                    raise
+                # as with groupby, e.g. the sums of objects that cannot be
+                # added drop their column
+                del funcs[col]
+                states.pop(col, None)
+                distinct.pop(col, None)
+                if not funcs:
+                    raise DataError('No numeric types to aggregate')
+                continue
+            states[col] = partial
+
+    if funcs is None:
+        raise ValueError('No chunks to aggregate')
+    empty = not states and not distinct
+
+    results = []
+    names = []
+    for col, col_funcs in compat.iteritems(funcs):
+        for func in col_funcs:
+            if empty:
+                res = _empty_chunk_result(first, keys, col, func)
+            elif func == 'nunique':
+                res = distinct[col].groupby(keys, sort=False)[col].nunique()
+            else:
+                res = _finalize_chunk_state(states[col], func)
+            results.append(res)
+            names.append((col, func))
+
+    index = results[0].index
+    result = DataFrame(dict((i, res.reindex(index))
+                            for i, res in enumerate(results)),
+                       index=index, columns=range(len(results)))
+    if isinstance(agg, list) or (isinstance(agg, dict) and any(
+            is_list_like(value) for value in compat.itervalues(agg))):
+        result.columns = MultiIndex.from_tuples(names)
+    else:
+        result.columns = Index([col for col, _ in names])
+
+    if sort:
+        result = result.sort_index()
+    return result
+
+
+def _get_chunk_funcs(chunk, keys, agg):
+    """ the ordered lists of aggregations of each column to aggregate """
+    if isinstance(agg, dict):
+        items = list(compat.iteritems(agg))
+    else:
+        items = [(col, agg) for col in chunk.columns if col not in keys]
+
+    funcs = collections.OrderedDict()
+    for col, col_funcs in items:
+        if col not in chunk:
+            raise KeyError('Column not found: {col}'.format(col=col))
+        if not is_list_like(col_funcs):
+            col_funcs = [col_funcs]
+        for func in col_funcs:
+            if func not in _chunk_states:
+                raise ValueError("cannot aggregate chunks with {func!r}, "
+                                 "supported aggregations are {valid}".format(
+                                     func=func,
+                                     valid=sorted(_chunk_states)))
+        if not isinstance(agg, dict) and not all(
+                _chunk_func_applies(chunk[col].dtype, func, is_list_like(agg))
+                for func in col_funcs):
+            # the nuisance columns are dropped, as with groupby
+            continue
+        funcs[col] = list(col_funcs)
+
+    if not funcs:
+        raise DataError('No numeric types to aggregate')
+    return funcs
+
+
+def _chunk_func_applies(dtype, func, listed):
+    """
+    whether an aggregation applies to a column of the given dtype, as for
+    ``groupby(...).agg``: the numeric aggregations are restricted to
+    numeric columns, except for sums given in a list, which add the
+    timedeltas and objects as well
+    """
+    if func not in _chunk_numeric or is_numeric_dtype(dtype):
+        return True
+    return listed and func == 'sum' and (is_timedelta64_dtype(dtype) or
+                                         dtype == np.object_)
+
+
+def _empty_chunk_result(chunk, keys, col, func):
+    """ the aggregation of a column when none of the chunks has rows """
+    if len(keys) > 1:
+        index = MultiIndex.from_arrays([chunk[key].values for key in keys],
+                                       names=keys)
+    else:
+        index = Index(chunk[keys[0]].values, name=keys[0])
+
+    if func in ['count', 'nunique']:
+        dtype = np.int64
+    elif func in ['mean', 'var', 'std']:
+        dtype = np.float64
+    else:
+        dtype = chunk[col].dtype
+    return Series([], index=index, dtype=dtype)
+
+
+def _merge_chunk_states(combined, levels):
+    """ merge the rows of the partial states that belong to the same group """
+    grouped = combined.groupby(level=levels, sort=False)
+
+    merged = {}
+    for name in combined.columns:
+        if name in _chunk_merges:
+            merged[name] = getattr(grouped[name], _chunk_merges[name])()
+
+    if 'm2' in combined:
+        # the pairwise update of Chan et al. generalized to any number of
+        # parts: the squared deviations of the parts from the group mean
+        # are added to their sums of squared deviations
+        count = combined['count']
+        mean = (grouped['sum'].transform('sum') /
+                grouped['count'].transform('sum'))
+        dev = (count * (combined['sum'] / count - mean) ** 2).fillna(0)
+        merged['m2'] = (combined['m2'] + dev).groupby(
+            level=levels, sort=False).sum()
+
+    return DataFrame(merged, columns=combined.columns)
+
+
+def _finalize_chunk_state(state, func):
+    """ compute the aggregation func from the merged states of a column """
+    if func in _chunk_merges:
+        return state[func]
+
+    count = state['count']
+    if func == 'mean':
+        return state['sum'] / count
+    var = (state['m2'] / (count - 1)).where(count > 1)
+    if func == 'std':
+        return np.sqrt(var)
+    return var
+
+
 def _get_axes(group):
     if isinstance(group, Series):
         return [group.index]
@@ -1895,6 +2259,40 @@ def _is_indexed_like(obj, axes):
     return False
 
 
+def _maybe_masked_result(result, values, how):
+    """
+    make the float64 result of a cython operation on the nullable values
+    nullable again, if it still holds integers (or booleans) which are exact
+    """
+    if result.ndim != 1 or how not in ('add', 'prod', 'min', 'max', 'first',
+                                       'last', 'cumsum', 'cumprod', 'cummin',
+                                       'cummax'):
+        return result
+
+    # float64 holds the integers up to 2**53 exactly, larger values or
+    # results may have been rounded
+    limit = 2 ** 53
+    data = values._data[~values._mask]
+    if data.dtype != np.bool_ and ((data > limit) | (data < -limit)).any():
+        return result
+    with np.errstate(invalid='ignore'):
+        if (np.abs(result) > limit).any():
+            return result
+
+    # sums and products of booleans are counts
+    dtype = values.dtype
+    dtypes = [dtype, 'Int64']
+    if how in ('add', 'prod', 'cumsum', 'cumprod') and dtype == 'Bool':
+        dtypes = ['Int64']
+
+    for dtype in dtypes:
+        try:
+            return MaskedArray(result, dtype=dtype)
+        except TypeError:
+            pass
+    return result
+
+
 class BaseGrouper(object):
     """
     This is an internal Grouper class, which actually holds
@@ -1955,7 +2353,8 @@ class BaseGrouper(object):
 
     def _get_splitter(self, data, axis=0):
         comp_ids, _, ngroups = self.group_info
-        return get_splitter(data, comp_ids, ngroups, axis=axis)
+        return get_splitter(data, comp_ids, ngroups, axis=axis,
+                            sort_idx=self._sort_idx)
 
     def _get_group_keys(self):
         if len(self.groupings) == 1:
@@ -2075,6 +2474,13 @@ class BaseGrouper(object):
         comp_ids = _ensure_int64(comp_ids)
         return comp_ids, obs_group_ids, ngroups
 
+    @cache_readonly
+    def _sort_idx(self):
+        # Counting sort indexer of the group ids, shared by the splitters of
+        # every groupby reusing this grouper
+        comp_ids, _, ngroups = self.group_info
+        return get_group_index_sorter(comp_ids, ngroups)
+
     @cache_readonly
     def label_info(self):
         # return the labels of items in original grouped axis
@@ -2148,6 +2554,7 @@ class BaseGrouper(object):
             },
             'last': 'group_last',
             'ohlc': 'group_ohlc',
+            'quantile': 'group_quantile',
         },
 
         'transform': {
@@ -2214,7 +2621,8 @@ class BaseGrouper(object):
                                       (how, dtype_str))
         return func, dtype_str
 
-    def _cython_operation(self, kind, values, how, axis, min_count=-1):
+    def _cython_operation(self, kind, values, how, axis, min_count=-1,
+                          **kwargs):
         assert kind in ['transform', 'aggregate']
 
         # can we do this operation with our cython functions
@@ -2228,6 +2636,15 @@ class BaseGrouper(object):
         if is_categorical_dtype(values):
             raise NotImplementedError(
                 "categoricals are not support in cython ops ATM")
+        elif is_masked_dtype(values):
+            return self._cython_operation_masked(kind, values, how, axis,
+                                                 min_count=min_count,
+                                                 **kwargs)
+        elif is_utf8_dtype(values):
+            # utf8 strings are operated on decoded
+            return self._cython_operation(kind, values.astype(object), how,
+                                          axis, min_count=min_count,
+                                          **kwargs)
         elif is_datetime64_any_dtype(values):
             if how in ['add', 'prod', 'cumsum', 'cumprod']:
                 raise NotImplementedError(
@@ -2299,7 +2716,7 @@ class BaseGrouper(object):
             counts = np.zeros(self.ngroups, dtype=np.int64)
             result = self._aggregate(
                 result, counts, values, labels, func, is_numeric,
-                is_datetimelike, min_count)
+                is_datetimelike, min_count, **kwargs)
         elif kind == 'transform':
             result = _maybe_fill(np.empty_like(values, dtype=out_dtype),
                                  fill_value=np.nan)
@@ -2341,15 +2758,114 @@ class BaseGrouper(object):
 
         return result, names
 
-    def aggregate(self, values, how, axis=0, min_count=-1):
+    def _cython_operation_masked(self, kind, values, how, axis,
+                                 min_count=-1, **kwargs):
+        """
+        operate on nullable integers or booleans
+
+        The sums, minima, maxima, first and last values of nullable integers
+        are computed exactly by the int64 kernels, with iNaT for the missing
+        values. Other operations are computed on float64 with NaN for the
+        missing values, and made nullable again only if the result is exact.
+        """
+        if (kind == 'aggregate' and values.ndim == 1 and
+                how in ('add', 'min', 'max', 'first', 'last') and
+                is_integer_dtype(values.dtype.numpy_dtype)):
+            data = values._data
+            mask = values._mask
+            i8 = data.astype(np.int64)
+
+            # unsigned values above the int64 range, and valid values equal
+            # to iNaT, cannot be told from the missing values
+            valid = i8[~mask]
+            exact = not (valid == iNaT).any()
+            if data.dtype == np.uint64:
+                exact = exact and not (valid < 0).any()
+
+            if exact:
+                i8[mask] = iNaT
+                if how == 'add':
+                    func = libgroupby.group_add_masked_int64
+                else:
+                    func, _ = self._get_cython_function(kind, how, i8, True)
+
+                labels, _, ngroups = self.group_info
+                result = np.empty((ngroups, 1), dtype=np.int64)
+                counts = np.zeros(ngroups, dtype=np.int64)
+                result = self._aggregate(
+                    result, counts, i8[:, None], labels, func, True, False,
+                    min_count, **kwargs)[:, 0]
+                if self._filter_empty_groups and not counts.all():
+                    result = result[counts > 0]
+
+                result_mask = result == iNaT
+                if data.dtype.kind == 'u':
+                    result = result.view(np.uint64)
+                    dtypes = [values.dtype, 'UInt64']
+                else:
+                    dtypes = [values.dtype, 'Int64']
+                for dtype in dtypes:
+                    try:
+                        return MaskedArray(result, mask=result_mask,
+                                           dtype=dtype), None
+                    except TypeError:
+                        pass
+
+        # nullable integers and booleans are operated on as float64 with
+        # NaN for their missing values
+        result, names = self._cython_operation(
+            kind, values.astype(np.float64), how, axis,
+            min_count=min_count, **kwargs)
+        return _maybe_masked_result(result, values, how), names
+
+    def aggregate(self, values, how, axis=0, min_count=-1, **kwargs):
         return self._cython_operation('aggregate', values, how, axis,
-                                      min_count=min_count)
+                                      min_count=min_count, **kwargs)
+
+    def aggregate_fused(self, values, hows, min_count=0):
+        """
+        compute several cython aggregations of the numeric values in a
+        single pass over them, along axis 0
+
+        Parameters
+        ----------
+        values : ndarray
+            1 or 2-dim, converted to float64
+        hows : list of str
+            aggregations among count, add, mean, var, std, min, max, first
+            and last
+        min_count : int, default 0
+            the minimum number of non-NA values of the sums
+
+        Returns
+        -------
+        list of ndarray, the result of each aggregation
+        """
+        vdim = values.ndim
+        values = _ensure_float64(values)
+        if vdim == 1:
+            values = values[:, None]
+
+        labels, _, ngroups = self.group_info
+        result = np.empty((len(hows), ngroups, values.shape[1]),
+                          dtype=np.float64)
+        counts = np.zeros(ngroups, dtype=np.int64)
+        codes = np.array([libgroupby.fused_hows[how] for how in hows],
+                         dtype=np.int64)
+        libgroupby.group_fused_float64(result, counts, values, labels, codes,
+                                       min_count)
+
+        if self._filter_empty_groups and not counts.all():
+            result = result[:, counts > 0]
+        if vdim == 1:
+            result = result[:, :, 0]
+        return list(result)
 
     def transform(self, values, how, axis=0):
         return self._cython_operation('transform', values, how, axis)
 
     def _aggregate(self, result, counts, values, comp_ids, agg_func,
-                   is_numeric, is_datetimelike, min_count=-1):
+                   is_numeric, is_datetimelike, min_count=-1, **kwargs):
         if values.ndim > 3:
             # punting for now
             raise NotImplementedError("number of dimensions is currently "
@@ -2359,12 +2875,47 @@ class BaseGrouper(object):
 
                 chunk = chunk.squeeze()
                 agg_func(result[:, :, i], counts, chunk, comp_ids,
-                         min_count)
+                         min_count, **kwargs)
         else:
-            agg_func(result, counts, values, comp_ids, min_count)
+            nthreads = min(get_option('compute.threads'), values.shape[1])
+            if nthreads > 1 and is_numeric:
+                self._aggregate_threaded(result, counts, values, comp_ids,
+                                         agg_func, nthreads, min_count,
+                                         **kwargs)
+            else:
+                agg_func(result, counts, values, comp_ids, min_count,
+                         **kwargs)
 
         return result
 
+    def _aggregate_threaded(self, result, counts, values, comp_ids, agg_func,
+                            nthreads, min_count=-1, **kwargs):
+        """
+        aggregate slices of the columns of 2-dim values on nthreads threads
+
+        The numeric cython kernels release the GIL, so the slices are
+        aggregated in parallel; each slice gets its own counts array as the
+        kernels write the group counts.
+        """
+        from multiprocessing.pool import ThreadPool
+
+        bounds = np.linspace(0, values.shape[1], nthreads + 1).astype(int)
+        slices = [slice(start, stop)
+                  for start, stop in zip(bounds[:-1], bounds[1:])]
+        slice_counts = [counts] + [np.zeros_like(counts)
+                                   for _ in slices[1:]]
+
+        def f(i):
+            agg_func(result[:, slices[i]], slice_counts[i],
+                     values[:, slices[i]], comp_ids, min_count, **kwargs)
+
+        pool = ThreadPool(nthreads)
+        try:
+            pool.map(f, range(nthreads))
+        finally:
+            pool.close()
+            pool.join()
+
     def _transform(self, result, values, comp_ids, transform_func,
                    is_numeric, is_datetimelike):
 
@@ -2400,7 +2951,7 @@ class BaseGrouper(object):
 
         # avoids object / Series creation overhead
         dummy = obj._get_values(slice(None, 0)).to_dense()
-        indexer = get_group_index_sorter(group_index, ngroups)
+        indexer = self._sort_idx
         obj = obj._take(indexer, convert=False).to_dense()
         group_index = algorithms.take_nd(
             group_index, indexer, allow_fill=False)
@@ -2416,7 +2967,8 @@ class BaseGrouper(object):
         counts = np.zeros(ngroups, dtype=int)
         result = None
 
-        splitter = get_splitter(obj, group_index, ngroups, axis=self.axis)
+        splitter = get_splitter(obj, group_index, ngroups, axis=self.axis,
+                                sort_idx=self._sort_idx)
 
         for label, group in splitter:
             res = func(group)
@@ -2730,7 +3282,8 @@ class Grouping(object):
 
             # no level passed
             elif not isinstance(self.grouper,
-                                (Series, Index, Categorical, np.ndarray)):
+                                (Series, Index, Categorical, np.ndarray,
+                                 MaskedArray, StringArray)):
                 if getattr(self.grouper, 'ndim', 1) != 1:
                     t = self.name or str(type(self.grouper))
                     raise ValueError("Grouper for '%s' not 1-dimensional" % t)
@@ -2884,9 +3437,18 @@ def _get_grouper(obj, key=None, axis=0, level=None, sort=True,
         else:
             return grouper, set([key.key]), obj
 
-    # already have a BaseGrouper, just return it
+    # already have a BaseGrouper, reuse it along with its cached labels
+    # if it was built on the same or an aligned axis
     elif isinstance(key, BaseGrouper):
-        return key, [], obj
+        key_axis = getattr(key, 'axis', None)
+        if key_axis is not None and not (key_axis is group_axis or
+                                         key_axis.equals(group_axis)):
+            raise ValueError('the grouper was built on a different axis '
+                             'than the one to group')
+        exclusions = [ping.name for ping in getattr(key, 'groupings', [])
+                      if ping.in_axis and isinstance(obj, DataFrame) and
+                      ping.name in obj]
+        return key, exclusions, obj
 
     # In the future, a tuple key will always mean an actual key,
     # not an iterable of keys. In the meantime, we attempt to provide
@@ -3201,6 +3763,11 @@ class SeriesGroupBy(GroupBy):
     agg = aggregate
 
     def _aggregate_multiple_funcs(self, arg, _level):
+        if not isinstance(arg, dict):
+            hows = self._get_fused_hows(arg, self._selected_obj)
+            if hows is not None:
+                return self._aggregate_fused(arg, hows)
+
         if isinstance(arg, dict):
 
             # show the deprecation, but only if we
@@ -3256,6 +3823,16 @@ class SeriesGroupBy(GroupBy):
             return list(compat.itervalues(results))[0]
         return DataFrame(results, columns=columns)
 
+    def _aggregate_fused(self, arg, hows):
+        obj = self._selected_obj
+        values = self.grouper.aggregate_fused(obj.values, hows)
+
+        results = {}
+        for name, how, result in zip(arg, hows, values):
+            results[name] = self._wrap_fused_result(result, how, obj.dtype)
+        return DataFrame(results, index=self.grouper.result_index,
+                         columns=list(arg))
+
     def _wrap_output(self, output, index, names=None):
         """ common agg/transform wrapping logic """
         output = output[self._selection_name]
@@ -3433,57 +4010,17 @@ class SeriesGroupBy(GroupBy):
 
     def nunique(self, dropna=True):
         """ Returns number of unique elements in the group """
-        ids, _, _ = self.grouper.group_info
-
-        val = self.obj.get_values()
-
-        try:
-            sorter = np.lexsort((val, ids))
-        except TypeError:  # catches object dtypes
-            assert val.dtype == object, \
-                'val.dtype must be object, got %s' % val.dtype
-            val, _ = algorithms.factorize(val, sort=False)
-            sorter = np.lexsort((val, ids))
-            _isna = lambda a: a == -1
-        else:
-            _isna = isna
+        ids, _, ngroups = self.grouper.group_info
 
-        ids, val = ids[sorter], val[sorter]
+        # the values are factorized with missing values coded as -1, and
+        # the distinct (group, code) pairs counted in a hash table
+        codes, _ = algorithms.factorize(self.obj.get_values(), sort=False)
 
-        # group boundaries are where group ids change
-        # unique observations are where sorted values change
-        idx = np.r_[0, 1 + np.nonzero(ids[1:] != ids[:-1])[0]]
-        inc = np.r_[1, val[1:] != val[:-1]]
-
-        # 1st item of each group is a new unique observation
-        mask = _isna(val)
-        if dropna:
-            inc[idx] = 1
-            inc[mask] = 0
-        else:
-            inc[mask & np.r_[False, mask[:-1]]] = 0
-            inc[idx] = 1
-
-        out = np.add.reduceat(inc, idx).astype('int64', copy=False)
-        if len(ids):
-            # NaN/NaT group exists if the head of ids is -1,
-            # so remove it from res and exclude its index from idx
-            if ids[0] == -1:
-                res = out[1:]
-                idx = idx[np.flatnonzero(idx)]
-            else:
-                res = out
-        else:
-            res = out[1:]
-        ri = self.grouper.result_index
-
-        # we might have duplications among the bins
-        if len(res) != len(ri):
-            res, out = np.zeros(len(ri), dtype=out.dtype), res
-            res[ids[idx]] = out
+        res = np.zeros(ngroups, dtype=np.int64)
+        libgroupby.group_nunique(res, ids, _ensure_int64(codes), dropna)
 
         return Series(res,
-                      index=ri,
+                      index=self.grouper.result_index,
                       name=self._selection_name)
 
     @Appender(Series.describe.__doc__)
@@ -3654,9 +4191,10 @@ class NDFrameGroupBy(GroupBy):
             yield val, slicer(val)
 
     def _cython_agg_general(self, how, alt=None, numeric_only=True,
-                            min_count=-1):
+                            min_count=-1, **kwargs):
         new_items, new_blocks = self._cython_agg_blocks(
-            how, alt=alt, numeric_only=numeric_only, min_count=min_count)
+            how, alt=alt, numeric_only=numeric_only, min_count=min_count,
+            **kwargs)
         return self._wrap_agged_blocks(new_items, new_blocks)
 
     def _wrap_agged_blocks(self, items, blocks):
@@ -3683,7 +4221,7 @@ class NDFrameGroupBy(GroupBy):
     _block_agg_axis = 0
 
     def _cython_agg_blocks(self, how, alt=None, numeric_only=True,
-                           min_count=-1):
+                           min_count=-1, **kwargs):
         # TODO: the actual managing of mgr_locs is a PITA
         # here, it should happen via BlockManager.combine
 
@@ -3700,7 +4238,8 @@ class NDFrameGroupBy(GroupBy):
             locs = block.mgr_locs.as_array
             try:
                 result, _ = self.grouper.aggregate(
-                    block.values, how, axis=agg_axis, min_count=min_count)
+                    block.values, how, axis=agg_axis, min_count=min_count,
+                    **kwargs)
             except NotImplementedError:
                 # generally if we have numeric_only=False
                 # and non-applicable functions
@@ -4341,6 +4880,31 @@ class DataFrameGroupBy(NDFrameGroupBy):
 
     agg = aggregate
 
+    def _aggregate_multiple_funcs(self, arg, _level, _axis):
+        obj = self._obj_with_exclusions
+        if (_axis == 0 and obj.ndim == 2 and len(obj.columns) and
+                obj.columns.is_unique and
+                not isinstance(obj.columns, MultiIndex)):
+            hows = self._get_fused_hows(arg, obj)
+            if hows is not None:
+                return self._aggregate_fused(arg, hows)
+
+        return super(DataFrameGroupBy, self)._aggregate_multiple_funcs(
+            arg, _level=_level, _axis=_axis)
+
+    def _aggregate_fused(self, arg, hows):
+        obj = self._obj_with_exclusions
+        values = self.grouper.aggregate_fused(obj.values, hows)
+
+        results = collections.OrderedDict()
+        for j, (col, dtype) in enumerate(zip(obj.columns, obj.dtypes)):
+            for name, how, result in zip(arg, hows, values):
+                results[(col, name)] = self._wrap_fused_result(
+                    result[:, j], how, dtype)
+        columns = MultiIndex.from_tuples(list(results.keys()))
+        return DataFrame(results, index=self.grouper.result_index,
+                         columns=columns)
+
     def _gotitem(self, key, ndim, subset=None):
         """
         sub-classes to define
@@ -4688,12 +5252,13 @@ class NDArrayGroupBy(GroupBy):
 
 class DataSplitter(object):
 
-    def __init__(self, data, labels, ngroups, axis=0):
+    def __init__(self, data, labels, ngroups, axis=0, sort_idx=None):
         self.data = data
         self.labels = _ensure_int64(labels)
         self.ngroups = ngroups
 
         self.axis = axis
+        self._sort_idx = sort_idx
 
     @cache_readonly
     def slabels(self):
@@ -4703,6 +5268,8 @@ class DataSplitter(object):
     @cache_readonly
     def sort_idx(self):
         # Counting sort indexer
+        if self._sort_idx is not None:
+            return self._sort_idx
         return get_group_index_sorter(self.labels, self.ngroups)
 
     def __iter__(self):
@@ -4746,8 +5313,9 @@ class SeriesSplitter(DataSplitter):
 
 class FrameSplitter(DataSplitter):
 
-    def __init__(self, data, labels, ngroups, axis=0):
-        super(FrameSplitter, self).__init__(data, labels, ngroups, axis=axis)
+    def __init__(self, data, labels, ngroups, axis=0, sort_idx=None):
+        super(FrameSplitter, self).__init__(data, labels, ngroups, axis=axis,
+                                            sort_idx=sort_idx)
 
     def fast_apply(self, f, names):
         # must return keys::list, values::list, mutated::bool
@@ -4771,8 +5339,9 @@ class FrameSplitter(DataSplitter):
 
 class NDFrameSplitter(DataSplitter):
 
-    def __init__(self, data, labels, ngroups, axis=0):
-        super(NDFrameSplitter, self).__init__(data, labels, ngroups, axis=axis)
+    def __init__(self, data, labels, ngroups, axis=0, sort_idx=None):
+        super(NDFrameSplitter, self).__init__(data, labels, ngroups,
+                                              axis=axis, sort_idx=sort_idx)
 
         self.factory = data._constructor
 
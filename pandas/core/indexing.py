@@ -294,8 +294,10 @@ class _NDFrameIndexer(_NDFrameIndexerBase):
         from pandas import Panel, DataFrame, Series  # noqa
         info_axis = self.obj._info_axis_number
 
-        # maybe partial set
-        take_split_path = self.obj._is_mixed_type
+        # maybe partial set; blocks of the same dtype are not merged under
+        # some consolidation policies
+        take_split_path = (self.obj._is_mixed_type or
+                           len(self.obj._data.blocks) > 1)
 
         # if there is only one block/type, still have to take split path
         # unless the block is one-dimensional or it can hold the value
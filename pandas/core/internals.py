@@ -1,3 +1,4 @@
+import os
 import warnings
 import copy
 from warnings import catch_warnings
@@ -5,17 +6,19 @@ import inspect
 import itertools
 import re
 import operator
+import weakref
+import tempfile
 from datetime import datetime, timedelta, date
 from collections import defaultdict
 from functools import partial
 
 import numpy as np
 
-from pandas.core.base import PandasObject
+from pandas.core.base import PandasObject, _memory_usage_of_objects
 
 from pandas.core.dtypes.dtypes import (
     ExtensionDtype, DatetimeTZDtype,
-    CategoricalDtype)
+    CategoricalDtype, MaskedDtype, StringDtype)
 from pandas.core.dtypes.common import (
     _TD_DTYPE, _NS_DTYPE,
     _ensure_int64, _ensure_platform_int,
@@ -25,6 +28,8 @@ from pandas.core.dtypes.common import (
     is_datetime64_dtype, is_datetimetz, is_sparse,
     is_categorical, is_categorical_dtype,
     is_integer_dtype,
+    is_masked_dtype,
+    is_utf8_dtype,
     is_datetime64tz_dtype,
     is_bool_dtype,
     is_object_dtype,
@@ -60,8 +65,11 @@ import pandas.core.algorithms as algos
 from pandas.core.index import Index, MultiIndex, _ensure_index
 from pandas.core.indexing import maybe_convert_indices, length_of_indexer
 from pandas.core.categorical import Categorical, _maybe_to_categorical
+from pandas.core.masked import MaskedArray
+from pandas.core.utf8 import StringArray
 from pandas.core.indexes.datetimes import DatetimeIndex
 from pandas.io.formats.printing import pprint_thing
+from pandas.core.config import get_option
 
 import pandas.core.missing as missing
 from pandas.core.sparse.array import _maybe_to_sparse, SparseArray
@@ -75,6 +83,26 @@ from pandas.util._validators import validate_bool_kwarg
 from pandas import compat
 from pandas.compat import range, map, zip, u
 
+# root ndarrays whose memory is shared between blocks under
+# ``mode.copy_on_write``, or that must not be written to, keyed by id
+_shared_values = weakref.WeakValueDictionary()
+
+
+def _values_root(values):
+    """ return the ndarray that owns the memory of ``values`` """
+    while isinstance(values.base, np.ndarray):
+        values = values.base
+    return values
+
+
+def _share_values(values):
+    """
+    register the memory of ``values`` as shared, so that the blocks holding
+    it make a private copy before an inplace modification
+    """
+    root = _values_root(values)
+    _shared_values[id(root)] = root
+
 
 class Block(PandasObject):
     """
@@ -83,7 +111,7 @@ class Block(PandasObject):
 
     Index-ignorant; let the container take care of that
     """
-    __slots__ = ['_mgr_locs', 'values', 'ndim']
+    __slots__ = ['_mgr_locs', 'values', 'ndim', '_memory_usage']
     is_numeric = False
     is_float = False
     is_integer = False
@@ -95,6 +123,7 @@ class Block(PandasObject):
     is_object = False
     is_categorical = False
     is_sparse = False
+    is_masked = False
     _box_to_block_values = True
     _can_hold_na = False
     _downcast_dtype = None
@@ -353,6 +382,7 @@ class Block(PandasObject):
         -------
         None
         """
+        self._copy_if_shared()
         self.values[locs] = values
 
     def delete(self, loc):
@@ -599,10 +629,40 @@ class Block(PandasObject):
 
             return self.make_block(Categorical(self.values, dtype=dtype))
 
+        # may need to convert to a nullable integer or boolean
+        if is_masked_dtype(dtype):
+            try:
+                values = self.get_values()
+                if values.ndim == 1:
+                    return self.make_block(MaskedArray(values, dtype=dtype))
+                return [make_block(MaskedArray(v, dtype=dtype),
+                                   placement=[loc], ndim=self.ndim)
+                        for v, loc in zip(values, self.mgr_locs)]
+            except (TypeError, ValueError):
+                if errors == 'raise':
+                    raise
+                return self.copy() if copy else self
+
+        # may need to convert to utf8 strings
+        if is_utf8_dtype(dtype):
+            try:
+                values = self.get_values()
+                if values.ndim == 1:
+                    return self.make_block(StringArray(values))
+                return [make_block(StringArray(v), placement=[loc],
+                                   ndim=self.ndim)
+                        for v, loc in zip(values, self.mgr_locs)]
+            except (TypeError, ValueError):
+                if errors == 'raise':
+                    raise
+                return self.copy() if copy else self
+
         # astype processing
         dtype = np.dtype(dtype)
         if self.dtype == dtype:
             if copy:
+                if get_option('mode.copy_on_write'):
+                    return self.share()
                 return self.copy()
             return self
 
@@ -744,6 +804,78 @@ class Block(PandasObject):
             values = values.copy()
         return self.make_block_same_class(values)
 
+    def share(self, mgr=None):
+        """
+        copy constructor for ``mode.copy_on_write``: the new block shares our
+        values, and whichever block is written to first makes a private copy
+        """
+        values = self.values
+        if type(values) is not np.ndarray:
+            return self.copy()
+        _share_values(values)
+        return self.make_block_same_class(values)
+
+    def to_mmap(self, path=None, mgr=None):
+        """
+        copy constructor whose values are backed by a memory-mapped file
+        created in the path directory; values that cannot be memory-mapped,
+        such as objects, are copied in memory
+        """
+        values = self.values
+        if (type(values) is not np.ndarray or values.dtype.hasobject or
+                not values.size):
+            return self.copy()
+
+        fd, filename = tempfile.mkstemp(suffix='.mmap', dir=path)
+        os.close(fd)
+        mapped = np.memmap(filename, dtype=values.dtype, mode='w+',
+                           shape=values.shape)
+        mapped[:] = values
+
+        # the mapping outlives the name, so that the space is given back
+        # once the values are freed; this fails on windows, where the file
+        # is in use
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
+
+        return self.make_block_same_class(mapped.view(np.ndarray))
+
+    def memory_usage(self, deep=False):
+        """
+        return the memory usage in bytes of each of our items, and the
+        variance of these usages when they are estimated with
+        ``deep='sample'``
+        """
+        values = self.values
+        n = len(self.mgr_locs)
+        if hasattr(values, 'memory_usage'):
+            usage = values.memory_usage(deep=deep)
+        else:
+            usage = values.nbytes // n if n else 0
+        return np.repeat(np.int64(usage), n), np.zeros(n)
+
+    def _copy_if_shared(self):
+        """
+        make our values private before an inplace modification if they are
+        shared under ``mode.copy_on_write``; return whether a copy was made
+
+        this is called before every inplace modification, so it also drops
+        the memory usage cached by ``memory_usage``
+        """
+        self._memory_usage = None
+        if not len(_shared_values):
+            return False
+        values = self.values
+        if type(values) is not np.ndarray:
+            return False
+        root = _values_root(values)
+        if _shared_values.get(id(root)) is not root:
+            return False
+        self.values = values.copy()
+        return True
+
     def replace(self, to_replace, value, inplace=False, filter=None,
                 regex=False, convert=True, mgr=None):
         """ replace the to_replace value with value, possible to create new
@@ -795,6 +927,7 @@ class Block(PandasObject):
                 value = np.nan
 
         # coerce if block dtype can store value
+        self._copy_if_shared()
         values = self.values
         try:
             values, _, value, _ = self._try_coerce_args(values, value)
@@ -935,6 +1068,8 @@ class Block(PandasObject):
         a list of new blocks, the result of the putmask
         """
 
+        if inplace:
+            self._copy_if_shared()
         new_values = self.values if inplace else self.values.copy()
 
         if hasattr(new, 'reindex_axis'):
@@ -1154,6 +1289,8 @@ class Block(PandasObject):
                 else:
                     return [self.copy()]
 
+        if inplace:
+            self._copy_if_shared()
         values = self.values if inplace else self.values.copy()
         values, _, fill_value, _ = self._try_coerce_args(values, fill_value)
         values = missing.interpolate_2d(values, method=method, axis=axis,
@@ -1171,6 +1308,8 @@ class Block(PandasObject):
         """ interpolate using scipy wrappers """
 
         inplace = validate_bool_kwarg(inplace, 'inplace')
+        if inplace:
+            self._copy_if_shared()
         data = self.values if inplace else self.values.copy()
 
         # only deal with floats
@@ -2093,6 +2232,30 @@ class ObjectBlock(Block):
         super(ObjectBlock, self).__init__(values, ndim=ndim, fastpath=fastpath,
                                           placement=placement, **kwargs)
 
+    def memory_usage(self, deep=False):
+        """
+        return the memory usage in bytes of each of our items, and the
+        variance of these usages when they are estimated with
+        ``deep='sample'``; the usages of the objects are cached until the
+        block is modified
+        """
+        values = self.values
+        if not deep or not isinstance(values, np.ndarray):
+            return super(ObjectBlock, self).memory_usage(deep=deep)
+
+        usage, variance = super(ObjectBlock, self).memory_usage()
+        cached = getattr(self, '_memory_usage', None)
+        if (cached is None or cached[0] is not values or
+                cached[1] != deep):
+            objects = [_memory_usage_of_objects(row.ravel(), deep)
+                       for row in values]
+            cached = (values, deep,
+                      np.array([u for u, _ in objects], dtype=np.int64),
+                      np.array([v for _, v in objects], dtype=np.float64))
+            self._memory_usage = cached
+
+        return usage + cached[2], variance + cached[3]
+
     @property
     def is_bool(self):
         """ we can be a bool if we have only bool values but are of type
@@ -2168,6 +2331,7 @@ class ObjectBlock(Block):
                     return
             except:
                 pass
+        self._copy_if_shared()
         try:
             self.values[locs] = values
         except (ValueError):
@@ -2293,6 +2457,8 @@ class ObjectBlock(Block):
                                                     filter=filter, regex=regex,
                                                     mgr=mgr)
 
+        if inplace:
+            self._copy_if_shared()
         new_values = self.values if inplace else self.values.copy()
 
         # deal with replacing values with objects (strings) that match but
@@ -2455,6 +2621,268 @@ class CategoricalBlock(NonConsolidatableMixIn, ObjectBlock):
             ndim=self.ndim)
 
 
+class MaskedBlock(NonConsolidatableMixIn, Block):
+    """ a single nullable integer or boolean column, held as a MaskedArray of
+    values and a mask of the missing ones """
+    __slots__ = ()
+    is_masked = True
+    is_numeric = True
+    _can_hold_na = True
+    _holder = MaskedArray
+    _concatenator = staticmethod(_concat._concat_masked)
+
+    @property
+    def is_view(self):
+        """ return a boolean if I am possibly a view """
+        return self.values._data.base is not None
+
+    @property
+    def array_dtype(self):
+        """ the dtype to return if I want to construct this block as an
+        array
+        """
+        dtype = self.values._data.dtype
+        if not self.values.hasnans:
+            return dtype
+        return np.dtype(np.object_ if dtype == np.bool_ else np.float64)
+
+    @property
+    def fill_value(self):
+        return np.nan
+
+    def to_dense(self):
+        return self.values.to_dense()
+
+    def external_values(self, dtype=None):
+        """ return an outside world format, upcast if there are missing
+        values """
+        return self.values.to_dense()
+
+    def internal_values(self, dtype=None):
+        """ return the MaskedArray """
+        return self.values
+
+    def make_block_same_class(self, values, placement=None, fastpath=True,
+                              **kwargs):
+        """ Wrap given values in a block of same type and ndim as self. """
+        kwargs.setdefault('ndim', self.ndim)
+        return super(MaskedBlock, self).make_block_same_class(
+            values, placement=placement, fastpath=fastpath, **kwargs)
+
+    def _dense_block(self, values=None):
+        """ return myself as a block of the upcast dense values """
+        if values is None:
+            values = self.get_values()
+        values = _block_shape(values, ndim=self.ndim)
+        placement = self.mgr_locs
+        if self.ndim == 1:
+            placement = slice(0, len(values))
+        return make_block(values, placement=placement, ndim=self.ndim)
+
+    def _can_hold_element(self, element):
+        try:
+            self.values._coerce_setitem_value(element)
+            return True
+        except (TypeError, ValueError):
+            return False
+
+    def _try_coerce_args(self, values, other):
+        """ operate on the dense values """
+        if isinstance(values, self._holder):
+            values = values.to_dense()
+        if isinstance(other, self._holder):
+            other = other.to_dense()
+        return values, False, other, False
+
+    def _try_coerce_result(self, result):
+        """ reverse of try_coerce_args """
+        if isinstance(result, np.ndarray):
+            result = _block_shape(result, ndim=self.ndim)
+        return result
+
+    def convert(self, copy=True, **kwargs):
+        return self.copy() if copy else self
+
+    def copy(self, deep=True, mgr=None):
+        values = self.values.copy(deep=deep)
+        return self.make_block_same_class(values)
+
+    def _astype(self, dtype, copy=False, errors='raise', values=None,
+                klass=None, mgr=None, **kwargs):
+        if is_masked_dtype(dtype):
+            try:
+                values = self.values.astype(dtype, copy=copy)
+            except (TypeError, ValueError):
+                if errors == 'raise':
+                    raise
+                return self.copy() if copy else self
+            return self.make_block_same_class(values)
+        return self._dense_block()._astype(dtype, copy=copy, errors=errors,
+                                           values=values, klass=klass,
+                                           mgr=mgr, **kwargs)
+
+    def setitem(self, indexer, value, mgr=None):
+        """ set the value inplace if the dtype can hold it, else upcast to a
+        dense block """
+        # a 2-dim indexer is on the transposed values, (rows, item)
+        key = indexer[0] if isinstance(indexer, tuple) else indexer
+        self._copy_if_shared()
+        try:
+            self.values[key] = value
+        except (TypeError, ValueError):
+            return self._dense_block().setitem(indexer, value, mgr=mgr)
+        return self
+
+    def putmask(self, mask, new, align=True, inplace=False, axis=0,
+                transpose=False, mgr=None):
+        """ putmask the data to the block, upcasting to a dense block if the
+        dtype cannot hold new """
+        inplace = validate_bool_kwarg(inplace, 'inplace')
+        mask = np.asarray(mask, dtype=np.bool_).ravel()
+        if isinstance(new, (np.ndarray, self._holder)) and \
+                len(new) == len(mask):
+            new = new[mask]
+
+        if inplace:
+            self._copy_if_shared()
+        values = self.values if inplace else self.values.copy()
+        try:
+            values[mask] = new
+        except (TypeError, ValueError):
+            return self._dense_block().putmask(
+                _block_shape(mask, ndim=self.ndim), new, align=align,
+                inplace=True, axis=axis, transpose=transpose, mgr=mgr)
+        return [self.make_block_same_class(values)]
+
+    def where(self, other, cond, align=True, errors='raise',
+              try_cast=False, axis=0, transpose=False, mgr=None):
+        """ keep the values where cond is True, the other ones are replaced
+        by other (missing by default) """
+        if hasattr(cond, 'values'):
+            cond = cond.values
+        cond = np.asarray(cond, dtype=np.bool_).ravel()
+        if hasattr(other, 'values') and not isinstance(other, self._holder):
+            other = other.values
+        if isinstance(other, np.ndarray) and other.ndim == 2:
+            other = other.ravel()
+        return self.putmask(~cond, other, align=align, inplace=False,
+                            axis=axis, transpose=transpose, mgr=mgr)
+
+    def fillna(self, value, limit=None, inplace=False, downcast=None,
+               mgr=None):
+        values = self.values.fillna(value=value, limit=limit)
+        if isinstance(values, np.ndarray):
+            return [self._dense_block(values)]
+        return [self.make_block_same_class(values)]
+
+    def interpolate(self, method='pad', axis=0, inplace=False, limit=None,
+                    fill_value=None, **kwargs):
+        m = missing.clean_fill_method(method) if method in (
+            'pad', 'ffill', 'backfill', 'bfill') else None
+        if m is not None:
+            return self.make_block_same_class(
+                self.values.fillna(method=m, limit=limit))
+        return self._dense_block().interpolate(
+            method=method, axis=axis, inplace=False, limit=limit,
+            fill_value=fill_value, **kwargs)
+
+    def shift(self, periods, axis=0, mgr=None):
+        return self.make_block_same_class(values=self.values.shift(periods),
+                                          placement=self.mgr_locs)
+
+    def take_nd(self, indexer, axis=0, new_mgr_locs=None, fill_tuple=None):
+        """
+        Take values according to indexer and return them as a block.
+        """
+        if fill_tuple is None:
+            fill_value = None
+        else:
+            fill_value = fill_tuple[0]
+
+        # axis doesn't matter; we are really a single-dim object
+        new_values = self.values.take_nd(indexer, fill_value=fill_value)
+
+        # if we are a 1-dim object, then always place at 0
+        if self.ndim == 1:
+            new_mgr_locs = [0]
+        else:
+            if new_mgr_locs is None:
+                new_mgr_locs = self.mgr_locs
+
+        return self.make_block_same_class(new_values, new_mgr_locs)
+
+    def _slice(self, slicer):
+        """ return a slice of my values """
+        return self.values._slice(slicer)
+
+    def to_native_types(self, slicer=None, na_rep='nan', quoting=None,
+                        **kwargs):
+        """ convert to our native types format, slicing if desired """
+        values = self.values
+        if slicer is not None:
+            values = values[slicer]
+        mask = values.isna()
+        values = np.array(values._data, dtype='object')
+        values[mask] = na_rep
+
+        # we are expected to return a 2-d ndarray
+        return values.reshape(1, len(values))
+
+    def concat_same_type(self, to_concat, placement=None):
+        """
+        Concatenate list of single blocks of the same type.
+        """
+        values = self._concatenator([blk.values for blk in to_concat],
+                                    axis=self.ndim - 1)
+        # not using self.make_block_same_class as values can be dense
+        return make_block(
+            values, placement=placement or slice(0, len(values), 1),
+            ndim=self.ndim)
+
+
+class StringBlock(MaskedBlock):
+    """ a single column of utf8 strings, held as a StringArray of a buffer of
+    bytes, the offsets of each string in it and a mask of the missing ones """
+    __slots__ = ()
+    is_numeric = False
+    _holder = StringArray
+    _concatenator = staticmethod(_concat._concat_utf8)
+
+    @property
+    def is_view(self):
+        """ the buffers are never modified inplace, setting values
+        rebuilds them """
+        return False
+
+    @property
+    def array_dtype(self):
+        """ the dtype to return if I want to construct this block as an
+        array
+        """
+        return np.dtype(np.object_)
+
+    def _astype(self, dtype, copy=False, errors='raise', values=None,
+                klass=None, mgr=None, **kwargs):
+        if is_utf8_dtype(dtype):
+            return self.copy() if copy else self
+        return self._dense_block()._astype(dtype, copy=copy, errors=errors,
+                                           values=values, klass=klass,
+                                           mgr=mgr, **kwargs)
+
+    def to_native_types(self, slicer=None, na_rep='nan', quoting=None,
+                        **kwargs):
+        """ convert to our native types format, slicing if desired """
+        values = self.values
+        if slicer is not None:
+            values = values[slicer]
+        mask = values.isna()
+        values = values.astype(object)
+        values[mask] = na_rep
+
+        # we are expected to return a 2-d ndarray
+        return values.reshape(1, len(values))
+
+
 class DatetimeBlock(DatetimeLikeBlockMixin, Block):
     __slots__ = ()
     is_datetime = True
@@ -2586,6 +3014,7 @@ class DatetimeBlock(DatetimeLikeBlockMixin, Block):
             # Workaround for numpy 1.6 bug
             values = conversion.ensure_datetime64ns(values)
 
+        self._copy_if_shared()
         self.values[locs] = values
 
 
@@ -2922,6 +3351,10 @@ def make_block(values, placement, klass=None, ndim=None, dtype=None,
 
         if isinstance(values, SparseArray):
             klass = SparseBlock
+        elif isinstance(values, MaskedArray):
+            klass = MaskedBlock
+        elif isinstance(values, StringArray):
+            klass = StringBlock
         elif issubclass(vtype, np.floating):
             klass = FloatBlock
         elif (issubclass(vtype, np.integer) and
@@ -3008,7 +3441,8 @@ class BlockManager(PandasObject):
     This is *not* a public API class
     """
     __slots__ = ['axes', 'blocks', '_ndim', '_shape', '_known_consolidated',
-                 '_is_consolidated', '_blknos', '_blklocs']
+                 '_is_consolidated', '_blknos', '_blklocs',
+                 '_consolidation_stats']
 
     def __init__(self, blocks, axes, do_integrity_check=True, fastpath=True):
         self.axes = [_ensure_index(ax) for ax in axes]
@@ -3279,7 +3713,9 @@ class BlockManager(PandasObject):
                 kwargs['filter'] = filter_locs
 
         if consolidate:
-            self._consolidate_inplace()
+            # operations along the items need all the items of a dtype in
+            # a single block, whatever the consolidation policy
+            self._consolidate_inplace(force=kwargs.get('axis') == 0)
 
         if f == 'where':
             align_copy = True
@@ -3533,20 +3969,18 @@ class BlockManager(PandasObject):
 
     @property
     def is_mixed_type(self):
-        # Warning, consolidation needs to get checked upstairs
-        self._consolidate_inplace()
-        return len(self.blocks) > 1
+        # more than one block would be left by consolidation; this is found
+        # without merging the blocks so that the consolidation policy holds
+        keys = set(blk._consolidate_key if blk._can_consolidate else id(blk)
+                   for blk in self.blocks)
+        return len(keys) > 1
 
     @property
     def is_numeric_mixed_type(self):
-        # Warning, consolidation needs to get checked upstairs
-        self._consolidate_inplace()
         return all(block.is_numeric for block in self.blocks)
 
     @property
     def is_datelike_mixed_type(self):
-        # Warning, consolidation needs to get checked upstairs
-        self._consolidate_inplace()
         return any(block.is_datelike for block in self.blocks)
 
     @property
@@ -3657,9 +4091,67 @@ class BlockManager(PandasObject):
             new_axes = [copy(ax) for ax in self.axes]
         else:
             new_axes = list(self.axes)
+        if deep and get_option('mode.copy_on_write'):
+            return self.apply('share', axes=new_axes,
+                              do_integrity_check=False)
         return self.apply('copy', axes=new_axes, deep=deep,
                           do_integrity_check=False)
 
+    def memory_usage(self, deep=False):
+        """
+        Return the memory usage in bytes of each item
+
+        Parameters
+        ----------
+        deep : boolean or 'sample', default False
+            Include the objects referenced by object blocks, estimated from a
+            sample of them with 'sample'
+
+        Returns
+        -------
+        usage : ndarray of int64
+        variance : ndarray of float64
+            The variance of the usages estimated with ``deep='sample'``
+        """
+        usage = np.zeros(len(self.items), dtype=np.int64)
+        variance = np.zeros(len(self.items), dtype=np.float64)
+        for blk in self.blocks:
+            blk_usage, blk_variance = blk.memory_usage(deep=deep)
+            usage[blk.mgr_locs.indexer] = blk_usage
+            variance[blk.mgr_locs.indexer] = blk_variance
+        return usage, variance
+
+    def to_mmap(self, path=None):
+        """
+        Make a copy of BlockManager whose blocks are backed by memory-mapped
+        files
+
+        Parameters
+        ----------
+        path : string, default None
+            Directory in which to create the files, the default temporary
+            directory if None
+
+        Returns
+        -------
+        copy : BlockManager
+        """
+        return self.apply('to_mmap', path=path, do_integrity_check=False)
+
+    def copy_if_shared(self):
+        """
+        Make private copies of any block values shared under
+        ``mode.copy_on_write``, before writing to them directly
+
+        Returns
+        -------
+        copied : boolean
+        """
+        copied = False
+        for blk in self.blocks:
+            copied = blk._copy_if_shared() or copied
+        return copied
+
     def as_array(self, transpose=False, items=None):
         """Convert the blockmanager data into an numpy array.
 
@@ -3684,7 +4176,7 @@ class BlockManager(PandasObject):
         else:
             mgr = self
 
-        if self._is_single_block or not self.is_mixed_type:
+        if mgr._is_single_block:
             arr = mgr.blocks[0].get_values()
         else:
             arr = mgr._interleave()
@@ -3832,21 +4324,76 @@ class BlockManager(PandasObject):
         -------
         y : BlockManager
         """
-        if self.is_consolidated():
+        if self.is_consolidated() or not self._should_consolidate():
             return self
 
         bm = self.__class__(self.blocks, self.axes)
         bm._is_consolidated = False
+        bm._consolidation_stats = self._get_consolidation_stats()
         bm._consolidate_inplace()
         return bm
 
-    def _consolidate_inplace(self):
-        if not self.is_consolidated():
-            self.blocks = tuple(_consolidate(self.blocks))
-            self._is_consolidated = True
+    def _consolidate_inplace(self, force=False):
+        """
+        Merge the blocks having the same dtype, if the ``mode.consolidation``
+        policy allows it or force is True
+        """
+        if self.is_consolidated():
+            return
+
+        if force or self._should_consolidate():
+            stats = self._get_consolidation_stats()
+            deferred = stats['deferred']
+
+            max_bytes = None
+            if not force and get_option('mode.consolidation') == 'lazy':
+                max_bytes = get_option('mode.consolidation_max_bytes')
+
+            self.blocks = tuple(_consolidate(self.blocks, max_bytes=max_bytes,
+                                             stats=stats))
+            self._is_consolidated = stats['deferred'] == deferred
             self._known_consolidated = True
             self._rebuild_blknos_and_blklocs()
 
+    def _should_consolidate(self):
+        """
+        Return whether the blocks should be merged now according to the
+        ``mode.consolidation`` option, counting the deferral otherwise
+        """
+        policy = get_option('mode.consolidation')
+        if policy == 'eager':
+            return True
+
+        max_blocks = get_option('mode.consolidation_max_blocks')
+        if policy == 'lazy' and len(self.blocks) > max_blocks:
+            return True
+
+        self._get_consolidation_stats()['deferred'] += 1
+        return False
+
+    def _get_consolidation_stats(self):
+        try:
+            return self._consolidation_stats
+        except AttributeError:
+            self._consolidation_stats = dict(merges=0, blocks_merged=0,
+                                             bytes_copied=0, deferred=0)
+            return self._consolidation_stats
+
+    def consolidation_stats(self):
+        """
+        Return statistics on the consolidations of this manager
+
+        Returns
+        -------
+        stats : dict
+            merges : number of groups of blocks merged into a single block
+            blocks_merged : number of blocks those groups held
+            bytes_copied : number of bytes copied by the merges
+            deferred : number of consolidations, or groups of blocks, left
+                unmerged because of the ``mode.consolidation`` policy
+        """
+        return dict(self._get_consolidation_stats())
+
     def get(self, item, fastpath=True):
         """
         Return values for selected item (ndarray or BlockManager).
@@ -4109,9 +4656,39 @@ class BlockManager(PandasObject):
 
         self._known_consolidated = False
 
-        if len(self.blocks) > 100:
+        if len(self.blocks) > get_option('mode.consolidation_max_blocks'):
             self._consolidate_inplace()
 
+    def append_items(self, items, values):
+        """
+        Append items at the end of the items axis in a single update,
+        rather than inserting them one at a time.
+
+        Parameters
+        ----------
+        items : list-like of hashables
+            Items not already in the BlockManager
+        values : list of array_like
+            The values of each item
+
+        """
+        items = _ensure_index(items)
+        if not items.is_unique or len(self.items.intersection(items)):
+            # Should this be a different kind of error??
+            raise ValueError('cannot append {}, already exists'.format(
+                list(items)))
+
+        offset = len(self.items)
+        blocks = form_blocks(values, items, [items] + self.axes[1:])
+        for blk in blocks:
+            blk.mgr_locs = blk.mgr_locs.add(offset)
+
+        self.axes[0] = self.items.append(items)
+        self.blocks += tuple(blocks)
+        self._shape = None
+        self._known_consolidated = False
+        self._rebuild_blknos_and_blklocs()
+
     def reindex_axis(self, new_index, axis, method=None, limit=None,
                      fill_value=None, copy=True):
         """
@@ -4551,7 +5128,7 @@ class SingleBlockManager(BlockManager):
     def _consolidate_check(self):
         pass
 
-    def _consolidate_inplace(self):
+    def _consolidate_inplace(self, force=False):
         pass
 
     def delete(self, item):
@@ -4646,20 +5223,23 @@ def create_block_manager_from_blocks(blocks, axes):
         construction_error(tot_items, blocks[0].shape[1:], axes, e)
 
 
-def create_block_manager_from_arrays(arrays, names, axes):
+def create_block_manager_from_arrays(arrays, names, axes, consolidate=True):
 
     try:
-        blocks = form_blocks(arrays, names, axes)
+        blocks = form_blocks(arrays, names, axes, consolidate=consolidate)
         mgr = BlockManager(blocks, axes)
-        mgr._consolidate_inplace()
+        if consolidate:
+            mgr._consolidate_inplace()
         return mgr
     except ValueError as e:
         construction_error(len(arrays), arrays[0].shape, axes, e)
 
 
-def form_blocks(arrays, names, axes):
+def form_blocks(arrays, names, axes, consolidate=True):
     # put "leftover" items in float bucket, where else?
     # generalize?
+    # if not consolidate, each array is wrapped in its own block without
+    # copying, consolidation is then deferred to the BlockManager
     float_items = []
     complex_items = []
     int_items = []
@@ -4669,6 +5249,8 @@ def form_blocks(arrays, names, axes):
     datetime_items = []
     datetime_tz_items = []
     cat_items = []
+    masked_items = []
+    utf8_items = []
     extra_locs = []
 
     names_idx = Index(names)
@@ -4708,24 +5290,30 @@ def form_blocks(arrays, names, axes):
             bool_items.append((i, k, v))
         elif is_categorical(v):
             cat_items.append((i, k, v))
+        elif is_masked_dtype(v):
+            masked_items.append((i, k, v))
+        elif is_utf8_dtype(v):
+            utf8_items.append((i, k, v))
         else:
             object_items.append((i, k, v))
 
     blocks = []
     if len(float_items):
-        float_blocks = _multi_blockify(float_items)
+        float_blocks = _multi_blockify(float_items, consolidate=consolidate)
         blocks.extend(float_blocks)
 
     if len(complex_items):
-        complex_blocks = _multi_blockify(complex_items)
+        complex_blocks = _multi_blockify(complex_items,
+                                         consolidate=consolidate)
         blocks.extend(complex_blocks)
 
     if len(int_items):
-        int_blocks = _multi_blockify(int_items)
+        int_blocks = _multi_blockify(int_items, consolidate=consolidate)
         blocks.extend(int_blocks)
 
     if len(datetime_items):
-        datetime_blocks = _simple_blockify(datetime_items, _NS_DTYPE)
+        datetime_blocks = _simple_blockify(datetime_items, _NS_DTYPE,
+                                           consolidate=consolidate)
         blocks.extend(datetime_blocks)
 
     if len(datetime_tz_items):
@@ -4737,11 +5325,13 @@ def form_blocks(arrays, names, axes):
         blocks.extend(dttz_blocks)
 
     if len(bool_items):
-        bool_blocks = _simple_blockify(bool_items, np.bool_)
+        bool_blocks = _simple_blockify(bool_items, np.bool_,
+                                       consolidate=consolidate)
         blocks.extend(bool_blocks)
 
     if len(object_items) > 0:
-        object_blocks = _simple_blockify(object_items, np.object_)
+        object_blocks = _simple_blockify(object_items, np.object_,
+                                         consolidate=consolidate)
         blocks.extend(object_blocks)
 
     if len(sparse_items) > 0:
@@ -4754,6 +5344,20 @@ def form_blocks(arrays, names, axes):
                       for i, _, array in cat_items]
         blocks.extend(cat_blocks)
 
+    if len(masked_items) > 0:
+        masked_blocks = [make_block(MaskedArray(array, copy=consolidate),
+                                    klass=MaskedBlock,
+                                    fastpath=True, placement=[i])
+                         for i, _, array in masked_items]
+        blocks.extend(masked_blocks)
+
+    if len(utf8_items) > 0:
+        utf8_blocks = [make_block(StringArray(array, copy=consolidate),
+                                  klass=StringBlock,
+                                  fastpath=True, placement=[i])
+                       for i, _, array in utf8_items]
+        blocks.extend(utf8_blocks)
+
     if len(extra_locs):
         shape = (len(extra_locs),) + tuple(len(x) for x in axes[1:])
 
@@ -4767,10 +5371,13 @@ def form_blocks(arrays, names, axes):
     return blocks
 
 
-def _simple_blockify(tuples, dtype):
+def _simple_blockify(tuples, dtype, consolidate=True):
     """ return a single array of a block that has a single dtype; if dtype is
     not None, coerce to this dtype
     """
+    if not consolidate:
+        return _single_blockify(tuples, dtype)
+
     values, placement = _stack_arrays(tuples, dtype)
 
     # CHECK DTYPE?
@@ -4781,8 +5388,10 @@ def _simple_blockify(tuples, dtype):
     return [block]
 
 
-def _multi_blockify(tuples, dtype=None):
+def _multi_blockify(tuples, dtype=None, consolidate=True):
     """ return an array of blocks that potentially have different dtypes """
+    if not consolidate:
+        return _single_blockify(tuples, dtype)
 
     # group by dtype
     grouper = itertools.groupby(tuples, lambda x: x[2].dtype)
@@ -4798,6 +5407,27 @@ def _multi_blockify(tuples, dtype=None):
     return new_blocks
 
 
+def _single_blockify(tuples, dtype=None):
+    """ return a block for each of the arrays, viewing rather than copying
+    the values where possible; if dtype is not None, coerce to this dtype
+    """
+
+    new_blocks = []
+    for i, names, array in tuples:
+        if isinstance(array, ABCSeries):
+            values = array._values
+        else:
+            values = np.asarray(array)
+
+        if dtype is not None and values.dtype != dtype:
+            values = values.astype(dtype)
+
+        block = make_block(values.reshape(1, -1), placement=[i])
+        new_blocks.append(block)
+
+    return new_blocks
+
+
 def _sparse_blockify(tuples, dtype=None):
     """ return an array of blocks that potentially have different dtypes (and
     are sparse)
@@ -4844,7 +5474,8 @@ def _interleaved_dtype(blocks):
     if not len(blocks):
         return None
 
-    dtype = find_common_type([b.dtype for b in blocks])
+    dtype = find_common_type([b.array_dtype if b.is_masked else b.dtype
+                              for b in blocks])
 
     # only numpy compat
     if isinstance(dtype, ExtensionDtype):
@@ -4853,9 +5484,12 @@ def _interleaved_dtype(blocks):
     return dtype
 
 
-def _consolidate(blocks):
+def _consolidate(blocks, max_bytes=None, stats=None):
     """
-    Merge blocks having same dtype, exclude non-consolidating blocks
+    Merge blocks having same dtype, exclude non-consolidating blocks and
+    groups of blocks holding more than max_bytes, if given
+
+    If stats is a dict, the merges are counted in it
     """
 
     # sort by _can_consolidate, dtype
@@ -4864,7 +5498,21 @@ def _consolidate(blocks):
 
     new_blocks = []
     for (_can_consolidate, dtype), group_blocks in grouper:
-        merged_blocks = _merge_blocks(list(group_blocks), dtype=dtype,
+        group_blocks = list(group_blocks)
+        if _can_consolidate and len(group_blocks) > 1:
+            nbytes = sum(b.values.nbytes for b in group_blocks)
+            if max_bytes is not None and nbytes > max_bytes:
+                if stats is not None:
+                    stats['deferred'] += 1
+                new_blocks.extend(group_blocks)
+                continue
+
+            if stats is not None:
+                stats['merges'] += 1
+                stats['blocks_merged'] += len(group_blocks)
+                stats['bytes_copied'] += nbytes
+
+        merged_blocks = _merge_blocks(group_blocks, dtype=dtype,
                                       _can_consolidate=_can_consolidate)
         new_blocks = _extend_blocks(merged_blocks, new_blocks)
     return new_blocks
@@ -5277,6 +5925,10 @@ def get_empty_dtype_and_na(join_units):
 
         if is_categorical_dtype(dtype):
             upcast_cls = 'category'
+        elif is_masked_dtype(dtype):
+            upcast_cls = 'masked'
+        elif is_utf8_dtype(dtype):
+            upcast_cls = 'utf8'
         elif is_datetimetz(dtype):
             upcast_cls = 'datetimetz'
         elif issubclass(dtype.type, np.bool_):
@@ -5303,6 +5955,29 @@ def get_empty_dtype_and_na(join_units):
     if not upcast_classes:
         upcast_classes = null_upcast_classes
 
+    # nullable integers or booleans stay nullable amongst themselves,
+    # else are upcast like their missing values
+    if 'masked' in upcast_classes:
+        masked = upcast_classes['masked']
+        if len(upcast_classes) == 1:
+            numpy_dtypes = [dtype.numpy_dtype for dtype in masked]
+            is_bool = [dtype == np.bool_ for dtype in numpy_dtypes]
+            if all(is_bool) or not any(is_bool):
+                g = np.find_common_type(numpy_dtypes, [])
+                if g in MaskedDtype._names:
+                    return MaskedDtype(g), np.nan
+        for dtype in upcast_classes.pop('masked'):
+            if dtype.numpy_dtype == np.bool_:
+                upcast_classes['object'].append(dtype)
+            else:
+                upcast_classes['float64'].append(np.dtype(np.float64))
+
+    # utf8 strings stay utf8 amongst themselves, else are object
+    if 'utf8' in upcast_classes:
+        if len(upcast_classes) == 1:
+            return StringDtype(), np.nan
+        upcast_classes['object'].extend(upcast_classes.pop('utf8'))
+
     # create the result
     if 'object' in upcast_classes:
         return np.dtype(np.object_), np.nan
@@ -5351,7 +6026,7 @@ def concatenate_join_units(join_units, concat_axis, copy):
     if len(to_concat) == 1:
         # Only one block, nothing to concatenate.
         concat_values = to_concat[0]
-        if copy and concat_values.base is not None:
+        if copy and getattr(concat_values, 'base', None) is not None:
             concat_values = concat_values.copy()
     else:
         concat_values = _concat._concat_compat(to_concat, axis=concat_axis)
@@ -5559,7 +6234,7 @@ class JoinUnit(object):
         if self.block is None:
             raise AssertionError("Block is None, no dtype")
 
-        if not self.needs_filling:
+        if not self.needs_filling or self.block.is_masked:
             return self.block.dtype
         else:
             return _get_dtype(maybe_promote(self.block.dtype,
@@ -5577,7 +6252,9 @@ class JoinUnit(object):
         # a block is NOT null, chunks should help in such cases.  1000 value
         # was chosen rather arbitrarily.
         values = self.block.values
-        if self.block.is_categorical:
+        if self.block.is_masked:
+            return values._mask.all()
+        elif self.block.is_categorical:
             values_flat = values.categories
         elif self.block.is_sparse:
             # fill_value is not NaN and have holes
@@ -5595,6 +6272,20 @@ class JoinUnit(object):
         return True
 
     def get_reindexed_values(self, empty_dtype, upcasted_na):
+        if is_masked_dtype(empty_dtype) or is_utf8_dtype(empty_dtype):
+            # all of the units are nullable (or missing)
+            if self.block is None:
+                n = self.shape[-1]
+                if is_utf8_dtype(empty_dtype):
+                    return StringArray._empty(n)
+                return MaskedArray._from_data_and_mask(
+                    np.zeros(n, dtype=empty_dtype.numpy_dtype),
+                    np.ones(n, dtype=np.bool_))
+            values = self.block.values
+            for indexer in self.indexers.values():
+                values = values.take_nd(indexer)
+            return values
+
         if upcasted_na is None:
             # No upcasting is necessary
             fill_value = self.block.fill_value
@@ -0,0 +1,499 @@
+"""
+An array of integer or boolean values with a mask of missing values, so that
+missing values do not force an upcast to float64 or object
+"""
+
+import numpy as np
+
+from pandas import compat
+from pandas._libs import lib
+from pandas.core.dtypes.generic import ABCSeries, ABCIndexClass
+from pandas.core.dtypes.missing import isna
+from pandas.core.dtypes.dtypes import MaskedDtype
+from pandas.core.dtypes.common import (
+    _ensure_platform_int,
+    is_bool_dtype,
+    is_integer_dtype,
+    is_masked_dtype,
+    is_list_like,
+    is_scalar,
+    pandas_dtype)
+from pandas.core.common import is_null_slice
+from pandas.core.base import PandasObject
+import pandas.core.missing as missing
+
+
+def _infer_numpy_dtype(values, mask):
+    """ infer the numpy dtype of the valid values """
+    if values.dtype in MaskedDtype._names:
+        return values.dtype
+
+    inferred = lib.infer_dtype(values[~mask])
+    if inferred in ('integer', 'empty'):
+        return np.dtype(np.int64)
+    elif inferred == 'boolean':
+        return np.dtype(np.bool_)
+    elif inferred in ('floating', 'mixed-integer-float'):
+        # validated to be integral when casting
+        return np.dtype(np.int64)
+    raise TypeError("cannot infer a nullable integer or boolean dtype "
+                    "from {inferred} values".format(inferred=inferred))
+
+
+def _coerce_to_dtype(values, mask, numpy_dtype, copy=False):
+    """ cast values to numpy_dtype, checking that the valid values are
+    unchanged """
+    if values.dtype == numpy_dtype:
+        return values.copy() if copy else values
+
+    if mask.any():
+        values = values.copy()
+        values[mask] = numpy_dtype.type(0)
+    if values.dtype == np.object_:
+        inferred = lib.infer_dtype(values)
+        if inferred not in ('integer', 'boolean', 'floating',
+                            'mixed-integer-float', 'empty'):
+            raise TypeError("cannot convert {inferred} values to "
+                            "{dtype}".format(inferred=inferred,
+                                             dtype=MaskedDtype(numpy_dtype)))
+
+    result = values.astype(numpy_dtype)
+    with np.errstate(invalid='ignore'):
+        equal = result == values
+    if not equal.all():
+        raise TypeError("cannot safely cast non-equivalent {values} to "
+                        "{dtype}".format(values=values.dtype,
+                                         dtype=MaskedDtype(numpy_dtype)))
+    return result
+
+
+class MaskedArray(PandasObject):
+    """
+    An array of integer or boolean values that may be missing.
+
+    The values are held in an ndarray of a numpy integer or boolean dtype,
+    and which of them are missing in a separate boolean mask, instead of the
+    values being upcast to float64 or object to hold ``NaN``.
+
+    .. versionadded:: 0.23.0
+
+    Parameters
+    ----------
+    values : array-like
+        Integer or boolean values, with ``NaN`` or ``None`` for missing
+        values if no ``mask`` is given
+    mask : array-like of bool, optional
+        True where the value is missing
+    dtype : MaskedDtype or str, optional
+        One of 'Int8', 'Int16', 'Int32', 'Int64', 'UInt8', 'UInt16',
+        'UInt32', 'UInt64' or 'Bool'. Inferred from ``values`` if not given.
+    copy : boolean, default False
+        Copy the values and mask
+
+    Examples
+    --------
+    >>> pd.Series([1, None, 3], dtype='Int8')
+    0      1
+    1    NaN
+    2      3
+    dtype: Int8
+    """
+
+    # For comparisons, so that numpy uses our implementation if the compare
+    # ops, which raise
+    __array_priority__ = 1000
+    _typ = 'maskedarray'
+
+    def __init__(self, values, mask=None, dtype=None, copy=False):
+
+        if isinstance(values, (ABCSeries, ABCIndexClass)):
+            values = values._values
+        if isinstance(values, MaskedArray):
+            if mask is None:
+                mask = values._mask
+            if dtype is None:
+                dtype = values.dtype
+            values = values._data
+
+        if not isinstance(values, np.ndarray):
+            values = np.asarray(values)
+        if values.ndim != 1:
+            raise ValueError("MaskedArray values must be 1-dimensional")
+
+        if mask is None:
+            mask = isna(values)
+        else:
+            mask = np.array(mask, dtype=np.bool_, copy=copy)
+            if mask.shape != values.shape:
+                raise ValueError("mask must have the same shape as values")
+
+        if dtype is None:
+            dtype = MaskedDtype(_infer_numpy_dtype(values, mask))
+        else:
+            dtype = MaskedDtype(dtype)
+
+        self._data = _coerce_to_dtype(values, mask, dtype.numpy_dtype,
+                                      copy=copy)
+        self._mask = mask
+
+    @classmethod
+    def _from_data_and_mask(cls, data, mask):
+        """ construct without validation """
+        result = cls.__new__(cls)
+        result._data = data
+        result._mask = mask
+        return result
+
+    @property
+    def dtype(self):
+        return MaskedDtype(self._data.dtype)
+
+    @property
+    def shape(self):
+        return self._data.shape
+
+    @property
+    def ndim(self):
+        return 1
+
+    @property
+    def size(self):
+        return self._data.size
+
+    @property
+    def T(self):
+        return self
+
+    @property
+    def nbytes(self):
+        return self._data.nbytes + self._mask.nbytes
+
+    def memory_usage(self, deep=False):
+        return self.nbytes
+
+    @property
+    def hasnans(self):
+        return self._mask.any()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def tolist(self):
+        """ the values as a list of python scalars, with ``NaN`` for the
+        missing values """
+        return list(self.astype(object))
+
+    def isna(self):
+        """ boolean array, True where the value is missing """
+        return self._mask.copy()
+
+    def notna(self):
+        """ boolean array, True where the value is not missing """
+        return ~self._mask
+
+    def to_dense(self):
+        """
+        Return the values as an ndarray, upcast to float64 (integers) or
+        object (booleans) to hold ``NaN`` if any value is missing
+
+        Returns
+        -------
+        dense : ndarray
+        """
+        if not self._mask.any():
+            return self._data
+        if is_bool_dtype(self._data):
+            result = self._data.astype(object)
+        else:
+            result = self._data.astype(np.float64)
+        result[self._mask] = np.nan
+        return result
+
+    def get_values(self):
+        return self.to_dense()
+
+    def __array__(self, dtype=None):
+        result = self.to_dense()
+        if dtype is not None:
+            result = np.asarray(result, dtype=dtype)
+        return result
+
+    def ravel(self, order='C'):
+        """ Return a flattened (numpy) array.
+
+        For internal compatibility with numpy arrays.
+        """
+        return np.array(self)
+
+    def view(self):
+        """ Return a view on the same values and mask """
+        return self._from_data_and_mask(self._data.view(), self._mask.view())
+
+    def copy(self, deep=True):
+        if not deep:
+            return self.view()
+        return self._from_data_and_mask(self._data.copy(), self._mask.copy())
+
+    def astype(self, dtype, copy=True):
+        """
+        Cast to a nullable dtype or to a numpy dtype
+
+        Parameters
+        ----------
+        dtype : MaskedDtype, numpy dtype or str
+        copy : boolean, default True
+
+        Raises
+        ------
+        ValueError
+            When casting missing values to a numpy integer or boolean dtype
+        """
+        if is_masked_dtype(dtype):
+            dtype = pandas_dtype(dtype)
+            if dtype == self.dtype:
+                return self.copy() if copy else self
+            return MaskedArray(self._data, mask=self._mask, dtype=dtype,
+                               copy=copy)
+
+        dtype = np.dtype(dtype)
+        if not self._mask.any():
+            return self._data.astype(dtype, copy=copy)
+        if is_integer_dtype(dtype) or is_bool_dtype(dtype):
+            raise ValueError("Cannot convert non-finite values (NA or inf) "
+                             "to {dtype}".format(dtype=dtype))
+        result = self._data.astype(dtype)
+        result[self._mask] = np.nan
+        return result
+
+    def _box_scalar(self, i):
+        if self._mask[i]:
+            return np.nan
+        return self._data[i]
+
+    def __getitem__(self, key):
+        if is_scalar(key) and not isinstance(key, slice):
+            return self._box_scalar(key)
+        if isinstance(key, tuple) and len(key) == 1:
+            key = key[0]
+        return self._from_data_and_mask(self._data[key], self._mask[key])
+
+    def _coerce_setitem_value(self, value):
+        """ return the data and mask to set for value """
+        if isinstance(value, MaskedArray):
+            return self._coerce_setitem_value(value._data)[0], value._mask
+
+        if is_scalar(value):
+            if isna(value):
+                return 0, True
+            value = np.array([value])
+            return _coerce_to_dtype(value, np.zeros(1, dtype=np.bool_),
+                                    self._data.dtype)[0], False
+
+        if not is_list_like(value):
+            raise TypeError("cannot set {typ} in a MaskedArray"
+                            .format(typ=type(value).__name__))
+        value = np.asarray(value)
+        mask = isna(value)
+        return _coerce_to_dtype(value, mask, self._data.dtype), mask
+
+    def __setitem__(self, key, value):
+        data, mask = self._coerce_setitem_value(value)
+        self._data[key] = data
+        self._mask[key] = mask
+
+    def take_nd(self, indexer, allow_fill=True, fill_value=None):
+        """
+        Take the values by the indexer, a -1 in the indexer gives a missing
+        value or ``fill_value``.
+
+        For internal compatibility with numpy arrays.
+        """
+        indexer = _ensure_platform_int(indexer)
+        if allow_fill:
+            fill = indexer == -1
+        else:
+            fill = np.zeros(len(indexer), dtype=np.bool_)
+
+        # -1 takes the last value, these are overwritten below
+        data = self._data.take(indexer)
+        mask = self._mask.take(indexer)
+        if fill.any():
+            if fill_value is None or isna(fill_value):
+                mask[fill] = True
+            else:
+                data[fill], mask[fill] = self._coerce_setitem_value(
+                    fill_value)
+        return self._from_data_and_mask(data, mask)
+
+    take = take_nd
+
+    def _slice(self, slicer):
+        """ Return a slice of myself.
+
+        For internal compatibility with numpy arrays.
+        """
+
+        # only allow 1 dimensional slicing, but can
+        # in a 2-d case be passd (slice(None),....)
+        if isinstance(slicer, tuple) and len(slicer) == 2:
+            if not is_null_slice(slicer[0]):
+                raise AssertionError("invalid slicing for a 1-ndim "
+                                     "MaskedArray")
+            slicer = slicer[1]
+        return self[slicer]
+
+    def shift(self, periods):
+        """
+        Shift the values by the desired number of periods, the values shifted
+        in are missing.
+        """
+        indexer = np.arange(len(self))
+        if len(self) and periods != 0:
+            indexer = np.roll(indexer, periods)
+            if periods > 0:
+                indexer[:periods] = -1
+            else:
+                indexer[periods:] = -1
+        return self.take_nd(indexer)
+
+    def fillna(self, value=None, method=None, limit=None):
+        """
+        Fill the missing values with a scalar value or by propagating the
+        valid values with ``method``.
+
+        Returns
+        -------
+        filled : MaskedArray, or an upcast ndarray if ``value`` cannot be
+            held by the dtype
+        """
+        if not self._mask.any():
+            return self.copy()
+
+        if method is not None:
+            # fill the positions of the valid values, then take them
+            positions = np.arange(len(self), dtype=np.float64)
+            positions[self._mask] = np.nan
+            positions = missing.interpolate_2d(positions, method=method,
+                                               limit=limit)
+            indexer = np.where(isna(positions), -1, positions)
+            return self.take_nd(indexer.astype(np.int64))
+
+        if limit is not None:
+            raise NotImplementedError("specifying a limit for 'fillna' has "
+                                      "not been implemented yet")
+        try:
+            data, _ = self._coerce_setitem_value(value)
+        except TypeError:
+            result = self.to_dense()
+            try:
+                result[self._mask] = value
+            except (TypeError, ValueError):
+                result = result.astype(object)
+                result[self._mask] = value
+            return result
+
+        result = self.copy()
+        result._data[self._mask] = data
+        result._mask[:] = False
+        return result
+
+    def argsort(self, *args, **kwargs):
+        """
+        Return the indices that would sort the values, with the missing
+        values last.
+
+        Returns
+        -------
+        argsorted : ndarray of int
+        """
+        result = self._data.argsort(*args, **kwargs)
+        mask = self._mask[result]
+        if mask.any():
+            result = np.concatenate([result[~mask], result[mask]])
+        return result
+
+    def unique(self):
+        """
+        Return the unique values, in order of appearance, with one missing
+        value if there are any.
+
+        Returns
+        -------
+        unique : MaskedArray
+        """
+        from pandas.core.algorithms import unique
+
+        valid = ~self._mask
+        data = unique(self._data[valid]).astype(self._data.dtype, copy=False)
+        mask = np.zeros(len(data), dtype=np.bool_)
+        if not valid.all():
+            # the missing value is placed by its first appearance
+            first = self._mask.argmax()
+            loc = len(unique(self._data[:first][valid[:first]]))
+            data = np.insert(data, loc, 0)
+            mask = np.insert(mask, loc, True)
+        return self._from_data_and_mask(data, mask)
+
+    def value_counts(self, dropna=True):
+        """
+        Returns a Series containing counts of each value.
+
+        Parameters
+        ----------
+        dropna : boolean, default True
+            Don't include counts of NaN.
+
+        Returns
+        -------
+        counts : Series
+        """
+        from pandas import Index, Series
+        from pandas.core.algorithms import value_counts
+
+        result = value_counts(self._data[~self._mask], sort=False)
+        index = Index(result.index.values.astype(self._data.dtype))
+        result = Series(result.values, index=index)
+        if not dropna and self._mask.any():
+            result = result.append(Series([self._mask.sum()],
+                                          index=[np.nan]))
+        return result
+
+    def map(self, mapper):
+        """
+        Map the values using an input correspondence (a dict, Series or
+        function), the missing values are passed as ``NaN``.
+
+        Returns
+        -------
+        mapped : ndarray
+        """
+        return lib.map_infer(self.astype(object), mapper)
+
+    def _reduce(self, op, name, axis=0, skipna=True, numeric_only=None,
+                filter_type=None, **kwds):
+        """ perform a reduction with a nanops function, passing our mask """
+        if not skipna and self._mask.any():
+            # propagate the missing values as the dense values would
+            return op(self.to_dense(), skipna=False, **kwds)
+        return op(self._data, skipna=True, mask=self._mask, **kwds)
+
+    def __unicode__(self):
+        """ a short repr of the values and the dtype """
+        values = self.astype(object)
+        return compat.text_type(u'{name}({values}, dtype={dtype})'.format(
+            name=type(self).__name__, values=list(values), dtype=self.dtype))
+
+
+def _concat_same_type(to_concat):
+    """
+    concatenate MaskedArrays, with the smallest dtype that can hold all
+    of their values
+    """
+    dtype = np.result_type(*[arr._data.dtype for arr in to_concat])
+    return MaskedArray._from_data_and_mask(
+        np.concatenate([arr._data.astype(dtype, copy=False)
+                        for arr in to_concat]),
+        np.concatenate([arr._mask for arr in to_concat]))
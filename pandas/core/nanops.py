@@ -117,6 +117,7 @@ class bottleneck_switch(object):
                     return _na_for_min_count(values, axis)
 
                 if (_USE_BOTTLENECK and skipna and
+                        kwds.get('mask') is None and
                         _bn_ok_dtype(values.dtype, bn_name)):
                     result = bn_func(values, axis=axis, **kwds)
 
@@ -200,23 +201,40 @@ def _get_fill_value(dtype, fill_value=None, fill_value_typ=None):
 
 
 def _get_values(values, skipna, fill_value=None, fill_value_typ=None,
-                isfinite=False, copy=True):
+                isfinite=False, copy=True, mask=None):
     """ utility to get the values view, mask, dtype
     if necessary copy and mask using the specified fill_value
     copy = True will force the copy
+    mask, if given, is used instead of the missing values of values
     """
     values = _values_from_object(values)
-    if isfinite:
+    dtype = values.dtype
+    dtype_ok = _na_ok_dtype(dtype)
+
+    if mask is not None and not dtype_ok and fill_value is None:
+        # the masked values of integers or booleans are filled with the
+        # extremes of their own dtype, or upcast to hold NaN
+        if fill_value_typ is None:
+            values = values.astype(np.float64)
+            dtype_ok = True
+        elif is_bool_dtype(dtype):
+            fill_value = fill_value_typ == '+inf'
+        elif fill_value_typ == '+inf':
+            fill_value = np.iinfo(dtype).max
+        else:
+            fill_value = np.iinfo(dtype).min
+
+    if mask is not None:
+        if isfinite:
+            mask = mask | _isfinite(values)
+    elif isfinite:
         mask = _isfinite(values)
     else:
         mask = isna(values)
 
-    dtype = values.dtype
-    dtype_ok = _na_ok_dtype(dtype)
-
     # get our fill value (in case we need to provide an alternative
     # dtype for it)
-    fill_value = _get_fill_value(dtype, fill_value=fill_value,
+    fill_value = _get_fill_value(values.dtype, fill_value=fill_value,
                                  fill_value_typ=fill_value_typ)
 
     if skipna:
@@ -315,20 +333,23 @@ def _na_for_min_count(values, axis):
         return result
 
 
-def nanany(values, axis=None, skipna=True):
-    values, mask, dtype, _ = _get_values(values, skipna, False, copy=skipna)
+def nanany(values, axis=None, skipna=True, mask=None):
+    values, mask, dtype, _ = _get_values(values, skipna, False, copy=skipna,
+                                         mask=mask)
     return values.any(axis)
 
 
-def nanall(values, axis=None, skipna=True):
-    values, mask, dtype, _ = _get_values(values, skipna, True, copy=skipna)
+def nanall(values, axis=None, skipna=True, mask=None):
+    values, mask, dtype, _ = _get_values(values, skipna, True, copy=skipna,
+                                         mask=mask)
     return values.all(axis)
 
 
 @disallow('M8')
 @bottleneck_switch()
-def nansum(values, axis=None, skipna=True, min_count=0):
-    values, mask, dtype, dtype_max = _get_values(values, skipna, 0)
+def nansum(values, axis=None, skipna=True, min_count=0, mask=None):
+    values, mask, dtype, dtype_max = _get_values(values, skipna, 0,
+                                                 mask=mask)
     dtype_sum = dtype_max
     if is_float_dtype(dtype):
         dtype_sum = dtype
@@ -342,8 +363,9 @@ def nansum(values, axis=None, skipna=True, min_count=0):
 
 @disallow('M8')
 @bottleneck_switch()
-def nanmean(values, axis=None, skipna=True):
-    values, mask, dtype, dtype_max = _get_values(values, skipna, 0)
+def nanmean(values, axis=None, skipna=True, mask=None):
+    values, mask, dtype, dtype_max = _get_values(values, skipna, 0,
+                                                 mask=mask)
 
     dtype_sum = dtype_max
     dtype_count = np.float64
@@ -368,9 +390,9 @@ def nanmean(values, axis=None, skipna=True):
 
 @disallow('M8')
 @bottleneck_switch()
-def nanmedian(values, axis=None, skipna=True):
+def nanmedian(values, axis=None, skipna=True, mask=None):
 
-    values, mask, dtype, dtype_max = _get_values(values, skipna)
+    values, mask, dtype, dtype_max = _get_values(values, skipna, mask=mask)
 
     def get_median(x):
         mask = notna(x)
@@ -428,18 +450,20 @@ def _get_counts_nanvar(mask, axis, ddof, dtype=float):
 
 @disallow('M8')
 @bottleneck_switch(ddof=1)
-def nanstd(values, axis=None, skipna=True, ddof=1):
-    result = np.sqrt(nanvar(values, axis=axis, skipna=skipna, ddof=ddof))
+def nanstd(values, axis=None, skipna=True, ddof=1, mask=None):
+    result = np.sqrt(nanvar(values, axis=axis, skipna=skipna, ddof=ddof,
+                            mask=mask))
     return _wrap_results(result, values.dtype)
 
 
 @disallow('M8')
 @bottleneck_switch(ddof=1)
-def nanvar(values, axis=None, skipna=True, ddof=1):
+def nanvar(values, axis=None, skipna=True, ddof=1, mask=None):
 
     values = _values_from_object(values)
     dtype = values.dtype
-    mask = isna(values)
+    if mask is None:
+        mask = isna(values)
     if is_any_int_dtype(values):
         values = values.astype('f8')
         values[mask] = np.nan
@@ -475,23 +499,24 @@ def nanvar(values, axis=None, skipna=True, ddof=1):
 
 
 @disallow('M8', 'm8')
-def nansem(values, axis=None, skipna=True, ddof=1):
-    var = nanvar(values, axis, skipna, ddof=ddof)
+def nansem(values, axis=None, skipna=True, ddof=1, mask=None):
+    var = nanvar(values, axis, skipna, ddof=ddof, mask=mask)
 
-    mask = isna(values)
+    if mask is None:
+        mask = isna(values)
     if not is_float_dtype(values.dtype):
         values = values.astype('f8')
     count, _ = _get_counts_nanvar(mask, axis, ddof, values.dtype)
-    var = nanvar(values, axis, skipna, ddof=ddof)
+    var = nanvar(values, axis, skipna, ddof=ddof, mask=mask)
 
     return np.sqrt(var) / np.sqrt(count)
 
 
 def _nanminmax(meth, fill_value_typ):
     @bottleneck_switch()
-    def reduction(values, axis=None, skipna=True):
+    def reduction(values, axis=None, skipna=True, mask=None):
         values, mask, dtype, dtype_max = _get_values(
-            values, skipna, fill_value_typ=fill_value_typ, )
+            values, skipna, fill_value_typ=fill_value_typ, mask=mask)
 
         if ((axis is not None and values.shape[axis] == 0) or
                 values.size == 0):
@@ -515,29 +540,31 @@ nanmax = _nanminmax('max', fill_value_typ='-inf')
 
 
 @disallow('O')
-def nanargmax(values, axis=None, skipna=True):
+def nanargmax(values, axis=None, skipna=True, mask=None):
     """
     Returns -1 in the NA case
     """
-    values, mask, dtype, _ = _get_values(values, skipna, fill_value_typ='-inf')
+    values, mask, dtype, _ = _get_values(values, skipna, fill_value_typ='-inf',
+                                         mask=mask)
     result = values.argmax(axis)
     result = _maybe_arg_null_out(result, axis, mask, skipna)
     return result
 
 
 @disallow('O')
-def nanargmin(values, axis=None, skipna=True):
+def nanargmin(values, axis=None, skipna=True, mask=None):
     """
     Returns -1 in the NA case
     """
-    values, mask, dtype, _ = _get_values(values, skipna, fill_value_typ='+inf')
+    values, mask, dtype, _ = _get_values(values, skipna, fill_value_typ='+inf',
+                                         mask=mask)
     result = values.argmin(axis)
     result = _maybe_arg_null_out(result, axis, mask, skipna)
     return result
 
 
 @disallow('M8', 'm8')
-def nanskew(values, axis=None, skipna=True):
+def nanskew(values, axis=None, skipna=True, mask=None):
     """ Compute the sample skewness.
 
     The statistic computed here is the adjusted Fisher-Pearson standardized
@@ -547,7 +574,8 @@ def nanskew(values, axis=None, skipna=True):
     """
 
     values = _values_from_object(values)
-    mask = isna(values)
+    if mask is None:
+        mask = isna(values)
     if not is_float_dtype(values.dtype):
         values = values.astype('f8')
         count = _get_counts(mask, axis)
@@ -596,7 +624,7 @@ def nanskew(values, axis=None, skipna=True):
 
 
 @disallow('M8', 'm8')
-def nankurt(values, axis=None, skipna=True):
+def nankurt(values, axis=None, skipna=True, mask=None):
     """ Compute the sample excess kurtosis.
 
     The statistic computed here is the adjusted Fisher-Pearson standardized
@@ -605,7 +633,8 @@ def nankurt(values, axis=None, skipna=True):
 
     """
     values = _values_from_object(values)
-    mask = isna(values)
+    if mask is None:
+        mask = isna(values)
     if not is_float_dtype(values.dtype):
         values = values.astype('f8')
         count = _get_counts(mask, axis)
@@ -664,9 +693,10 @@ def nankurt(values, axis=None, skipna=True):
 
 
 @disallow('M8', 'm8')
-def nanprod(values, axis=None, skipna=True, min_count=0):
-    mask = isna(values)
-    if skipna and not is_any_int_dtype(values):
+def nanprod(values, axis=None, skipna=True, min_count=0, mask=None):
+    if mask is None:
+        mask = isna(values)
+    if skipna and mask.any():
         values = values.copy()
         values[mask] = 1
     result = values.prod(axis)
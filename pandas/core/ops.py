@@ -26,7 +26,7 @@ from pandas.core.dtypes.missing import notna, isna
 from pandas.core.dtypes.common import (
     needs_i8_conversion,
     is_datetimelike_v_numeric,
-    is_integer_dtype, is_categorical_dtype,
+    is_integer_dtype, is_categorical_dtype, is_utf8_dtype,
     is_object_dtype, is_timedelta64_dtype,
     is_datetime64_dtype, is_datetime64tz_dtype, is_datetime64_ns_dtype,
     is_bool_dtype, is_datetimetz,
@@ -798,6 +798,10 @@ def _comp_method_SERIES(op, name, str_rep, masker=False):
             if not self._indexed_same(other):
                 msg = 'Can only compare identically-labeled Series objects'
                 raise ValueError(msg)
+            if is_utf8_dtype(self) and is_utf8_dtype(other):
+                # compare the bytes of the strings
+                return self._constructor(op(self._values, other._values),
+                                         index=self.index, name=name)
             return self._constructor(na_op(self.values, other.values),
                                      index=self.index, name=name)
         elif isinstance(other, ABCDataFrame):  # pragma: no cover
@@ -834,6 +838,9 @@ def _comp_method_SERIES(op, name, str_rep, masker=False):
             # dispatch to it.
             with np.errstate(all='ignore'):
                 res = op(self.values, other)
+        elif is_utf8_dtype(self) and is_scalar(other):
+            # compare the bytes of the strings
+            res = op(self._values, other)
         else:
             values = self.get_values()
             if isinstance(other, (list, np.ndarray)):
@@ -15,6 +15,8 @@ import numpy.ma as ma
 
 from pandas.core.dtypes.common import (
     is_categorical_dtype,
+    is_masked_dtype,
+    is_utf8_dtype,
     is_bool,
     is_integer, is_integer_dtype,
     is_float_dtype,
@@ -53,6 +55,8 @@ from pandas.core.indexing import check_bool_indexer, maybe_convert_indices
 from pandas.core import generic, base
 from pandas.core.internals import SingleBlockManager
 from pandas.core.categorical import Categorical, CategoricalAccessor
+from pandas.core.masked import MaskedArray
+from pandas.core.utf8 import StringArray
 import pandas.core.strings as strings
 from pandas.core.indexes.accessors import CombinedDatetimelikeProperties
 from pandas.core.indexes.datetimes import DatetimeIndex
@@ -778,6 +782,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
         key = com._apply_if_callable(key, self)
 
         def setitem(key, value):
+            self._data.copy_if_shared()
             try:
                 self._set_with_engine(key, value)
                 return
@@ -970,6 +975,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
         return self._set_value(label, value, takeable=takeable)
 
     def _set_value(self, label, value, takeable=False):
+        self._data.copy_if_shared()
         try:
             if takeable:
                 self._values[label] = value
@@ -2777,7 +2783,10 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
         dtype: bool
 
         """
-        result = algorithms.isin(_values_from_object(self), values)
+        if is_utf8_dtype(self):
+            result = algorithms.isin(self._values, values)
+        else:
+            result = algorithms.isin(_values_from_object(self), values)
         return self._constructor(result, index=self.index).__finalize__(self)
 
     def between(self, left, right, inclusive=True):
@@ -3134,6 +3143,26 @@ def _sanitize_array(data, index, dtype=None, copy=False,
         else:
             data = data.copy()
 
+    # utf8 strings
+    if isinstance(data, StringArray):
+        if dtype is None or is_utf8_dtype(dtype):
+            return StringArray(data, copy=copy)
+        data = data.astype(dtype)
+    elif is_utf8_dtype(dtype):
+        if is_scalar(data) and index is not None:
+            data = [data] * len(index)
+        return StringArray(data, copy=copy)
+
+    # nullable integers and booleans
+    if isinstance(data, MaskedArray):
+        if dtype is None or is_masked_dtype(dtype):
+            return MaskedArray(data, dtype=dtype, copy=copy)
+        data = data.astype(dtype)
+    elif is_masked_dtype(dtype):
+        if is_scalar(data) and index is not None:
+            data = [data] * len(index)
+        return MaskedArray(data, dtype=dtype, copy=copy)
+
     def _try_cast(arr, take_fast_path):
 
         # perf shortcut as this is the most common case
@@ -1,12 +1,14 @@
 import numpy as np
 
 from pandas.compat import zip
-from pandas.core.dtypes.generic import ABCSeries, ABCIndex
+from pandas.core.dtypes.generic import ABCSeries, ABCIndex, ABCStringArray
 from pandas.core.dtypes.missing import isna, notna
 from pandas.core.dtypes.common import (
     is_bool_dtype,
     is_categorical_dtype,
+    is_integer_dtype,
     is_object_dtype,
+    is_utf8_dtype,
     is_string_like,
     is_list_like,
     is_scalar,
@@ -197,6 +199,33 @@ def _map(f, arr, na_mask=False, na_value=np.nan, dtype=object):
         return lib.map_infer(arr, f)
 
 
+def _utf8_values(arr, pat=None):
+    """ the StringArray of a utf8 Series, to compute a result on the bytes
+    of the strings, or None if the result is to be mapped over the strings
+    """
+    if isinstance(arr, ABCSeries) and is_utf8_dtype(arr):
+        if pat is None or isinstance(pat, compat.string_types):
+            return arr._values
+    return None
+
+
+def _utf8_na_map(values, result, na_result=np.nan):
+    """ put na_result in a result computed on the bytes of the strings of
+    values, where the strings are missing, as _na_map would """
+    if isinstance(result, ABCStringArray) or not values.hasnans:
+        return result
+
+    mask = values.isna()
+    if is_integer_dtype(result) and isna(na_result):
+        result = result.astype(np.float64)
+    else:
+        result = result.astype(object)
+    result[mask] = na_result
+    if na_result is not np.nan and result.dtype == object:
+        result = lib.maybe_convert_objects(result)
+    return result
+
+
 def str_count(arr, pat, flags=0):
     """
     Count occurrences of pattern in each string of the Series/Index.
@@ -242,6 +271,12 @@ def str_contains(arr, pat, case=True, flags=0, na=np.nan, regex=True):
     match : analogous, but stricter, relying on re.match instead of re.search
 
     """
+    values = _utf8_values(arr, pat)
+    if (values is not None and case and not flags and
+            (not regex or re.escape(pat) == pat)):
+        # a literal pattern, searched for in the bytes of the strings
+        return _utf8_na_map(values, values.contains(pat), na)
+
     if regex:
         if not case:
             flags |= re.IGNORECASE
@@ -281,6 +316,10 @@ def str_startswith(arr, pat, na=np.nan):
     -------
     startswith : Series/array of boolean values
     """
+    values = _utf8_values(arr, pat)
+    if values is not None:
+        return _utf8_na_map(values, values.startswith(pat), na)
+
     f = lambda x: x.startswith(pat)
     return _na_map(f, arr, na, dtype=bool)
 
@@ -301,6 +340,10 @@ def str_endswith(arr, pat, na=np.nan):
     -------
     endswith : Series/array of boolean values
     """
+    values = _utf8_values(arr, pat)
+    if values is not None:
+        return _utf8_na_map(values, values.endswith(pat), na)
+
     f = lambda x: x.endswith(pat)
     return _na_map(f, arr, na, dtype=bool)
 
@@ -1309,9 +1352,15 @@ def str_encode(arr, encoding, errors="strict"):
     return _na_map(f, arr)
 
 
-def _noarg_wrapper(f, docstring=None, **kargs):
+def _noarg_wrapper(f, docstring=None, native=None, **kargs):
     def wrapper(self):
-        result = _na_map(f, self._data, **kargs)
+        # native is the name of the StringArray method computing the result
+        # on the bytes of utf8 strings
+        values = _utf8_values(self._data) if native is not None else None
+        if values is not None:
+            result = _utf8_na_map(values, getattr(values, native)())
+        else:
+            result = _na_map(f, self._data, **kargs)
         return self._wrap_result(result)
 
     wrapper.__name__ = f.__name__
@@ -1815,7 +1864,8 @@ class StringMethods(NoNewAttributesMixin):
     -------
     lengths : Series/Index of integer values
     """)
-    len = _noarg_wrapper(len, docstring=_shared_docs['len'], dtype=int)
+    len = _noarg_wrapper(len, docstring=_shared_docs['len'],
+                         native='lengths', dtype=int)
 
     _shared_docs['casemethods'] = ("""
     Convert strings in the Series/Index to %(type)s.
@@ -1833,10 +1883,10 @@ class StringMethods(NoNewAttributesMixin):
     _shared_docs['swapcase'] = dict(type='be swapcased', method='swapcase')
     lower = _noarg_wrapper(lambda x: x.lower(),
                            docstring=_shared_docs['casemethods'] %
-                           _shared_docs['lower'])
+                           _shared_docs['lower'], native='lower')
     upper = _noarg_wrapper(lambda x: x.upper(),
                            docstring=_shared_docs['casemethods'] %
-                           _shared_docs['upper'])
+                           _shared_docs['upper'], native='upper')
     title = _noarg_wrapper(lambda x: x.title(),
                            docstring=_shared_docs['casemethods'] %
                            _shared_docs['title'])
@@ -1899,7 +1949,8 @@ class StringMethods(NoNewAttributesMixin):
         if (isinstance(data, ABCSeries) and
                 not ((is_categorical_dtype(data.dtype) and
                       is_object_dtype(data.values.categories)) or
-                     (is_object_dtype(data.dtype)))):
+                     is_object_dtype(data.dtype) or
+                     is_utf8_dtype(data.dtype))):
             # it's neither a string series not a categorical series with
             # strings inside the categories.
             # this really should exclude all series with any non-string values
@@ -0,0 +1,610 @@
+"""
+An array of strings held as a single buffer of their utf8 bytes, the offsets
+of each string in the buffer and a mask of the missing ones, so that strings
+do not need a python object each
+"""
+
+import operator
+
+import numpy as np
+
+from pandas import compat
+from pandas._libs import lib, hashtable as htable
+from pandas.core.dtypes.generic import ABCSeries, ABCIndexClass
+from pandas.core.dtypes.missing import isna
+from pandas.core.dtypes.dtypes import StringDtype
+from pandas.core.dtypes.common import (
+    _ensure_platform_int,
+    is_list_like,
+    is_object_dtype,
+    is_scalar,
+    is_utf8_dtype)
+from pandas.core.common import is_null_slice
+from pandas.core.base import PandasObject
+import pandas.core.missing as missing
+
+
+def _encode(values, mask):
+    """ encode the valid strings of an object array to a utf8 buffer and
+    the offsets of each string in it """
+    encoded = [b'' if m else v.encode('utf-8') for v, m in zip(values, mask)]
+    lengths = np.fromiter((len(v) for v in encoded), dtype=np.int64,
+                          count=len(encoded))
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    data = np.frombuffer(b''.join(encoded), dtype=np.uint8).copy()
+    return data, offsets
+
+
+def _gather(data, starts, lengths):
+    """ gather the strings data[starts[i]:starts[i] + lengths[i]] to a new
+    buffer and its offsets """
+    offsets = np.zeros(len(starts) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    positions = (np.repeat(starts - offsets[:-1], lengths) +
+                 np.arange(offsets[-1], dtype=np.int64))
+    return data.take(positions), offsets
+
+
+# lookup tables of the ascii case conversions of a byte
+_ascii_lower = np.arange(256, dtype=np.uint8)
+_ascii_lower[ord('A'):ord('Z') + 1] += 32
+_ascii_upper = np.arange(256, dtype=np.uint8)
+_ascii_upper[ord('a'):ord('z') + 1] -= 32
+
+
+class StringArray(PandasObject):
+    """
+    An array of strings that may be missing, held as utf8 bytes.
+
+    The strings are encoded to a single buffer of utf8 bytes, with an array
+    of the offsets of each string in the buffer and a boolean mask of the
+    missing ones, instead of an object array of python strings. Hashing,
+    factorizing, comparisons, ``isin`` and the common ``.str`` methods work
+    on the bytes, the strings are decoded only when they are accessed.
+
+    .. versionadded:: 0.23.0
+
+    Parameters
+    ----------
+    values : array-like
+        Strings, with ``NaN`` or ``None`` for missing values
+    copy : boolean, default False
+        Copy the buffers if ``values`` is a StringArray
+
+    Examples
+    --------
+    >>> pd.Series(['a', None, 'c'], dtype='utf8')
+    0      a
+    1    NaN
+    2      c
+    dtype: utf8
+    """
+
+    # For comparisons, so that numpy uses our implementation if the compare
+    # ops, which raise
+    __array_priority__ = 1000
+    _typ = 'stringarray'
+
+    def __init__(self, values, copy=False):
+
+        if isinstance(values, (ABCSeries, ABCIndexClass)):
+            values = values._values
+        if isinstance(values, StringArray):
+            if copy:
+                values = values.copy()
+            self._data = values._data
+            self._offsets = values._offsets
+            self._mask = values._mask
+            return
+
+        values = np.asarray(values, dtype=object)
+        if values.ndim != 1:
+            raise ValueError("StringArray values must be 1-dimensional")
+
+        mask = isna(values)
+        inferred = lib.infer_dtype(values[~mask])
+        if inferred not in ('string', 'unicode', 'empty'):
+            raise TypeError("cannot construct a StringArray from {inferred} "
+                            "values".format(inferred=inferred))
+
+        self._data, self._offsets = _encode(values, mask)
+        self._mask = mask
+
+    @classmethod
+    def _from_buffers(cls, data, offsets, mask):
+        """ construct without validation """
+        result = cls.__new__(cls)
+        result._data = data
+        result._offsets = offsets
+        result._mask = mask
+        return result
+
+    @classmethod
+    def _empty(cls, n):
+        """ an array of n missing strings """
+        return cls._from_buffers(np.empty(0, dtype=np.uint8),
+                                 np.zeros(n + 1, dtype=np.int64),
+                                 np.ones(n, dtype=np.bool_))
+
+    @property
+    def dtype(self):
+        return StringDtype()
+
+    @property
+    def shape(self):
+        return self._mask.shape
+
+    @property
+    def ndim(self):
+        return 1
+
+    @property
+    def size(self):
+        return self._mask.size
+
+    @property
+    def T(self):
+        return self
+
+    @property
+    def nbytes(self):
+        return self._data.nbytes + self._offsets.nbytes + self._mask.nbytes
+
+    def memory_usage(self, deep=False):
+        return self.nbytes
+
+    @property
+    def hasnans(self):
+        return self._mask.any()
+
+    def __len__(self):
+        return len(self._mask)
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def tolist(self):
+        """ the strings as a list, with ``NaN`` for the missing values """
+        return list(self.to_dense())
+
+    def isna(self):
+        """ boolean array, True where the value is missing """
+        return self._mask.copy()
+
+    def notna(self):
+        """ boolean array, True where the value is not missing """
+        return ~self._mask
+
+    def to_dense(self):
+        """
+        Return the strings decoded to an object ndarray, with ``NaN`` for the
+        missing values
+
+        Returns
+        -------
+        dense : ndarray
+        """
+        return lib.utf8_to_object(self._data, self._offsets, self._mask)
+
+    def get_values(self):
+        return self.to_dense()
+
+    def __array__(self, dtype=None):
+        result = self.to_dense()
+        if dtype is not None:
+            result = np.asarray(result, dtype=dtype)
+        return result
+
+    def ravel(self, order='C'):
+        """ Return a flattened (numpy) array.
+
+        For internal compatibility with numpy arrays.
+        """
+        return np.array(self)
+
+    def view(self):
+        """ Return a view on the same buffers """
+        return self._from_buffers(self._data, self._offsets, self._mask)
+
+    def copy(self, deep=True):
+        if not deep:
+            return self.view()
+        return self._from_buffers(self._data.copy(), self._offsets.copy(),
+                                  self._mask.copy())
+
+    def astype(self, dtype, copy=True):
+        """
+        Cast to the utf8 dtype or to a numpy dtype
+
+        Parameters
+        ----------
+        dtype : StringDtype, numpy dtype or str
+        copy : boolean, default True
+        """
+        if is_utf8_dtype(dtype):
+            return self.copy() if copy else self
+
+        result = self.to_dense()
+        if is_object_dtype(dtype):
+            return result
+        return result.astype(dtype)
+
+    def _box_scalar(self, i):
+        if i < 0:
+            i += len(self)
+        if self._mask[i]:
+            return np.nan
+        start, stop = self._offsets[i], self._offsets[i + 1]
+        return self._data[start:stop].tobytes().decode('utf-8')
+
+    def __getitem__(self, key):
+        if is_scalar(key) and not isinstance(key, slice):
+            return self._box_scalar(key)
+        if isinstance(key, tuple) and len(key) == 1:
+            key = key[0]
+
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                # a view on the buffer of the strings of the slice
+                stop = max(start, stop)
+                offsets = self._offsets[start:stop + 1]
+                return self._from_buffers(
+                    self._data[offsets[0]:offsets[-1]],
+                    offsets - offsets[0], self._mask[start:stop])
+
+        indexer = np.arange(len(self))[key]
+        return self.take_nd(indexer, allow_fill=False)
+
+    def _coerce_setitem_value(self, value):
+        """ return the value to set as a StringArray """
+        if isinstance(value, StringArray):
+            return value
+
+        if is_scalar(value):
+            if isna(value):
+                return self._empty(1)
+            if not isinstance(value, compat.string_types):
+                raise TypeError("cannot set {typ} in a StringArray"
+                                .format(typ=type(value).__name__))
+            return StringArray([value])
+
+        if not is_list_like(value):
+            raise TypeError("cannot set {typ} in a StringArray"
+                            .format(typ=type(value).__name__))
+        return StringArray(value)
+
+    def __setitem__(self, key, value):
+        # the strings can change length, so the buffers are rebuilt by taking
+        # our strings and the new ones
+        value = self._coerce_setitem_value(value)
+        n = len(self)
+        positions = np.arange(n)[key]
+        indexer = np.arange(n)
+        if len(value) == 1:
+            indexer[positions] = n
+        else:
+            indexer[positions] = n + np.arange(len(value))
+
+        result = _concat_same_type([self, value]).take_nd(indexer,
+                                                          allow_fill=False)
+        self._data = result._data
+        self._offsets = result._offsets
+        self._mask = result._mask
+
+    def take_nd(self, indexer, allow_fill=True, fill_value=None):
+        """
+        Take the values by the indexer, a -1 in the indexer gives a missing
+        value or ``fill_value``.
+
+        For internal compatibility with numpy arrays.
+        """
+        indexer = _ensure_platform_int(indexer)
+        if allow_fill:
+            fill = indexer == -1
+        else:
+            fill = np.zeros(len(indexer), dtype=np.bool_)
+
+        if fill.all():
+            result = self._empty(len(indexer))
+        else:
+            # -1 takes the last value, these are overwritten below
+            starts = self._offsets[:-1].take(indexer)
+            lengths = self._offsets[1:].take(indexer) - starts
+            mask = self._mask.take(indexer)
+            lengths[mask | fill] = 0
+            mask[fill] = True
+            data, offsets = _gather(self._data, starts, lengths)
+            result = self._from_buffers(data, offsets, mask)
+
+        if fill.any() and fill_value is not None and not isna(fill_value):
+            result[fill] = fill_value
+        return result
+
+    take = take_nd
+
+    def _slice(self, slicer):
+        """ Return a slice of myself.
+
+        For internal compatibility with numpy arrays.
+        """
+
+        # only allow 1 dimensional slicing, but can
+        # in a 2-d case be passd (slice(None),....)
+        if isinstance(slicer, tuple) and len(slicer) == 2:
+            if not is_null_slice(slicer[0]):
+                raise AssertionError("invalid slicing for a 1-ndim "
+                                     "StringArray")
+            slicer = slicer[1]
+        return self[slicer]
+
+    def shift(self, periods):
+        """
+        Shift the values by the desired number of periods, the values shifted
+        in are missing.
+        """
+        indexer = np.arange(len(self))
+        if len(self) and periods != 0:
+            indexer = np.roll(indexer, periods)
+            if periods > 0:
+                indexer[:periods] = -1
+            else:
+                indexer[periods:] = -1
+        return self.take_nd(indexer)
+
+    def fillna(self, value=None, method=None, limit=None):
+        """
+        Fill the missing values with a scalar value or by propagating the
+        valid values with ``method``.
+
+        Returns
+        -------
+        filled : StringArray, or an object ndarray if ``value`` is not a
+            string
+        """
+        if not self._mask.any():
+            return self.copy()
+
+        if method is not None:
+            # fill the positions of the valid values, then take them
+            positions = np.arange(len(self), dtype=np.float64)
+            positions[self._mask] = np.nan
+            positions = missing.interpolate_2d(positions, method=method,
+                                               limit=limit)
+            indexer = np.where(isna(positions), -1, positions)
+            return self.take_nd(indexer.astype(np.int64))
+
+        if limit is not None:
+            raise NotImplementedError("specifying a limit for 'fillna' has "
+                                      "not been implemented yet")
+        try:
+            self._coerce_setitem_value(value)
+        except TypeError:
+            result = self.to_dense()
+            result[self._mask] = value
+            return result
+
+        result = self.copy()
+        result[self._mask] = value
+        return result
+
+    def factorize(self, na_sentinel=-1):
+        """
+        Encode the strings as labels of the unique strings, in order of
+        appearance, by hashing their bytes.
+
+        Returns
+        -------
+        labels : ndarray of int64
+        uniques : StringArray
+        """
+        labels, first = htable.factorize_utf8(self._data, self._offsets,
+                                              self._mask,
+                                              na_sentinel=na_sentinel)
+        return labels, self.take_nd(first, allow_fill=False)
+
+    def argsort(self, *args, **kwargs):
+        """
+        Return the indices that would sort the strings, with the missing
+        values last.
+
+        Returns
+        -------
+        argsorted : ndarray of int
+        """
+        # sort the unique strings, and then the labels by their rank
+        labels, uniques = self.factorize()
+        ranks = np.empty(len(uniques), dtype=np.int64)
+        ranks[np.argsort(uniques.to_dense())] = np.arange(len(uniques))
+        keys = np.full(len(self), len(uniques), dtype=np.int64)
+        valid = ~self._mask
+        keys[valid] = ranks.take(labels[valid])
+        return keys.argsort(*args, **kwargs)
+
+    def unique(self):
+        """
+        Return the unique strings, in order of appearance, with one missing
+        value if there are any.
+
+        Returns
+        -------
+        unique : StringArray
+        """
+        labels, _ = self.factorize()
+        _, first = np.unique(labels, return_index=True)
+        return self.take_nd(np.sort(first), allow_fill=False)
+
+    def value_counts(self, dropna=True):
+        """
+        Returns a Series containing counts of each value.
+
+        Parameters
+        ----------
+        dropna : boolean, default True
+            Don't include counts of NaN.
+
+        Returns
+        -------
+        counts : Series
+        """
+        from pandas import Index, Series
+
+        labels, uniques = self.factorize()
+        counts = np.bincount(labels[labels != -1], minlength=len(uniques))
+        result = Series(counts, index=Index(uniques.to_dense()))
+        if not dropna and self._mask.any():
+            result = result.append(Series([self._mask.sum()],
+                                          index=[np.nan]))
+        return result
+
+    def isin(self, values):
+        """
+        Return a boolean array, True where the string is one of ``values``.
+
+        Parameters
+        ----------
+        values : list-like of strings
+
+        Returns
+        -------
+        isin : ndarray of bool
+        """
+        if not isinstance(values, StringArray):
+            values = np.asarray(values, dtype=object)
+            mask = isna(values)
+            if lib.infer_dtype(values[~mask]) not in ('string', 'unicode',
+                                                      'empty'):
+                # only the strings and missing values can match
+                valid = np.array([isinstance(v, compat.string_types)
+                                  for v in values], dtype=np.bool_)
+                values = values[valid | mask]
+            values = StringArray(values)
+        return htable.isin_utf8(self._data, self._offsets, self._mask,
+                                values._data, values._offsets, values._mask)
+
+    def map(self, mapper):
+        """
+        Map the values using an input correspondence (a dict, Series or
+        function), the missing values are passed as ``NaN``.
+
+        Returns
+        -------
+        mapped : ndarray
+        """
+        return lib.map_infer(self.to_dense(), mapper)
+
+    # ------------------------------------------------------------------
+    # string methods, the results of the missing strings are unspecified
+
+    def lengths(self):
+        """ the number of characters of each string, as an int64 ndarray """
+        # count the bytes that start a character, i.e. are not continuation
+        # bytes of the form 0b10xxxxxx
+        starts = (self._data & 0xC0) != 0x80
+        counts = np.zeros(len(starts) + 1, dtype=np.int64)
+        np.cumsum(starts, out=counts[1:])
+        return counts[self._offsets[1:]] - counts[self._offsets[:-1]]
+
+    def _convert_case(self, table, func):
+        if not len(self._data) or self._data.max() < 0x80:
+            # only ascii, where the case maps byte to byte
+            return self._from_buffers(table.take(self._data),
+                                      self._offsets.copy(),
+                                      self._mask.copy())
+        values = self.to_dense()
+        valid = ~self._mask
+        values[valid] = [func(v) for v in values[valid]]
+        return StringArray(values)
+
+    def lower(self):
+        """ the strings converted to lowercase, as a StringArray """
+        return self._convert_case(_ascii_lower, lambda x: x.lower())
+
+    def upper(self):
+        """ the strings converted to uppercase, as a StringArray """
+        return self._convert_case(_ascii_upper, lambda x: x.upper())
+
+    def _find(self, pat, how):
+        return lib.utf8_find(self._data, self._offsets, self._mask,
+                             pat.encode('utf-8'), how)
+
+    def contains(self, pat):
+        """ boolean ndarray, True where the string contains pat """
+        return self._find(pat, 'contains')
+
+    def startswith(self, pat):
+        """ boolean ndarray, True where the string starts with pat """
+        return self._find(pat, 'startswith')
+
+    def endswith(self, pat):
+        """ boolean ndarray, True where the string ends with pat """
+        return self._find(pat, 'endswith')
+
+    # ------------------------------------------------------------------
+    # comparisons, the missing values compare False, or True for ``!=``
+
+    def _compare(self, other, op):
+        if isinstance(other, (ABCSeries, ABCIndexClass)):
+            other = other._values
+        if isinstance(other, StringArray):
+            return lib.utf8_compare(self._data, self._offsets, self._mask,
+                                    other._data, other._offsets, other._mask,
+                                    op)
+        elif isinstance(other, compat.string_types):
+            return lib.utf8_compare_scalar(self._data, self._offsets,
+                                           self._mask, other.encode('utf-8'),
+                                           op)
+        elif is_scalar(other) and isna(other):
+            return np.full(len(self), op == 'ne', dtype=np.bool_)
+
+        # compare the decoded strings
+        result = getattr(operator, op)(self.to_dense(), other)
+        if isinstance(result, np.ndarray) and self._mask.any():
+            result[self._mask] = op == 'ne'
+        return result
+
+    def __eq__(self, other):
+        return self._compare(other, 'eq')
+
+    def __ne__(self, other):
+        return self._compare(other, 'ne')
+
+    def __lt__(self, other):
+        return self._compare(other, 'lt')
+
+    def __le__(self, other):
+        return self._compare(other, 'le')
+
+    def __gt__(self, other):
+        return self._compare(other, 'gt')
+
+    def __ge__(self, other):
+        return self._compare(other, 'ge')
+
+    __hash__ = None
+
+    def _reduce(self, op, name, axis=0, skipna=True, numeric_only=None,
+                filter_type=None, **kwds):
+        """ perform a reduction with a nanops function on the decoded
+        strings """
+        return op(self.to_dense(), skipna=skipna, **kwds)
+
+    def __unicode__(self):
+        """ a short repr of the values and the dtype """
+        return compat.text_type(u'{name}({values}, dtype={dtype})'.format(
+            name=type(self).__name__, values=self.tolist(), dtype=self.dtype))
+
+
+def _concat_same_type(to_concat):
+    """
+    concatenate StringArrays, by concatenating their buffers
+    """
+    shifts = np.cumsum([0] + [len(arr._data) for arr in to_concat])
+    offsets = [arr._offsets[:-1] + shift
+               for arr, shift in zip(to_concat, shifts)]
+    offsets.append(np.array([shifts[-1]], dtype=np.int64))
+    return StringArray._from_buffers(
+        np.concatenate([arr._data for arr in to_concat]),
+        np.concatenate(offsets),
+        np.concatenate([arr._mask for arr in to_concat]))
@@ -11,7 +11,7 @@ from pandas.core.dtypes.generic import (
     ABCSeries,
     ABCDataFrame)
 from pandas.core.dtypes.common import (
-    is_categorical_dtype, is_list_like)
+    is_categorical_dtype, is_utf8_dtype, is_list_like)
 from pandas.core.dtypes.missing import isna
 from pandas.core.dtypes.cast import infer_dtype_from_scalar
 
@@ -86,7 +86,7 @@ def hash_pandas_object(obj, index=True, encoding='utf8', hash_key=None,
                        categorize).astype('uint64', copy=False)
         h = Series(h, index=obj, dtype='uint64', copy=False)
     elif isinstance(obj, ABCSeries):
-        h = hash_array(obj.values, encoding, hash_key,
+        h = hash_array(_hashable_values(obj), encoding, hash_key,
                        categorize).astype('uint64', copy=False)
         if index:
             index_iter = (hash_pandas_object(obj.index,
@@ -101,7 +101,8 @@ def hash_pandas_object(obj, index=True, encoding='utf8', hash_key=None,
         h = Series(h, index=obj.index, dtype='uint64', copy=False)
 
     elif isinstance(obj, ABCDataFrame):
-        hashes = (hash_array(series.values) for _, series in obj.iteritems())
+        hashes = (hash_array(_hashable_values(series))
+                  for _, series in obj.iteritems())
         num_items = len(obj.columns)
         if index:
             index_hash_generator = (hash_pandas_object(obj.index,
@@ -190,6 +191,44 @@ def hash_tuple(val, encoding='utf8', hash_key=None):
     return h
 
 
+def _hashable_values(obj):
+    """ the values of a Series to hash, utf8 strings are hashed from their
+    buffer of bytes """
+    if is_utf8_dtype(obj):
+        return obj._values
+    return obj.values
+
+
+def _hash_utf8(vals, encoding, hash_key, categorize):
+    """
+    Hash a StringArray from its buffer of utf8 bytes, the hashes are the same
+    as those of the object array of its strings
+
+    Parameters
+    ----------
+    vals : StringArray
+    encoding : string, default 'utf8'
+    hash_key : string key to encode, default to _default_hash_key
+    categorize : bool
+        the missing values hash as the maximum uint64 (as for a Categorical),
+        rather than as the string 'nan'
+
+    Returns
+    -------
+    ndarray of hashed values array, same size as len(vals)
+    """
+    if encoding.replace('-', '').lower() != 'utf8':
+        return hash_array(vals.astype(object), encoding, hash_key,
+                          categorize=categorize)
+
+    result = hashing.hash_utf8_array(vals._data, vals._offsets, vals._mask,
+                                     hash_key, encoding)
+    result = _mix_hashes(result)
+    if categorize and vals.hasnans:
+        result[vals._mask] = np.iinfo(np.uint64).max
+    return result
+
+
 def _hash_categorical(c, encoding, hash_key):
     """
     Hash a Categorical by hashing its categories, and then mapping the codes
@@ -263,6 +302,8 @@ def hash_array(vals, encoding='utf8', hash_key=None, categorize=True):
     # numpy if categorical is a subdtype of complex, as it will choke).
     if is_categorical_dtype(dtype):
         return _hash_categorical(vals, encoding, hash_key)
+    elif is_utf8_dtype(dtype):
+        return _hash_utf8(vals, encoding, hash_key, categorize)
 
     # we'll be working with everything as 64-bit values, so handle this
     # 128-bit value early
@@ -295,7 +336,12 @@ def hash_array(vals, encoding='utf8', hash_key=None, categorize=True):
             vals = hashing.hash_object_array(vals.astype(str).astype(object),
                                              hash_key, encoding)
 
-    # Then, redistribute these 64-bit ints within the space of 64-bit ints
+    return _mix_hashes(vals)
+
+
+def _mix_hashes(vals):
+    """ redistribute 64-bit ints within the space of 64-bit ints, inplace
+    """
     vals ^= vals >> 30
     vals *= np.uint64(0xbf58476d1ce4e5b9)
     vals ^= vals >> 27
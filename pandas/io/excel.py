@@ -7,8 +7,10 @@ Module parse to/from Excel
 from datetime import datetime, date, time, MINYEAR
 
 import os
+import copy
 import abc
 import warnings
+from itertools import chain, islice
 import numpy as np
 
 from pandas.core.dtypes.common import (
@@ -20,7 +22,7 @@ from pandas.io.parsers import TextParser
 from pandas.errors import EmptyDataError
 from pandas.io.common import (_is_url, _urlopen, _validate_header_arg,
                               get_filepath_or_buffer, _NA_VALUES,
-                              _stringify_path)
+                              _stringify_path, BaseIterator)
 from pandas.core.indexes.period import Period
 import pandas._libs.json as json
 from pandas.compat import (map, zip, reduce, range, lrange, u, add_metaclass,
@@ -111,7 +113,13 @@ dtype : Type name or dict of column -> type, default None
 
 engine: string, default None
     If io is not a buffer or path, this must be set to identify io.
-    Acceptable values are None or xlrd
+    Acceptable values are None, xlrd or openpyxl. The openpyxl engine
+    reads .xlsx files in read-only mode, parsing the rows of a sheet as
+    they are read.
+
+    .. versionadded:: 0.23.0
+       The openpyxl engine.
+
 converters : dict, default None
     Dict of functions for converting values in certain columns. Keys can
     either be integers or column labels, values are functions that take one
@@ -134,6 +142,23 @@ nrows : int, default None
 
     .. versionadded:: 0.23.0
 
+chunksize : int, default None
+    Return an iterator over the chunks of the sheet, with chunksize rows
+    each. Only a single sheet can be read in chunks.
+
+    .. versionadded:: 0.23.0
+
+processes : int, default None
+    Parse the sheets in a pool of this many processes when more than one
+    sheet is read. Each process opens the workbook, which must be given as
+    a path, and parses its sheets independently; converters and date_parser
+    must be picklable. xlrd loads .xlsx workbooks as a whole, so these are
+    parsed with openpyxl when no engine is given, and a warning is raised
+    if they cannot be. With xlrd, .xls workbooks are loaded once to get the
+    sheet names and then once more by each process, for its sheets only.
+
+    .. versionadded:: 0.23.0
+
 na_values : scalar, str, list-like, or dict, default None
     Additional strings to recognize as NA/NaN. If dict passed, specific
     per-column NA values. By default the following values are interpreted
@@ -312,30 +337,47 @@ def read_excel(io,
         raise TypeError("Cannot specify both `sheet_name` and `sheetname`. "
                         "Use just `sheet_name`")
 
-    if not isinstance(io, ExcelFile):
+    close_workbook = not isinstance(io, ExcelFile)
+    if close_workbook:
+        processes = kwds.get('processes')
+        if engine is None and processes is not None and processes > 1:
+            engine = _processes_engine(io)
         io = ExcelFile(io, engine=engine)
 
-    return io._parse_excel(
-        sheetname=sheet_name,
-        header=header,
-        names=names,
-        index_col=index_col,
-        usecols=usecols,
-        squeeze=squeeze,
-        dtype=dtype,
-        converters=converters,
-        true_values=true_values,
-        false_values=false_values,
-        skiprows=skiprows,
-        nrows=nrows,
-        na_values=na_values,
-        parse_dates=parse_dates,
-        date_parser=date_parser,
-        thousands=thousands,
-        comment=comment,
-        skipfooter=skipfooter,
-        convert_float=convert_float,
-        **kwds)
+    try:
+        result = io._parse_excel(
+            sheetname=sheet_name,
+            header=header,
+            names=names,
+            index_col=index_col,
+            usecols=usecols,
+            squeeze=squeeze,
+            dtype=dtype,
+            converters=converters,
+            true_values=true_values,
+            false_values=false_values,
+            skiprows=skiprows,
+            nrows=nrows,
+            na_values=na_values,
+            parse_dates=parse_dates,
+            date_parser=date_parser,
+            thousands=thousands,
+            comment=comment,
+            skipfooter=skipfooter,
+            convert_float=convert_float,
+            **kwds)
+    except Exception:
+        if close_workbook:
+            io._close_workbook()
+        raise
+
+    if close_workbook:
+        if isinstance(result, _ExcelChunkReader):
+            # the rows of the sheet are read with the chunks
+            result._excel_file = io
+        else:
+            io._close_workbook()
+    return result
 
 
 class ExcelFile(object):
@@ -350,11 +392,29 @@ class ExcelFile(object):
         If a string or path object, expected to be a path to xls or xlsx file
     engine: string, default None
         If io is not a buffer or path, this must be set to identify io.
-        Acceptable values are None or xlrd
+        Acceptable values are None, xlrd or openpyxl. With openpyxl, .xlsx
+        workbooks are opened in read-only mode and the rows of a sheet are
+        parsed while they are read.
+
+        .. versionadded:: 0.23.0
+           The openpyxl engine.
     """
 
     def __init__(self, io, **kwds):
 
+        # could be a str, ExcelFile, Book, etc.
+        self.io = io
+        # Always a string
+        self._io = _stringify_path(io)
+
+        engine = kwds.pop('engine', None)
+        self.engine = engine or 'xlrd'
+        self._handle = None
+
+        if engine == 'openpyxl':
+            self._open_openpyxl_workbook()
+            return
+
         err_msg = "Install xlrd >= 0.9.0 for Excel support"
 
         try:
@@ -367,13 +427,6 @@ class ExcelFile(object):
                 raise ImportError(err_msg +
                                   ". Current version " + xlrd.__VERSION__)
 
-        # could be a str, ExcelFile, Book, etc.
-        self.io = io
-        # Always a string
-        self._io = _stringify_path(io)
-
-        engine = kwds.pop('engine', None)
-
         if engine is not None and engine != 'xlrd':
             raise ValueError("Unknown engine: {engine}".format(engine=engine))
 
@@ -396,6 +449,33 @@ class ExcelFile(object):
             raise ValueError('Must explicitly set engine if not passing in'
                              ' buffer or path for io.')
 
+    def _open_openpyxl_workbook(self):
+        try:
+            import openpyxl
+        except ImportError:
+            raise ImportError("Install openpyxl >= 2.4.0 to read Excel files "
+                              "with the openpyxl engine")
+
+        if _is_url(self._io):
+            io = _urlopen(self._io)
+        else:
+            io, _, _ = get_filepath_or_buffer(self._io)
+
+        if hasattr(io, "read"):
+            # the workbook is a zip archive, which needs a seekable buffer
+            io = compat.BytesIO(io.read())
+        elif isinstance(io, compat.string_types):
+            # openpyxl opens a read-only workbook given by path twice and
+            # never closes the first archive, so the file is opened here
+            # and closed with the workbook
+            io = self._handle = open(io, 'rb')
+        else:
+            raise ValueError('The openpyxl engine needs a buffer or path '
+                             'for io.')
+
+        self.book = openpyxl.load_workbook(io, read_only=True,
+                                           data_only=True)
+
     def __fspath__(self):
         return self._io
 
@@ -503,76 +583,10 @@ class ExcelFile(object):
 
         _validate_header_arg(header)
 
-        if 'chunksize' in kwds:
-            raise NotImplementedError("chunksize keyword of read_excel "
-                                      "is not implemented")
-
         if parse_dates is True and index_col is None:
             warn("The 'parse_dates=True' keyword of read_excel was provided"
                  " without an 'index_col' keyword value.")
 
-        import xlrd
-        from xlrd import (xldate, XL_CELL_DATE,
-                          XL_CELL_ERROR, XL_CELL_BOOLEAN,
-                          XL_CELL_NUMBER)
-
-        epoch1904 = self.book.datemode
-
-        def _parse_cell(cell_contents, cell_typ):
-            """converts the contents of the cell into a pandas
-               appropriate object"""
-
-            if cell_typ == XL_CELL_DATE:
-
-                if xlrd_0_9_3:
-                    # Use the newer xlrd datetime handling.
-                    try:
-                        cell_contents = \
-                            xldate.xldate_as_datetime(cell_contents,
-                                                      epoch1904)
-                    except OverflowError:
-                        return cell_contents
-                    # Excel doesn't distinguish between dates and time,
-                    # so we treat dates on the epoch as times only.
-                    # Also, Excel supports 1900 and 1904 epochs.
-                    year = (cell_contents.timetuple())[0:3]
-                    if ((not epoch1904 and year == (1899, 12, 31)) or
-                            (epoch1904 and year == (1904, 1, 1))):
-                        cell_contents = time(cell_contents.hour,
-                                             cell_contents.minute,
-                                             cell_contents.second,
-                                             cell_contents.microsecond)
-                else:
-                    # Use the xlrd <= 0.9.2 date handling.
-                    try:
-                        dt = xldate.xldate_as_tuple(cell_contents, epoch1904)
-
-                    except xldate.XLDateTooLarge:
-                        return cell_contents
-
-                    if dt[0] < MINYEAR:
-                        cell_contents = time(*dt[3:])
-                    else:
-                        cell_contents = datetime(*dt)
-
-            elif cell_typ == XL_CELL_ERROR:
-                cell_contents = np.nan
-            elif cell_typ == XL_CELL_BOOLEAN:
-                cell_contents = bool(cell_contents)
-            elif convert_float and cell_typ == XL_CELL_NUMBER:
-                # GH5394 - Excel 'numbers' are always floats
-                # it's a minimal perf hit and less surprising
-                val = int(cell_contents)
-                if val == cell_contents:
-                    cell_contents = val
-            return cell_contents
-
-        # xlrd >= 0.9.3 can return datetime objects directly.
-        if LooseVersion(xlrd.__VERSION__) >= LooseVersion("0.9.3"):
-            xlrd_0_9_3 = True
-        else:
-            xlrd_0_9_3 = False
-
         ret_dict = False
 
         # Keep sheetname to maintain backwards compatibility.
@@ -585,41 +599,79 @@ class ExcelFile(object):
         else:
             sheets = [sheetname]
 
+        chunksize = kwds.get('chunksize')
+        if chunksize is not None and ret_dict:
+            raise ValueError("chunksize is only supported when reading "
+                             "a single sheet")
+
         # handle same-type duplicates.
         sheets = list(OrderedDict.fromkeys(sheets).keys())
 
+        processes = kwds.pop('processes', None)
+        if processes is not None and processes > 1 and len(sheets) > 1:
+            if (not isinstance(self._io, compat.string_types) or
+                    _is_url(self._io) or not os.path.isfile(self._io)):
+                raise ValueError("processes requires the path of a workbook")
+
+            # xlrd loads .xlsx workbooks as a whole, as this one already is,
+            # so only .xls workbooks are parsed in processes with xlrd
+            if self.engine == 'xlrd' and not self.book.biff_version:
+                warn("processes is ignored for .xlsx workbooks read with "
+                     "xlrd, which loads them as a whole; use "
+                     "engine='openpyxl' to parse their sheets in processes",
+                     UserWarning, stacklevel=3)
+            else:
+                kwds.update(header=header, names=names, index_col=index_col,
+                            usecols=usecols, squeeze=squeeze, dtype=dtype,
+                            true_values=true_values,
+                            false_values=false_values, skiprows=skiprows,
+                            nrows=nrows, na_values=na_values,
+                            verbose=verbose, parse_dates=parse_dates,
+                            date_parser=date_parser, thousands=thousands,
+                            comment=comment, skipfooter=skipfooter,
+                            convert_float=convert_float)
+                return self._parse_sheets_in_processes(sheets, processes,
+                                                       kwds)
+
+        if self.engine == 'openpyxl':
+            parse_cell = _openpyxl_cell_parser(convert_float)
+        else:
+            parse_cell = self._xlrd_cell_parser(convert_float)
+
         output = OrderedDict()
 
         for asheetname in sheets:
             if verbose:
                 print("Reading sheet {sheet}".format(sheet=asheetname))
 
-            if isinstance(asheetname, compat.string_types):
-                sheet = self.book.sheet_by_name(asheetname)
-            else:  # assume an integer if not a string
-                sheet = self.book.sheet_by_index(asheetname)
+            # the rows are parsed lazily, skipping the rows and columns
+            # which are not used, so that only the rows read by the parser
+            # are held in memory
+            rows = self._sheet_rows(asheetname, parse_cell, usecols,
+                                    skiprows)
 
-            data = []
-            should_parse = {}
+            if is_list_like(header) and len(header) == 1:
+                header = header[0]
 
-            for i in range(sheet.nrows):
-                row = []
-                for j, (value, typ) in enumerate(zip(sheet.row_values(i),
-                                                     sheet.row_types(i))):
-                    if usecols is not None and j not in should_parse:
-                        should_parse[j] = self._should_parse(j, usecols)
+            # the leading rows which are changed for the header and index
+            nleading = 1
+            if header is not None:
+                nleading = (max(header) if is_list_like(header)
+                            else header) + 1
+            if is_list_like(index_col):
+                # forward fill values for MultiIndex index
+                if not is_list_like(header):
+                    offset = 1 + header
+                else:
+                    offset = 1 + max(header)
+                nleading = max(nleading, offset + 1)
 
-                    if usecols is None or should_parse[j]:
-                        row.append(_parse_cell(value, typ))
-                data.append(row)
+            data = list(islice(rows, nleading))
 
-            if sheet.nrows == 0:
+            if len(data) == 0:
                 output[asheetname] = DataFrame()
                 continue
 
-            if is_list_like(header) and len(header) == 1:
-                header = header[0]
-
             # forward fill and pull out names for MultiIndex column
             header_names = None
             if header is not None:
@@ -627,9 +679,6 @@ class ExcelFile(object):
                     header_names = []
                     control_row = [True for x in data[0]]
                     for row in header:
-                        if is_integer(skiprows):
-                            row += skiprows
-
                         data[row], control_row = _fill_mi_header(
                             data[row], control_row)
                         header_name, data[row] = _pop_header_name(
@@ -638,26 +687,15 @@ class ExcelFile(object):
                 else:
                     data[header] = _trim_excel_header(data[header])
 
+            rows = chain(data, rows)
             if is_list_like(index_col):
-                # forward fill values for MultiIndex index
-                if not is_list_like(header):
-                    offset = 1 + header
-                else:
-                    offset = 1 + max(header)
-
-                for col in index_col:
-                    last = data[offset][col]
-                    for row in range(offset + 1, len(data)):
-                        if data[row][col] == '' or data[row][col] is None:
-                            data[row][col] = last
-                        else:
-                            last = data[row][col]
+                rows = _fill_mi_index(rows, offset, index_col)
 
             has_index_names = is_list_like(header) and len(header) > 1
 
             # GH 12292 : error when read one empty column from excel file
             try:
-                parser = TextParser(data,
+                parser = TextParser(rows,
                                     header=header,
                                     index_col=index_col,
                                     has_index_names=has_index_names,
@@ -665,7 +703,6 @@ class ExcelFile(object):
                                     dtype=dtype,
                                     true_values=true_values,
                                     false_values=false_values,
-                                    skiprows=skiprows,
                                     nrows=nrows,
                                     na_values=na_values,
                                     parse_dates=parse_dates,
@@ -675,12 +712,12 @@ class ExcelFile(object):
                                     skipfooter=skipfooter,
                                     **kwds)
 
-                output[asheetname] = parser.read(nrows=nrows)
-                if names is not None:
-                    output[asheetname].columns = names
-                if not squeeze or isinstance(output[asheetname], DataFrame):
-                    output[asheetname].columns = output[
-                        asheetname].columns.set_names(header_names)
+                if chunksize is not None:
+                    return _ExcelChunkReader(parser, names, header_names,
+                                             squeeze)
+
+                output[asheetname] = _set_excel_columns(
+                    parser.read(nrows=nrows), names, header_names, squeeze)
             except EmptyDataError:
                 # No Data, return an empty DataFrame
                 output[asheetname] = DataFrame()
@@ -690,12 +727,153 @@ class ExcelFile(object):
         else:
             return output[asheetname]
 
+    def _parse_sheets_in_processes(self, sheets, processes, kwds):
+        """
+        Parse sheets in a pool of processes, each opening the workbook
+        """
+        from multiprocessing import Pool
+
+        tasks = [(self._io, self.engine, sheet, kwds) for sheet in sheets]
+        pool = Pool(min(processes, len(sheets)))
+        try:
+            frames = pool.map(_parse_excel_sheet, tasks, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+
+        return OrderedDict(zip(sheets, frames))
+
+    def _xlrd_cell_parser(self, convert_float):
+        import xlrd
+        from xlrd import (xldate, XL_CELL_DATE,
+                          XL_CELL_ERROR, XL_CELL_BOOLEAN,
+                          XL_CELL_NUMBER)
+
+        epoch1904 = self.book.datemode
+
+        def _parse_cell(cell):
+            """converts the contents of the cell into a pandas
+               appropriate object"""
+
+            cell_contents, cell_typ = cell
+
+            if cell_typ == XL_CELL_DATE:
+
+                if xlrd_0_9_3:
+                    # Use the newer xlrd datetime handling.
+                    try:
+                        cell_contents = \
+                            xldate.xldate_as_datetime(cell_contents,
+                                                      epoch1904)
+                    except OverflowError:
+                        return cell_contents
+                    # Excel doesn't distinguish between dates and time,
+                    # so we treat dates on the epoch as times only.
+                    # Also, Excel supports 1900 and 1904 epochs.
+                    year = (cell_contents.timetuple())[0:3]
+                    if ((not epoch1904 and year == (1899, 12, 31)) or
+                            (epoch1904 and year == (1904, 1, 1))):
+                        cell_contents = time(cell_contents.hour,
+                                             cell_contents.minute,
+                                             cell_contents.second,
+                                             cell_contents.microsecond)
+                else:
+                    # Use the xlrd <= 0.9.2 date handling.
+                    try:
+                        dt = xldate.xldate_as_tuple(cell_contents, epoch1904)
+
+                    except xldate.XLDateTooLarge:
+                        return cell_contents
+
+                    if dt[0] < MINYEAR:
+                        cell_contents = time(*dt[3:])
+                    else:
+                        cell_contents = datetime(*dt)
+
+            elif cell_typ == XL_CELL_ERROR:
+                cell_contents = np.nan
+            elif cell_typ == XL_CELL_BOOLEAN:
+                cell_contents = bool(cell_contents)
+            elif convert_float and cell_typ == XL_CELL_NUMBER:
+                # GH5394 - Excel 'numbers' are always floats
+                # it's a minimal perf hit and less surprising
+                val = int(cell_contents)
+                if val == cell_contents:
+                    cell_contents = val
+            return cell_contents
+
+        # xlrd >= 0.9.3 can return datetime objects directly.
+        if LooseVersion(xlrd.__VERSION__) >= LooseVersion("0.9.3"):
+            xlrd_0_9_3 = True
+        else:
+            xlrd_0_9_3 = False
+
+        return _parse_cell
+
+    def _get_sheet(self, name):
+        if self.engine == 'openpyxl':
+            if isinstance(name, compat.string_types):
+                return self.book[name]
+            return self.book.worksheets[name]
+
+        if isinstance(name, compat.string_types):
+            return self.book.sheet_by_name(name)
+        else:  # assume an integer if not a string
+            return self.book.sheet_by_index(name)
+
+    def _sheet_rows(self, name, parse_cell, usecols, skiprows):
+        """
+        Yield the rows of a sheet as lists of parsed cells, leaving out the
+        rows in skiprows and the columns not in usecols
+        """
+        sheet = self._get_sheet(name)
+        if self.engine == 'openpyxl':
+            raw_rows = sheet.iter_rows()
+        else:
+            raw_rows = (zip(sheet.row_values(i), sheet.row_types(i))
+                        for i in range(sheet.nrows))
+
+        if skiprows is None:
+            skipfunc = lambda i: False
+        elif callable(skiprows):
+            skipfunc = skiprows
+        elif is_integer(skiprows):
+            skipfunc = lambda i: i < skiprows
+        else:
+            skiprows = set(skiprows)
+            skipfunc = lambda i: i in skiprows
+
+        should_parse = {}
+        for i, cells in enumerate(raw_rows):
+            if skipfunc(i):
+                continue
+
+            row = []
+            for j, cell in enumerate(cells):
+                if usecols is not None and j not in should_parse:
+                    should_parse[j] = self._should_parse(j, usecols)
+
+                if usecols is None or should_parse[j]:
+                    row.append(parse_cell(cell))
+            yield row
+
     @property
     def sheet_names(self):
+        if self.engine == 'openpyxl':
+            return self.book.sheetnames
         return self.book.sheet_names()
 
+    def _close_workbook(self):
+        """close the workbook and the file opened for it, but not io"""
+        if self.engine == 'openpyxl':
+            self.book.close()
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
     def close(self):
         """close io if necessary"""
+        self._close_workbook()
         if hasattr(self.io, 'close'):
             self.io.close()
 
@@ -706,6 +884,119 @@ class ExcelFile(object):
         self.close()
 
 
+def _processes_engine(io):
+    """
+    The engine to parse the sheets of io in processes when none is given:
+    openpyxl for .xlsx and .xlsm paths if it is installed, as xlrd loads these
+    as a whole
+    """
+    path = _stringify_path(io)
+    if not isinstance(path, compat.string_types) or _is_url(path):
+        return None
+    if os.path.splitext(path)[1].lower() not in ('.xlsx', '.xlsm'):
+        return None
+    try:
+        import openpyxl  # noqa
+    except ImportError:
+        return None
+    return 'openpyxl'
+
+
+def _parse_excel_sheet(task):
+    """parse a sheet of a workbook in a worker process"""
+    path, engine, sheet, kwds = task
+    if engine == 'xlrd':
+        import xlrd
+        # only load the sheets which are parsed
+        io = xlrd.open_workbook(path, on_demand=True)
+    else:
+        io = path
+    with ExcelFile(io, engine=engine) as excel:
+        return excel._parse_excel(sheetname=sheet, **kwds)
+
+
+class _ExcelChunkReader(BaseIterator):
+    """
+    Iterator over the chunks of a sheet read with read_excel(chunksize=...)
+    """
+
+    def __init__(self, parser, names, header_names, squeeze):
+        self._parser = parser
+        self._names = names
+        self._header_names = header_names
+        self._squeeze = squeeze
+        # the ExcelFile opened by read_excel, closed with the reader
+        self._excel_file = None
+
+    def __next__(self):
+        return self.get_chunk()
+
+    def get_chunk(self, size=None):
+        try:
+            chunk = self._parser.get_chunk(size)
+        except StopIteration:
+            self.close()
+            raise
+        return _set_excel_columns(chunk, self._names, self._header_names,
+                                  self._squeeze)
+
+    def close(self):
+        self._parser.close()
+        if self._excel_file is not None:
+            self._excel_file._close_workbook()
+            self._excel_file = None
+
+
+def _set_excel_columns(frame, names, header_names, squeeze):
+    if names is not None:
+        frame.columns = names
+    if not squeeze or isinstance(frame, DataFrame):
+        frame.columns = frame.columns.set_names(header_names)
+    return frame
+
+
+def _openpyxl_cell_parser(convert_float):
+
+    def _parse_cell(cell):
+        """converts the value of an openpyxl cell into a pandas
+           appropriate object, like the xlrd cells"""
+        try:
+            value = cell.value
+        except OverflowError:
+            # a number with a date format outside of the datetime range
+            return cell.internal_value
+        if value is None:
+            return ''
+        elif cell.data_type == 'e':
+            return np.nan
+        elif cell.data_type == 'n' and not isinstance(value, bool):
+            if is_integer(value):
+                if not convert_float:
+                    return float(value)
+            elif convert_float and is_float(value):
+                val = int(value)
+                if val == value:
+                    return val
+        return value
+
+    return _parse_cell
+
+
+def _fill_mi_index(rows, offset, index_col):
+    """forward fill the blank values of the MultiIndex index columns"""
+    last = None
+    for i, row in enumerate(rows):
+        if i == offset:
+            last = [row[col] for col in index_col]
+        elif i > offset:
+            for k, col in enumerate(index_col):
+                if row[col] == '' or row[col] is None:
+                    row[col] = last[k]
+                else:
+                    last[k] = row[col]
+        yield row
+
+
 def _validate_freeze_panes(freeze_panes):
     if freeze_panes is not None:
         if (
@@ -834,6 +1125,10 @@ class ExcelWriter(object):
     # - Optional:
     #   - ``__init__(self, path, engine=None, **kwargs)`` --> always called
     #     with path as first argument.
+    #   - ``write_rows(self, cells, rows, firstrow, styles, sheet_name=None,
+    #     startrow=0, startcol=0, freeze_panes=None)`` --> called instead of
+    #     ``write_cells`` for frames without styles, defaults to writing the
+    #     rows as cells.
 
     # You also need to register the class with ``register_writer()``.
     # Technically, ExcelWriter implementations don't need to subclass
@@ -896,6 +1191,40 @@ class ExcelWriter(object):
         """
         pass
 
+    def write_rows(self, cells, rows, firstrow, styles, sheet_name=None,
+                   startrow=0, startcol=0, freeze_panes=None):
+        """
+        Write given formatted header cells and body rows into an excel sheet
+
+        Parameters
+        ----------
+        cells : list of ExcelCell
+            formatted cells of the header
+        rows : iterator of sequences
+            formatted values of each row of the body, starting at column 0
+        firstrow : int
+            row of the first row of the body
+        styles : list
+            style of each column of the rows
+        sheet_name : string, default None
+            Name of Excel sheet, if None, then use self.cur_sheet
+        startrow: upper left cell row to dump data frame
+        startcol: upper left cell column to dump data frame
+        freeze_panes: integer tuple of length 2
+            contains the bottom-most row and right-most column to freeze
+        """
+        from pandas.io.formats.excel import ExcelCell
+
+        def _cells():
+            for cell in cells:
+                yield cell
+            for rownum, row in enumerate(rows, firstrow):
+                for colnum, (val, style) in enumerate(zip(row, styles)):
+                    yield ExcelCell(rownum, colnum, val, style)
+
+        self.write_cells(_cells(), sheet_name, startrow=startrow,
+                         startcol=startcol, freeze_panes=freeze_panes)
+
     @abc.abstractmethod
     def save(self):
         """
@@ -967,14 +1296,17 @@ class _OpenpyxlWriter(ExcelWriter):
     engine = 'openpyxl'
     supported_extensions = ('.xlsx', '.xlsm')
 
-    def __init__(self, path, engine=None, **engine_kwargs):
+    def __init__(self, path, engine=None, write_only=False, **engine_kwargs):
         # Use the openpyxl module as the Excel writer.
         from openpyxl.workbook import Workbook
 
         super(_OpenpyxlWriter, self).__init__(path, **engine_kwargs)
 
         # Create workbook object with default optimized_write=True.
-        self.book = Workbook()
+        self.book = Workbook(write_only=write_only)
+        self.write_only = write_only
+        # number of rows already appended to each write-only sheet
+        self._appended_rows = {}
 
         # Openpyxl 1.6.1 adds a dummy sheet. We remove it.
         if self.book.worksheets:
@@ -1343,13 +1675,9 @@ class _OpenpyxlWriter(ExcelWriter):
 
         return Protection(**protection_dict)
 
-    def write_cells(self, cells, sheet_name=None, startrow=0, startcol=0,
-                    freeze_panes=None):
-        # Write the frame cells using openpyxl.
+    def _get_worksheet(self, sheet_name, freeze_panes):
         sheet_name = self._get_sheet_name(sheet_name)
 
-        _style_cache = {}
-
         if sheet_name in self.sheets:
             wks = self.sheets[sheet_name]
         else:
@@ -1358,8 +1686,68 @@ class _OpenpyxlWriter(ExcelWriter):
             self.sheets[sheet_name] = wks
 
         if _validate_freeze_panes(freeze_panes):
-            wks.freeze_panes = wks.cell(row=freeze_panes[0] + 1,
-                                        column=freeze_panes[1] + 1)
+            if self.write_only:
+                from openpyxl.utils import get_column_letter
+
+                wks.freeze_panes = '{col}{row}'.format(
+                    col=get_column_letter(freeze_panes[1] + 1),
+                    row=freeze_panes[0] + 1)
+            else:
+                wks.freeze_panes = wks.cell(row=freeze_panes[0] + 1,
+                                            column=freeze_panes[1] + 1)
+        return wks
+
+    def _append_row(self, wks, row, values):
+        # Append the values to a write-only sheet at the 0-based row,
+        # after padding the sheet with empty rows.
+        nrows = self._appended_rows.get(wks.title, 0)
+        if row < nrows:
+            raise ValueError("Rows of openpyxl write-only sheets must be "
+                             "written in order")
+        for _ in range(row - nrows):
+            wks.append([])
+        wks.append(values)
+        self._appended_rows[wks.title] = row + 1
+
+    def _write_cells_write_only(self, wks, cells, startrow, startcol):
+        from openpyxl.cell import WriteOnlyCell
+
+        _style_cache = {}
+
+        rows = {}
+        for cell in cells:
+            if cell.mergestart is not None and cell.mergeend is not None:
+                raise ValueError("openpyxl write-only sheets do not "
+                                 "support merged cells")
+            rows.setdefault(cell.row, []).append(cell)
+
+        for rownum in sorted(rows):
+            row = rows[rownum]
+            values = [None] * (startcol + max(cell.col for cell in row) + 1)
+            for cell in row:
+                xcell = WriteOnlyCell(wks, _conv_value(cell.val))
+                if cell.style:
+                    key = str(cell.style)
+                    style_kwargs = _style_cache.get(key)
+                    if style_kwargs is None:
+                        style_kwargs = self._convert_to_style_kwargs(
+                            cell.style)
+                        _style_cache[key] = style_kwargs
+                    for k, v in style_kwargs.items():
+                        setattr(xcell, k, v)
+                values[startcol + cell.col] = xcell
+            self._append_row(wks, startrow + rownum, values)
+
+    def write_cells(self, cells, sheet_name=None, startrow=0, startcol=0,
+                    freeze_panes=None):
+        # Write the frame cells using openpyxl.
+        wks = self._get_worksheet(sheet_name, freeze_panes)
+
+        if self.write_only:
+            return self._write_cells_write_only(wks, cells, startrow,
+                                                startcol)
+
+        _style_cache = {}
 
         for cell in cells:
             xcell = wks.cell(
@@ -1407,6 +1795,55 @@ class _OpenpyxlWriter(ExcelWriter):
                             for k, v in style_kwargs.items():
                                 setattr(xcell, k, v)
 
+    def write_rows(self, cells, rows, firstrow, styles, sheet_name=None,
+                   startrow=0, startcol=0, freeze_panes=None):
+        # Write the body row by row, styling the first cell of each styled
+        # column and copying its style to the cells below.
+        from openpyxl.cell import WriteOnlyCell
+
+        self.write_cells(cells, sheet_name, startrow=startrow,
+                         startcol=startcol, freeze_panes=freeze_panes)
+        wks = self.sheets[self._get_sheet_name(sheet_name)]
+
+        _style_cache = {}
+        column_styles = []
+        for style in styles:
+            style_kwargs = None
+            if style:
+                key = str(style)
+                style_kwargs = _style_cache.get(key)
+                if style_kwargs is None:
+                    style_kwargs = self._convert_to_style_kwargs(style)
+                    _style_cache[key] = style_kwargs
+            column_styles.append(style_kwargs)
+        style_arrays = [None] * len(styles)
+
+        def _style_cell(xcell, colnum):
+            if style_arrays[colnum] is not None:
+                xcell._style = copy.copy(style_arrays[colnum])
+            elif column_styles[colnum]:
+                for k, v in column_styles[colnum].items():
+                    setattr(xcell, k, v)
+                style_arrays[colnum] = xcell._style
+
+        if self.write_only:
+            padding = [None] * startcol
+            for rownum, row in enumerate(rows, startrow + firstrow):
+                values = list(row)
+                for colnum, style_kwargs in enumerate(column_styles):
+                    if style_kwargs:
+                        xcell = WriteOnlyCell(wks, values[colnum])
+                        _style_cell(xcell, colnum)
+                        values[colnum] = xcell
+                self._append_row(wks, rownum, padding + values)
+        else:
+            for rownum, row in enumerate(rows, startrow + firstrow + 1):
+                for colnum, val in enumerate(row):
+                    xcell = wks.cell(row=rownum, column=startcol + colnum + 1)
+                    xcell.value = val
+                    if column_styles[colnum]:
+                        _style_cell(xcell, colnum)
+
 
 register_writer(_OpenpyxlWriter)
 
@@ -1756,5 +2193,43 @@ class _XlsxWriter(ExcelWriter):
                           startcol + cell.col,
                           val, style)
 
+    def write_rows(self, cells, rows, firstrow, styles, sheet_name=None,
+                   startrow=0, startcol=0, freeze_panes=None):
+        # Write the header cells and then the body row by row, so that
+        # workbooks opened with the constant_memory option can be written.
+        cells = sorted(cells, key=lambda cell: (cell.row, cell.col))
+        self.write_cells(cells, sheet_name, startrow=startrow,
+                         startcol=startcol, freeze_panes=freeze_panes)
+        wks = self.sheets[self._get_sheet_name(sheet_name)]
+
+        # Each distinct style is converted once per number format.
+        style_dict = {}
+
+        def _get_format(style, num_format_str):
+            stylekey = (json.dumps(style), num_format_str)
+            if stylekey not in style_dict:
+                if style is None and num_format_str is None:
+                    style_dict[stylekey] = None
+                else:
+                    style_dict[stylekey] = self.book.add_format(
+                        _XlsxStyler.convert(style, num_format_str))
+            return style_dict[stylekey]
+
+        formats = [_get_format(style, None) for style in styles]
+        datetime_formats = [_get_format(style, self.datetime_format)
+                            for style in styles]
+        date_formats = [_get_format(style, self.date_format)
+                        for style in styles]
+
+        for rownum, row in enumerate(rows, startrow + firstrow):
+            for colnum, val in enumerate(row):
+                if isinstance(val, datetime):
+                    style = datetime_formats[colnum]
+                elif isinstance(val, date):
+                    style = date_formats[colnum]
+                else:
+                    style = formats[colnum]
+                wks.write(rownum, startcol + colnum, val, style)
+
 
 register_writer(_XlsxWriter)
@@ -1,8 +1,13 @@
 """ feather-format compat """
 
 from distutils.version import LooseVersion
-from pandas import DataFrame, RangeIndex, Int64Index
-from pandas.compat import range
+
+import numpy as np
+
+from pandas import DataFrame, RangeIndex, Int64Index, Index
+from pandas.compat import range, string_types
+from pandas.core.internals import (BlockManager, make_block, _block_shape,
+                                   _share_values)
 from pandas.io.common import _stringify_path
 
 
@@ -83,7 +88,7 @@ def to_feather(df, path):
     feather.write_dataframe(df, path)
 
 
-def read_feather(path, nthreads=1):
+def read_feather(path, nthreads=1, columns=None, memory_map=False):
     """
     Load a feather-format object from the file path
 
@@ -97,16 +102,114 @@ def read_feather(path, nthreads=1):
 
        .. versionadded 0.21.0
 
+    columns : sequence, default None
+        If not None, only these columns will be read from the file.
+
+       .. versionadded 0.23.0
+
+    memory_map : boolean, default False
+        Memory-map the file and, where the on-disk layout allows it, return
+        numeric columns as read-only views onto the map instead of copying
+        them. Only single-chunk integer and float columns without nulls are
+        returned as views; all other columns are copied. Requires pyarrow
+        >= 0.8.0 and a file path. ``nthreads`` is ignored.
+
+       .. versionadded 0.23.0
+
     Returns
     -------
     type of object stored in file
 
+    Notes
+    -----
+    The views returned with ``memory_map=True`` are read-only, and they
+    keep the file mapped for as long as they are alive. The frame can still
+    be modified: setting values in one of those columns first copies that
+    column into memory, and operations that consolidate the frame's blocks
+    copy them as well. The file itself is never written to.
+
     """
 
     feather = _try_import()
     path = _stringify_path(path)
 
+    if memory_map:
+        return _read_feather_memory_map(path, columns=columns)
+
     if LooseVersion(feather.__version__) < LooseVersion('0.4.0'):
-        return feather.read_dataframe(path)
+        return feather.read_dataframe(path, columns=columns)
+
+    return feather.read_dataframe(path, columns=columns, nthreads=nthreads)
+
 
-    return feather.read_dataframe(path, nthreads=nthreads)
+def _read_feather_memory_map(path, columns=None):
+    """
+    read a feather file through a memory map, building one block per column
+    so that numeric columns can be zero-copy views onto the mapped buffers
+    """
+    try:
+        import pyarrow
+        from pyarrow.feather import FeatherReader
+    except ImportError:
+        raise ImportError("pyarrow is required to read feather files "
+                          "with memory_map=True")
+    if LooseVersion(pyarrow.__version__) < LooseVersion('0.8.0'):
+        raise ImportError("pyarrow >= 0.8.0 is required to read feather "
+                          "files with memory_map=True")
+
+    if not isinstance(path, string_types):
+        raise ValueError("memory_map=True is only supported for file paths")
+
+    reader = FeatherReader(pyarrow.memory_map(path, 'r'))
+
+    names = [reader.get_column_name(i) for i in range(reader.num_columns)]
+    if columns is None:
+        indexer = list(range(len(names)))
+    else:
+        missing = [c for c in columns if c not in names]
+        if missing:
+            raise KeyError("columns {missing} are not in the feather "
+                           "file".format(missing=missing))
+        indexer = [names.index(c) for c in columns]
+
+    blocks = []
+    for loc, i in enumerate(indexer):
+        column = reader.get_column(i)
+        values = _column_view(column)
+        if values is None:
+            values = column.to_pandas()._values
+        if isinstance(values, np.ndarray):
+            values = _block_shape(values, ndim=2)
+        blocks.append(make_block(values, placement=[loc], ndim=2))
+
+    axes = [Index([names[i] for i in indexer]), RangeIndex(reader.num_rows)]
+    return DataFrame(BlockManager(blocks, axes))
+
+
+def _column_view(column):
+    """
+    return a read-only ndarray viewing the data buffer of a pyarrow Column,
+    or None if the column cannot be represented without a copy
+    """
+    data = column.data
+    if data.num_chunks != 1:
+        return None
+
+    arr = data.chunk(0)
+    try:
+        dtype = np.dtype(arr.type.to_pandas_dtype())
+    except NotImplementedError:
+        return None
+    if dtype.kind not in 'iuf':
+        return None
+
+    from pyarrow import ArrowException
+    try:
+        values = arr.to_pandas(zero_copy_only=True)
+    except ArrowException:
+        # a copy would be required, e.g. because of nulls
+        return None
+    values.flags.writeable = False
+    # blocks copy the view before writing to it, as the file is read-only
+    _share_values(values)
+    return values
@@ -11,7 +11,8 @@ from pandas.compat import reduce
 from pandas.io.formats.css import CSSResolver, CSSWarning
 from pandas.io.formats.printing import pprint_thing
 from pandas.core.common import _any_not_none
-from pandas.core.dtypes.common import is_float, is_scalar
+from pandas.core.dtypes.common import (is_float, is_scalar, is_float_dtype,
+                                       is_integer_dtype, is_bool_dtype)
 from pandas.core.dtypes import missing
 from pandas import Index, MultiIndex, PeriodIndex
 from pandas.io.formats.common import get_level_lengths
@@ -379,6 +380,7 @@ class ExcelFormatter(object):
         self.header = header
         self.merge_cells = merge_cells
         self.inf_rep = inf_rep
+        self._body_by_rows = False
 
     def _format_value(self, val):
         if is_scalar(val) and missing.isna(val):
@@ -511,6 +513,9 @@ class ExcelFormatter(object):
                 yield ExcelCell(self.rowcounter - 1, 0, index_label,
                                 header_style)
 
+            if self._body_by_rows:
+                return
+
             # write index_values
             index_values = self.df.index
             if isinstance(self.df.index, PeriodIndex):
@@ -523,6 +528,9 @@ class ExcelFormatter(object):
         else:
             coloffset = 0
 
+        if self._body_by_rows:
+            return
+
         for cell in self._generate_body(coloffset):
             yield cell
 
@@ -555,6 +563,9 @@ class ExcelFormatter(object):
                     yield ExcelCell(self.rowcounter - 1, cidx, name,
                                     header_style)
 
+            if self._body_by_rows:
+                return
+
             if self.merge_cells:
                 # Format hierarchical rows as merged cells.
                 level_strs = self.df.index.format(sparsify=True, adjoin=False,
@@ -588,6 +599,9 @@ class ExcelFormatter(object):
                                         indexcolval, header_style)
                     gcolidx += 1
 
+        if self._body_by_rows:
+            return
+
         for cell in self._generate_body(gcolidx):
             yield cell
 
@@ -615,6 +629,78 @@ class ExcelFormatter(object):
             cell.val = self._format_value(cell.val)
             yield cell
 
+    def _can_format_rows(self):
+        # Styled bodies and merged index cells need one ExcelCell per value.
+        return self.styler is None and not (
+            self.index and self.merge_cells and
+            isinstance(self.df.index, MultiIndex))
+
+    def _get_index_columns(self, index):
+        if not self.index:
+            return []
+        if isinstance(index, MultiIndex):
+            return [index.get_level_values(i) for i in range(index.nlevels)]
+        if isinstance(index, PeriodIndex):
+            index = index.to_timestamp()
+        return [index]
+
+    def _format_values(self, values):
+        # Format a column of the body at once, returning the Python values
+        # ready to be written.
+        from pandas.io.excel import _conv_value
+
+        if is_float_dtype(values) and self.float_format is None:
+            arr = np.asarray(values)
+            result = arr.tolist()
+            for i in np.flatnonzero(~np.isfinite(arr)):
+                result[i] = self._format_value(arr[i])
+            return result
+        elif is_integer_dtype(values) or is_bool_dtype(values):
+            return np.asarray(values).tolist()
+        return [_conv_value(self._format_value(val)) for val in values]
+
+    def _generate_rows(self, chunksize):
+        nrows = len(self.df)
+        for start in range(0, nrows, chunksize):
+            chunk = self.df.iloc[start:start + chunksize]
+            columns = self._get_index_columns(chunk.index)
+            columns.extend(chunk.iloc[:, i] for i in range(len(self.columns)))
+            values = [self._format_values(column) for column in columns]
+            for row in zip(*values):
+                yield row
+
+    def get_formatted_rows(self, chunksize=10000):
+        """
+        Format the header as ExcelCells and the body as rows of values
+
+        Only valid for frames without styles and without merged index cells.
+
+        Parameters
+        ----------
+        chunksize : int, default 10000
+            Number of rows of the frame formatted at once
+
+        Returns
+        -------
+        cells : list of ExcelCell
+            The formatted cells of the header and of the index labels
+        rows : iterator of tuples
+            The formatted values of each row of the body, index values first
+        firstrow : int
+            The row of the first row of the body
+        styles : list
+            The style of each column of the rows
+        """
+        self._body_by_rows = True
+        try:
+            cells = list(self.get_formatted_cells())
+        finally:
+            self._body_by_rows = False
+
+        nindex = len(self._get_index_columns(self.df.index))
+        styles = [header_style] * nindex + [None] * len(self.columns)
+        return cells, self._generate_rows(chunksize), self.rowcounter, styles
+
     def write(self, writer, sheet_name='Sheet1', startrow=0,
               startcol=0, freeze_panes=None, engine=None):
         """
@@ -643,9 +729,15 @@ class ExcelFormatter(object):
             writer = ExcelWriter(_stringify_path(writer), engine=engine)
             need_save = True
 
-        formatted_cells = self.get_formatted_cells()
-        writer.write_cells(formatted_cells, sheet_name,
-                           startrow=startrow, startcol=startcol,
-                           freeze_panes=freeze_panes)
+        if self._can_format_rows() and hasattr(writer, 'write_rows'):
+            cells, rows, firstrow, styles = self.get_formatted_rows()
+            writer.write_rows(cells, rows, firstrow, styles, sheet_name,
+                              startrow=startrow, startcol=startcol,
+                              freeze_panes=freeze_panes)
+        else:
+            formatted_cells = self.get_formatted_cells()
+            writer.write_cells(formatted_cells, sheet_name,
+                               startrow=startrow, startcol=startcol,
+                               freeze_panes=freeze_panes)
         if need_save:
             writer.save()
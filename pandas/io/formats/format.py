@@ -13,6 +13,8 @@ from textwrap import dedent
 from pandas.core.dtypes.missing import isna, notna
 from pandas.core.dtypes.common import (
     is_categorical_dtype,
+    is_masked_dtype,
+    is_utf8_dtype,
     is_float_dtype,
     is_period_arraylike,
     is_integer_dtype,
@@ -1803,6 +1805,11 @@ def format_array(values, formatter, float_format=None, na_rep='NaN',
         fmt_klass = CategoricalArrayFormatter
     elif is_interval_dtype(values):
         fmt_klass = IntervalArrayFormatter
+    elif is_masked_dtype(values) or is_utf8_dtype(values):
+        # the valid values as integers, booleans or strings, NaN for the
+        # missing ones
+        values = values.astype(object)
+        fmt_klass = GenericArrayFormatter
     elif is_float_dtype(values.dtype):
         fmt_klass = FloatArrayFormatter
     elif is_period_arraylike(values):
@@ -18,7 +18,7 @@ from pandas.io.common import (_is_url, urlopen,
                               parse_url, _validate_header_arg)
 from pandas.io.parsers import TextParser
 from pandas.compat import (lrange, lmap, u, string_types, iteritems,
-                           raise_with_traceback, binary_type)
+                           raise_with_traceback, binary_type, BytesIO)
 from pandas import Series
 from pandas.core.common import AbstractMethodError
 from pandas.io.formats.printing import pprint_thing
@@ -616,6 +616,216 @@ class _LxmlFrameParser(_HtmlFrameParser):
                 table.xpath(expr)]
 
 
+class _EncodedReader(object):
+    """File-like object encoding the text read from a text file-like object
+    """
+
+    def __init__(self, f, encoding):
+        self.f = f
+        self.encoding = encoding
+
+    def read(self, size=-1):
+        return self.f.read(size).encode(self.encoding)
+
+
+class _LxmlIterparseFrameParser(_LxmlFrameParser):
+    """HTML to DataFrame parser that parses the document incrementally with
+    ``lxml.etree.iterparse``.
+
+    The rows of a table are parsed into lists of strings as soon as their
+    closing tag is parsed and their elements are then discarded, as are the
+    elements outside of tables, so that the DOM of the whole document is
+    never built. Tables whose attributes don't match ``attrs`` are skipped
+    without parsing their rows.
+
+    See Also
+    --------
+    _LxmlFrameParser
+    """
+
+    _sections = 'thead', 'tbody', 'tfoot'
+
+    def __init__(self, *args, **kwargs):
+        super(_LxmlIterparseFrameParser, self).__init__(*args, **kwargs)
+        from lxml.etree import tostring, XPath
+        self._tostring = tostring
+        self._td_xpath = XPath('.//td|.//th')
+
+    def parse_tables(self):
+        return self._iterparse_tables(self.match, self.attrs)
+
+    def _text_getter(self, obj):
+        # iterparse builds lxml.etree elements, which lack text_content
+        return self._tostring(obj, method='text', encoding='unicode',
+                              with_tail=False)
+
+    def _parse_td(self, row):
+        return self._td_xpath(row)
+
+    def _open_source(self):
+        # return the source to give to iterparse and whether to close it
+        io = self.io
+        if _is_url(io):
+            return urlopen(io), True
+        elif hasattr(io, 'read'):
+            if isinstance(io.read(0), binary_type):
+                return io, False
+            # iterparse reads bytes
+            self.encoding = 'utf-8'
+            return _EncodedReader(io, self.encoding), False
+        elif isinstance(io, char_types):
+            try:
+                if os.path.isfile(io):
+                    return io, False
+            except (TypeError, ValueError):
+                pass
+            if not isinstance(io, binary_type):
+                io = io.encode('utf-8')
+                if self.encoding is None:
+                    self.encoding = 'utf-8'
+            return BytesIO(io), True
+        raise TypeError("Cannot read object of type %r" % type(io).__name__)
+
+    def _attrs_match(self, table, attrs):
+        if not attrs:
+            return True
+        attrs = dict(attrs)
+        if 'class_' in attrs:
+            attrs['class'] = attrs.pop('class_')
+        return all(table.get(key) == value for key, value in iteritems(attrs))
+
+    def _text_match(self, texts, match):
+        return any(text and match.search(text) is not None for text in texts)
+
+    def _iter_texts(self, element):
+        # the text nodes of the descendants of element, tails included
+        for el in element.iterdescendants():
+            yield el.text
+            yield el.tail
+
+    def _iterparse_tables(self, match, attrs):
+        from lxml.etree import iterparse
+
+        source, close = self._open_source()
+        # the tables being parsed, innermost last, and the parsed tables
+        # waiting for their outermost table to be closed
+        stack = []
+        parsed = []
+        ntables = 0
+        # the rows being parsed, numbered in document order
+        open_rows = []
+        nrows = 0
+        found = False
+        try:
+            # all the elements are iterated over, so that the ones outside
+            # of tables can be discarded as well
+            events = iterparse(source, events=('start', 'end'), html=True,
+                               huge_tree=True, encoding=self.encoding)
+            for event, element in events:
+                tag = element.tag
+                if event == 'start':
+                    if tag == 'table':
+                        stack.append({
+                            'order': ntables,
+                            'keep': self._attrs_match(element, attrs),
+                            'matched': False,
+                            'rows': [],
+                            'counts': dict.fromkeys(self._sections, 0),
+                            'open': []})
+                        ntables += 1
+                    elif tag in self._sections:
+                        # number the sections of each table in document
+                        # order, nested tables included
+                        for state in stack:
+                            state['open'].append((tag, state['counts'][tag]))
+                            state['counts'][tag] += 1
+                    elif tag == 'tr':
+                        open_rows.append(nrows)
+                        nrows += 1
+                    continue
+
+                if tag == 'tr':
+                    # like the XPath queries of _LxmlFrameParser, a row
+                    # belongs to every table it is nested in
+                    order = open_rows.pop()
+                    kept = [state for state in stack if state['keep']]
+                    if kept:
+                        # the full text of the cells is matched, so that
+                        # text following inline tags is found as well
+                        texts = [self._text_getter(td)
+                                 for td in self._parse_td(element)]
+                        row = [_remove_whitespace(text) for text in texts]
+                        text = self._text_getter(element)
+                        nonblank = bool(text.strip(' \t\r\n'))
+                        matched = self._text_match(texts, match)
+                    for state in kept:
+                        state['matched'] = state['matched'] or matched
+                        # the rows are padded in place by _expand_elements
+                        state['rows'].append((order, tuple(state['open']),
+                                              list(row), nonblank))
+                    # the rows of nested tables are kept until the outermost
+                    # table is closed, as they are part of its rows
+                    if len(stack) == 1:
+                        self._discard(element, 'tr')
+                elif tag in self._sections:
+                    for state in stack:
+                        state['open'].pop()
+                elif tag == 'table':
+                    state = stack.pop()
+                    if state['keep'] and (state['matched'] or self._text_match(
+                            self._iter_texts(element), match)):
+                        found = True
+                        parsed.append((state['order'],
+                                       self._build_rows(state)))
+                    if not stack:
+                        parsed.sort(key=lambda x: x[0])
+                        for _, table in parsed:
+                            yield table
+                        parsed = []
+
+                if not stack:
+                    self._discard(element)
+        finally:
+            if close:
+                source.close()
+
+        if not found:
+            raise ValueError("No tables found matching regex {patt!r}"
+                             .format(patt=match.pattern))
+
+    def _discard(self, element, tag=None):
+        # free the element and the siblings parsed before it, only those
+        # with the given tag if any
+        element.clear()
+        parent = element.getparent()
+        if parent is None:
+            # a root element, whose siblings cannot be removed
+            return
+        previous = element.getprevious()
+        while previous is not None and (tag is None or previous.tag == tag):
+            parent.remove(previous)
+            previous = element.getprevious()
+
+    def _build_rows(self, state):
+        # select the rows of the header, body and footer the way
+        # _LxmlFrameParser does
+        # the rows of nested tables end before the rows they are nested in
+        rows = [row[1:] for row in sorted(state['rows'],
+                                          key=lambda row: row[0])]
+        header = [row for sections, row, nonblank in rows
+                  if ('thead', 0) in sections and nonblank and
+                  any(col != '' for col in row)]
+        if state['counts']['tbody']:
+            body = [row for sections, row, nonblank in rows
+                    if ('tbody', 0) in sections and nonblank]
+        else:
+            body = [row for _, row, nonblank in rows if nonblank]
+        footer = [col for sections, row, _ in rows
+                  if any(tag == 'tfoot' for tag, _ in sections)
+                  for col in row]
+        return header, body, footer
+
+
 def _expand_elements(body):
     lens = Series(lmap(len, body))
     lens_max = lens.max()
@@ -729,7 +939,15 @@ def _validate_flavor(flavor):
     return flavor
 
 
-def _parse(flavor, io, match, attrs, encoding, **kwargs):
+def _parse(flavor, io, match, attrs, encoding, iterparse=False, **kwargs):
+    if iterparse:
+        # the tables are parsed while they are read, so there is no going
+        # back to try another flavor
+        if flavor is None:
+            flavor = 'lxml'
+        if _validate_flavor(flavor) != ('lxml',):
+            raise ValueError("iterparse is only supported by the 'lxml' "
+                             "flavor")
     flavor = _validate_flavor(flavor)
     compiled_match = re.compile(match)  # you can pass a compiled regex here
 
@@ -737,6 +955,8 @@ def _parse(flavor, io, match, attrs, encoding, **kwargs):
     retained = None
     for flav in flavor:
         parser = _parser_dispatch(flav)
+        if iterparse:
+            parser = _LxmlIterparseFrameParser
         p = parser(io, compiled_match, attrs, encoding)
 
         try:
@@ -773,7 +993,7 @@ def read_html(io, match='.+', flavor=None, header=None, index_col=None,
               skiprows=None, attrs=None, parse_dates=False,
               tupleize_cols=None, thousands=',', encoding=None,
               decimal='.', converters=None, na_values=None,
-              keep_default_na=True):
+              keep_default_na=True, iterparse=False):
     r"""Read HTML tables into a ``list`` of ``DataFrame`` objects.
 
     Parameters
@@ -877,6 +1097,14 @@ def read_html(io, match='.+', flavor=None, header=None, index_col=None,
 
         .. versionadded:: 0.19.0
 
+    iterparse : bool, default False
+        Parse the document incrementally with ``lxml.etree.iterparse``
+        instead of building its whole DOM, discarding each row once its text
+        is read. Reduces the memory needed to read large documents. Only
+        supported by the ``lxml`` flavor.
+
+        .. versionadded:: 0.23.0
+
     Returns
     -------
     dfs : list of DataFrames
@@ -924,4 +1152,4 @@ def read_html(io, match='.+', flavor=None, header=None, index_col=None,
                   parse_dates=parse_dates, tupleize_cols=tupleize_cols,
                   thousands=thousands, attrs=attrs, encoding=encoding,
                   decimal=decimal, converters=converters, na_values=na_values,
-                  keep_default_na=keep_default_na)
+                  keep_default_na=keep_default_na, iterparse=iterparse)
@@ -40,6 +40,7 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from datetime import datetime, date, timedelta
 from dateutil.parser import parse
+from functools import partial
 import os
 from textwrap import dedent
 import warnings
@@ -160,7 +161,8 @@ def to_msgpack(path_or_buf, *args, **kwargs):
         writer(path_or_buf)
 
 
-def read_msgpack(path_or_buf, encoding='utf-8', iterator=False, **kwargs):
+def read_msgpack(path_or_buf, encoding='utf-8', iterator=False, copy=True,
+                 **kwargs):
     """
     Load msgpack pandas object from the specified
     file path
@@ -174,6 +176,13 @@ def read_msgpack(path_or_buf, encoding='utf-8', iterator=False, **kwargs):
     encoding: Encoding for decoding msgpack str type
     iterator : boolean, if True, return an iterator to the unpacker
                (default is False)
+    copy : boolean, default True
+        If False, the data of uncompressed arrays is not copied out of the
+        payload read from ``path_or_buf``; the resulting arrays are
+        read-only views that keep the payload alive. Compressed data is
+        always decompressed into new, writeable arrays.
+
+        .. versionadded:: 0.23.0
 
     Returns
     -------
@@ -181,8 +190,10 @@ def read_msgpack(path_or_buf, encoding='utf-8', iterator=False, **kwargs):
 
     """
     path_or_buf, _, _ = get_filepath_or_buffer(path_or_buf)
+    if not copy:
+        kwargs.setdefault('object_hook', partial(decode, copy=False))
     if iterator:
-        return Iterator(path_or_buf)
+        return Iterator(path_or_buf, **kwargs)
 
     def read(fh):
         l = list(unpack(fh, encoding=encoding, **kwargs))
@@ -301,7 +312,7 @@ def convert(values):
     return ExtType(0, v.tostring())
 
 
-def unconvert(values, dtype, compress=None):
+def unconvert(values, dtype, compress=None, copy=True):
 
     as_is_ext = isinstance(values, ExtType) and values.code == 0
 
@@ -352,8 +363,12 @@ def unconvert(values, dtype, compress=None):
                 )
                 # fall through to copying `np.fromstring`
 
-    # Copy the bytes into a numpy array.
     buf = np.frombuffer(values, dtype=dtype)
+    if not copy and not compress:
+        # a read-only view, which keeps the payload alive
+        return buf
+
+    # Copy the bytes into a numpy array.
     buf = buf.copy()  # required to not mutate the original data
     buf.flags.writeable = True
     return buf
@@ -545,9 +560,12 @@ def encode(obj):
     return obj
 
 
-def decode(obj):
+def decode(obj, copy=True):
     """
     Decoder for deserializing numpy data types.
+
+    If ``copy`` is False, uncompressed array data is returned as read-only
+    views onto the unpacked payload instead of being copied.
     """
 
     typ = obj.get(u'typ')
@@ -563,7 +581,7 @@ def decode(obj):
     elif typ == u'index':
         dtype = dtype_for(obj[u'dtype'])
         data = unconvert(obj[u'data'], dtype,
-                         obj.get(u'compress'))
+                         obj.get(u'compress'), copy=copy)
         return globals()[obj[u'klass']](data, dtype=dtype, name=obj[u'name'])
     elif typ == u'range_index':
         return globals()[obj[u'klass']](obj[u'start'],
@@ -573,15 +591,17 @@ def decode(obj):
     elif typ == u'multi_index':
         dtype = dtype_for(obj[u'dtype'])
         data = unconvert(obj[u'data'], dtype,
-                         obj.get(u'compress'))
+                         obj.get(u'compress'), copy=copy)
         data = [tuple(x) for x in data]
         return globals()[obj[u'klass']].from_tuples(data, names=obj[u'names'])
     elif typ == u'period_index':
-        data = unconvert(obj[u'data'], np.int64, obj.get(u'compress'))
+        data = unconvert(obj[u'data'], np.int64, obj.get(u'compress'),
+                         copy=copy)
         d = dict(name=obj[u'name'], freq=obj[u'freq'])
         return globals()[obj[u'klass']]._from_ordinals(data, **d)
     elif typ == u'datetime_index':
-        data = unconvert(obj[u'data'], np.int64, obj.get(u'compress'))
+        data = unconvert(obj[u'data'], np.int64, obj.get(u'compress'),
+                         copy=copy)
         d = dict(name=obj[u'name'], freq=obj[u'freq'], verify_integrity=False)
         result = globals()[obj[u'klass']](data, **d)
         tz = obj[u'tz']
@@ -603,7 +623,8 @@ def decode(obj):
 
         index = obj[u'index']
         result = globals()[obj[u'klass']](unconvert(obj[u'data'], dtype,
-                                                    obj[u'compress']),
+                                                    obj[u'compress'],
+                                                    copy=copy),
                                           index=index,
                                           dtype=pd_dtype,
                                           name=obj[u'name'])
@@ -615,7 +636,7 @@ def decode(obj):
         def create_block(b):
             values = _safe_reshape(unconvert(
                 b[u'values'], dtype_for(b[u'dtype']),
-                b[u'compress']), b[u'shape'])
+                b[u'compress'], copy=copy), b[u'shape'])
 
             # locs handles duplicate column names, and should be used instead
             # of items; see GH 9618
@@ -664,7 +685,8 @@ def decode(obj):
         return globals()[obj[u'klass']](obj[u'length'], obj[u'indices'])
     elif typ == u'ndarray':
         return unconvert(obj[u'data'], np.typeDict[obj[u'dtype']],
-                         obj.get(u'compress')).reshape(obj[u'shape'])
+                         obj.get(u'compress'),
+                         copy=copy).reshape(obj[u'shape'])
     elif typ == u'np_scalar':
         if obj.get(u'sub_typ') == u'np_complex':
             return c2f(obj[u'real'], obj[u'imag'], obj[u'dtype'])
@@ -786,7 +808,7 @@ class Iterator(object):
                     needs_closing = False
                     fh = self.path
 
-            unpacker = unpack(fh)
+            unpacker = unpack(fh, **self.kwargs)
             for o in unpacker:
                 yield o
         finally:
@@ -69,6 +69,15 @@ class BaseImpl(object):
     def read(self, path, columns=None, **kwargs):
         raise AbstractMethodError(self)
 
+    def open_writer(self, path, df, compression, **kwargs):
+        raise AbstractMethodError(self)
+
+    def write_chunk(self, handle, df, row_group_size=None):
+        raise AbstractMethodError(self)
+
+    def close_writer(self, handle):
+        raise AbstractMethodError(self)
+
 
 class PyArrowImpl(BaseImpl):
 
@@ -108,18 +117,40 @@ class PyArrowImpl(BaseImpl):
         if self._pyarrow_lt_070:
             self._validate_write_lt_070(df)
         path, _, _ = get_filepath_or_buffer(path)
+        table = self._to_table(df)
 
         if self._pyarrow_lt_060:
-            table = self.api.Table.from_pandas(df, timestamps_to_ms=True)
             self.api.parquet.write_table(
                 table, path, compression=compression, **kwargs)
 
         else:
-            table = self.api.Table.from_pandas(df)
             self.api.parquet.write_table(
                 table, path, compression=compression,
                 coerce_timestamps=coerce_timestamps, **kwargs)
 
+    def open_writer(self, path, df, compression='snappy',
+                    coerce_timestamps='ms', **kwargs):
+        path, _, _ = get_filepath_or_buffer(path)
+        schema = self._to_table(df).schema
+        if not self._pyarrow_lt_060:
+            kwargs['coerce_timestamps'] = coerce_timestamps
+        return self.api.parquet.ParquetWriter(
+            path, schema, compression=compression, **kwargs)
+
+    def write_chunk(self, handle, df, row_group_size=None):
+        if self._pyarrow_lt_070:
+            self._validate_write_lt_070(df)
+        handle.write_table(self._to_table(df),
+                           row_group_size=row_group_size)
+
+    def close_writer(self, handle):
+        handle.close()
+
+    def _to_table(self, df):
+        if self._pyarrow_lt_060:
+            return self.api.Table.from_pandas(df, timestamps_to_ms=True)
+        return self.api.Table.from_pandas(df)
+
     def read(self, path, columns=None, **kwargs):
         path, _, _ = get_filepath_or_buffer(path)
         if self._pyarrow_lt_070:
@@ -204,6 +235,121 @@ class FastParquetImpl(BaseImpl):
         parquet_file = self.api.ParquetFile(path)
         return parquet_file.to_pandas(columns=columns, **kwargs)
 
+    def open_writer(self, path, df, compression='snappy', **kwargs):
+        path, _, _ = get_filepath_or_buffer(path)
+        # fastparquet appends row groups by re-opening the file and
+        # rewriting the footer, so we need an actual path on disk
+        if not isinstance(path, string_types):
+            raise ValueError("the fastparquet engine only supports "
+                             "incremental writes to a file path")
+        kwargs['compression'] = compression
+        return {'path': path, 'kwargs': kwargs, 'append': False}
+
+    def write_chunk(self, handle, df, row_group_size=None):
+        kwargs = dict(handle['kwargs'])
+        if row_group_size is not None:
+            kwargs['row_group_offsets'] = row_group_size
+        with catch_warnings(record=True):
+            self.api.write(handle['path'], df,
+                           append=handle['append'], **kwargs)
+        handle['append'] = True
+
+    def close_writer(self, handle):
+        # the footer is rewritten on every append
+        pass
+
+
+class ParquetWriter(object):
+    """
+    Write successive DataFrames to a single parquet file.
+
+    Each DataFrame passed to :meth:`write` is appended as one or more row
+    groups, so the memory needed is bounded by the size of a single chunk
+    rather than that of the whole dataset. The file footer is finalised
+    when the writer is closed. All chunks must have the same columns and
+    dtypes as the first one.
+
+    .. versionadded:: 0.23.0
+
+    Parameters
+    ----------
+    path : string
+        File path
+    engine : {'auto', 'pyarrow', 'fastparquet'}, default 'auto'
+        Parquet library to use. If 'auto', then the option
+        'io.parquet.engine' is used. If 'auto', then the first
+        library to be installed is used.
+    compression : str, optional, default 'snappy'
+        compression method, includes {'gzip', 'snappy', 'brotli'}
+    row_group_size : int, optional
+        Maximum number of rows in each row group. By default each chunk
+        is written as a single row group.
+    kwargs
+        Additional keyword arguments passed to the engine
+
+    Notes
+    -----
+    The fastparquet engine can only append to a file path, not to an
+    open file handle.
+
+    Examples
+    --------
+    >>> from pandas.io.parquet import ParquetWriter
+    >>> with ParquetWriter('out.parquet') as writer:
+    ...     for chunk in pd.read_csv('data.csv', chunksize=100000):
+    ...         writer.write(chunk)
+    """
+
+    def __init__(self, path, engine='auto', compression='snappy',
+                 row_group_size=None, **kwargs):
+        self.path = path
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.kwargs = kwargs
+        self._impl = get_engine(engine)
+        self._handle = None
+        self._dtypes = None
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, df):
+        """
+        Append a DataFrame to the file.
+
+        Parameters
+        ----------
+        df : DataFrame
+            Must have the same columns and dtypes as the first chunk.
+        """
+        if self._closed:
+            raise ValueError("I/O operation on closed ParquetWriter")
+
+        self._impl.validate_dataframe(df)
+        if self._handle is None:
+            self._handle = self._impl.open_writer(
+                self.path, df, compression=self.compression, **self.kwargs)
+            self._dtypes = df.dtypes
+        elif not df.dtypes.equals(self._dtypes):
+            raise ValueError("all chunks written to a ParquetWriter must "
+                             "have the same columns and dtypes")
+
+        self._impl.write_chunk(self._handle, df,
+                               row_group_size=self.row_group_size)
+
+    def close(self):
+        """ finalise the file, writing the footer if required """
+        if self._closed:
+            return
+        if self._handle is not None:
+            self._impl.close_writer(self._handle)
+        self._handle = None
+        self._closed = True
+
 
 def to_parquet(df, path, engine='auto', compression='snappy', **kwargs):
     """
@@ -114,6 +114,132 @@ def read_pickle(path, compression='infer'):
         raise
 
 
+def to_pickle_buffers(obj, protocol=pkl.HIGHEST_PROTOCOL):
+    """
+    Pickle (serialize) object, keeping the data of numpy arrays out-of-band
+
+    The pickle stream only holds the structure of the object and the
+    metadata of its arrays; the array data itself is returned as a list of
+    buffers that reference the memory of the original arrays without
+    copying it. The buffers can be written to shared memory, a
+    memory-mapped file or a socket independently of the (small) pickle
+    stream, and the object is rebuilt with :func:`read_pickle_buffers`.
+
+    Arrays with object dtype and arrays that are not contiguous are pickled
+    in-band as usual.
+
+    .. versionadded:: 0.23.0
+
+    Parameters
+    ----------
+    obj : any object
+    protocol : int
+        Int which indicates which protocol should be used by the pickler,
+        default HIGHEST_PROTOCOL. A negative value for the protocol parameter
+        is equivalent to setting its value to HIGHEST_PROTOCOL.
+
+    Returns
+    -------
+    header : bytes
+        The pickle stream
+    buffers : list of memoryview
+        The out-of-band array data, valid for as long as ``obj`` is not
+        modified
+
+    See Also
+    --------
+    read_pickle_buffers
+    """
+    if protocol < 0:
+        protocol = pkl.HIGHEST_PROTOCOL
+
+    buffers = []
+    seen = {}
+
+    def persistent_id(obj):
+        if type(obj) is not np.ndarray or obj.dtype.hasobject:
+            return None
+        if obj.flags.c_contiguous:
+            order = 'C'
+        elif obj.flags.f_contiguous:
+            order = 'F'
+        else:
+            return None
+
+        # persistent ids are not memoized by the pickler, so keep track of
+        # arrays that are referenced more than once ourselves; holding on
+        # to the array makes sure its id is not reused while pickling
+        key = id(obj)
+        if key not in seen:
+            # a flat uint8 view exports a buffer for any dtype, including
+            # datetime64 which does not support the buffer protocol itself
+            data = obj.ravel(order=order).view(np.uint8)
+            buffers.append(memoryview(data))
+            seen[key] = (len(buffers) - 1, obj)
+
+        # protocol 0 requires persistent ids to be ascii strings
+        shape = ','.join(str(n) for n in obj.shape)
+        return ' '.join(['ndarray', str(seen[key][0]), obj.dtype.str,
+                         order, shape])
+
+    f = BytesIO()
+    pickler = pkl.Pickler(f, protocol=protocol)
+    pickler.persistent_id = persistent_id
+    pickler.dump(obj)
+    return f.getvalue(), buffers
+
+
+def read_pickle_buffers(header, buffers):
+    """
+    Load an object pickled with :func:`to_pickle_buffers`
+
+    The numpy arrays of the result are views onto ``buffers`` and are not
+    copied; they are read-only if the buffers are read-only, and keep the
+    buffers alive.
+
+    Warning: Loading pickled data received from untrusted sources can be
+    unsafe. See: https://docs.python.org/3/library/pickle.html
+
+    .. versionadded:: 0.23.0
+
+    Parameters
+    ----------
+    header : bytes
+        The pickle stream returned by :func:`to_pickle_buffers`
+    buffers : list of buffer-like objects
+        The out-of-band array data returned by :func:`to_pickle_buffers`,
+        or copies of it, e.g. ``bytes``, ``bytearray``, ``mmap`` or
+        ``memoryview`` objects
+
+    Returns
+    -------
+    unpickled : type of object pickled
+
+    See Also
+    --------
+    to_pickle_buffers
+    """
+
+    arrays = {}
+
+    def persistent_load(pid):
+        parts = pid.split(' ')
+        if len(parts) != 5 or parts[0] != 'ndarray':
+            raise pkl.UnpicklingError(
+                "unsupported persistent id {pid!r}".format(pid=pid))
+        _, i, dtype, order, shape = parts
+        shape = tuple(int(n) for n in shape.split(',') if n)
+
+        i = int(i)
+        if i not in arrays:
+            arrays[i] = np.frombuffer(buffers[i], dtype=np.uint8)
+        return arrays[i].view(dtype).reshape(shape, order=order)
+
+    unpickler = pkl.Unpickler(BytesIO(header))
+    unpickler.persistent_load = persistent_load
+    return unpickler.load()
+
+
 # compat with sparse pickle / unpickle
 
 
@@ -4,20 +4,36 @@
 import numpy as np
 cimport numpy as np
 from numpy cimport uint8_t, uint16_t, int8_t, int64_t
+from libc.string cimport memcpy, memset
 import sas_constants as const
 
+# the status codes of the decompression routines, which cannot raise as
+# they run without the GIL
+cdef enum DecompressStatus:
+    decompress_ok = 0
+    decompress_unknown_command = -1
+    decompress_bad_control = -2
+    decompress_out_of_bounds = -3
+
+
+cdef enum Compression:
+    compression_none = 0
+    compression_rle = 1
+    compression_rdc = 2
+
+
 # rle_decompress decompresses data using a Run Length Encoding
 # algorithm.  It is partially documented here:
 #
 # https://cran.r-project.org/web/packages/sas7bdat/vignettes/sas7bdat.pdf
-cdef np.ndarray[uint8_t, ndim=1] rle_decompress(
-        int result_length, np.ndarray[uint8_t, ndim=1] inbuff):
+cdef int rle_decompress_into(const uint8_t *inbuff, Py_ssize_t length,
+                             uint8_t *result,
+                             Py_ssize_t result_length) nogil:
 
     cdef:
         uint8_t control_byte, x
-        uint8_t [:] result = np.zeros(result_length, np.uint8)
-        int rpos = 0, ipos = 0, length = len(inbuff)
-        int i, nbytes, end_of_first_byte
+        Py_ssize_t rpos = 0, ipos = 0
+        int nbytes, end_of_first_byte
 
     while ipos < length:
         control_byte = inbuff[ipos] & 0xF0
@@ -26,115 +42,101 @@ cdef np.ndarray[uint8_t, ndim=1] rle_decompress(
 
         if control_byte == 0x00:
             if end_of_first_byte != 0:
-                raise ValueError("Unexpected non-zero end_of_first_byte")
+                return decompress_bad_control
+            if ipos >= length:
+                return decompress_out_of_bounds
             nbytes = <int>(inbuff[ipos]) + 64
             ipos += 1
-            for i in range(nbytes):
-                result[rpos] = inbuff[ipos]
-                rpos += 1
-                ipos += 1
+            if ipos + nbytes > length or rpos + nbytes > result_length:
+                return decompress_out_of_bounds
+            memcpy(result + rpos, inbuff + ipos, nbytes)
+            rpos += nbytes
+            ipos += nbytes
         elif control_byte == 0x40:
             # not documented
+            if ipos + 1 >= length:
+                return decompress_out_of_bounds
             nbytes = end_of_first_byte * 16
             nbytes += <int>(inbuff[ipos])
             ipos += 1
-            for i in range(nbytes):
-                result[rpos] = inbuff[ipos]
-                rpos += 1
-            ipos += 1
-        elif control_byte == 0x60:
-            nbytes = end_of_first_byte * 256 + <int>(inbuff[ipos]) + 17
+            if rpos + nbytes > result_length:
+                return decompress_out_of_bounds
+            memset(result + rpos, inbuff[ipos], nbytes)
+            rpos += nbytes
             ipos += 1
-            for i in range(nbytes):
-                result[rpos] = 0x20
-                rpos += 1
-        elif control_byte == 0x70:
+        elif control_byte == 0x60 or control_byte == 0x70:
+            if ipos >= length:
+                return decompress_out_of_bounds
             nbytes = end_of_first_byte * 256 + <int>(inbuff[ipos]) + 17
             ipos += 1
-            for i in range(nbytes):
-                result[rpos] = 0x00
-                rpos += 1
-        elif control_byte == 0x80:
-            nbytes = end_of_first_byte + 1
-            for i in range(nbytes):
-                result[rpos] = inbuff[ipos + i]
-                rpos += 1
-            ipos += nbytes
-        elif control_byte == 0x90:
-            nbytes = end_of_first_byte + 17
-            for i in range(nbytes):
-                result[rpos] = inbuff[ipos + i]
-                rpos += 1
-            ipos += nbytes
-        elif control_byte == 0xA0:
-            nbytes = end_of_first_byte + 33
-            for i in range(nbytes):
-                result[rpos] = inbuff[ipos + i]
-                rpos += 1
-            ipos += nbytes
-        elif control_byte == 0xB0:
-            nbytes = end_of_first_byte + 49
-            for i in range(nbytes):
-                result[rpos] = inbuff[ipos + i]
-                rpos += 1
+            if rpos + nbytes > result_length:
+                return decompress_out_of_bounds
+            memset(result + rpos, 0x20 if control_byte == 0x60 else 0x00,
+                   nbytes)
+            rpos += nbytes
+        elif (control_byte == 0x80 or control_byte == 0x90 or
+                control_byte == 0xA0 or control_byte == 0xB0):
+            # 0x80: 1, 0x90: 17, 0xA0: 33 and 0xB0: 49 bytes and more
+            nbytes = end_of_first_byte + 1 + 16 * ((control_byte >> 4) - 8)
+            if ipos + nbytes > length or rpos + nbytes > result_length:
+                return decompress_out_of_bounds
+            memcpy(result + rpos, inbuff + ipos, nbytes)
+            rpos += nbytes
             ipos += nbytes
         elif control_byte == 0xC0:
+            if ipos >= length:
+                return decompress_out_of_bounds
             nbytes = end_of_first_byte + 3
             x = inbuff[ipos]
             ipos += 1
-            for i in range(nbytes):
-                result[rpos] = x
-                rpos += 1
-        elif control_byte == 0xD0:
-            nbytes = end_of_first_byte + 2
-            for i in range(nbytes):
-                result[rpos] = 0x40
-                rpos += 1
-        elif control_byte == 0xE0:
-            nbytes = end_of_first_byte + 2
-            for i in range(nbytes):
-                result[rpos] = 0x20
-                rpos += 1
-        elif control_byte == 0xF0:
+            if rpos + nbytes > result_length:
+                return decompress_out_of_bounds
+            memset(result + rpos, x, nbytes)
+            rpos += nbytes
+        elif (control_byte == 0xD0 or control_byte == 0xE0 or
+                control_byte == 0xF0):
             nbytes = end_of_first_byte + 2
-            for i in range(nbytes):
-                result[rpos] = 0x00
-                rpos += 1
+            if rpos + nbytes > result_length:
+                return decompress_out_of_bounds
+            if control_byte == 0xD0:
+                x = 0x40
+            elif control_byte == 0xE0:
+                x = 0x20
+            else:
+                x = 0x00
+            memset(result + rpos, x, nbytes)
+            rpos += nbytes
         else:
-            raise ValueError("unknown control byte: {byte}"
-                             .format(byte=control_byte))
-
-    if len(result) != result_length:
-        raise ValueError("RLE: {got} != {expect}".format(got=len(result),
-                                                         expect=result_length))
+            return decompress_unknown_command
 
-    return np.asarray(result)
+    return decompress_ok
 
 
 # rdc_decompress decompresses data using the Ross Data Compression algorithm:
 #
 # http://collaboration.cmc.ec.gc.ca/science/rpn/biblio/ddj/Website/articles/CUJ/1992/9210/ross/ross.htm
-cdef np.ndarray[uint8_t, ndim=1] rdc_decompress(
-        int result_length, np.ndarray[uint8_t, ndim=1] inbuff):
+cdef int rdc_decompress_into(const uint8_t *inbuff, Py_ssize_t length,
+                             uint8_t *outbuff,
+                             Py_ssize_t result_length) nogil:
 
     cdef:
         uint8_t cmd
-        uint16_t ctrl_bits, ctrl_mask = 0, ofs, cnt
-        int ipos = 0, rpos = 0, k
-        uint8_t [:] outbuff = np.zeros(result_length, dtype=np.uint8)
-
-    ii = -1
+        uint16_t ctrl_bits = 0, ctrl_mask = 0, ofs, cnt
+        Py_ssize_t ipos = 0, rpos = 0, k
 
-    while ipos < len(inbuff):
-        ii += 1
+    while ipos < length:
         ctrl_mask = ctrl_mask >> 1
         if ctrl_mask == 0:
+            if ipos + 2 >= length:
+                return decompress_out_of_bounds
             ctrl_bits = ((<uint16_t>inbuff[ipos] << 8) +
                          <uint16_t>inbuff[ipos + 1])
             ipos += 2
             ctrl_mask = 0x8000
 
         if ctrl_bits & ctrl_mask == 0:
+            if rpos >= result_length:
+                return decompress_out_of_bounds
             outbuff[rpos] = inbuff[ipos]
             ipos += 1
             rpos += 1
@@ -147,52 +149,149 @@ cdef np.ndarray[uint8_t, ndim=1] rdc_decompress(
         # short RLE
         if cmd == 0:
             cnt += 3
-            for k in range(cnt):
-                outbuff[rpos + k] = inbuff[ipos]
+            if ipos >= length or rpos + cnt > result_length:
+                return decompress_out_of_bounds
+            memset(outbuff + rpos, inbuff[ipos], cnt)
             rpos += cnt
             ipos += 1
 
         # long RLE
         elif cmd == 1:
+            if ipos + 1 >= length:
+                return decompress_out_of_bounds
             cnt += <uint16_t>inbuff[ipos] << 4
             cnt += 19
             ipos += 1
-            for k in range(cnt):
-                outbuff[rpos + k] = inbuff[ipos]
+            if rpos + cnt > result_length:
+                return decompress_out_of_bounds
+            memset(outbuff + rpos, inbuff[ipos], cnt)
             rpos += cnt
             ipos += 1
 
         # long pattern
         elif cmd == 2:
+            if ipos + 1 >= length:
+                return decompress_out_of_bounds
             ofs = cnt + 3
             ofs += <uint16_t>inbuff[ipos] << 4
             ipos += 1
             cnt = <uint16_t>inbuff[ipos]
             ipos += 1
             cnt += 16
+            if ofs > rpos or rpos + cnt > result_length:
+                return decompress_out_of_bounds
+            # the pattern may overlap the output, so copy byte by byte
             for k in range(cnt):
-                outbuff[rpos + k] = outbuff[rpos - <int>ofs + k]
+                outbuff[rpos + k] = outbuff[rpos - ofs + k]
             rpos += cnt
 
         # short pattern
-        elif (cmd >= 3) & (cmd <= 15):
+        else:
+            if ipos >= length:
+                return decompress_out_of_bounds
             ofs = cnt + 3
             ofs += <uint16_t>inbuff[ipos] << 4
             ipos += 1
+            if ofs > rpos or rpos + cmd > result_length:
+                return decompress_out_of_bounds
             for k in range(cmd):
-                outbuff[rpos + k] = outbuff[rpos - <int>ofs + k]
+                outbuff[rpos + k] = outbuff[rpos - ofs + k]
             rpos += cmd
 
-        else:
-            raise ValueError("unknown RDC command")
+    return decompress_ok
+
+
+cdef int decompress_into(int compression, const uint8_t *inbuff,
+                         Py_ssize_t length, uint8_t *result,
+                         Py_ssize_t result_length) nogil:
+    if compression == compression_rle:
+        return rle_decompress_into(inbuff, length, result, result_length)
+    return rdc_decompress_into(inbuff, length, result, result_length)
+
+
+cdef raise_decompress_error(int status, int compression):
+    name = 'RLE' if compression == compression_rle else 'RDC'
+    if status == decompress_unknown_command:
+        raise ValueError("{name}: unknown command".format(name=name))
+    elif status == decompress_bad_control:
+        raise ValueError("{name}: unexpected non-zero end_of_first_byte"
+                         .format(name=name))
+    raise ValueError("{name}: compressed data out of bounds"
+                     .format(name=name))
+
+
+cdef np.ndarray[uint8_t, ndim=1] rle_decompress(
+        int result_length, np.ndarray[uint8_t, ndim=1] inbuff):
+    return decompress(compression_rle, result_length, inbuff)
+
+
+cdef np.ndarray[uint8_t, ndim=1] rdc_decompress(
+        int result_length, np.ndarray[uint8_t, ndim=1] inbuff):
+    return decompress(compression_rdc, result_length, inbuff)
+
+
+cdef np.ndarray[uint8_t, ndim=1] decompress(
+        int compression, int result_length,
+        np.ndarray[uint8_t, ndim=1] inbuff):
+    cdef:
+        np.ndarray[uint8_t, ndim=1] result = np.zeros(result_length,
+                                                      np.uint8)
+        int status
+
+    inbuff = np.ascontiguousarray(inbuff)
+    status = decompress_into(compression, <const uint8_t *>inbuff.data,
+                             len(inbuff), <uint8_t *>result.data,
+                             result_length)
+    if status != decompress_ok:
+        raise_decompress_error(status, compression)
+    return result
+
+
+def decompress_rows(bytes page not None, int64_t[:] offsets, int64_t[:] lengths,
+                    uint8_t[:, ::1] out, object compression):
+    """
+    Copy the rows of a page held at offsets into the rows of out,
+    decompressing the rows shorter than a record with the compression of
+    the file (b'' if none). The GIL is released while the rows are copied,
+    so that the pages can be decoded on several threads.
+    """
+    cdef:
+        const uint8_t *buff = <const uint8_t *><char *>page
+        Py_ssize_t i, n = len(offsets), page_length = len(page)
+        Py_ssize_t row_length = out.shape[1]
+        int64_t offset, length
+        int kind = compression_none, status = decompress_ok
+
+    if compression == const.rle_compression:
+        kind = compression_rle
+    elif compression == const.rdc_compression:
+        kind = compression_rdc
+    if out.shape[0] < n:
+        raise ValueError("out is too small for the rows")
+    if row_length == 0:
+        return
+
+    with nogil:
+        for i in range(n):
+            offset = offsets[i]
+            length = lengths[i]
+            if offset < 0 or length < 0 or offset + length > page_length:
+                status = decompress_out_of_bounds
+                break
+            if kind != compression_none and length < row_length:
+                status = decompress_into(kind, buff + offset, length,
+                                         &out[i, 0], row_length)
+                if status != decompress_ok:
+                    break
+            else:
+                memcpy(&out[i, 0], buff + offset, min(length, row_length))
 
-    if len(outbuff) != result_length:
-        raise ValueError("RDC: {got} != {expect}\n"
-                         .format(got=len(outbuff), expect=result_length))
+    if status != decompress_ok:
+        raise_decompress_error(status, kind)
 
-    return np.asarray(outbuff)
 
 cdef enum ColumnTypes:
+    column_type_skip = 0
     column_type_decimal = 1
     column_type_string = 2
 
@@ -234,6 +333,7 @@ cdef class Parser(object):
         cdef:
             int j
             char[:] column_types
+            uint8_t[:] column_mask
 
         self.parser = parser
         self.header_length = self.parser.header_length
@@ -252,6 +352,7 @@ cdef class Parser(object):
         self.update_next_page()
 
         column_types = parser.column_types
+        column_mask = parser._column_mask.view(np.uint8)
 
         # map column types
         for j in range(self.column_count):
@@ -263,6 +364,9 @@ cdef class Parser(object):
                 raise ValueError("unknown column type: "
                                  "{typ}"
                                  .format(typ=self.parser.columns[j].ctype))
+            # columns which are not read are not copied out of the records
+            if not column_mask[j]:
+                self.column_types[j] = column_type_skip
 
         # compression
         if parser.compression == const.rle_compression:
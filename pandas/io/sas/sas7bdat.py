@@ -21,7 +21,7 @@ from pandas.errors import EmptyDataError
 import numpy as np
 import struct
 import pandas.io.sas.sas_constants as const
-from pandas.io.sas._sas import Parser
+from pandas.io.sas._sas import Parser, decompress_rows
 
 
 class _subheader_pointer(object):
@@ -60,13 +60,30 @@ class SAS7BDATReader(BaseIterator):
     convert_header_text : bool, defaults to True
         If False, header text, including column names, are left as raw
         bytes.
+    columns : list-like, defaults to None
+        Names of the columns to read, in the order in which they are
+        returned. Only these columns are copied out of the records.
+
+        .. versionadded:: 0.23.0
+    nthreads : int, defaults to 1
+        Number of threads decoding the pages of the file. With more than
+        one thread, the pages are read in batches whose records are
+        decompressed in parallel, without the GIL, and the selected columns
+        are then copied out of the decoded records.
+
+        .. versionadded:: 0.23.0
     """
 
     def __init__(self, path_or_buf, index=None, convert_dates=True,
                  blank_missing=True, chunksize=None, encoding=None,
-                 convert_text=True, convert_header_text=True):
+                 convert_text=True, convert_header_text=True,
+                 columns=None, nthreads=1):
+
+        if nthreads < 1:
+            raise ValueError("nthreads must be at least 1")
 
         self.index = index
+        self.nthreads = nthreads
         self.convert_dates = convert_dates
         self.blank_missing = blank_missing
         self.chunksize = chunksize
@@ -97,6 +114,7 @@ class SAS7BDATReader(BaseIterator):
 
         self._get_properties()
         self._parse_metadata()
+        self._set_column_selection(columns)
 
     def close(self):
         try:
@@ -104,6 +122,31 @@ class SAS7BDATReader(BaseIterator):
         except AttributeError:
             pass
 
+    def _set_column_selection(self, columns):
+        # locations of the returned columns, and a mask of the columns that
+        # are copied out of the records (these also include the index)
+        if columns is None:
+            self._column_locs = list(range(len(self.column_names)))
+            self._column_mask = np.ones(len(self.column_names), dtype=bool)
+            return
+
+        columns = list(columns)
+        if len(set(columns)) != len(columns):
+            self.close()
+            raise ValueError("columns contains duplicate entries")
+        unmatched = [col for col in columns if col not in self.column_names]
+        if unmatched:
+            self.close()
+            raise ValueError("The following columns were not found in the "
+                             "SAS file: " + ', '.join(map(str, unmatched)))
+
+        self._column_locs = [self.column_names.index(col)
+                             for col in columns]
+        self._column_mask = np.zeros(len(self.column_names), dtype=bool)
+        self._column_mask[self._column_locs] = True
+        if self.index is not None and self.index in self.column_names:
+            self._column_mask[self.column_names.index(self.index)] = True
+
     def _get_properties(self):
 
         # Check magic number
@@ -606,15 +649,19 @@ class SAS7BDATReader(BaseIterator):
         if nrows > m:
             nrows = m
 
-        nd = (self.column_types == b'd').sum()
-        ns = (self.column_types == b's').sum()
+        nd = (self.column_types[self._column_mask] == b'd').sum()
+        ns = (self.column_types[self._column_mask] == b's').sum()
 
         self._string_chunk = np.empty((ns, nrows), dtype=np.object)
-        self._byte_chunk = np.empty((nd, 8 * nrows), dtype=np.uint8)
+        # truncated numbers are padded with zeros
+        self._byte_chunk = np.zeros((nd, 8 * nrows), dtype=np.uint8)
 
         self._current_row_in_chunk_index = 0
-        p = Parser(self)
-        p.read(nrows)
+        if self.nthreads > 1:
+            self._read_pages(nrows)
+        else:
+            p = Parser(self)
+            p.read(nrows)
 
         rslt = self._chunk_to_dataframe()
         if self.index is not None:
@@ -644,6 +691,135 @@ class SAS7BDATReader(BaseIterator):
 
         return False
 
+    # The number of pages decoded at once by each thread.
+    _pages_per_thread = 4
+
+    def _read_pages(self, nrows):
+        # read nrows records like Parser, decoding batches of pages on
+        # nthreads threads and copying the selected columns out of the
+        # decoded records on this thread
+        from multiprocessing.pool import ThreadPool
+
+        # the pool is only started for batches of several pages, as it
+        # takes longer to start than to decode a page
+        pool = None
+        try:
+            done = False
+            while self._current_row_in_chunk_index < nrows and not done:
+                batch, done = self._read_batch(
+                    nrows - self._current_row_in_chunk_index)
+                count = sum(len(offsets) for _, offsets, _ in batch)
+                if not count:
+                    break
+
+                records = np.zeros((count, self.row_length), dtype=np.uint8)
+                starts = np.cumsum([0] + [len(offsets)
+                                          for _, offsets, _ in batch])
+
+                def decode(i):
+                    page, offsets, lengths = batch[i]
+                    decompress_rows(page, offsets, lengths,
+                                    records[starts[i]:starts[i + 1]],
+                                    self.compression)
+
+                if len(batch) == 1:
+                    decode(0)
+                else:
+                    if pool is None:
+                        pool = ThreadPool(self.nthreads)
+                    pool.map(decode, range(len(batch)))
+                self._records_to_chunk(records)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+    def _read_batch(self, nrows):
+        # the (page, offsets, lengths) of the next records, at most nrows of
+        # them over as many pages as the threads decode at once, and
+        # whether the end of the file was reached
+        batch = []
+        count = 0
+        while (count < nrows and
+               len(batch) < self.nthreads * self._pages_per_thread):
+            if len(self._cached_page) == 0:
+                return batch, True
+
+            offsets, lengths = self._page_records()
+            start = self._current_row_on_page_index
+            stop = min(len(offsets), start + nrows - count)
+            if stop > start:
+                batch.append((self._cached_page, offsets[start:stop],
+                              lengths[start:stop]))
+                count += stop - start
+                self._current_row_on_page_index = stop
+
+            # like Parser, the next page is read once the records of a data
+            # or mix page are read, and when a meta page has no more
+            # records
+            if (stop == len(offsets) and
+                    (self._current_page_type != const.page_meta_type or
+                     stop == start)):
+                self._current_row_on_page_index = 0
+                if self._read_next_page():
+                    return batch, True
+        return batch, False
+
+    def _page_records(self):
+        # the offsets and lengths of the records of the cached page
+        page_type = self._current_page_type
+        if page_type == const.page_meta_type:
+            pointers = self._current_page_data_subheader_pointers
+            offsets = np.array([p.offset for p in pointers], dtype=np.int64)
+            lengths = np.array([p.length for p in pointers], dtype=np.int64)
+            return offsets, lengths
+
+        offset = self._page_bit_offset + const.subheader_pointers_offset
+        if page_type in const.page_mix_types:
+            offset += (self._current_page_subheaders_count *
+                       self._subheader_pointer_length)
+            offset += offset % 8
+            count = min(self.row_count, self._mix_page_row_count)
+        elif page_type == const.page_data_type:
+            count = self._current_page_block_count
+        else:
+            self.close()
+            raise ValueError("unknown page type: {typ}".format(typ=page_type))
+        offsets = offset + self.row_length * np.arange(count, dtype=np.int64)
+        lengths = np.repeat(np.int64(self.row_length), count)
+        return offsets, lengths
+
+    def _records_to_chunk(self, records):
+        # copy the selected columns of the decoded records into the chunks,
+        # as Parser does record by record
+        start = self._current_row_in_chunk_index
+        stop = start + len(records)
+        js, jb = 0, 0
+        for j in range(self.column_count):
+            length = self._column_data_lengths[j]
+            if length == 0:
+                break
+            if not self._column_mask[j]:
+                continue
+            offset = self._column_data_offsets[j]
+            values = records[:, offset:offset + length]
+            if self.column_types[j] == b'd':
+                chunk = self._byte_chunk[jb].reshape(-1, 8)
+                if self.byte_order == "<":
+                    chunk[start:stop, 8 - length:] = values
+                else:
+                    chunk[start:stop, :length] = values
+                jb += 1
+            elif self.column_types[j] == b's':
+                buf = values.tobytes()
+                self._string_chunk[js, start:stop] = np.array(
+                    [buf[i:i + length].rstrip()
+                     for i in range(0, len(buf), length)], dtype=np.object)
+                js += 1
+
+        self._current_row_in_chunk_index = stop
+        self._current_row_in_file_index += len(records)
+
     def _chunk_to_dataframe(self):
 
         n = self._current_row_in_chunk_index
@@ -651,12 +827,29 @@ class SAS7BDATReader(BaseIterator):
         ix = range(m - n, m)
         rslt = pd.DataFrame(index=ix)
 
+        # rows of the byte and string chunks holding each column read
+        chunk_locs = {}
         js, jb = 0, 0
-        for j in range(self.column_count):
+        for j in np.flatnonzero(self._column_mask):
+            if self.column_types[j] == b'd':
+                chunk_locs[j] = jb
+                jb += 1
+            elif self.column_types[j] == b's':
+                chunk_locs[j] = js
+                js += 1
+
+        column_locs = self._column_locs
+        if self.index is not None and self.index in self.column_names:
+            index_loc = self.column_names.index(self.index)
+            if index_loc not in column_locs:
+                column_locs = column_locs + [index_loc]
+
+        for j in column_locs:
 
             name = self.column_names[j]
 
             if self.column_types[j] == b'd':
+                jb = chunk_locs[j]
                 rslt[name] = self._byte_chunk[jb, :].view(
                     dtype=self.byte_order + 'd')
                 rslt[name] = np.asarray(rslt[name], dtype=np.float64)
@@ -669,8 +862,8 @@ class SAS7BDATReader(BaseIterator):
                     if unit:
                         rslt[name] = pd.to_datetime(rslt[name], unit=unit,
                                                     origin="1960-01-01")
-                jb += 1
             elif self.column_types[j] == b's':
+                js = chunk_locs[j]
                 rslt[name] = self._string_chunk[js, :]
                 if self.convert_text and (self.encoding is not None):
                     rslt[name] = rslt[name].str.decode(
@@ -678,7 +871,6 @@ class SAS7BDATReader(BaseIterator):
                 if self.blank_missing:
                     ii = rslt[name].str.len() == 0
                     rslt.loc[ii, name] = np.nan
-                js += 1
             else:
                 self.close()
                 raise ValueError("unknown column type %s" %
@@ -144,25 +144,6 @@ def _split_line(s, parts):
     return out
 
 
-def _handle_truncated_float_vec(vec, nbytes):
-    # This feature is not well documented, but some SAS XPORT files
-    # have 2-7 byte "truncated" floats.  To read these truncated
-    # floats, pad them with zeros on the right to make 8 byte floats.
-    #
-    # References:
-    # https://github.com/jcushman/xport/pull/3
-    # The R "foreign" library
-
-    if nbytes != 8:
-        vec1 = np.zeros(len(vec), np.dtype('S8'))
-        dtype = np.dtype('S%d,S%d' % (nbytes, 8 - nbytes))
-        vec2 = vec1.view(dtype=dtype)
-        vec2['f0'] = vec
-        return vec2
-
-    return vec
-
-
 def _parse_float_vec(vec):
     """
     Parse a vector of float values representing IBM 8 byte floats into
@@ -187,10 +168,8 @@ def _parse_float_vec(vec):
     # places. This will tell us how to adjust the ibm exponent to be a
     # power of 2 ieee exponent and how to shift the fraction bits to
     # restore the correct magnitude.
-    shift = np.zeros(len(vec), dtype=np.uint8)
-    shift[np.where(xport1 & 0x00200000)] = 1
-    shift[np.where(xport1 & 0x00400000)] = 2
-    shift[np.where(xport1 & 0x00800000)] = 3
+    shift = np.array([0, 1, 2, 2, 3, 3, 3, 3], dtype=np.uint8)
+    shift = shift.take((xport1 >> 21) & 0x7)
 
     # shift the ieee number down the correct number of places then
     # set the second half of the ieee number to be the second half
@@ -423,6 +402,31 @@ class XportReader(BaseIterator):
         miss &= miss1
         return miss
 
+    def _parse_numeric(self, data, locs):
+        """
+        Convert the numeric fields at locs of the records to native floats
+
+        The fields are copied into one array of 8 byte values, so that the
+        missing values of all fields are found and their IBM floats converted
+        at once.
+        """
+        # Some SAS XPORT files have 2-7 byte "truncated" floats, these are
+        # padded with zeros on the right to make 8 byte floats when they are
+        # assigned to the 8 byte values.
+        #
+        # References:
+        # https://github.com/jcushman/xport/pull/3
+        # The R "foreign" library
+        vec = np.empty((len(data), len(locs)), dtype='S8')
+        for k, j in enumerate(locs):
+            vec[:, k] = data['s%d' % j]
+        vec = vec.ravel()
+
+        miss = self._missing_double(vec)
+        values = _parse_float_vec(vec)
+        values[miss] = np.nan
+        return values.reshape(len(data), len(locs))
+
     @Appender(_read_method_doc)
     def read(self, nrows=None):
 
@@ -437,26 +441,24 @@ class XportReader(BaseIterator):
         raw = self.filepath_or_buffer.read(read_len)
         data = np.frombuffer(raw, dtype=self._dtype, count=read_lines)
 
-        df = pd.DataFrame(index=range(read_lines))
+        numeric = [j for j, field in enumerate(self.fields)
+                   if field['ntype'] == 'numeric']
+        if numeric:
+            values = self._parse_numeric(data, numeric)
+
+        columns = {}
+        for k, j in enumerate(numeric):
+            columns[self.columns[j]] = values[:, k]
         for j, x in enumerate(self.columns):
-            vec = data['s%d' % j]
-            ntype = self.fields[j]['ntype']
-            if ntype == "numeric":
-                vec = _handle_truncated_float_vec(
-                    vec, self.fields[j]['field_length'])
-                miss = self._missing_double(vec)
-                v = _parse_float_vec(vec)
-                v[miss] = np.nan
-            elif self.fields[j]['ntype'] == 'char':
-                v = [y.rstrip() for y in vec]
-                if compat.PY3:
-                    if self._encoding is not None:
-                        v = [y.decode(self._encoding) for y in v]
-            df[x] = v
-
-        if self._index is None:
-            df.index = range(self._lines_read, self._lines_read + read_lines)
-        else:
+            if self.fields[j]['ntype'] == 'char':
+                v = [y.rstrip() for y in data['s%d' % j].tolist()]
+                if compat.PY3 and self._encoding is not None:
+                    v = [y.decode(self._encoding) for y in v]
+                columns[x] = v
+
+        index = range(self._lines_read, self._lines_read + read_lines)
+        df = pd.DataFrame(columns, index=index, columns=self.columns)
+        if self._index is not None:
             df = df.set_index(self._index)
 
         self._lines_read += read_lines
@@ -6,7 +6,7 @@ from pandas.io.common import _stringify_path
 
 
 def read_sas(filepath_or_buffer, format=None, index=None, encoding=None,
-             chunksize=None, iterator=False):
+             chunksize=None, iterator=False, columns=None, nthreads=1):
     """
     Read SAS files stored as either XPORT or SAS7BDAT format files.
 
@@ -25,6 +25,18 @@ def read_sas(filepath_or_buffer, format=None, index=None, encoding=None,
         Read file `chunksize` lines at a time, returns iterator.
     iterator : bool, defaults to False
         If True, returns an iterator for reading the file incrementally.
+    columns : list-like, default None
+        Names of the columns to read from a SAS7BDAT file, in the order in
+        which they are returned. Other columns are skipped when the records
+        are read.
+
+        .. versionadded:: 0.23.0
+    nthreads : int, default 1
+        Number of threads decoding the pages of a SAS7BDAT file. The
+        compressed records of the pages are decoded in parallel, and the
+        selected columns are then copied out of them.
+
+        .. versionadded:: 0.23.0
 
     Returns
     -------
@@ -50,6 +62,10 @@ def read_sas(filepath_or_buffer, format=None, index=None, encoding=None,
             pass
 
     if format.lower() == 'xport':
+        if columns is not None:
+            raise ValueError("columns is only supported for SAS7BDAT files")
+        if nthreads != 1:
+            raise ValueError("nthreads is only supported for SAS7BDAT files")
         from pandas.io.sas.sas_xport import XportReader
         reader = XportReader(filepath_or_buffer, index=index,
                              encoding=encoding,
@@ -58,7 +74,8 @@ def read_sas(filepath_or_buffer, format=None, index=None, encoding=None,
         from pandas.io.sas.sas7bdat import SAS7BDATReader
         reader = SAS7BDATReader(filepath_or_buffer, index=index,
                                 encoding=encoding,
-                                chunksize=chunksize)
+                                chunksize=chunksize, columns=columns,
+                                nthreads=nthreads)
     else:
         raise ValueError('unknown SAS format')
 
@@ -977,8 +977,8 @@ class StataReader(StataParser, BaseIterator):
         self._has_string_data = False
         self._missing_values = False
         self._can_read_value_labels = False
-        self._column_selector_set = False
         self._value_labels_read = False
+        self._strls_read = False
         self._data_read = False
         self._dtype = None
         self._lines_read = 0
@@ -1397,6 +1397,11 @@ class StataReader(StataParser, BaseIterator):
         self._value_labels_read = True
 
     def _read_strls(self):
+        if self._strls_read:
+            # Don't read twice
+            return
+        self._strls_read = True
+
         self.path_or_buf.seek(self.seek_strls)
         # Wrap v_o in a string to allow uint64 values as keys on 32bit OS
         self.GSO = {'0': ''}
@@ -1494,10 +1499,26 @@ class StataReader(StataParser, BaseIterator):
         if nrows is None:
             nrows = self.nobs
 
-        if (self.format_version >= 117) and (not self._value_labels_read):
+        if self.format_version >= 117:
             self._can_read_value_labels = True
             self._read_strls()
 
+        # Only the selected variables are converted; the others are skipped
+        # by reading the records through a dtype that omits their fields
+        if columns is not None:
+            try:
+                locs = self._get_column_locs(columns)
+            except ValueError:
+                self.close()
+                raise
+        else:
+            locs = lrange(len(self.varlist))
+        varlist = [self.varlist[i] for i in locs]
+        typlist = [self.typlist[i] for i in locs]
+        dtyplist = [self.dtyplist[i] for i in locs]
+        fmtlist = [self.fmtlist[i] for i in locs]
+        lbllist = [self.lbllist[i] for i in locs]
+
         # Read data
         dtype = self._dtype
         max_read_len = (self.nobs - self._lines_read) * dtype.itemsize
@@ -1513,7 +1534,8 @@ class StataReader(StataParser, BaseIterator):
         offset = self._lines_read * dtype.itemsize
         self.path_or_buf.seek(self.data_location + offset)
         read_lines = min(nrows, self.nobs - self._lines_read)
-        data = np.frombuffer(self.path_or_buf.read(read_len), dtype=dtype,
+        data = np.frombuffer(self.path_or_buf.read(read_len),
+                             dtype=self._column_dtype(locs),
                              count=read_lines)
 
         self._lines_read += read_lines
@@ -1528,10 +1550,10 @@ class StataReader(StataParser, BaseIterator):
             self._read_value_labels()
 
         if len(data) == 0:
-            data = DataFrame(columns=self.varlist)
+            data = DataFrame(columns=varlist)
         else:
             data = DataFrame.from_records(data)
-            data.columns = self.varlist
+            data.columns = varlist
 
         # If index is not specified, use actual row number rather than
         # restarting at 0 for each chunk.
@@ -1539,53 +1561,46 @@ class StataReader(StataParser, BaseIterator):
             ix = np.arange(self._lines_read - read_lines, self._lines_read)
             data = data.set_index(ix)
 
-        if columns is not None:
-            try:
-                data = self._do_select_columns(data, columns)
-            except ValueError:
-                self.close()
-                raise
-
         # Decode strings
-        for col, typ in zip(data, self.typlist):
+        for col, typ in zip(data, typlist):
             if type(typ) is int:
                 data[col] = data[col].apply(
                     self._null_terminate, convert_dtype=True)
 
-        data = self._insert_strls(data)
+        data = self._insert_strls(data, typlist)
 
-        cols_ = np.where(self.dtyplist)[0]
+        cols_ = np.where(dtyplist)[0]
 
         # Convert columns (if needed) to match input type
         ix = data.index
         requires_type_conversion = False
         data_formatted = []
         for i in cols_:
-            if self.dtyplist[i] is not None:
+            if dtyplist[i] is not None:
                 col = data.columns[i]
                 dtype = data[col].dtype
-                if dtype != np.dtype(object) and dtype != self.dtyplist[i]:
+                if dtype != np.dtype(object) and dtype != dtyplist[i]:
                     requires_type_conversion = True
                     data_formatted.append(
-                        (col, Series(data[col], ix, self.dtyplist[i])))
+                        (col, Series(data[col], ix, dtyplist[i])))
                 else:
                     data_formatted.append((col, data[col]))
         if requires_type_conversion:
             data = DataFrame.from_items(data_formatted)
         del data_formatted
 
-        self._do_convert_missing(data, convert_missing)
+        self._do_convert_missing(data, convert_missing, typlist)
 
         if convert_dates:
             cols = np.where(lmap(lambda x: any(x.startswith(fmt)
                                                for fmt in _date_formats),
-                                 self.fmtlist))[0]
+                                 fmtlist))[0]
             for i in cols:
                 col = data.columns[i]
                 try:
                     data[col] = _stata_elapsed_date_to_datetime_vec(
                         data[col],
-                        self.fmtlist[i])
+                        fmtlist[i])
                 except ValueError:
                     self.close()
                     raise
@@ -1593,7 +1608,7 @@ class StataReader(StataParser, BaseIterator):
         if convert_categoricals and self.format_version > 108:
             data = self._do_convert_categoricals(data,
                                                  self.value_label_dict,
-                                                 self.lbllist,
+                                                 lbllist,
                                                  order_categoricals)
 
         if not preserve_dtypes:
@@ -1616,80 +1631,78 @@ class StataReader(StataParser, BaseIterator):
 
         return data
 
-    def _do_convert_missing(self, data, convert_missing):
-        # Check for missing values, and replace if found
-
-        for i, colname in enumerate(data):
-            fmt = self.typlist[i]
-            if fmt not in self.VALID_RANGE:
-                continue
+    def _do_convert_missing(self, data, convert_missing, typlist):
+        # Check for missing values, and replace if found. Columns of the
+        # same Stata type share a dtype, so they are checked all at once.
+        locs_by_fmt = {}
+        for i, fmt in enumerate(typlist):
+            if fmt in self.VALID_RANGE:
+                locs_by_fmt.setdefault(fmt, []).append(i)
 
+        for fmt, locs in compat.iteritems(locs_by_fmt):
             nmin, nmax = self.VALID_RANGE[fmt]
-            series = data[colname]
-            missing = np.logical_or(series < nmin, series > nmax)
-
-            if not missing.any():
-                continue
-
-            if convert_missing:  # Replacement follows Stata notation
-                missing_loc = np.argwhere(missing)
-                umissing, umissing_loc = np.unique(series[missing],
-                                                   return_inverse=True)
-                replacement = Series(series, dtype=np.object)
-                for j, um in enumerate(umissing):
-                    missing_value = StataMissingValue(um)
-
-                    loc = missing_loc[umissing_loc == j]
-                    replacement.iloc[loc] = missing_value
-            else:  # All replacements are identical
-                dtype = series.dtype
-                if dtype not in (np.float32, np.float64):
-                    dtype = np.float64
-                replacement = Series(series, dtype=dtype)
-                replacement[missing] = np.nan
+            values = data.iloc[:, locs].values
+            all_missing = np.logical_or(values < nmin, values > nmax)
+
+            for j in np.flatnonzero(all_missing.any(axis=0)):
+                colname = data.columns[locs[j]]
+                series = data[colname]
+                missing = all_missing[:, j]
+
+                if convert_missing:  # Replacement follows Stata notation
+                    missing_loc = np.argwhere(missing)
+                    umissing, umissing_loc = np.unique(series[missing],
+                                                       return_inverse=True)
+                    replacement = Series(series, dtype=np.object)
+                    for k, um in enumerate(umissing):
+                        missing_value = StataMissingValue(um)
+
+                        loc = missing_loc[umissing_loc == k]
+                        replacement.iloc[loc] = missing_value
+                else:  # All replacements are identical
+                    dtype = series.dtype
+                    if dtype not in (np.float32, np.float64):
+                        dtype = np.float64
+                    replacement = Series(series, dtype=dtype)
+                    replacement[missing] = np.nan
 
-            data[colname] = replacement
+                data[colname] = replacement
 
-    def _insert_strls(self, data):
+    def _insert_strls(self, data, typlist):
         if not hasattr(self, 'GSO') or len(self.GSO) == 0:
             return data
-        for i, typ in enumerate(self.typlist):
+        for i, typ in enumerate(typlist):
             if typ != 'Q':
                 continue
             # Wrap v_o in a string to allow uint64 values as keys on 32bit OS
             data.iloc[:, i] = [self.GSO[str(k)] for k in data.iloc[:, i]]
         return data
 
-    def _do_select_columns(self, data, columns):
-
-        if not self._column_selector_set:
-            column_set = set(columns)
-            if len(column_set) != len(columns):
-                raise ValueError('columns contains duplicate entries')
-            unmatched = column_set.difference(data.columns)
-            if unmatched:
-                raise ValueError('The following columns were not found in the '
-                                 'Stata data set: ' +
-                                 ', '.join(list(unmatched)))
-            # Copy information for retained columns for later processing
-            dtyplist = []
-            typlist = []
-            fmtlist = []
-            lbllist = []
-            for col in columns:
-                i = data.columns.get_loc(col)
-                dtyplist.append(self.dtyplist[i])
-                typlist.append(self.typlist[i])
-                fmtlist.append(self.fmtlist[i])
-                lbllist.append(self.lbllist[i])
-
-            self.dtyplist = dtyplist
-            self.typlist = typlist
-            self.fmtlist = fmtlist
-            self.lbllist = lbllist
-            self._column_selector_set = True
-
-        return data[columns]
+    def _get_column_locs(self, columns):
+        """ validate the selected columns and return their positions """
+        column_set = set(columns)
+        if len(column_set) != len(columns):
+            raise ValueError('columns contains duplicate entries')
+        unmatched = column_set.difference(self.varlist)
+        if unmatched:
+            raise ValueError('The following columns were not found in the '
+                             'Stata data set: ' +
+                             ', '.join(list(unmatched)))
+        return [self.varlist.index(col) for col in columns]
+
+    def _column_dtype(self, locs):
+        """
+        a record dtype holding only the fields at locs, with the offsets and
+        itemsize of the full record, so the other fields are skipped
+        """
+        dtype = self._dtype
+        if len(locs) == len(dtype.names) and locs == sorted(locs):
+            return dtype
+        names = [dtype.names[i] for i in locs]
+        return np.dtype({'names': names,
+                         'formats': [dtype.fields[n][0] for n in names],
+                         'offsets': [dtype.fields[n][1] for n in names],
+                         'itemsize': dtype.itemsize})
 
     def _do_convert_categoricals(self, data, value_label_dict, lbllist,
                                  order_categoricals):
@@ -1869,88 +1882,13 @@ def _dtype_to_default_stata_fmt(dtype, column):
         raise NotImplementedError("Data type %s not supported." % dtype)
 
 
-class StataWriter(StataParser):
+class _StataWriterBase(StataParser):
     """
-    A class for writing Stata binary dta files
-
-    Parameters
-    ----------
-    fname : str or buffer
-        String path of file-like object
-    data : DataFrame
-        Input to save
-    convert_dates : dict
-        Dictionary mapping columns containing datetime types to stata internal
-        format to use when writing the dates. Options are 'tc', 'td', 'tm',
-        'tw', 'th', 'tq', 'ty'. Column can be either an integer or a name.
-        Datetime columns that do not have a conversion type specified will be
-        converted to 'tc'. Raises NotImplementedError if a datetime column has
-        timezone information
-    write_index : bool
-        Write the index to Stata dataset.
-    encoding : str
-        Default is latin-1. Only latin-1 and ascii are supported.
-    byteorder : str
-        Can be ">", "<", "little", or "big". default is `sys.byteorder`
-    time_stamp : datetime
-        A datetime to use as file creation date.  Default is the current time
-    dataset_label : str
-        A label for the data set.  Must be 80 characters or smaller.
-    variable_labels : dict
-        Dictionary containing columns as keys and variable labels as values.
-        Each label must be 80 characters or smaller.
-
-        .. versionadded:: 0.19.0
-
-    Returns
-    -------
-    writer : StataWriter instance
-        The StataWriter instance has a write_file method, which will
-        write the file to the given `fname`.
-
-    Raises
-    ------
-    NotImplementedError
-        * If datetimes contain timezone information
-    ValueError
-        * Columns listed in convert_dates are neither datetime64[ns]
-          or datetime.datetime
-        * Column dtype is not representable in Stata
-        * Column listed in convert_dates is not in DataFrame
-        * Categorical label contains more than 32,000 characters
-
-    Examples
-    --------
-    >>> import pandas as pd
-    >>> data = pd.DataFrame([[1.0, 1]], columns=['a', 'b'])
-    >>> writer = StataWriter('./data_file.dta', data)
-    >>> writer.write_file()
-
-    Or with dates
-    >>> from datetime import datetime
-    >>> data = pd.DataFrame([[datetime(2000,1,1)]], columns=['date'])
-    >>> writer = StataWriter('./date_data_file.dta', data, {'date' : 'tw'})
-    >>> writer.write_file()
+    Conversion of DataFrames to the Stata types, and writing of the header,
+    descriptors, records and value labels of a Stata binary dta file, shared
+    by StataWriter and StataStreamWriter
     """
 
-    def __init__(self, fname, data, convert_dates=None, write_index=True,
-                 encoding="latin-1", byteorder=None, time_stamp=None,
-                 data_label=None, variable_labels=None):
-        super(StataWriter, self).__init__(encoding)
-        self._convert_dates = {} if convert_dates is None else convert_dates
-        self._write_index = write_index
-        self._time_stamp = time_stamp
-        self._data_label = data_label
-        self._variable_labels = variable_labels
-        # attach nobs, nvars, data, varlist, typlist
-        self._prepare_pandas(data)
-
-        if byteorder is None:
-            byteorder = sys.byteorder
-        self._byteorder = _set_endianness(byteorder)
-        self._fname = _stringify_path(fname)
-        self.type_converters = {253: np.int32, 252: np.int16, 251: np.int8}
-
     def _write(self, to_write):
         """
         Helper to call encode before writing to file for Python 3 compat.
@@ -2141,23 +2079,6 @@ class StataWriter(StataParser):
             for key in self._convert_dates:
                 self.fmtlist[key] = self._convert_dates[key]
 
-    def write_file(self):
-        self._file = _open_file_binary_write(
-            self._fname, self._encoding or self._default_encoding
-        )
-        try:
-            self._write_header(time_stamp=self._time_stamp,
-                               data_label=self._data_label)
-            self._write_descriptors()
-            self._write_variable_labels()
-            # write 5 zeros for expansion fields
-            self._write(_pad_bytes("", 5))
-            self._prepare_data()
-            self._write_data()
-            self._write_value_labels()
-        finally:
-            self._file.close()
-
     def _write_value_labels(self):
         for vl in self._value_labels:
             self._file.write(vl.generate_value_label(self._byteorder,
@@ -2303,3 +2224,323 @@ class StataWriter(StataParser):
         else:
             s += null_byte
             return s
+
+
+class StataWriter(_StataWriterBase):
+    """
+    A class for writing Stata binary dta files
+
+    Parameters
+    ----------
+    fname : str or buffer
+        String path of file-like object
+    data : DataFrame
+        Input to save
+    convert_dates : dict
+        Dictionary mapping columns containing datetime types to stata internal
+        format to use when writing the dates. Options are 'tc', 'td', 'tm',
+        'tw', 'th', 'tq', 'ty'. Column can be either an integer or a name.
+        Datetime columns that do not have a conversion type specified will be
+        converted to 'tc'. Raises NotImplementedError if a datetime column has
+        timezone information
+    write_index : bool
+        Write the index to Stata dataset.
+    encoding : str
+        Default is latin-1. Only latin-1 and ascii are supported.
+    byteorder : str
+        Can be ">", "<", "little", or "big". default is `sys.byteorder`
+    time_stamp : datetime
+        A datetime to use as file creation date.  Default is the current time
+    dataset_label : str
+        A label for the data set.  Must be 80 characters or smaller.
+    variable_labels : dict
+        Dictionary containing columns as keys and variable labels as values.
+        Each label must be 80 characters or smaller.
+
+        .. versionadded:: 0.19.0
+
+    Returns
+    -------
+    writer : StataWriter instance
+        The StataWriter instance has a write_file method, which will
+        write the file to the given `fname`.
+
+    Raises
+    ------
+    NotImplementedError
+        * If datetimes contain timezone information
+    ValueError
+        * Columns listed in convert_dates are neither datetime64[ns]
+          or datetime.datetime
+        * Column dtype is not representable in Stata
+        * Column listed in convert_dates is not in DataFrame
+        * Categorical label contains more than 32,000 characters
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> data = pd.DataFrame([[1.0, 1]], columns=['a', 'b'])
+    >>> writer = StataWriter('./data_file.dta', data)
+    >>> writer.write_file()
+
+    Or with dates
+    >>> from datetime import datetime
+    >>> data = pd.DataFrame([[datetime(2000,1,1)]], columns=['date'])
+    >>> writer = StataWriter('./date_data_file.dta', data, {'date' : 'tw'})
+    >>> writer.write_file()
+    """
+
+    def __init__(self, fname, data, convert_dates=None, write_index=True,
+                 encoding="latin-1", byteorder=None, time_stamp=None,
+                 data_label=None, variable_labels=None):
+        super(StataWriter, self).__init__(encoding)
+        self._convert_dates = {} if convert_dates is None else convert_dates
+        self._write_index = write_index
+        self._time_stamp = time_stamp
+        self._data_label = data_label
+        self._variable_labels = variable_labels
+        # attach nobs, nvars, data, varlist, typlist
+        self._prepare_pandas(data)
+
+        if byteorder is None:
+            byteorder = sys.byteorder
+        self._byteorder = _set_endianness(byteorder)
+        self._fname = _stringify_path(fname)
+        self.type_converters = {253: np.int32, 252: np.int16, 251: np.int8}
+
+    def write_file(self):
+        self._file = _open_file_binary_write(
+            self._fname, self._encoding or self._default_encoding
+        )
+        try:
+            self._write_header(time_stamp=self._time_stamp,
+                               data_label=self._data_label)
+            self._write_descriptors()
+            self._write_variable_labels()
+            # write 5 zeros for expansion fields
+            self._write(_pad_bytes("", 5))
+            self._prepare_data()
+            self._write_data()
+            self._write_value_labels()
+        finally:
+            self._file.close()
+
+
+class StataStreamWriter(_StataWriterBase):
+    """
+    A class for writing a Stata binary dta file from a sequence of
+    DataFrames, one chunk at a time
+
+    The variables of the file are taken from the first chunk passed to
+    ``write``, which writes the header. Each chunk is then converted and
+    appended to the file as records, so only one chunk needs to be held in
+    memory. The number of observations in the header is set when the writer
+    is closed.
+
+    .. versionadded:: 0.23.0
+
+    Parameters
+    ----------
+    fname : str or buffer
+        String path of file-like object. Buffers must be seekable.
+    convert_dates : dict
+        Dictionary mapping columns containing datetime types to stata internal
+        format to use when writing the dates. Options are 'tc', 'td', 'tm',
+        'tw', 'th', 'tq', 'ty'. Column can be either an integer or a name.
+        Datetime columns that do not have a conversion type specified will be
+        converted to 'tc'. Raises NotImplementedError if a datetime column has
+        timezone information
+    write_index : bool
+        Write the index to Stata dataset.
+    encoding : str
+        Default is latin-1. Only latin-1 and ascii are supported.
+    byteorder : str
+        Can be ">", "<", "little", or "big". default is `sys.byteorder`
+    time_stamp : datetime
+        A datetime to use as file creation date.  Default is the current time
+    data_label : str
+        A label for the data set.  Must be 80 characters or smaller.
+    variable_labels : dict
+        Dictionary containing columns as keys and variable labels as values.
+        Each label must be 80 characters or smaller.
+
+    Raises
+    ------
+    ValueError
+        * A chunk has different columns than the first chunk
+        * A chunk needs a wider Stata type than the first chunk, e.g. a
+          longer string or a larger integer
+        * The categories of a categorical column differ from the first chunk
+
+    Notes
+    -----
+    The Stata types of the variables are those needed by the first chunk.
+    Later chunks are cast to these types when they fit; if one does not,
+    cast the corresponding column of the first chunk to a wider type.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> with StataStreamWriter('./data_file.dta', write_index=False) as writer:
+    ...     for chunk in pd.read_csv('./data_file.csv', chunksize=100000):
+    ...         writer.write(chunk)
+    """
+
+    _numeric_types = {251: np.int8, 252: np.int16, 253: np.int32,
+                      254: np.float32, 255: np.float64}
+
+    def __init__(self, fname, convert_dates=None, write_index=True,
+                 encoding="latin-1", byteorder=None, time_stamp=None,
+                 data_label=None, variable_labels=None):
+        super(StataStreamWriter, self).__init__(encoding)
+        self._convert_dates = {} if convert_dates is None else convert_dates
+        self._write_index = write_index
+        self._time_stamp = time_stamp
+        self._data_label = data_label
+        self._variable_labels = variable_labels
+
+        if byteorder is None:
+            byteorder = sys.byteorder
+        self._byteorder = _set_endianness(byteorder)
+        self._fname = _stringify_path(fname)
+        self.type_converters = {253: np.int32, 252: np.int16, 251: np.int8}
+
+        self._file = None
+        self._closed = False
+        self._nobs_written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, data):
+        """
+        Append a DataFrame to the file
+
+        Parameters
+        ----------
+        data : DataFrame
+            The first chunk determines the variables of the file; later
+            chunks must have the same columns.
+        """
+        if self._closed:
+            raise ValueError("I/O operation on closed StataStreamWriter")
+
+        if self._file is None:
+            self._start(data)
+        else:
+            self._prepare_chunk(data)
+
+        self._prepare_data()
+        self._write_data()
+        self._nobs_written += self.nobs
+
+    def close(self):
+        """
+        Write the value labels, set the number of observations in the header
+        and close the file
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._file is None:
+            return
+        try:
+            self._write_value_labels()
+            # number of obs, 4 bytes after ds_format, byteorder, filetype,
+            # unused and the number of vars
+            self._file.seek(6)
+            self._file.write(struct.pack(self._byteorder + "i",
+                                         self._nobs_written))
+        finally:
+            self._file.close()
+
+    def _start(self, data):
+        # attach nobs, nvars, data, varlist, typlist from the first chunk
+        self._columns = self._chunk_columns(data)
+        self._prepare_pandas(data)
+        self._categories = dict(
+            (i, data[col].cat.categories)
+            for i, col in enumerate(self.data)
+            if self._is_col_cat[i])
+        self._is_cat_schema = list(self._is_col_cat)
+        self._value_labels_schema = list(self._value_labels)
+
+        self._file = _open_file_binary_write(
+            self._fname, self._encoding or self._default_encoding
+        )
+        try:
+            self._write_header(time_stamp=self._time_stamp,
+                               data_label=self._data_label)
+            self._write_descriptors()
+            self._write_variable_labels()
+            # write 5 zeros for expansion fields
+            self._write(_pad_bytes("", 5))
+        except Exception:
+            self._closed = True
+            self._file.close()
+            raise
+
+    def _chunk_columns(self, data):
+        columns = list(data.columns)
+        if self._write_index:
+            columns = list(data.index.names) + columns
+        return columns
+
+    def _prepare_chunk(self, data):
+        """
+        Apply the conversions of _prepare_pandas to a later chunk and cast
+        it to the Stata types chosen for the first chunk
+        """
+        if self._chunk_columns(data) != self._columns:
+            raise ValueError("all chunks written to a StataStreamWriter "
+                             "must have the same columns")
+
+        data = data.copy()
+        if self._write_index:
+            data = data.reset_index()
+        data.columns = self.varlist
+
+        data = _cast_to_stata_types(data)
+        data = self._replace_nans(data)
+
+        for i, categories in compat.iteritems(self._categories):
+            col = self.varlist[i]
+            if (not is_categorical_dtype(data[col]) or
+                    not data[col].cat.categories.equals(categories)):
+                raise ValueError('The categories of column {0} must be the '
+                                 'same in all chunks'.format(col))
+        data = self._prepare_categoricals(data)
+        if self._is_col_cat != self._is_cat_schema:
+            raise ValueError('Categorical columns must be the same '
+                             'in all chunks')
+        self._value_labels = self._value_labels_schema
+
+        for i, col in enumerate(data):
+            if i in self._convert_dates:
+                # converted to doubles in _prepare_data
+                continue
+            typ = ord(self.typlist[i])
+            dtype = data[col].dtype
+            if is_datetime64_dtype(dtype):
+                chunk_typ = None
+            else:
+                chunk_typ = ord(_dtype_to_stata_type(dtype, data[col]))
+            if chunk_typ == typ:
+                continue
+            if typ <= 244:
+                # strings are padded to the width of the first chunk
+                if (chunk_typ is not None and chunk_typ <= typ and
+                        dtype.type == np.object_):
+                    continue
+            elif chunk_typ is not None and 251 <= chunk_typ < typ:
+                data[col] = data[col].astype(self._numeric_types[typ])
+                continue
+            raise ValueError('Column {0} cannot be stored using the Stata '
+                             'type of the first chunk; cast it to a wider '
+                             'type in the first chunk'.format(col))
+
+        self.nobs = data.shape[0]
+        self.data = data
@@ -12,7 +12,7 @@ from pandas import (
 from pandas.compat import string_types
 from pandas.core.dtypes.dtypes import (
     DatetimeTZDtype, PeriodDtype,
-    IntervalDtype, CategoricalDtype)
+    IntervalDtype, CategoricalDtype, MaskedDtype, StringDtype)
 from pandas.core.dtypes.common import (
     is_categorical_dtype, is_categorical,
     is_datetime64tz_dtype, is_datetimetz,
@@ -20,7 +20,7 @@ from pandas.core.dtypes.common import (
     is_dtype_equal, is_datetime64_ns_dtype,
     is_datetime64_dtype, is_interval_dtype,
     is_datetime64_any_dtype, is_string_dtype,
-    _coerce_to_dtype)
+    is_masked_dtype, is_utf8_dtype, _coerce_to_dtype)
 import pandas.util.testing as tm
 
 
@@ -577,6 +577,107 @@ class TestIntervalDtype(Base):
         assert len(IntervalDtype._cache) == 0
 
 
+class TestMaskedDtype(Base):
+
+    def create(self):
+        return MaskedDtype('int8')
+
+    def test_hash_vs_equality(self):
+        dtype = self.dtype
+        dtype2 = MaskedDtype('Int8')
+        dtype3 = MaskedDtype(dtype2)
+        dtype4 = MaskedDtype(np.int8)
+        assert dtype == dtype2 == dtype3 == dtype4
+        assert dtype is dtype2
+        assert dtype is dtype3
+        assert dtype is dtype4
+        assert hash(dtype) == hash(dtype2)
+        assert dtype != MaskedDtype('Int16')
+
+    @pytest.mark.parametrize('numpy_dtype, name', [
+        ('int8', 'Int8'), ('int16', 'Int16'), ('int32', 'Int32'),
+        ('int64', 'Int64'), ('uint8', 'UInt8'), ('uint16', 'UInt16'),
+        ('uint32', 'UInt32'), ('uint64', 'UInt64'), ('bool', 'Bool')])
+    def test_construction_from_string(self, numpy_dtype, name):
+        dtype = MaskedDtype.construct_from_string(name)
+        assert dtype.numpy_dtype == np.dtype(numpy_dtype)
+        assert str(dtype) == dtype.name == name
+        assert dtype == name
+        assert is_dtype_equal(dtype, name)
+        assert pd.api.types.pandas_dtype(name) == dtype
+
+    def test_construction_invalid(self):
+        for dtype in ['float64', 'int', 'Float64', 'object', np.float32]:
+            pytest.raises(TypeError, MaskedDtype.construct_from_string,
+                          dtype)
+        for dtype in ['float64', np.float32, object, 'Float64']:
+            pytest.raises(ValueError, MaskedDtype, dtype)
+
+    def test_is_dtype(self):
+        assert MaskedDtype.is_dtype(self.dtype)
+        assert MaskedDtype.is_dtype('Int64')
+        assert MaskedDtype.is_dtype('Bool')
+        assert not MaskedDtype.is_dtype('int64')
+        assert not MaskedDtype.is_dtype('bool')
+        assert not MaskedDtype.is_dtype(np.int64)
+        assert not MaskedDtype.is_dtype(CategoricalDtype())
+
+    def test_basic(self):
+        assert is_masked_dtype(self.dtype)
+        assert is_masked_dtype('UInt32')
+
+        s = Series([1, None, 3], dtype='Int8')
+        assert is_masked_dtype(s)
+        assert is_masked_dtype(s.dtype)
+        assert not is_masked_dtype(s.values)
+        assert not is_masked_dtype(np.array([1, 2]))
+        assert not is_masked_dtype(np.int8)
+        assert not is_masked_dtype(None)
+
+
+class TestStringDtype(Base):
+
+    def create(self):
+        return StringDtype()
+
+    def test_hash_vs_equality(self):
+        dtype = self.dtype
+        dtype2 = StringDtype()
+        assert dtype == dtype2
+        assert hash(dtype) == hash(dtype2)
+        assert dtype != MaskedDtype('Int8')
+        assert dtype != np.object_
+
+    def test_construction_from_string(self):
+        dtype = StringDtype.construct_from_string('utf8')
+        assert dtype == self.dtype
+        assert str(dtype) == dtype.name == 'utf8'
+        assert dtype == 'utf8'
+        assert is_dtype_equal(dtype, 'utf8')
+        assert pd.api.types.pandas_dtype('utf8') == dtype
+        for string in ['object', 'str', 'utf-8', 'string', np.object_]:
+            pytest.raises(TypeError, StringDtype.construct_from_string,
+                          string)
+
+    def test_is_dtype(self):
+        assert StringDtype.is_dtype(self.dtype)
+        assert StringDtype.is_dtype('utf8')
+        assert not StringDtype.is_dtype('object')
+        assert not StringDtype.is_dtype(np.object_)
+        assert not StringDtype.is_dtype(CategoricalDtype())
+
+    def test_basic(self):
+        assert is_utf8_dtype(self.dtype)
+        assert is_string_dtype(self.dtype)
+
+        s = Series(['a', None], dtype='utf8')
+        assert is_utf8_dtype(s)
+        assert is_utf8_dtype(s.dtype)
+        assert not is_utf8_dtype(s.values)
+        assert not is_utf8_dtype(np.array(['a', 'b'], dtype=object))
+        assert not is_utf8_dtype(None)
+
+
 class TestCategoricalDtypeParametrized(object):
 
     @pytest.mark.parametrize('categories, ordered', [
@@ -11,8 +11,9 @@ from numpy import nan
 import numpy as np
 
 from pandas import (DataFrame, Series, Timestamp, date_range, compat,
-                    option_context)
+                    option_context, Index)
 from pandas.compat import StringIO
+from pandas.core.internals import BlockManager, make_block, _share_values
 import pandas as pd
 
 from pandas.util.testing import (assert_almost_equal,
@@ -340,6 +341,112 @@ class TestDataFrameBlockInternals(TestData):
         copy = self.mixed_frame.copy()
         assert copy._data is not self.mixed_frame._data
 
+    def test_copy_on_write(self):
+        df = DataFrame({'a': np.arange(5.), 'b': np.arange(5),
+                        'c': list('abcde')})
+        expected = df.copy()
+
+        with option_context('mode.copy_on_write', True):
+            derived = [df.copy(), df.rename(columns=str.upper),
+                       df.reset_index(),
+                       df.set_axis(['x', 'y', 'z'], axis=1, inplace=False)]
+            for result in derived:
+                assert np.shares_memory(result.iloc[:, -3].values,
+                                        df['a'].values)
+                assert np.shares_memory(result.iloc[:, -2].values,
+                                        df['b'].values)
+
+            cop = df.copy()
+            cop.iloc[0, 0] = 10.
+            cop.loc[1, 'b'] = 10
+            cop.at[2, 'c'] = 'z'
+            cop.replace(3, 30, inplace=True)
+            assert_frame_equal(df, expected)
+            assert cop.loc[0, 'a'] == 10.
+            assert cop.loc[1, 'b'] == 10
+            assert cop.loc[2, 'c'] == 'z'
+            assert cop.loc[3, 'b'] == 30
+
+            # writing to the original leaves the copy alone
+            cop = df.copy()
+            df.iloc[:, 1] = 0
+            df.fillna(0, inplace=True)
+            assert_frame_equal(cop, expected)
+
+    def test_copy_on_write_series(self):
+        s = Series(np.arange(5.))
+
+        with option_context('mode.copy_on_write', True):
+            assert np.shares_memory(s.astype('float64').values, s.values)
+            result = s.copy()
+            assert np.shares_memory(result.values, s.values)
+            result[0] = 10.
+            result.iloc[1] = 10.
+            assert_series_equal(s, Series(np.arange(5.)))
+            assert not np.shares_memory(result.values, s.values)
+
+        # without copy-on-write deep copies are not shared
+        assert not np.shares_memory(s.copy().values, s.values)
+
+    def test_setitem_shared_read_only_blocks(self):
+        # e.g. the views onto a memory map of read_feather(memory_map=True)
+        a = np.arange(5.)
+        b = np.arange(5)
+        a.flags.writeable = False
+        b.flags.writeable = False
+        _share_values(a)
+        _share_values(b)
+        blocks = [make_block(a.reshape(1, -1), placement=[0], ndim=2),
+                  make_block(b.reshape(1, -1), placement=[1], ndim=2)]
+        df = DataFrame(BlockManager(blocks, [Index(['a', 'b']),
+                                             pd.RangeIndex(5)]))
+
+        df.iloc[0, 0] = 10.
+        df.loc[df['b'] > 2, 'b'] = 0
+        df.at[1, 'b'] = 7
+        expected = DataFrame({'a': [10., 1., 2., 3., 4.],
+                              'b': [0, 7, 2, 0, 0]})
+        assert_frame_equal(df, expected)
+
+        df['a'] = 1.
+        df.fillna(0, inplace=True)
+        expected['a'] = 1.
+        assert_frame_equal(df, expected)
+
+        # the read-only values are untouched
+        tm.assert_numpy_array_equal(a, np.arange(5.))
+        tm.assert_numpy_array_equal(b, np.arange(5))
+
+    def test_to_mmap(self, tmpdir):
+        df = DataFrame({'a': np.arange(5.), 'b': np.arange(5),
+                        'c': list('abcde'),
+                        'd': date_range('2000', periods=5),
+                        'e': pd.Categorical(list('aabbc'))})
+        expected = df.copy()
+
+        result = df.to_mmap(str(tmpdir))
+        assert_frame_equal(result, expected)
+        for col, mapped in [('a', True), ('b', True), ('c', False),
+                            ('d', True)]:
+            mgr = result._data
+            blk = mgr.blocks[mgr._blknos[result.columns.get_loc(col)]]
+            assert isinstance(blk.values.base, np.memmap) == mapped
+            assert not np.shares_memory(result[col].values, df[col].values)
+
+        # the files are removed once mapped
+        if not compat.is_platform_windows():
+            assert not tmpdir.listdir()
+
+        result.loc[0, 'a'] = 10.
+        result['f'] = result['a'] * 2
+        assert_frame_equal(df, expected)
+        assert result['f'].tolist() == [20., 2., 4., 6., 8.]
+        assert_frame_equal(tm.round_trip_pickle(result), result)
+
+        s = df['a'].to_mmap()
+        assert_series_equal(s, df['a'])
+        assert isinstance(s._data._block.values.base, np.memmap)
+
     def test_pickle(self):
         unpickled = tm.round_trip_pickle(self.mixed_frame)
         assert_frame_equal(self.mixed_frame, unpickled)
@@ -387,6 +387,29 @@ class TestDataFrameConstructors(TestData):
                        columns=['d', 'c', 'b', 'a'])
         tm.assert_numpy_array_equal(df.values, expected)
 
+    def test_constructor_dict_nocopy(self):
+        a = np.arange(5, dtype=np.float64)
+        b = np.arange(5, dtype=np.int64)
+        c = np.array(list('abcde'), dtype=object)
+        s = Series(np.arange(5, dtype=np.float64))
+        data = OrderedDict([('a', a), ('b', b), ('c', c), ('s', s)])
+
+        df = DataFrame(data, copy=False)
+        assert len(df._data.blocks) == 4
+        assert not df._data.is_consolidated()
+        for key, values in [('a', a), ('b', b), ('c', c), ('s', s.values)]:
+            assert np.shares_memory(df[key].values, values)
+
+        expected = DataFrame(data)
+        assert len(expected._data.blocks) == 3
+        assert not np.shares_memory(expected['a'].values, a)
+        tm.assert_frame_equal(df, expected)
+
+        # consolidated once an operation requires it
+        tm.assert_numpy_array_equal(df.values, expected.values)
+        assert df._data.is_consolidated()
+        assert len(df._data.blocks) == 3
+
     def test_constructor_dict_cast(self):
         # cast float tests
         test_data = {
@@ -81,6 +81,25 @@ class TestDataFrameMutateColumns(TestData):
 
         assert_frame_equal(result, expected)
 
+    def test_assign_many(self):
+        df = DataFrame({'A': [1, 2, 3]})
+        data = {'c%d' % i: np.arange(3.) + i for i in range(200)}
+        result = df.assign(A=lambda x: x.A * 2, B='b', **data)
+
+        expected = df.copy()
+        expected['A'] = expected['A'] * 2
+        for k in result.columns[1:]:
+            expected[k] = data[k] if k != 'B' else 'b'
+        assert_frame_equal(result, expected)
+
+        # the new columns are added to the BlockManager at once
+        assert result._data.nblocks == 3
+
+        result = DataFrame().assign(A=Series([1, 2], index=[5, 6]),
+                                    B=[3, 4])
+        expected = DataFrame({'A': [1, 2], 'B': [3, 4]}, index=[5, 6])
+        assert_frame_equal(result, expected)
+
     def test_assign_bad(self):
         df = DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6]})
 
@@ -94,6 +113,13 @@ class TestDataFrameMutateColumns(TestData):
         with pytest.raises(KeyError):
             df.assign(C=df.A, D=lambda x: x['A'] + x['C'])
 
+        # a 2-dim value is a single column only if it has one column
+        msg = 'Wrong number of items passed 2, placement implies 1'
+        with tm.assert_raises_regex(ValueError, msg):
+            df.assign(C=np.ones((3, 2)))
+        result = df.assign(C=np.ones((3, 1)))
+        assert result['C'].tolist() == [1., 1., 1.]
+
     def test_insert_error_msmgs(self):
 
         # GH 7432
@@ -386,6 +386,52 @@ class TestDataFrameReprInfoEtc(TestData):
         assert (df_object.memory_usage(deep=True).sum() >
                 df_object.memory_usage().sum())
 
+    @pytest.mark.skipif(PYPY,
+                        reason="on PyPy deep=True doesn't change result")
+    def test_memory_usage_deep_shared_objects(self):
+        words = np.array(['x' * 10, 'y' * 20], dtype=object)
+        df = DataFrame({'a': words[np.arange(10000) % 2],
+                        'b': np.arange(10000.)})
+        sizes = words[0].__sizeof__() + words[1].__sizeof__()
+
+        result = df.memory_usage(index=False, deep=True)
+        assert result['a'] == 80000 + sizes
+        assert result['b'] == 80000
+        assert df['a'].memory_usage(index=False, deep=True) == 80000 + sizes
+
+        # the usage of the objects is cached until the column is modified
+        blk = df._data.blocks[df._data._blknos[0]]
+        assert blk._memory_usage[2].tolist() == [sizes]
+        df.loc[0, 'a'] = 'z' * 30
+        result = df.memory_usage(index=False, deep=True)
+        assert result['a'] == 80000 + sizes + df.loc[0, 'a'].__sizeof__()
+
+    @pytest.mark.skipif(PYPY,
+                        reason="on PyPy deep=True doesn't change result")
+    def test_memory_usage_deep_sample(self):
+        df = DataFrame({'a': ['x' * 10, 'y' * 20] * 5000,
+                        'b': np.arange(10000.)})
+        shallow = df.memory_usage(index=False)
+        exact = 80000 + 5000 * (('x' * 10).__sizeof__() +
+                                ('y' * 20).__sizeof__())
+
+        with option_context('compute.memory_usage_sample_size', 500):
+            result = df.memory_usage(index=False, deep='sample')
+            assert result['b'] == shallow['b']
+            assert abs(result['a'] - exact) < 0.05 * exact
+            assert (df['a'].memory_usage(index=False, deep='sample') ==
+                    result['a'])
+
+            buf = StringIO()
+            df.info(buf=buf, memory_usage='sample')
+            assert re.search(r"memory usage: \S+ KB \+/- \S+ KB",
+                             buf.getvalue())
+
+        # small columns are measured exactly
+        df = DataFrame({'a': ['x' * 10, 'y' * 20]})
+        assert (df.memory_usage(index=False, deep='sample')['a'] ==
+                df.memory_usage(index=False, deep=True)['a'])
+
     @pytest.mark.skipif(not PYPY,
                         reason="on PyPy deep=True does not change result")
     def test_info_memory_usage_deep_pypy(self):
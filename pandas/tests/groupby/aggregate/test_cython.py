@@ -14,6 +14,7 @@ import pandas as pd
 
 from pandas import bdate_range, DataFrame, Index, Series
 from pandas.core.groupby import DataError
+from pandas._libs import groupby as libgroupby
 import pandas.util.testing as tm
 
 
@@ -187,3 +188,191 @@ def test_cython_agg_empty_buckets_nanops():
         {"a": [1, 1, 1716, 1]},
         index=pd.CategoricalIndex(intervals, name='a', ordered=True))
     tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize('op', ['sum', 'prod', 'mean', 'median', 'var',
+                                'min', 'max', 'first', 'last', 'count'])
+@pytest.mark.parametrize('nthreads', [2, 3, 20])
+def test_cython_agg_threads(op, nthreads):
+    df = DataFrame(np.random.randn(100, 7), columns=list('abcdefg'))
+    df.iloc[::3, 1] = nan
+    df['h'] = np.random.randint(0, 10, 100)
+    df['i'] = pd.date_range('20130101', periods=100)
+    df['key'] = np.random.randint(0, 5, 100)
+    grouped = df.groupby('key')
+
+    expected = getattr(grouped, op)()
+    with pd.option_context('compute.threads', nthreads):
+        result = getattr(grouped, op)()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_cython_agg_threads_min_count():
+    df = DataFrame({'a': [1., nan, 3., nan], 'b': [nan, nan, 2., 1.],
+                    'c': [1., 2., 3., 4.], 'key': [0, 0, 1, 1]})
+    expected = DataFrame({'a': [1., 3.], 'b': [nan, 3.], 'c': [3., 7.]},
+                         index=Index([0, 1], name='key'))
+    with pd.option_context('compute.threads', 2):
+        result = df.groupby('key').sum(min_count=1)
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize('funcs', [
+    ['sum', 'mean', 'std', 'count', 'min', 'max'],
+    ['first', 'last', 'var'],
+    ['count', 'sum'],
+])
+@pytest.mark.parametrize('keys', [['key'], ['key', 'key2']])
+def test_cython_agg_fused(funcs, keys):
+    df = DataFrame(np.random.randn(100, 3), columns=list('abc'))
+    df.iloc[::3, 1] = nan
+    df['d'] = np.random.randn(100).astype('float32')
+    df['key'] = np.random.randint(0, 10, 100)
+    df['key2'] = np.random.randint(0, 2, 100)
+    df.loc[5, 'key'] = nan
+    columns = ['a', 'b', 'c', 'd']
+    grouped = df[columns].groupby([df[key] for key in keys])
+
+    result = grouped.agg(funcs)
+    expected = pd.concat([DataFrame({func: getattr(grouped[col], func)()
+                                     for func in funcs}, columns=funcs)
+                          for col in columns], keys=columns, axis=1)
+    tm.assert_frame_equal(result, expected)
+
+    result = grouped['b'].agg(funcs)
+    tm.assert_frame_equal(result, expected['b'])
+
+    result = grouped.agg({'a': funcs, 'd': funcs})
+    tm.assert_frame_equal(result, expected[['a', 'd']])
+
+
+def test_cython_agg_fused_int():
+    df = DataFrame({'a': [1, 2, 3, 4, 5, 6], 'b': [1., 2., 3., 4., 5., 6.],
+                    'key': [0, 0, 0, 1, 1, 2]})
+    grouped = df.groupby('key')
+
+    result = grouped.agg(['sum', 'mean', 'var', 'std', 'count'])
+    expected = pd.concat([
+        DataFrame({'sum': grouped[col].sum(), 'mean': grouped[col].mean(),
+                   'var': grouped[col].var(), 'std': grouped[col].std(),
+                   'count': grouped[col].count()},
+                  columns=['sum', 'mean', 'var', 'std', 'count'])
+        for col in ['a', 'b']], keys=['a', 'b'], axis=1)
+    tm.assert_frame_equal(result, expected)
+    assert result[('a', 'sum')].dtype == np.int64
+
+    # min and max of integers are not computed through float64
+    result = grouped.agg(['min', 'max'])
+    assert result[('a', 'min')].dtype == np.int64
+
+
+def test_group_fused_float64():
+    values = np.random.randn(50, 3)
+    values[::4, 0] = nan
+    labels = np.random.randint(-1, 5, 50).astype(np.int64)
+    hows = ['count', 'add', 'mean', 'var', 'std', 'min', 'max', 'first',
+            'last']
+
+    out = np.empty((len(hows), 5, 3))
+    counts = np.zeros(5, dtype=np.int64)
+    codes = np.array([libgroupby.fused_hows[how] for how in hows],
+                     dtype=np.int64)
+    libgroupby.group_fused_float64(out, counts, values, labels, codes)
+
+    for i, how in enumerate(hows):
+        exp_counts = np.zeros(5, dtype=np.int64)
+        if how == 'count':
+            expected = np.array([(~np.isnan(values[labels == lab])).sum(0)
+                                 for lab in range(5)], dtype=np.float64)
+        elif how == 'std':
+            expected = np.empty((5, 3))
+            libgroupby.group_var_float64(expected, exp_counts, values,
+                                         labels)
+            expected = np.sqrt(expected)
+        else:
+            expected = np.empty((5, 3))
+            if how == 'first':
+                libgroupby.group_nth_float64(expected, exp_counts, values,
+                                             labels, 1)
+            else:
+                func = getattr(libgroupby, 'group_%s_float64' % how)
+                func(expected, exp_counts, values, labels)
+        tm.assert_numpy_array_equal(out[i], expected)
+    tm.assert_numpy_array_equal(counts, np.bincount(labels[labels >= 0],
+                                                    minlength=5))
+
+
+@pytest.mark.parametrize('interpolation', [
+    'linear', 'lower', 'higher', 'nearest', 'midpoint'])
+@pytest.mark.parametrize('q', [0, 0.1, 0.5, 0.75, 1])
+def test_cython_agg_quantile(interpolation, q):
+    df = DataFrame({'a': np.random.randint(0, 5, 100),
+                    'b': np.random.randn(100),
+                    'c': np.random.randint(0, 50, 100)})
+    df.loc[::7, 'b'] = nan
+    grouped = df.groupby('a')
+
+    result = grouped.quantile(q, interpolation=interpolation)
+    expected = grouped.apply(
+        lambda x: x.drop('a', axis=1).quantile(
+            q, interpolation=interpolation))
+    expected.columns.name = None
+    result.columns.name = None
+    # the rows of the applied quantiles are upcast to float64, only the
+    # interpolated quantiles of integers are floats
+    int_dtype = (np.float64 if interpolation in ('linear', 'midpoint')
+                 else np.int64)
+    expected['c'] = expected['c'].astype(int_dtype)
+    assert result['b'].dtype == np.float64
+    assert result['c'].dtype == int_dtype
+    tm.assert_frame_equal(result, expected)
+
+    for col in ['b', 'c']:
+        result = grouped[col].quantile(q, interpolation=interpolation)
+        expected = grouped[col].apply(
+            lambda x: x.quantile(q, interpolation=interpolation))
+        tm.assert_series_equal(result, expected)
+    assert result.dtype == int_dtype
+
+
+@pytest.mark.parametrize('interpolation', ['lower', 'higher', 'nearest'])
+def test_cython_agg_quantile_large_integers(interpolation):
+    # int64 beyond 2**53 is not exact as float64
+    s = Series([2 ** 53 + 1, 1, 2 ** 62 + 3, 2 ** 62 + 3])
+    grouped = s.groupby([0, 0, 1, 1])
+
+    result = grouped.quantile(1, interpolation=interpolation)
+    expected = Series([2 ** 53 + 1, 2 ** 62 + 3])
+    tm.assert_series_equal(result, expected)
+
+
+def test_cython_agg_quantile_invalid():
+    df = DataFrame({'a': [1, 1, 2], 'b': [1., 2., 3.]})
+    with tm.assert_raises_regex(ValueError, 'interpolation'):
+        df.groupby('a').quantile(interpolation='foo')
+
+
+@pytest.mark.parametrize('op_name', ['first', 'last', 'min', 'max'])
+def test_cython_agg_object_nan(op_name):
+    df = DataFrame({'a': [1, 1, 1, 2, 2, 3],
+                    'b': [nan, 'x', 'y', 'z', None, nan]})
+    grouped = df.groupby('a')
+
+    result = getattr(grouped, op_name)()
+    values = {'first': ['x', 'z', nan], 'last': ['y', 'z', nan],
+              'min': ['x', 'z', nan], 'max': ['y', 'z', nan]}[op_name]
+    expected = DataFrame({'b': values}, index=Index([1, 2, 3], name='a'))
+    tm.assert_frame_equal(result, expected)
+
+
+def test_group_nunique():
+    labels = np.array([0, 0, 1, 1, 1, -1, 2], dtype=np.int64)
+    codes = np.array([0, 0, 1, 2, -1, 3, -1], dtype=np.int64)
+
+    out = np.zeros(3, dtype=np.int64)
+    libgroupby.group_nunique(out, labels, codes)
+    tm.assert_numpy_array_equal(out, np.array([1, 2, 0], dtype=np.int64))
+
+    out = np.zeros(3, dtype=np.int64)
+    libgroupby.group_nunique(out, labels, codes, dropna=False)
+    tm.assert_numpy_array_equal(out, np.array([1, 3, 1], dtype=np.int64))
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+""" test groupby_chunks """
+
+import pytest
+
+import numpy as np
+
+import pandas as pd
+from pandas import DataFrame
+from pandas.core.groupby import DataError
+import pandas.util.testing as tm
+
+
+@pytest.fixture
+def frame():
+    np.random.seed(1234)
+    n = 1000
+    df = DataFrame({'key1': np.random.randint(0, 10, n),
+                    'key2': np.random.choice(['a', 'b', None], n),
+                    'float': np.random.randn(n),
+                    'int': np.random.randint(0, 50, n),
+                    'obj': np.random.choice(['x', 'y', 'z', None], n),
+                    'date': pd.Timestamp('2000') + pd.to_timedelta(
+                        np.random.randint(0, 1000, n), unit='D')})
+    df.loc[::7, 'float'] = np.nan
+    return df
+
+
+def _chunks(df, size):
+    return (df.iloc[i:i + size] for i in range(0, len(df), size))
+
+
+@pytest.mark.parametrize('by', ['key1', ['key1', 'key2']])
+@pytest.mark.parametrize('sort', [True, False])
+@pytest.mark.parametrize('size', [77, 1000])
+def test_groupby_chunks(frame, by, sort, size):
+    numeric = ['count', 'sum', 'mean', 'var', 'std', 'min', 'max', 'first',
+               'last', 'nunique']
+    agg = {'float': numeric, 'int': numeric,
+           'obj': ['count', 'min', 'max', 'first', 'last', 'nunique']}
+
+    result = pd.groupby_chunks(_chunks(frame, size), by=by, agg=agg,
+                               sort=sort)
+    expected = frame.groupby(by, sort=sort).agg(agg)
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize('agg', [
+    'sum', ['sum'], 'mean', ['mean', 'last'], ['count', 'min'], 'max',
+    {'float': 'std', 'int': 'max'},
+    {'float': ['min', 'count'], 'obj': 'nunique'}])
+def test_groupby_chunks_agg_spec(frame, agg):
+    # as with groupby, the columns that a string or a list does not apply
+    # to are dropped
+    df = frame.drop('key2', axis=1)
+    result = pd.groupby_chunks(_chunks(df, 100), by='key1', agg=agg)
+    expected = df.groupby('key1').agg(agg)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_groupby_chunks_all_missing():
+    chunks = [DataFrame({'key': [1, 2], 'value': [np.nan, 1.]}),
+              DataFrame({'key': [1, 3], 'value': [np.nan, 2.]})]
+    agg = ['count', 'sum', 'mean', 'var', 'min', 'first', 'nunique']
+
+    result = pd.groupby_chunks(chunks, by='key', agg=agg)
+    expected = pd.concat(chunks).groupby('key').agg(agg)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_groupby_chunks_invalid():
+    chunks = [DataFrame({'key': [1, 2], 'value': [1., 2.]})]
+
+    with tm.assert_raises_regex(ValueError, 'cannot aggregate chunks'):
+        pd.groupby_chunks(chunks, by='key', agg='median')
+
+    with pytest.raises(KeyError):
+        pd.groupby_chunks(chunks, by='key', agg={'other': 'sum'})
+
+    with tm.assert_raises_regex(ValueError, 'No chunks'):
+        pd.groupby_chunks([], by='key', agg='sum')
+
+    chunks = [DataFrame({'key': [1, 2], 'value': ['a', 'b']})]
+    with tm.assert_raises_regex(DataError, 'No numeric types'):
+        pd.groupby_chunks(chunks, by='key', agg='mean')
+
+
+@pytest.mark.parametrize('by', ['key', ['key', 'other']])
+def test_groupby_chunks_empty(by):
+    # e.g. a header-only csv read with a chunksize
+    df = DataFrame({'key': [1], 'other': ['a'], 'int': [1], 'float': [1.]})
+    chunks = [df.iloc[:0], df.iloc[:0]]
+    agg = {'float': ['sum', 'mean', 'first'],
+           'int': ['min', 'count', 'nunique']}
+
+    result = pd.groupby_chunks(chunks, by=by, agg=agg)
+    expected = pd.concat(chunks).groupby(by).agg(agg)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_groupby_chunks_index_by(frame):
+    result = pd.groupby_chunks(_chunks(frame, 100),
+                               by=pd.Index(['key1', 'key2']), agg='sum')
+    expected = frame.groupby(['key1', 'key2']).agg('sum')
+    tm.assert_frame_equal(result, expected)
+
+
+def test_groupby_chunks_mean_dtype():
+    # unlike groupby, the means of integers are always floats
+    df = DataFrame({'key': [1, 1, 2], 'value': [1, 3, 3]})
+
+    result = pd.groupby_chunks([df.iloc[:2], df.iloc[2:]], by='key',
+                               agg={'value': 'mean'})
+    expected = DataFrame({'value': [2., 3.]},
+                         index=pd.Index([1, 2], name='key'))
+    tm.assert_frame_equal(result, expected)
@@ -305,6 +305,45 @@ class TestGrouping(MixIn):
         expected = grouped.mean()
         tm.assert_frame_equal(result, expected)
 
+    def test_groupby_grouper_reuse(self):
+        grouped = self.df.groupby(['A', 'B'])
+        grouper = grouped.grouper
+
+        result = self.df.groupby(grouper).sum()
+        expected = grouped.sum()
+        tm.assert_frame_equal(result, expected)
+
+        result = self.df.groupby(grouper)[['C']].agg(['min', 'max'])
+        expected = grouped[['C']].agg(['min', 'max'])
+        tm.assert_frame_equal(result, expected)
+
+        result = self.df.groupby(grouper).apply(lambda x: x.D.sum())
+        expected = grouped.apply(lambda x: x.D.sum())
+        tm.assert_series_equal(result, expected)
+
+        # the labels and the sort indexer are computed once
+        assert self.df.groupby(grouper).grouper is grouper
+        sort_idx = grouper._sort_idx
+        self.df.groupby(grouper).apply(lambda x: x.D.sum())
+        assert grouper._sort_idx is sort_idx
+
+        # an aligned object
+        other = self.df[['C', 'D']] * 2
+        result = other.groupby(grouper).sum()
+        expected = grouped[['C', 'D']].sum() * 2
+        tm.assert_frame_equal(result, expected)
+
+        result = other['C'].groupby(grouper).sum()
+        tm.assert_series_equal(result, expected['C'])
+
+    def test_groupby_grouper_reuse_misaligned(self):
+        grouper = self.df.groupby('A').grouper
+
+        with tm.assert_raises_regex(ValueError, 'different axis'):
+            self.df.iloc[:4].groupby(grouper)
+        with tm.assert_raises_regex(ValueError, 'different axis'):
+            self.df.iloc[::-1].groupby(grouper)
+
     def test_groupby_dict_mapping(self):
         # GH #679
         from pandas import Series
@@ -425,6 +425,28 @@ class TestBlockManager(object):
         tm.assert_numpy_array_equal(mgr.get('d').internal_values(),
                                     np.array(['foo'] * 3, dtype=np.object_))
 
+    def test_append_items(self):
+        mgr = create_mgr('a,b: f8; c: i8', item_shape=(3, ))
+
+        mgr.append_items(['d', 'e', 'f'],
+                         [np.array([1., 2., 3.]), np.array([4, 5, 6]),
+                          np.array([7., 8., 9.])])
+        tm.assert_index_equal(mgr.items, Index(list('abcdef')))
+        assert mgr.nblocks == 4
+        tm.assert_numpy_array_equal(mgr.get('e').internal_values(),
+                                    np.array([4, 5, 6]))
+        tm.assert_numpy_array_equal(mgr.get('f').internal_values(),
+                                    np.array([7., 8., 9.]))
+        tm.assert_numpy_array_equal(mgr._blknos,
+                                    np.array([0, 0, 1, 2, 3, 2]))
+        tm.assert_numpy_array_equal(mgr._blklocs,
+                                    np.array([0, 1, 0, 0, 0, 1]))
+
+        pytest.raises(ValueError, mgr.append_items, ['g', 'a'],
+                      [np.zeros(3), np.zeros(3)])
+        pytest.raises(ValueError, mgr.append_items, ['g', 'g'],
+                      [np.zeros(3), np.zeros(3)])
+
     def test_set_change_dtype(self, mgr):
         mgr.set('baz', np.zeros(N, dtype=bool))
 
@@ -683,6 +705,78 @@ class TestBlockManager(object):
         tm.assert_numpy_array_equal(cons.blocks[0].mgr_locs.as_array,
                                     np.arange(len(cons.items), dtype=np.int64))
 
+    def test_consolidation_policy(self):
+        mgr = create_mgr('a: f8; b: i8')
+        for i in range(3):
+            mgr.set('c%d' % i, randn(N))
+        assert mgr.nblocks == 5
+
+        with pd.option_context('mode.consolidation', 'never'):
+            assert mgr.consolidate() is mgr
+            mgr._consolidate_inplace()
+            assert mgr.nblocks == 5
+
+        with pd.option_context('mode.consolidation', 'lazy',
+                               'mode.consolidation_max_blocks', 5):
+            mgr._consolidate_inplace()
+            assert mgr.nblocks == 5
+
+            # the sixth block goes over the threshold
+            mgr.set('d', randn(N))
+            assert mgr.nblocks == 2
+            assert mgr.is_consolidated()
+
+        assert mgr.consolidation_stats() == dict(merges=1, blocks_merged=5,
+                                                 bytes_copied=5 * N * 8,
+                                                 deferred=3)
+
+    def test_consolidation_policy_never_frame(self):
+        # the values, reductions and setitem of a frame do not merge its
+        # blocks under the 'never' policy
+        with pd.option_context('mode.consolidation', 'never'):
+            df = DataFrame({'a': np.arange(3.)})
+            for col in 'bcd':
+                df[col] = np.arange(3.)
+            df['e'] = np.arange(3)
+            assert df._data.nblocks == 5
+            assert df._is_mixed_type
+            assert not df[['a', 'b', 'c']]._is_mixed_type
+
+            expected = np.array([[i] * 5 for i in range(3)], dtype=float)
+            tm.assert_numpy_array_equal(df.values, expected)
+            tm.assert_numpy_array_equal(df[['a', 'b', 'c']].values,
+                                        expected[:, :3])
+            tm.assert_series_equal(df.sum(), Series(3., index=df.columns))
+
+            df.loc[1, 'b'] = 10.
+            df.loc[:, 'c'] = 5.
+            assert df['b'].tolist() == [0., 10., 2.]
+            assert df['c'].tolist() == [5., 5., 5.]
+
+            assert df._data.nblocks == 5
+            assert df._data.consolidation_stats()['merges'] == 0
+
+    def test_consolidation_policy_max_bytes(self):
+        mgr = create_mgr('a: f8; b: i8')
+        mgr.set('c', randn(N))
+        mgr.set('d', np.arange(N, dtype=np.int64))
+        mgr.set('e', randn(N))
+
+        with pd.option_context('mode.consolidation', 'lazy',
+                               'mode.consolidation_max_blocks', 0,
+                               'mode.consolidation_max_bytes', 2 * N * 8):
+            cons = mgr.consolidate()
+
+        assert cons.nblocks == 4
+        assert not cons.is_consolidated()
+        assert cons.consolidation_stats() == dict(merges=1, blocks_merged=2,
+                                                  bytes_copied=2 * N * 8,
+                                                  deferred=1)
+        assert_frame_equal(DataFrame(cons), DataFrame(mgr))
+
+        # the default policy merges every block
+        assert cons.consolidate().nblocks == 2
+
     def test_reindex_index(self):
         pass
 
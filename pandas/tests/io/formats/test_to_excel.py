@@ -5,7 +5,10 @@ ExcelFormatter is tested implicitly in pandas/tests/io/test_excel.py
 
 import pytest
 
-from pandas.io.formats.excel import CSSToExcelConverter
+import numpy as np
+
+import pandas as pd
+from pandas.io.formats.excel import CSSToExcelConverter, ExcelFormatter
 
 
 @pytest.mark.parametrize('css,expected', [
@@ -212,3 +215,54 @@ def test_css_to_excel_multiple():
 def test_css_to_excel_inherited(css, inherited, expected):
     convert = CSSToExcelConverter(inherited)
     assert expected == convert(css)
+
+
+@pytest.mark.parametrize('kwargs', [
+    {},
+    {'index': False},
+    {'float_format': '%.1f', 'inf_rep': 'INF'},
+    {'header': ['x', 'y', 'z', 'w']},
+])
+@pytest.mark.parametrize('index', [
+    pd.Index([10, 20, 30], name='idx'),
+    pd.period_range('2000', periods=3, freq='M'),
+    pd.MultiIndex.from_arrays([['a', 'b', 'c'], [1, 2, np.nan]],
+                              names=['l1', 'l2']),
+])
+def test_formatted_rows_match_cells(kwargs, index):
+    df = pd.DataFrame({'A': [1.5, np.nan, np.inf],
+                       'B': [1, 2, 3],
+                       'C': pd.date_range('2000', periods=3),
+                       'D': ['x', None, [1, 2]]},
+                      columns=['A', 'B', 'C', 'D'], index=index)
+
+    def by_position(cells):
+        return {(cell.row, cell.col): (cell.val, cell.style)
+                for cell in cells}
+
+    formatter = ExcelFormatter(df, na_rep='NA', **kwargs)
+    expected = by_position(formatter.get_formatted_cells())
+
+    formatter = ExcelFormatter(df, na_rep='NA', **kwargs)
+    assert formatter._can_format_rows()
+    cells, rows, firstrow, styles = formatter.get_formatted_rows(chunksize=2)
+    result = by_position(cells)
+    for rownum, row in enumerate(rows, firstrow):
+        for colnum, (val, style) in enumerate(zip(row, styles)):
+            result[rownum, colnum] = (val, style)
+
+    assert sorted(result) == sorted(expected)
+    for key, (val, style) in result.items():
+        if isinstance(expected[key][0], list):
+            assert val == str(expected[key][0])
+        else:
+            assert val == expected[key][0]
+        assert style == expected[key][1]
+
+
+def test_formatted_rows_not_used_for_merged_index():
+    index = pd.MultiIndex.from_arrays([['a', 'a'], [1, 2]])
+    df = pd.DataFrame({'A': [1, 2]}, index=index)
+    assert not ExcelFormatter(df, merge_cells=True)._can_format_rows()
+    assert ExcelFormatter(df, merge_cells=False)._can_format_rows()
+    assert ExcelFormatter(df, index=False, merge_cells=True)._can_format_rows()
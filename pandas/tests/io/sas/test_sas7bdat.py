@@ -108,6 +108,23 @@ class TestSAS7BDAT(object):
                     assert y == rdr.row_count
                     rdr.close()
 
+    @pytest.mark.parametrize('nthreads', [2, 3])
+    def test_nthreads(self, nthreads):
+        # the pages decoded in parallel give the records read serially,
+        # for the uncompressed, RLE and RDC files of both byte orders
+        for j in 0, 1:
+            df0 = self.data[j]
+            for k in self.test_ix[j]:
+                fname = os.path.join(
+                    self.dirpath, "test{k}.sas7bdat".format(k=k))
+                df = pd.read_sas(fname, encoding='utf-8', nthreads=nthreads)
+                tm.assert_frame_equal(df, df0)
+
+                rdr = pd.read_sas(fname, encoding='utf-8', chunksize=3,
+                                  nthreads=nthreads)
+                tm.assert_frame_equal(pd.concat(list(rdr)), df0)
+                rdr.close()
+
     def test_iterator_read_too_much(self):
         # github #14734
         k = self.test_ix[0][0]
@@ -191,3 +208,68 @@ def test_zero_variables():
     fname = os.path.join(dirpath, "zero_variables.sas7bdat")
     with pytest.raises(EmptyDataError):
         pd.read_sas(fname)
+
+
+@pytest.mark.parametrize('columns', [
+    ['Column2', 'Column4'],
+    ['Column12', 'Column1', 'Column3'],
+    ['Column5']])
+def test_columns(columns):
+    dirpath = tm.get_data_path()
+    fname = os.path.join(dirpath, "test1.sas7bdat")
+    expected = pd.read_sas(fname, encoding='utf-8')[columns]
+    result = pd.read_sas(fname, encoding='utf-8', columns=columns)
+    tm.assert_frame_equal(result, expected)
+
+    rdr = pd.read_sas(fname, encoding='utf-8', columns=columns,
+                      chunksize=4)
+    result = pd.concat(list(rdr))
+    rdr.close()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_columns_index():
+    dirpath = tm.get_data_path()
+    fname = os.path.join(dirpath, "test1.sas7bdat")
+    expected = pd.read_sas(fname, encoding='utf-8',
+                           index='Column1')[['Column2']]
+    result = pd.read_sas(fname, encoding='utf-8', index='Column1',
+                         columns=['Column2'])
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize('filename', ['productsales.sas7bdat',
+                                      'test_12659.sas7bdat'])
+def test_nthreads_pages(filename):
+    # files with many pages, read in chunks that straddle them
+    dirpath = tm.get_data_path()
+    fname = os.path.join(dirpath, filename)
+    expected = pd.read_sas(fname)
+
+    result = pd.read_sas(fname, nthreads=2)
+    tm.assert_frame_equal(result, expected)
+
+    rdr = pd.read_sas(fname, chunksize=7, nthreads=2,
+                      columns=expected.columns[::-2])
+    result = pd.concat(list(rdr))
+    rdr.close()
+    tm.assert_frame_equal(result, expected[expected.columns[::-2]])
+
+
+def test_nthreads_invalid():
+    dirpath = tm.get_data_path()
+    fname = os.path.join(dirpath, "test1.sas7bdat")
+    with tm.assert_raises_regex(ValueError, 'nthreads'):
+        pd.read_sas(fname, nthreads=0)
+    fname = os.path.join(dirpath, "DEMO_G.xpt")
+    with tm.assert_raises_regex(ValueError, 'nthreads'):
+        pd.read_sas(fname, nthreads=2)
+
+
+def test_columns_invalid():
+    dirpath = tm.get_data_path()
+    fname = os.path.join(dirpath, "test1.sas7bdat")
+    with tm.assert_raises_regex(ValueError, 'not found'):
+        pd.read_sas(fname, columns=['Column1', 'missing'])
+    with tm.assert_raises_regex(ValueError, 'duplicate'):
+        pd.read_sas(fname, columns=['Column1', 'Column1'])
@@ -128,6 +128,15 @@ class TestXport(object):
         data = read_sas(self.file03, encoding="utf-8")
         tm.assert_frame_equal(data, data_csv)
 
+    def test_multiple_types_chunks(self):
+        # Chunks of DRXFCD_G.xpt read with text and numeric variables
+        data_csv = pd.read_csv(self.file03.replace(".xpt", ".csv"))
+
+        reader = read_sas(self.file03, encoding="utf-8", chunksize=1000)
+        data = pd.concat(list(reader))
+        reader.close()
+        tm.assert_frame_equal(data, data_csv)
+
     def test_truncated_float_support(self):
         # Test with paxraw_d_short.xpt, a shortened version of:
         # http://wwwn.cdc.gov/Nchs/Nhanes/2005-2006/PAXRAW_D.ZIP
@@ -1,4 +1,5 @@
 # pylint: disable=E1101
+import gc
 import os
 import sys
 import warnings
@@ -149,13 +150,48 @@ class ReadingTestsBase(SharedItems):
     #    installed.
     # 2. Add a property ext, which is the file extension that your reader
     #    reades from. (needs to start with '.' so it's a valid path)
-    # 3. Add a property engine_name, which is the name of the reader class.
-    #    For the reader this is not used for anything at the moment.
+    # 3. Add a property engine_name, which is the name of the reader engine
+    #    passed to ExcelFile and read_excel.
 
     def setup_method(self, method):
         self.check_skip()
         super(ReadingTestsBase, self).setup_method(method)
 
+    def get_excelfile(self, basename):
+        return ExcelFile(os.path.join(self.dirpath, basename + self.ext),
+                         engine=self.engine_name)
+
+    def get_exceldf(self, basename, *args, **kwds):
+        kwds.setdefault('engine', self.engine_name)
+        return super(ReadingTestsBase, self).get_exceldf(basename, *args,
+                                                         **kwds)
+
+    def test_read_excel_chunksize(self):
+        expected = self.get_exceldf('test1', 'Sheet1', index_col=0)
+
+        reader = self.get_exceldf('test1', 'Sheet1', index_col=0,
+                                  chunksize=4)
+        chunks = list(reader)
+        assert [len(chunk) for chunk in chunks] == [4, 3]
+        tm.assert_frame_equal(pd.concat(chunks), expected)
+
+        reader = self.get_exceldf('test1', 'Sheet1', index_col=0,
+                                  chunksize=4, nrows=6)
+        tm.assert_frame_equal(pd.concat(list(reader)), expected.iloc[:6])
+
+        msg = 'single sheet'
+        with tm.assert_raises_regex(ValueError, msg):
+            self.get_exceldf('test1', sheet_name=None, chunksize=4)
+
+    def test_read_excel_skiprows_usecols_nrows(self):
+        expected = self.get_exceldf('test1', 'Sheet2', index_col=0,
+                                    skiprows=[1])
+        expected = expected[['A', 'C']].iloc[:3]
+        result = self.get_exceldf('test1', 'Sheet2', index_col=0,
+                                  skiprows=lambda x: x == 1,
+                                  usecols=[0, 1, 3], nrows=3)
+        tm.assert_frame_equal(result, expected)
+
     def test_usecols_int(self):
 
         dfref = self.get_csv_refdf('test1')
@@ -295,8 +331,12 @@ class ReadingTestsBase(SharedItems):
         df3 = excel.parse(0, index_col=0, skipfooter=1)
         tm.assert_frame_equal(df3, df1.iloc[:-1])
 
-        import xlrd
-        with pytest.raises(xlrd.XLRDError):
+        if self.engine_name == 'openpyxl':
+            error = KeyError
+        else:
+            import xlrd
+            error = xlrd.XLRDError
+        with pytest.raises(error):
             read_excel(excel, 'asdf')
 
     def test_excel_table(self):
@@ -421,6 +461,37 @@ class ReadingTestsBase(SharedItems):
         # Ensure sheet order is preserved
         assert expected_keys == list(dfs.keys())
 
+    def test_reading_all_sheets_processes(self):
+        # xlrd loads .xlsx workbooks as a whole, so their sheets are parsed
+        # serially
+        warning = None
+        if self.engine_name == 'xlrd' and self.ext != '.xls':
+            warning = UserWarning
+
+        basename = 'test_multisheet'
+        expected = self.get_exceldf(basename, sheet_name=None)
+        with tm.assert_produces_warning(warning, check_stacklevel=False):
+            result = self.get_exceldf(basename, sheet_name=None,
+                                      processes=2)
+        assert list(result.keys()) == list(expected.keys())
+        for key in expected:
+            tm.assert_frame_equal(result[key], expected[key])
+
+        with tm.assert_produces_warning(warning, check_stacklevel=False):
+            result = self.get_exceldf(basename, sheet_name=['Beta', 0],
+                                      index_col=0, processes=2)
+        expected = self.get_exceldf(basename, sheet_name=['Beta', 0],
+                                    index_col=0)
+        assert list(result.keys()) == ['Beta', 0]
+        for key in expected:
+            tm.assert_frame_equal(result[key], expected[key])
+
+        with open(os.path.join(self.dirpath, basename + self.ext),
+                  'rb') as f:
+            with tm.assert_raises_regex(ValueError, 'path'):
+                read_excel(f, sheet_name=None, engine=self.engine_name,
+                           processes=2)
+
     def test_reading_multiple_specific_sheets(self):
         # Test reading specific sheetnames by specifying a mixed list
         # of integers and strings, and confirm that duplicated sheet
@@ -573,6 +644,21 @@ class XlrdTests(ReadingTestsBase):
     are supported: xls, xlsx, xlsm
     """
 
+    def test_reading_all_sheets_processes_default_engine(self):
+        # .xlsx workbooks are parsed in processes with openpyxl when no
+        # engine is given
+        if self.ext != '.xls':
+            _skip_if_no_openpyxl()
+
+        basename = 'test_multisheet'
+        pth = os.path.join(self.dirpath, basename + self.ext)
+        expected = self.get_exceldf(basename, sheet_name=None)
+        with tm.assert_produces_warning(None):
+            result = read_excel(pth, sheet_name=None, processes=2)
+        assert list(result.keys()) == list(expected.keys())
+        for key in expected:
+            tm.assert_frame_equal(result[key], expected[key])
+
     def test_excel_read_buffer(self):
 
         pth = os.path.join(self.dirpath, 'test1' + self.ext)
@@ -961,12 +1047,6 @@ class XlrdTests(ReadingTestsBase):
                 pd.read_excel(os.path.join(self.dirpath, 'test1' + self.ext),
                               header=arg)
 
-    def test_read_excel_chunksize(self):
-        # GH 8011
-        with pytest.raises(NotImplementedError):
-            pd.read_excel(os.path.join(self.dirpath, 'test1' + self.ext),
-                          chunksize=100)
-
     def test_read_excel_parse_dates(self):
         # GH 11544, 12051
         _skip_if_no_openpyxl()
@@ -1077,6 +1157,23 @@ class TestXlsmReaderTests(XlrdTests):
     check_skip = staticmethod(_skip_if_no_xlrd)
 
 
+class TestOpenpyxlReaderTests(ReadingTestsBase):
+    ext = '.xlsx'
+    engine_name = 'openpyxl'
+    check_skip = staticmethod(_skip_if_no_openpyxl)
+
+    @pytest.mark.parametrize('chunksize', [None, 4])
+    def test_read_excel_closes_file(self, chunksize):
+        # the files opened for the workbook are closed once it is read
+        with tm.assert_produces_warning(None):
+            result = self.get_exceldf('test1', 'Sheet1', index_col=0,
+                                      chunksize=chunksize)
+            if chunksize is not None:
+                list(result)
+            del result
+            gc.collect()
+
+
 class ExcelWriterBase(SharedItems):
     # Base class for test cases to run with different Excel writers.
     # To add a writer test, define the following:
@@ -2100,6 +2197,38 @@ class TestOpenpyxlTests(ExcelWriterBase):
             assert xcell_b1.font == openpyxl_sty_merged
             assert xcell_a2.font == openpyxl_sty_merged
 
+    def test_write_only(self):
+        frame = DataFrame({'A': [1.5, np.nan, 3.5], 'B': ['x', 'y', 'z'],
+                           'C': pd.date_range('2000', periods=3)},
+                          index=Index([1, 2, 3], name='idx'))
+        with ensure_clean(self.ext) as path:
+            with ExcelWriter(path, write_only=True) as writer:
+                assert writer.write_only
+                frame.to_excel(writer, 'Sheet1', freeze_panes=(1, 1))
+                frame.to_excel(writer, 'Sheet1', startrow=5, header=False)
+                frame.to_excel(writer, 'Sheet2', startrow=1, startcol=2)
+
+            result = read_excel(path, 'Sheet1', index_col=0, nrows=3)
+            tm.assert_frame_equal(result, frame)
+            result = read_excel(path, 'Sheet1', index_col=0, header=None,
+                                skiprows=5)
+            result.columns = frame.columns
+            tm.assert_frame_equal(result, frame, check_names=False)
+            result = read_excel(path, 'Sheet2', index_col=0, header=1,
+                                usecols=[2, 3, 4, 5])
+            tm.assert_frame_equal(result, frame)
+
+    def test_write_only_raises(self):
+        frame = DataFrame({'A': [1, 2]},
+                          index=MultiIndex.from_tuples([('a', 1), ('a', 2)]))
+        with ensure_clean(self.ext) as path:
+            writer = ExcelWriter(path, write_only=True)
+            frame.to_excel(writer, 'Sheet1', startrow=5, merge_cells=False)
+            with tm.assert_raises_regex(ValueError, 'in order'):
+                frame.to_excel(writer, 'Sheet1', merge_cells=False)
+            with tm.assert_raises_regex(ValueError, 'merged cells'):
+                frame.to_excel(writer, 'Sheet2', merge_cells=True)
+
 
 class TestXlwtTests(ExcelWriterBase):
     ext = '.xls'
@@ -2210,6 +2339,24 @@ class TestXlsxWriterTests(ExcelWriterBase):
 
             assert read_num_format == num_format
 
+    def test_constant_memory(self):
+        # the rows must be written in order in constant_memory mode
+        frame = DataFrame({'A': [1.5, np.nan, 3.5], 'B': ['x', 'y', 'z'],
+                           'C': pd.date_range('2000', periods=3)},
+                          index=MultiIndex.from_tuples(
+                              [('a', 1), ('a', 2), ('b', 1)],
+                              names=['l1', 'l2']))
+        with ensure_clean(self.ext) as path:
+            with ExcelWriter(path,
+                             options={'constant_memory': True}) as writer:
+                frame.to_excel(writer, merge_cells=False)
+                frame.reset_index().to_excel(writer, 'Sheet2', index=False)
+
+            result = read_excel(path, index_col=[0, 1])
+            tm.assert_frame_equal(result, frame)
+            result = read_excel(path, 'Sheet2')
+            tm.assert_frame_equal(result, frame.reset_index())
+
 
 class TestOpenpyxlTests_NoMerge(ExcelWriterBase):
     ext = '.xlsx'
@@ -140,3 +140,53 @@ class TestFeather(object):
         df = tm.makeDataFrame().reset_index()
         result = tm.round_trip_localpath(df.to_feather, pd.read_feather)
         tm.assert_frame_equal(df, result)
+
+    def test_read_columns(self):
+
+        df = pd.DataFrame({'col1': list('abc'),
+                           'col2': list(range(1, 4)),
+                           'col3': list('xyz'),
+                           'col4': list(range(4, 7))})
+        columns = ['col1', 'col3']
+        with ensure_clean() as path:
+            to_feather(df, path)
+            result = read_feather(path, columns=columns)
+            assert_frame_equal(result, df[columns])
+
+    def test_memory_map(self):
+        pyarrow = pytest.importorskip('pyarrow')
+        if LooseVersion(pyarrow.__version__) < LooseVersion('0.8.0'):
+            pytest.skip('pyarrow >= 0.8.0 required')
+
+        df = pd.DataFrame({'int': np.arange(5, dtype='int64'),
+                           'float': np.arange(5, dtype='float64'),
+                           'float_with_null': [1., np.nan, 3., 4., 5.],
+                           'string': list('abcde'),
+                           'dt': pd.date_range('20130101', periods=5)})
+        with ensure_clean() as path:
+            to_feather(df, path)
+            result = read_feather(path, memory_map=True)
+            assert_frame_equal(result, df)
+
+            # numeric columns without nulls are read-only views
+            assert not result['int'].values.flags.writeable
+            assert not result['float'].values.flags.writeable
+            assert result['float_with_null'].values.flags.writeable
+
+            # setting values copies the read-only columns
+            result.iloc[0, result.columns.get_loc('int')] = 10
+            result.loc[result['float'] > 2, 'float'] = 0.
+            result['float'] += 1.
+            expected = df.copy()
+            expected.loc[0, 'int'] = 10
+            expected['float'] = [1., 2., 3., 1., 1.]
+            assert_frame_equal(result, expected)
+            assert result['int'].values.flags.writeable
+            assert_frame_equal(read_feather(path, memory_map=True), df)
+
+            result = read_feather(path, memory_map=True,
+                                  columns=['string', 'int'])
+            assert_frame_equal(result, df[['string', 'int']])
+
+            with pytest.raises(KeyError):
+                read_feather(path, memory_map=True, columns=['missing'])
@@ -24,7 +24,7 @@ from numpy.random import rand
 from pandas import (DataFrame, MultiIndex, read_csv, Timestamp, Index,
                     date_range, Series)
 from pandas.compat import (map, zip, StringIO, string_types, BytesIO,
-                           is_platform_windows, PY3)
+                           is_platform_windows, PY3, u)
 from pandas.io.common import URLError, urlopen, file_path_to_url
 import pandas.io.html
 from pandas.io.html import read_html
@@ -890,6 +890,125 @@ class TestReadHtmlLxml(ReadHtmlMixin):
         self.read_html(data, header=[0, 1])
 
 
+class TestReadHtmlIterparse(ReadHtmlMixin):
+    flavor = 'lxml'
+
+    @classmethod
+    def setup_class(cls):
+        _skip_if_no('lxml')
+
+    def read_html(self, *args, **kwargs):
+        kwargs.setdefault('iterparse', True)
+        return super(TestReadHtmlIterparse, self).read_html(*args, **kwargs)
+
+    @pytest.mark.parametrize('filename', ['valid_markup.html',
+                                          'wikipedia_states.html',
+                                          'computer_sales_page.html'])
+    def test_same_as_lxml(self, filename):
+        path = os.path.join(DATA_PATH, filename)
+        expected = read_html(path, flavor='lxml')
+        result = self.read_html(path)
+        assert_framelist_equal(result, expected)
+
+    def test_recovers_invalid_markup(self):
+        # iterparse uses lxml's recovering parser
+        banklist_data = os.path.join(DATA_PATH, 'banklist.html')
+        df = self.read_html(banklist_data, 'Metcalf',
+                            attrs={'id': 'table'})[0]
+        assert df.shape == (505, 7)
+
+    @pytest.mark.parametrize('reader', [
+        lambda text: text,
+        lambda text: text.encode('utf-8'),
+        lambda text: StringIO(text),
+        lambda text: BytesIO(text.encode('utf-8'))])
+    def test_inputs(self, reader):
+        df = DataFrame({'A': [1, 2], 'B': [u('\u2018x'), 'y']})
+        result = self.read_html(reader(df.to_html()), index_col=0)
+        tm.assert_frame_equal(result[0], df)
+
+    def test_match_and_attrs(self):
+        data = """
+        <table id="a"><tr><td>x</td><td>1</td></tr></table>
+        <p>some text</p>
+        <table id="b"><caption>numbers</caption>
+          <tr><td>y</td><td>2</td></tr></table>
+        <table id="b"><tr><td>z</td><td>3</td></tr></table>
+        """
+        result = self.read_html(data, match='numbers')
+        assert_framelist_equal(result, [DataFrame([['y', 2]])])
+        result = self.read_html(data, attrs={'id': 'b'})
+        assert_framelist_equal(result, [DataFrame([['y', 2]]),
+                                        DataFrame([['z', 3]])])
+        with tm.assert_raises_regex(ValueError, 'No tables found'):
+            self.read_html(data, match='numbers', attrs={'id': 'a'})
+
+    def test_match_inline_tags(self):
+        # the text following inline tags is matched as well
+        data = """
+        <table><tr><td>x</td><td>1</td></tr></table>
+        <table>
+          <tr><td><b>id</b> target</td><td>2</td></tr>
+          <tr><td><i>a</i>b</td><td>3</td></tr>
+        </table>
+        """
+        for match in ['target', 'b']:
+            result = self.read_html(data, match=match)
+            expected = read_html(data, match=match, flavor='lxml')
+            assert_framelist_equal(result, expected)
+            assert len(result) == 1
+
+    def test_markup_outside_tables(self):
+        # the elements outside of tables are discarded while parsing
+        data = """
+        <div><p>before <b>x</b></p><tr><td>stray</td></tr></div>
+        <div><div><table><tr><td>a</td><td>1</td></tr></table></div>
+        <p>between</p></div>
+        <ul><li>c</li><li>d</li></ul>
+        <table><tr><td>b</td><td>2</td></tr></table>
+        """
+        result = self.read_html(data)
+        expected = read_html(data, flavor='lxml')
+        assert_framelist_equal(result, expected)
+        assert len(result) == 2
+
+    def test_nested_tables(self):
+        # the outer table is returned first and holds the nested rows
+        data = """
+        <table>
+          <tbody>
+            <tr><td>a</td><td>1</td></tr>
+            <tr><td><table><tbody><tr><td>b</td><td>2</td></tr></tbody>
+            </table></td></tr>
+            <tr><td>c</td><td>3</td></tr>
+          </tbody>
+        </table>
+        """
+        result = self.read_html(data)
+        expected = read_html(data, flavor='lxml')
+        assert len(result) == 2
+        assert_framelist_equal(result, expected)
+
+    def test_thead_tfoot(self):
+        data = """
+        <table>
+          <thead><tr><th>A</th><th>B</th></tr></thead>
+          <tbody><tr><td>1</td><td>2</td></tr>
+                 <tr><td>3</td><td>4</td></tr></tbody>
+          <tfoot><tr><td>5</td><td>6</td></tr></tfoot>
+        </table>
+        """
+        result = self.read_html(data)
+        expected = read_html(data, flavor='lxml')
+        assert_framelist_equal(result, expected)
+
+    def test_invalid_flavor(self):
+        with tm.assert_raises_regex(ValueError, 'lxml'):
+            self.read_html('<table></table>', flavor='bs4')
+        with tm.assert_raises_regex(ValueError, 'lxml'):
+            self.read_html('<table></table>', flavor=['lxml', 'bs4'])
+
+
 def test_invalid_flavor():
     url = 'google.com'
     with pytest.raises(ValueError):
@@ -551,6 +551,40 @@ class TestNDFrame(TestPackers):
         assert_frame_equal(result_2, expected_2)
         assert_frame_equal(result_3, expected_3)
 
+    def test_no_copy(self):
+
+        for s, i in self.frame.items():
+            with ensure_clean(self.path) as path:
+                to_msgpack(path, i)
+                i_rec = read_msgpack(path, copy=False)
+            assert_frame_equal(i, i_rec)
+
+            # non-object blocks are read-only views
+            for block in i_rec._data.blocks:
+                if (isinstance(block.values, np.ndarray) and
+                        not block.is_object):
+                    assert not block.values.flags.writeable
+
+        with ensure_clean(self.path) as path:
+            to_msgpack(path, *self.frame.values())
+            for i, packed in enumerate(read_msgpack(path, iterator=True,
+                                                    copy=False)):
+                assert_frame_equal(packed, list(self.frame.values())[i])
+
+    def test_no_copy_compressed(self):
+
+        if not _ZLIB_INSTALLED:
+            pytest.skip('no zlib')
+
+        i = self.frame['float']
+        packed = to_msgpack(None, i, compress='zlib')
+        i_rec = read_msgpack(packed, copy=False)
+        assert_frame_equal(i, i_rec)
+
+        # decompressed data is always a new, writeable array
+        for block in i_rec._data.blocks:
+            assert block.values.flags.writeable
+
 
 class TestSparse(TestPackers):
 
@@ -648,7 +682,8 @@ class TestCompression(TestPackers):
             pytest.skip('no blosc')
         self._test_compression('blosc')
 
-    def _test_compression_warns_when_decompress_caches(self, compress):
+    def _test_compression_warns_when_decompress_caches(self, compress,
+                                                       copy=True):
         not_garbage = []
         control = []  # copied data
 
@@ -676,7 +711,9 @@ class TestCompression(TestPackers):
         with patch(compress_module, 'decompress', decompress), \
                 tm.assert_produces_warning(PerformanceWarning) as ws:
 
-            i_rec = self.encode_decode(self.frame, compress=compress)
+            with ensure_clean(self.path) as p:
+                to_msgpack(p, self.frame, compress=compress)
+                i_rec = read_msgpack(p, copy=copy)
             for k in self.frame.keys():
 
                 value = i_rec[k]
@@ -705,6 +742,13 @@ class TestCompression(TestPackers):
             pytest.skip('no zlib')
         self._test_compression_warns_when_decompress_caches('zlib')
 
+    def test_compression_warns_when_decompress_caches_no_copy(self):
+        # the copy made after decompressing is writeable with copy=False
+        if not _ZLIB_INSTALLED:
+            pytest.skip('no zlib')
+        self._test_compression_warns_when_decompress_caches('zlib',
+                                                            copy=False)
+
     def test_compression_warns_when_decompress_caches_blosc(self):
         if not _BLOSC_INSTALLED:
             pytest.skip('no blosc')
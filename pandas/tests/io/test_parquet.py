@@ -9,7 +9,7 @@ import numpy as np
 import pandas as pd
 from pandas.compat import PY3, is_platform_windows, is_platform_mac
 from pandas.io.parquet import (to_parquet, read_parquet, get_engine,
-                               PyArrowImpl, FastParquetImpl)
+                               PyArrowImpl, FastParquetImpl, ParquetWriter)
 from pandas.util import testing as tm
 
 try:
@@ -361,6 +361,54 @@ class TestBasic(Base):
                 expected = df[['A', 'B']]
                 tm.assert_frame_equal(result, expected)
 
+    def test_writer_chunks(self, engine):
+        df = pd.DataFrame({'A': np.arange(10, dtype='int64'),
+                           'B': np.arange(10, dtype='float64'),
+                           'C': list('abcdefghij')})
+
+        with tm.ensure_clean() as path:
+            with ParquetWriter(path, engine, compression=None) as writer:
+                for i in range(0, len(df), 4):
+                    writer.write(df.iloc[i:i + 4])
+            result = read_parquet(path, engine)
+
+        tm.assert_frame_equal(result.reset_index(drop=True), df)
+
+    def test_writer_row_group_size(self, engine):
+        df = pd.DataFrame({'A': np.arange(10, dtype='int64')})
+
+        with tm.ensure_clean() as path:
+            with ParquetWriter(path, engine, compression=None,
+                               row_group_size=2) as writer:
+                writer.write(df.iloc[:6])
+                writer.write(df.iloc[6:])
+            result = read_parquet(path, engine)
+
+        tm.assert_frame_equal(result.reset_index(drop=True), df)
+
+    def test_writer_schema_mismatch(self, engine):
+        df = pd.DataFrame({'A': [1, 2, 3]})
+
+        with tm.ensure_clean() as path:
+            with ParquetWriter(path, engine, compression=None) as writer:
+                writer.write(df)
+                with pytest.raises(ValueError):
+                    writer.write(df.astype('float64'))
+                with pytest.raises(ValueError):
+                    writer.write(df.rename(columns={'A': 'B'}))
+
+    def test_writer_closed(self, engine):
+        df = pd.DataFrame({'A': [1, 2, 3]})
+
+        with tm.ensure_clean() as path:
+            writer = ParquetWriter(path, engine, compression=None)
+            writer.write(df)
+            writer.close()
+            # closing twice is a no-op
+            writer.close()
+            with pytest.raises(ValueError):
+                writer.write(df)
+
 
 class TestParquetPyArrow(Base):
 
@@ -478,6 +526,12 @@ class TestParquetFastParquet(Base):
             self.check_round_trip(df, fp, df.astype('datetime64[ns]'),
                                   write_kwargs={'compression': None})
 
+    def test_writer_buffer_unsupported(self, fp):
+        df = pd.DataFrame({'A': [1, 2, 3]})
+        writer = ParquetWriter(pd.compat.BytesIO(), fp, compression=None)
+        with pytest.raises(ValueError):
+            writer.write(df)
+
     def test_filter_row_groups(self, fp):
         d = {'a': list(range(0, 3))}
         df = pd.DataFrame(d)
@@ -18,9 +18,11 @@ from warnings import catch_warnings
 
 import os
 from distutils.version import LooseVersion
+import numpy as np
 import pandas as pd
 from pandas import Index
 from pandas.compat import is_platform_little_endian
+from pandas.io.pickle import to_pickle_buffers, read_pickle_buffers
 import pandas
 import pandas.util.testing as tm
 import pandas.util._test_decorators as td
@@ -527,3 +529,51 @@ class TestProtocol(object):
             with tm.ensure_clean(get_random_path) as path:
                 df = tm.makeDataFrame()
                 df.to_pickle(path, protocol=protocol)
+
+
+# ---------------------
+# test out-of-band buffers
+# ---------------------
+
+class TestBuffers(object):
+
+    def round_trip(self, obj, **kwargs):
+        header, buffers = to_pickle_buffers(obj, **kwargs)
+        return read_pickle_buffers(header, [bytes(b) for b in buffers])
+
+    @pytest.mark.parametrize('protocol', [-1, 0, 1, 2])
+    def test_round_trip(self, protocol):
+        df = tm.makeMixedDataFrame()
+        df['E'] = pd.date_range('20130101', periods=5, tz='US/Eastern')
+        df['F'] = pd.Categorical(list('aabbc'))
+        tm.assert_frame_equal(self.round_trip(df, protocol=protocol), df)
+
+        s = tm.makeTimeSeries()
+        tm.assert_series_equal(self.round_trip(s, protocol=protocol), s)
+
+        df = pd.DataFrame()
+        tm.assert_frame_equal(self.round_trip(df, protocol=protocol), df)
+
+    def test_buffers_zero_copy(self):
+        df = pd.DataFrame(np.random.randn(100, 3), columns=list('abc'))
+        df['d'] = 'foo'
+
+        header, buffers = to_pickle_buffers(df)
+
+        # the float block is out-of-band, the object block in-band
+        values = df._data.blocks[0].values
+        assert any(b.nbytes == values.nbytes for b in buffers)
+        assert len(header) < values.nbytes
+
+        data = [bytearray(b) for b in buffers]
+        result = read_pickle_buffers(header, data)
+        tm.assert_frame_equal(result, df)
+
+        # the result is a view onto the passed buffers
+        loc = [b.nbytes for b in buffers].index(values.nbytes)
+        data[loc][:8] = np.array([42.], dtype=values.dtype).tobytes()
+        assert (result[['a', 'b', 'c']].values == 42.).sum() == 1
+
+    def test_non_contiguous(self):
+        s = pd.Series(np.arange(20.)[::2])
+        tm.assert_series_equal(self.round_trip(s), s)
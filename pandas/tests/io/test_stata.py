@@ -20,7 +20,8 @@ from pandas.core.dtypes.common import is_categorical_dtype
 from pandas.core.frame import DataFrame, Series
 from pandas.io.parsers import read_csv
 from pandas.io.stata import (read_stata, StataReader, InvalidColumnName,
-                             PossiblePrecisionLoss, StataMissingValue)
+                             PossiblePrecisionLoss, StataMissingValue,
+                             StataStreamWriter)
 
 
 @pytest.fixture
@@ -1122,6 +1123,30 @@ class TestStata(object):
                 tm.assert_frame_equal(from_frame, chunk, check_dtype=False)
                 pos += chunksize
 
+    @pytest.mark.parametrize(
+        'file, convert_missing',
+        [('dta1_114', False), ('dta1_117', False), ('dta2_115', False),
+         ('dta4_117', False), ('dta16_117', False), ('dta22_118', False),
+         ('dta17_117', False), ('dta17_117', True)])
+    def test_read_columns_projection(self, file, convert_missing):
+        fname = getattr(self, file)
+
+        with warnings.catch_warnings(record=True):
+            parsed = read_stata(fname, convert_missing=convert_missing)
+            columns = list(parsed.columns[::-2])
+
+            result = read_stata(fname, convert_missing=convert_missing,
+                                columns=columns)
+            tm.assert_frame_equal(result, parsed[columns], check_dtype=False)
+
+            # selecting columns does not change the reader's metadata
+            with StataReader(fname) as sr:
+                varlist = list(sr.varlist)
+                typlist = list(sr.typlist)
+                sr.read(columns=columns)
+                assert sr.varlist == varlist
+                assert sr.typlist == typlist
+
     def test_write_variable_labels(self):
         # GH 13631, add support for writing variable labels
         original = pd.DataFrame({'a': [1, 2, 3, 4],
@@ -1348,3 +1373,72 @@ class TestStata(object):
         unformatted = df.loc[0, column]
         formatted = df.loc[0, column + "_fmt"]
         assert unformatted == formatted
+
+    @pytest.mark.parametrize('write_index', [True, False])
+    def test_stream_writer(self, write_index):
+        df = DataFrame({'ints': np.arange(10, dtype=np.int64),
+                        'floats': np.linspace(0, 1, 10),
+                        'strs': ['a', 'bb', 'ccc', 'd', 'e',
+                                 'f', 'g', 'h', 'i', 'j'],
+                        'cats': pd.Categorical(list('xyzxyzxyzx')),
+                        'dates': pd.date_range('2000-01-01', periods=10)},
+                       columns=['ints', 'floats', 'strs', 'cats', 'dates'])
+        df.index.name = 'index'
+        chunks = [df.iloc[:4], df.iloc[4:7], df.iloc[7:]]
+        with tm.ensure_clean() as path:
+            df.to_stata(path, write_index=write_index,
+                        convert_dates={'dates': 'td'})
+            expected = read_stata(path)
+        with tm.ensure_clean() as path:
+            with StataStreamWriter(path, write_index=write_index,
+                                   convert_dates={'dates': 'td'}) as writer:
+                for chunk in chunks:
+                    writer.write(chunk)
+            result = read_stata(path)
+        tm.assert_frame_equal(result, expected)
+
+    def test_stream_writer_casts_narrower_chunks(self):
+        first = DataFrame({'a': np.array([1000, 2000], dtype=np.int16),
+                           'b': [1.5, 2.5],
+                           'c': ['abcd', 'efgh']})
+        second = DataFrame({'a': np.array([1, 2], dtype=np.int8),
+                            'b': [1, 2], 'c': ['a', 'b']})
+        with tm.ensure_clean() as path:
+            with StataStreamWriter(path, write_index=False) as writer:
+                writer.write(first)
+                writer.write(second)
+            result = read_stata(path)
+        expected = pd.concat([first, second], ignore_index=True)
+        tm.assert_frame_equal(result, expected)
+
+    def test_stream_writer_invalid_chunks(self):
+        first = DataFrame({'a': np.array([1, 2], dtype=np.int32),
+                           'b': ['x', 'y'],
+                           'c': pd.Categorical(['p', 'q'])})
+        with tm.ensure_clean() as path:
+            with StataStreamWriter(path, write_index=False) as writer:
+                writer.write(first)
+
+                msg = 'same columns'
+                with tm.assert_raises_regex(ValueError, msg):
+                    writer.write(first[['a', 'b']])
+
+                wider = first.copy()
+                wider['a'] = [2 ** 40, 2]
+                with tm.assert_raises_regex(ValueError, 'wider type'):
+                    writer.write(wider)
+
+                longer = first.copy()
+                longer['b'] = ['xyz', 'y']
+                with tm.assert_raises_regex(ValueError, 'wider type'):
+                    writer.write(longer)
+
+                recoded = first.copy()
+                recoded['c'] = pd.Categorical(['p', 'r'])
+                with tm.assert_raises_regex(ValueError, 'categories'):
+                    writer.write(recoded)
+
+            with tm.assert_raises_regex(ValueError, 'closed'):
+                writer.write(first)
+            result = read_stata(path, order_categoricals=False)
+        tm.assert_frame_equal(result, first)
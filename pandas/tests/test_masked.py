@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import numpy as np
+import pandas as pd
+from pandas import Series, DataFrame, Index, concat
+from pandas.core.internals import MaskedBlock
+from pandas.core.masked import MaskedArray
+import pandas.util.testing as tm
+
+
+class TestMaskedArray(object):
+
+    def test_constructor(self):
+        arr = MaskedArray([1, None, 3])
+        assert arr.dtype == 'Int64'
+        tm.assert_numpy_array_equal(arr._data,
+                                    np.array([1, 0, 3], dtype=np.int64))
+        tm.assert_numpy_array_equal(arr._mask, np.array([False, True,
+                                                         False]))
+
+        arr = MaskedArray(np.array([1, 2, 3], dtype=np.uint8),
+                          mask=[False, False, True])
+        assert arr.dtype == 'UInt8'
+        assert arr.isna().tolist() == [False, False, True]
+
+        arr = MaskedArray([True, None, False])
+        assert arr.dtype == 'Bool'
+
+        arr = MaskedArray([1.0, np.nan, 3.0], dtype='Int16')
+        assert arr.dtype == 'Int16'
+        assert arr._data.dtype == np.int16
+
+    def test_constructor_invalid(self):
+        pytest.raises(TypeError, MaskedArray, [1.5, 2])
+        pytest.raises(TypeError, MaskedArray, ['a', 'b'])
+        pytest.raises(TypeError, MaskedArray, [300, 1], dtype='Int8')
+        pytest.raises(ValueError, MaskedArray, [1, 2], dtype='float64')
+        pytest.raises(ValueError, MaskedArray, [1, 2], mask=[True])
+        pytest.raises(ValueError, MaskedArray, np.zeros((2, 2)))
+
+    def test_to_dense(self):
+        arr = MaskedArray([1, 2, 3], dtype='Int8')
+        tm.assert_numpy_array_equal(arr.to_dense(),
+                                    np.array([1, 2, 3], dtype=np.int8))
+
+        arr = MaskedArray([1, None, 3], dtype='Int8')
+        tm.assert_numpy_array_equal(arr.to_dense(),
+                                    np.array([1, np.nan, 3]))
+
+        arr = MaskedArray([True, None])
+        tm.assert_numpy_array_equal(arr.to_dense(),
+                                    np.array([True, np.nan], dtype=object))
+
+    def test_astype(self):
+        arr = MaskedArray([1, None, 3], dtype='Int8')
+        result = arr.astype('Int64')
+        assert result.dtype == 'Int64'
+        tm.assert_numpy_array_equal(result.isna(), arr.isna())
+
+        tm.assert_numpy_array_equal(arr.astype('float32'),
+                                    np.array([1, np.nan, 3],
+                                             dtype=np.float32))
+        pytest.raises(ValueError, arr.astype, 'int64')
+        tm.assert_numpy_array_equal(arr[[0, 2]].astype('int64'),
+                                    np.array([1, 3], dtype=np.int64))
+
+    def test_take_nd(self):
+        arr = MaskedArray([1, None, 3], dtype='Int8')
+
+        result = arr.take_nd(np.array([2, -1, 0]))
+        assert result.dtype == 'Int8'
+        assert result.isna().tolist() == [False, True, False]
+        tm.assert_numpy_array_equal(result.to_dense(),
+                                    np.array([3, np.nan, 1]))
+
+        result = arr.take_nd(np.array([2, -1, 0]), fill_value=5)
+        tm.assert_numpy_array_equal(result.to_dense(),
+                                    np.array([3, 5, 1], dtype=np.int8))
+
+    def test_setitem(self):
+        arr = MaskedArray([1, None, 3], dtype='Int8')
+        arr[1] = 2
+        arr[0] = np.nan
+        assert arr.isna().tolist() == [True, False, False]
+        tm.assert_numpy_array_equal(arr._data[1:],
+                                    np.array([2, 3], dtype=np.int8))
+
+        with pytest.raises(TypeError):
+            arr[0] = 1.5
+
+    def test_unique_argsort(self):
+        arr = MaskedArray([3, None, 1, 3], dtype='Int8')
+        result = arr.unique()
+        assert result.dtype == 'Int8'
+        assert result.isna().tolist() == [False, True, False]
+        tm.assert_numpy_array_equal(result._data[[0, 2]],
+                                    np.array([3, 1], dtype=np.int8))
+
+        tm.assert_numpy_array_equal(arr.argsort(),
+                                    np.array([2, 0, 3, 1]))
+
+    def test_concat(self):
+        a = MaskedArray([1, None], dtype='Int8')
+        b = MaskedArray([None, 300], dtype='Int16')
+        result = pd.core.dtypes.concat._concat_compat([a, b])
+        assert result.dtype == 'Int16'
+        assert result.isna().tolist() == [False, True, True, False]
+
+        result = pd.core.dtypes.concat._concat_compat(
+            [a, np.array([1.5, 2.5])])
+        tm.assert_numpy_array_equal(result,
+                                    np.array([1, np.nan, 1.5, 2.5]))
+
+
+class TestMaskedSeries(object):
+
+    def setup_method(self, method):
+        self.s = Series([1, None, 3, 2], dtype='Int8', name='a')
+        self.dense = Series([1, np.nan, 3, 2], name='a')
+
+    def test_constructor(self):
+        s = self.s
+        assert s.dtype == 'Int8'
+        assert isinstance(s._data.blocks[0], MaskedBlock)
+        assert isinstance(s._values, MaskedArray)
+        tm.assert_numpy_array_equal(s.values, self.dense.values)
+
+        result = Series(5, index=[0, 1], dtype='UInt8')
+        assert result.dtype == 'UInt8'
+        assert result.tolist() == [5, 5]
+
+        result = Series(MaskedArray([True, None]))
+        assert result.dtype == 'Bool'
+
+        result = Series(s._values, dtype='float32')
+        tm.assert_series_equal(result, self.dense.astype('float32'),
+                               check_names=False)
+
+    def test_memory_usage(self):
+        s = Series(np.arange(100), dtype='Int8')
+        assert s.memory_usage(index=False) == 200
+        assert s.nbytes == 200
+        assert s.astype('float64').nbytes == 800
+
+    @pytest.mark.parametrize('method', [
+        'sum', 'mean', 'min', 'max', 'median', 'std', 'var', 'sem', 'skew',
+        'kurt', 'prod', 'idxmin', 'idxmax', 'count', 'any', 'all'])
+    def test_reductions(self, method):
+        for skipna in [True, False]:
+            result = getattr(self.s, method)(skipna=skipna) \
+                if method != 'count' else self.s.count()
+            expected = getattr(self.dense, method)(skipna=skipna) \
+                if method != 'count' else self.dense.count()
+            tm.assert_almost_equal(result, expected)
+
+    def test_reductions_int_extremes(self):
+        s = Series([-128, None, 127], dtype='Int8')
+        assert s.min() == -128
+        assert s.max() == 127
+
+        s = Series([np.iinfo(np.int64).max, None, 1], dtype='Int64')
+        assert s.max() == np.iinfo(np.int64).max
+
+    def test_reductions_bool(self):
+        s = Series([True, None, False], dtype='Bool')
+        assert s.any()
+        assert not s.all()
+        assert s.sum() == 1
+
+    def test_reindex(self):
+        result = self.s.reindex([3, 1, 5])
+        assert result.dtype == 'Int8'
+        tm.assert_series_equal(result.astype('float64'),
+                               self.dense.reindex([3, 1, 5]))
+
+        result = self.s.reindex([0, 5], fill_value=7)
+        assert result.dtype == 'Int8'
+        assert result.tolist() == [1, 7]
+
+    def test_concat(self):
+        result = concat([self.s, Series([None, 100], dtype='Int16')])
+        assert result.dtype == 'Int16'
+        assert result.isna().tolist() == [False, True, False, False,
+                                          True, False]
+
+        result = concat([self.s, Series([0.5])])
+        assert result.dtype == 'float64'
+
+    def test_setitem(self):
+        s = self.s.copy()
+        s[1] = 4
+        assert s.dtype == 'Int8'
+        assert s.tolist() == [1, 4, 3, 2]
+
+        s[0] = np.nan
+        assert s.dtype == 'Int8'
+        assert s.isna().tolist() == [True, False, False, False]
+
+        s[2] = 2.5
+        assert s.dtype == 'float64'
+        tm.assert_series_equal(s, Series([np.nan, 4, 2.5, 2], name='a'))
+
+    def test_fillna(self):
+        result = self.s.fillna(0)
+        assert result.dtype == 'Int8'
+        assert result.tolist() == [1, 0, 3, 2]
+
+        result = self.s.fillna(method='ffill')
+        assert result.dtype == 'Int8'
+        assert result.tolist() == [1, 1, 3, 2]
+
+        result = self.s.fillna(0.5)
+        tm.assert_series_equal(result, self.dense.fillna(0.5))
+
+    def test_where(self):
+        result = self.s.where(self.s > 1)
+        assert result.dtype == 'Int8'
+        assert result.isna().tolist() == [True, True, False, False]
+
+    def test_astype(self):
+        result = self.s.astype('Int64')
+        assert result.dtype == 'Int64'
+        tm.assert_series_equal(self.s.astype('float64'), self.dense)
+        tm.assert_series_equal(self.dense.astype('Int8'), self.s)
+        pytest.raises(ValueError, self.s.astype, 'int64')
+
+    def test_sort_values(self):
+        result = self.s.sort_values()
+        tm.assert_index_equal(result.index, Index([0, 3, 2, 1]))
+
+    def test_value_counts(self):
+        result = self.s.value_counts().sort_index()
+        expected = Series([1, 1, 1], index=[1, 2, 3], name='a')
+        tm.assert_series_equal(result, expected)
+
+    def test_repr(self):
+        expected = ("0      1\n1    NaN\n2      3\n3      2\n"
+                    "Name: a, dtype: Int8")
+        assert repr(self.s) == expected
+
+
+class TestMaskedFrame(object):
+
+    def setup_method(self, method):
+        self.df = DataFrame({'a': Series([1, None, 3, 2], dtype='Int32'),
+                             'b': [1., 2., 3., 4.],
+                             'key': ['x', 'x', 'y', 'y']})
+
+    def test_constructor(self):
+        df = self.df
+        assert df.dtypes['a'] == 'Int32'
+        assert isinstance(df._data.blocks[-1], MaskedBlock)
+        assert df['a'].dtype == 'Int32'
+
+        # the column does not share its values with the Series
+        s = Series([1, 2], dtype='Int8')
+        df = DataFrame({'a': s})
+        df.loc[0, 'a'] = 5
+        assert s[0] == 1
+
+    def test_values(self):
+        tm.assert_numpy_array_equal(
+            self.df[['a', 'b']].values,
+            np.array([[1, 1], [np.nan, 2], [3, 3], [2, 4]], dtype=float))
+
+        df = DataFrame({'a': Series([1, 2], dtype='Int32')})
+        assert df.values.dtype == np.int32
+
+    def test_concat(self):
+        result = concat([self.df, self.df])
+        assert result.dtypes['a'] == 'Int32'
+
+        other = DataFrame({'b': [5.]})
+        result = concat([self.df, other], ignore_index=True)
+        assert result.dtypes['a'] == 'Int32'
+        assert result['a'].isna().tolist() == [False, True, False, False,
+                                               True]
+
+    def test_groupby(self):
+        result = self.df.groupby('key')['a'].sum()
+        expected = Series([1, 5], index=Index(['x', 'y'], name='key'),
+                          name='a', dtype='Int32')
+        tm.assert_series_equal(result, expected)
+
+        result = self.df.groupby('key').max()
+        assert result.dtypes['a'] == 'Int32'
+        assert result['a'].tolist() == [1, 3]
+
+        result = self.df.groupby('key').mean()
+        tm.assert_series_equal(result['a'],
+                               Series([1., 2.5], index=result.index,
+                                      name='a'))
+
+    def test_groupby_missing_group(self):
+        df = DataFrame({'a': Series([None, None, 3], dtype='Int64'),
+                        'key': [1, 1, 2]})
+        result = df.groupby('key')['a'].sum(min_count=1)
+        assert result.dtype == 'Int64'
+        assert result.isna().tolist() == [True, False]
+
+    def test_groupby_large_integers(self):
+        # values above 2**53 are aggregated exactly
+        big = 2 ** 53 + 1
+        df = DataFrame({'a': Series([big, 1, None, 5], dtype='Int64'),
+                        'key': [1, 1, 2, 2]})
+        grouped = df.groupby('key')['a']
+        index = Index([1, 2], name='key')
+
+        for how, values in [('sum', [big + 1, 5]), ('max', [big, 5]),
+                            ('min', [1, 5]), ('first', [big, 5]),
+                            ('last', [1, 5])]:
+            result = getattr(grouped, how)()
+            expected = Series(values, index=index, name='a', dtype='Int64')
+            tm.assert_series_equal(result, expected)
+            assert result.tolist() == values
+
+        # other operations are computed on float64, which is returned as is
+        # when it may have been rounded
+        result = grouped.prod()
+        assert result.dtype == np.float64
+        result = grouped.cumsum()
+        assert result.dtype == np.float64
+
+        df = DataFrame({'a': Series([big, 1, None, 5], dtype='UInt64'),
+                        'key': [1, 1, 2, 2]})
+        result = df.groupby('key').max()
+        assert result.dtypes['a'] == 'UInt64'
+        assert result['a'].tolist() == [big, 5]
+
+    def test_astype(self):
+        result = self.df[['b']].astype('Int16')
+        assert result.dtypes['b'] == 'Int16'
+        tm.assert_frame_equal(result.astype('float64'), self.df[['b']])
+
+        result = self.df.astype({'a': 'float64'})
+        assert result.dtypes['a'] == np.float64
+
+    def test_setitem_loc(self):
+        df = self.df.copy()
+        df.loc[1, 'a'] = 7
+        assert df.dtypes['a'] == 'Int32'
+        assert df['a'].tolist() == [1, 7, 3, 2]
+        tm.assert_frame_equal(df.drop('a', axis=1),
+                              self.df.drop('a', axis=1))
+
+    def test_to_csv(self):
+        result = self.df.to_csv()
+        expected = (',a,b,key\n0,1,1.0,x\n1,,2.0,x\n2,3,3.0,y\n'
+                    '3,2,4.0,y\n')
+        assert result == expected
@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import numpy as np
+import pandas as pd
+from pandas import Series, DataFrame, Index, concat
+from pandas.compat import u
+from pandas.core.internals import StringBlock
+from pandas.core.utf8 import StringArray
+from pandas.util import hash_pandas_object
+import pandas.util.testing as tm
+
+
+class TestStringArray(object):
+
+    def test_constructor(self):
+        arr = StringArray(['a', None, u('\xe9t\xe9'), ''])
+        assert arr.dtype == 'utf8'
+        tm.assert_numpy_array_equal(arr._data, np.array(
+            [97, 195, 169, 116, 195, 169], dtype=np.uint8))
+        tm.assert_numpy_array_equal(arr._offsets,
+                                    np.array([0, 1, 1, 6, 6], dtype=np.int64))
+        tm.assert_numpy_array_equal(arr._mask,
+                                    np.array([False, True, False, False]))
+
+        result = StringArray(arr, copy=True)
+        assert result._data is not arr._data
+        tm.assert_numpy_array_equal(result._offsets, arr._offsets)
+
+        assert len(StringArray([])) == 0
+
+    def test_constructor_invalid(self):
+        pytest.raises(TypeError, StringArray, [1, 2])
+        pytest.raises(TypeError, StringArray, ['a', 1])
+        pytest.raises(ValueError, StringArray, np.array([['a']],
+                                                        dtype=object))
+
+    def test_to_dense(self):
+        arr = StringArray(['a', None, u('\xe9t\xe9')])
+        tm.assert_numpy_array_equal(
+            arr.to_dense(), np.array(['a', np.nan, u('\xe9t\xe9')],
+                                     dtype=object))
+        assert arr.tolist() == ['a', np.nan, u('\xe9t\xe9')]
+        assert arr[2] == u('\xe9t\xe9')
+        assert arr[-1] == u('\xe9t\xe9')
+        assert np.isnan(arr[1])
+
+    def test_getitem(self):
+        arr = StringArray(['a', None, 'bc', 'def'])
+
+        # a slice is a view on the buffer
+        result = arr[2:]
+        assert result._data.base is arr._data
+        tm.assert_numpy_array_equal(result._offsets,
+                                    np.array([0, 2, 5], dtype=np.int64))
+        assert result.tolist() == ['bc', 'def']
+
+        assert arr[::-2].tolist() == ['def', np.nan]
+        assert arr[[3, 0]].tolist() == ['def', 'a']
+        assert arr[arr.notna()].tolist() == ['a', 'bc', 'def']
+        assert arr[2:1].tolist() == []
+
+    def test_take_nd(self):
+        arr = StringArray(['a', None, 'bc'])
+
+        result = arr.take_nd(np.array([2, -1, 0]))
+        assert result.dtype == 'utf8'
+        assert result.tolist() == ['bc', np.nan, 'a']
+
+        result = arr.take_nd(np.array([2, -1, 0]), fill_value='x')
+        assert result.tolist() == ['bc', 'x', 'a']
+
+        result = StringArray([]).take_nd(np.array([-1, -1]))
+        assert result.isna().tolist() == [True, True]
+
+    def test_setitem(self):
+        arr = StringArray(['a', None, 'bc'])
+        arr[1] = 'longer'
+        arr[0] = np.nan
+        assert arr.tolist() == [np.nan, 'longer', 'bc']
+
+        arr[[0, 2]] = ['x', 'y']
+        assert arr.tolist() == ['x', 'longer', 'y']
+
+        arr[arr == 'x'] = None
+        assert arr.tolist() == [np.nan, 'longer', 'y']
+
+        with pytest.raises(TypeError):
+            arr[0] = 1
+
+    @pytest.mark.parametrize('op, expected', [
+        ('eq', [True, False, False, False]),
+        ('ne', [False, True, True, True]),
+        ('lt', [False, False, True, False]),
+        ('le', [True, False, True, False]),
+        ('gt', [False, False, False, True]),
+        ('ge', [True, False, False, True])])
+    def test_compare(self, op, expected):
+        arr = StringArray(['b', None, 'a', u('\xe9')])
+        op = '__{op}__'.format(op=op)
+
+        result = getattr(arr, op)('b')
+        tm.assert_numpy_array_equal(result, np.array(expected))
+
+        result = getattr(arr, op)(StringArray(['b', 'b', 'b', 'b']))
+        tm.assert_numpy_array_equal(result, np.array(expected))
+
+    def test_factorize_unique(self):
+        arr = StringArray(['b', None, 'a', 'b', u('\xe9'), None])
+        labels, uniques = arr.factorize()
+        tm.assert_numpy_array_equal(labels, np.array([0, -1, 1, 0, 2, -1]))
+        assert uniques.tolist() == ['b', 'a', u('\xe9')]
+
+        assert arr.unique().tolist() == ['b', np.nan, 'a', u('\xe9')]
+
+        tm.assert_numpy_array_equal(arr.argsort(kind='mergesort'),
+                                    np.array([2, 0, 3, 4, 1, 5]))
+
+    def test_isin(self):
+        arr = StringArray(['b', None, 'a', 'abc'])
+        tm.assert_numpy_array_equal(arr.isin(['a', 'c', 1]),
+                                    np.array([False, False, True, False]))
+        tm.assert_numpy_array_equal(arr.isin(['b', None]),
+                                    np.array([True, True, False, False]))
+        tm.assert_numpy_array_equal(arr.isin([]),
+                                    np.array([False] * 4))
+
+    def test_string_methods(self):
+        arr = StringArray(['aBc', None, u('\xc9t\xe9'), ''])
+        tm.assert_numpy_array_equal(arr.lengths(),
+                                    np.array([3, 0, 3, 0], dtype=np.int64))
+        assert arr.lower().tolist() == ['abc', np.nan, u('\xe9t\xe9'), '']
+        assert arr.upper().tolist() == ['ABC', np.nan, u('\xc9T\xc9'), '']
+        assert arr[:1].upper().tolist() == ['ABC']
+
+        tm.assert_numpy_array_equal(arr.contains('Bc'),
+                                    np.array([True, False, False, False]))
+        tm.assert_numpy_array_equal(arr.startswith(u('\xc9')),
+                                    np.array([False, False, True, False]))
+        tm.assert_numpy_array_equal(arr.endswith(''),
+                                    np.array([True, False, True, True]))
+
+    def test_concat(self):
+        a = StringArray(['a', None])
+        b = StringArray(['bc'])
+        result = pd.core.dtypes.concat._concat_compat([a, b])
+        assert result.dtype == 'utf8'
+        assert result.tolist() == ['a', np.nan, 'bc']
+
+        result = pd.core.dtypes.concat._concat_compat(
+            [a, np.array([1.5])])
+        tm.assert_numpy_array_equal(result,
+                                    np.array(['a', np.nan, 1.5],
+                                             dtype=object))
+
+
+class TestStringSeries(object):
+
+    def setup_method(self, method):
+        self.s = Series(['b', None, 'a', u('\xe9t\xe9'), 'b'], dtype='utf8',
+                        name='s')
+        self.dense = Series(['b', np.nan, 'a', u('\xe9t\xe9'), 'b'],
+                            name='s')
+
+    def test_constructor(self):
+        s = self.s
+        assert s.dtype == 'utf8'
+        assert isinstance(s._data.blocks[0], StringBlock)
+        assert isinstance(s._values, StringArray)
+        tm.assert_numpy_array_equal(s.values, self.dense.values)
+
+        result = Series('x', index=[0, 1], dtype='utf8')
+        assert result.dtype == 'utf8'
+        assert result.tolist() == ['x', 'x']
+
+        tm.assert_series_equal(Series(self.dense, dtype='utf8'), s)
+
+    def test_memory_usage(self):
+        s = Series(['abc'] * 10, dtype='utf8')
+        assert s.memory_usage(index=False) == 30 + 88 + 10
+        assert s.memory_usage(index=False, deep=True) == 128
+
+    def test_isna(self):
+        tm.assert_series_equal(self.s.isna(), self.dense.isna())
+        tm.assert_series_equal(self.s.notna(), self.dense.notna())
+        assert self.s.count() == 4
+
+    @pytest.mark.parametrize('op', ['eq', 'ne', 'lt', 'le', 'gt', 'ge'])
+    def test_compare(self, op):
+        op = '__{op}__'.format(op=op)
+        result = getattr(self.s, op)('b')
+        expected = getattr(self.dense, op)('b')
+        tm.assert_series_equal(result, expected)
+
+        result = getattr(self.s, op)(self.s[::-1].reset_index(drop=True))
+        expected = getattr(self.dense, op)(
+            self.dense[::-1].reset_index(drop=True))
+        tm.assert_series_equal(result, expected)
+
+    def test_isin(self):
+        tm.assert_series_equal(self.s.isin(['b', u('\xe9t\xe9')]),
+                               self.dense.isin(['b', u('\xe9t\xe9')]))
+
+    def test_factorize(self):
+        labels, uniques = pd.factorize(self.s)
+        expected_labels, expected_uniques = pd.factorize(self.dense)
+        tm.assert_numpy_array_equal(labels, expected_labels)
+        tm.assert_index_equal(uniques, expected_uniques)
+
+        labels, uniques = pd.factorize(self.s, sort=True)
+        expected_labels, expected_uniques = pd.factorize(self.dense,
+                                                         sort=True)
+        tm.assert_numpy_array_equal(labels, expected_labels)
+        tm.assert_index_equal(uniques, expected_uniques)
+
+    def test_value_counts(self):
+        result = self.s.value_counts().sort_index()
+        expected = self.dense.value_counts().sort_index()
+        tm.assert_series_equal(result, expected)
+        assert self.s.nunique() == 3
+
+    def test_hash(self):
+        for categorize in [True, False]:
+            tm.assert_series_equal(
+                hash_pandas_object(self.s, categorize=categorize),
+                hash_pandas_object(self.dense, categorize=categorize))
+
+    def test_str_methods(self):
+        for method in ['len', 'lower', 'upper']:
+            result = getattr(self.s.str, method)()
+            expected = getattr(self.dense.str, method)()
+            tm.assert_series_equal(result.astype(object),
+                                   expected.astype(object))
+        assert self.s.str.lower().dtype == 'utf8'
+
+        for method, pat in [('contains', 't'), ('startswith', 'b'),
+                            ('endswith', u('\xe9'))]:
+            result = getattr(self.s.str, method)(pat)
+            expected = getattr(self.dense.str, method)(pat)
+            tm.assert_series_equal(result, expected)
+
+            result = getattr(self.s.str, method)(pat, na=False)
+            expected = getattr(self.dense.str, method)(pat, na=False)
+            tm.assert_series_equal(result, expected)
+
+        # patterns that are not literal are matched on the strings
+        tm.assert_series_equal(self.s.str.contains('^b'),
+                               self.dense.str.contains('^b'))
+        tm.assert_series_equal(self.s.str.split('t'),
+                               self.dense.str.split('t'))
+
+    def test_reindex(self):
+        result = self.s.reindex([3, 1, 7])
+        assert result.dtype == 'utf8'
+        tm.assert_series_equal(result.astype(object),
+                               self.dense.reindex([3, 1, 7]))
+
+    def test_concat(self):
+        result = concat([self.s, Series(['x'], dtype='utf8')])
+        assert result.dtype == 'utf8'
+        assert result.tolist() == self.dense.tolist() + ['x']
+
+        result = concat([self.s, Series([0.5])])
+        assert result.dtype == object
+
+    def test_setitem(self):
+        s = self.s.copy()
+        s[1] = 'longer'
+        assert s.dtype == 'utf8'
+        assert s[1] == 'longer'
+
+        s[0] = 1
+        assert s.dtype == object
+        assert s.tolist() == [1, 'longer', 'a', u('\xe9t\xe9'), 'b']
+
+    def test_fillna(self):
+        result = self.s.fillna('z')
+        assert result.dtype == 'utf8'
+        tm.assert_series_equal(result.astype(object), self.dense.fillna('z'))
+
+        result = self.s.fillna(method='ffill')
+        assert result.dtype == 'utf8'
+        assert result.tolist() == ['b', 'b', 'a', u('\xe9t\xe9'), 'b']
+
+        tm.assert_series_equal(self.s.fillna(0), self.dense.fillna(0))
+
+    def test_astype(self):
+        tm.assert_series_equal(self.s.astype(object), self.dense)
+        tm.assert_series_equal(self.dense.astype('utf8'), self.s)
+
+    def test_sort_values(self):
+        result = self.s.sort_values()
+        tm.assert_index_equal(result.index, Index([2, 0, 4, 3, 1]))
+
+    def test_repr(self):
+        expected = ("0      b\n1    NaN\n2      a\n3      c\n"
+                    "Name: s, dtype: utf8")
+        s = Series(['b', None, 'a', 'c'], dtype='utf8', name='s')
+        assert repr(s) == expected
+
+
+class TestStringFrame(object):
+
+    def setup_method(self, method):
+        self.df = DataFrame({'a': Series(['x', None, 'y', 'x'],
+                                         dtype='utf8'),
+                             'b': [1., 2., 3., 4.]})
+
+    def test_constructor(self):
+        df = self.df
+        assert df.dtypes['a'] == 'utf8'
+        assert isinstance(df._data.blocks[-1], StringBlock)
+        tm.assert_numpy_array_equal(
+            df.values, np.array([['x', 1.], [np.nan, 2.], ['y', 3.],
+                                 ['x', 4.]], dtype=object))
+
+    def test_concat(self):
+        result = concat([self.df, self.df])
+        assert result.dtypes['a'] == 'utf8'
+
+        other = DataFrame({'b': [5.]})
+        result = concat([self.df, other], ignore_index=True)
+        assert result.dtypes['a'] == 'utf8'
+        assert result['a'].isna().tolist() == [False, True, False, False,
+                                               True]
+
+    def test_groupby(self):
+        result = self.df.groupby('a')['b'].sum()
+        expected = Series([5., 3.], index=Index(['x', 'y'], name='a'),
+                          name='b')
+        tm.assert_series_equal(result, expected)
+
+        result = self.df.groupby('b')['a'].first()
+        expected = Series(['x', np.nan, 'y', 'x'],
+                          index=Index([1., 2., 3., 4.], name='b'), name='a')
+        tm.assert_series_equal(result, expected)
+
+    def test_merge(self):
+        result = pd.merge(self.df, self.df, on='a')
+        expected = pd.merge(self.df.astype({'a': object}),
+                            self.df.astype({'a': object}), on='a')
+        tm.assert_frame_equal(result.astype({'a': object}), expected)
+
+    def test_setitem_loc(self):
+        df = self.df.copy()
+        df.loc[1, 'a'] = 'zz'
+        assert df.dtypes['a'] == 'utf8'
+        assert df['a'].tolist() == ['x', 'zz', 'y', 'x']
+
+    def test_pickle(self):
+        result = tm.round_trip_pickle(self.df)
+        tm.assert_frame_equal(result, self.df)
+
+    def test_to_csv(self):
+        result = self.df.to_csv()
+        expected = ',a,b\n0,x,1.0\n1,,2.0\n2,y,3.0\n3,x,4.0\n'
+        assert result == expected
@@ -462,8 +462,10 @@ ext_data = {
         'depends': _pxi_dep['algos']},
     '_libs.groupby': {
         'pyxfile': '_libs/groupby',
-        'pxdfiles': ['_libs/src/util', '_libs/algos'],
-        'depends': _pxi_dep['groupby']},
+        'pxdfiles': ['_libs/src/util', '_libs/algos', '_libs/missing',
+                     '_libs/khash'],
+        'depends': (['pandas/_libs/src/klib/khash_python.h'] +
+                    _pxi_dep['groupby'])},
     '_libs.hashing': {
         'pyxfile': '_libs/hashing'},
     '_libs.hashtable': {